@@ -0,0 +1,142 @@
+# alert_index.py - KRX 투자주의/경고/위험 종목 색인 (시작 시 한 번 구성, 조회는 dict + 이분 탐색)
+
+from bisect import bisect_right
+
+import pandas as pd
+
+from corp_code_index import normalize_corp_name
+
+
+def _to_dates(series):
+    """날짜 열 → datetime.date 리스트 ('-', 빈 값, 잘못된 값은 None)"""
+    parsed = pd.to_datetime(series.astype(str).str.strip(), format='mixed', errors='coerce')
+    return [value.date() if not pd.isna(value) else None for value in parsed]
+
+
+class AlertTable:
+    """
+    지정 이력 테이블 하나 (종목코드별 지정 구간을 시작일 순으로 정렬해 보관)
+
+    codes[종목코드] = (시작일 ordinal 리스트, [(시작일, 해제일 또는 None, 구분), ...])
+    """
+
+    def __init__(self, df, start_column, end_column=None, type_column=None, default_type=None):
+        self.codes = {}
+        if df is None or df.empty or '종목코드' not in df.columns or start_column not in df.columns:
+            return
+
+        stock_codes = df['종목코드'].astype(str).str.strip().str.zfill(6).tolist()
+        starts = _to_dates(df[start_column])
+        ends = _to_dates(df[end_column]) if end_column in df.columns else [None] * len(df)
+        if type_column in df.columns:
+            types = [default_type if pd.isna(value) else value for value in df[type_column]]
+        else:
+            types = [default_type] * len(df)
+
+        grouped = {}
+        for code, start, end, kind in zip(stock_codes, starts, ends, types):
+            if start is not None:
+                grouped.setdefault(code, []).append((start, end, kind))
+
+        for code, intervals in grouped.items():
+            intervals.sort(key=lambda interval: interval[0])
+            self.codes[code] = ([start.toordinal() for start, _, _ in intervals], intervals)
+
+    def latest_as_of(self, stock_code, as_of):
+        """
+        기준일 이전(포함) 가장 최근 지정 구간
+
+        Args:
+            stock_code: 6자리 종목코드
+            as_of: 기준일 (datetime.date)
+
+        Returns:
+            (시작일, 해제일 또는 None, 구분) 또는 None
+        """
+        entry = self.codes.get(stock_code)
+        if entry is None:
+            return None
+        starts, intervals = entry
+        position = bisect_right(starts, as_of.toordinal()) - 1
+        return intervals[position] if position >= 0 else None
+
+    def active_as_of(self, stock_code, as_of):
+        """기준일에 유효한 지정 구간 (가장 최근 지정이 해제됐으면 None)"""
+        interval = self.latest_as_of(stock_code, as_of)
+        if interval is None:
+            return None
+        _, end, _ = interval
+        if end is not None and as_of > end:
+            return None
+        return interval
+
+
+class AlertIndex:
+    """
+    투자주의/경고/위험 세 테이블 통합 색인
+
+    - names: 정규화된 종목명 → (종목코드, 원래 종목명) (주의 → 경고 → 위험 순서로 먼저 나온 것 우선)
+    - caution / warning / risk: AlertTable
+    """
+
+    def __init__(self, caution_df=None, warning_df=None, risk_df=None):
+        self.names = {}
+        for df in (caution_df, warning_df, risk_df):
+            if df is None or df.empty or '종목명' not in df.columns or '종목코드' not in df.columns:
+                continue
+            stock_codes = df['종목코드'].astype(str).str.strip().str.zfill(6)
+            for name, code in zip(df['종목명'].astype(str), stock_codes):
+                self.names.setdefault(normalize_corp_name(name), (code, name))
+
+        # 투자주의는 해제일이 없고, 경고/위험은 공시일~해제일 구간
+        self.caution = AlertTable(caution_df, '지정일', type_column='구분', default_type='투자주의')
+        self.warning = AlertTable(warning_df, '공시일', end_column='해제일')
+        self.risk = AlertTable(risk_df, '공시일', end_column='해제일')
+
+    def find(self, stock_name):
+        """
+        종목명으로 종목코드 조회
+
+        Returns:
+            (종목코드, 원래 종목명) 또는 None
+        """
+        return self.names.get(normalize_corp_name(stock_name))
+
+    def status(self, stock_code, as_of):
+        """
+        기준일 현재 지정 상태
+
+        Args:
+            stock_code: 6자리 종목코드
+            as_of: 기준일 (datetime.date)
+
+        Returns:
+            dict: caution / warning / risk 목록과 any_alert
+        """
+        result = {
+            'caution': [],
+            'warning': [],
+            'risk': [],
+            'any_alert': False
+        }
+
+        interval = self.caution.active_as_of(stock_code, as_of)
+        if interval:
+            start, _, kind = interval
+            result['caution'].append({
+                'type': kind,
+                'start_date': start.strftime('%Y-%m-%d'),
+                'end_date': '현재'  # 투자주의는 해제일이 없음
+            })
+
+        for key, table in (('warning', self.warning), ('risk', self.risk)):
+            interval = table.active_as_of(stock_code, as_of)
+            if interval:
+                start, end, _ = interval
+                result[key].append({
+                    'start_date': start.strftime('%Y-%m-%d'),
+                    'end_date': end.strftime('%Y-%m-%d') if end else '현재'
+                })
+
+        result['any_alert'] = bool(result['caution'] or result['warning'] or result['risk'])
+        return result
@@ -1,5 +1,6 @@
 ﻿# app.py - Flask 웹 API (폴링 방식으로 완전 재설계)
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import json
 import traceback
@@ -12,8 +13,21 @@ import uuid
 from main import IntegratedSearchSystem
 from memory_optimizer import MemoryOptimizer
 from config import Config
+from http_utils import pool_stats
+
+
+class AnalysisJSONProvider(DefaultJSONProvider):
+    """검색 결과 객체(SearchResults 등)는 API 응답을 만들 때만 dict로 직렬화"""
+    
+    @staticmethod
+    def default(o):
+        if hasattr(o, 'to_dict'):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
 
 app = Flask(__name__)
+app.json = AnalysisJSONProvider(app)
 CORS(app)
 
 # 시스템 초기화
@@ -22,7 +36,8 @@ try:
     # 메모리 사용량 확인
     MemoryOptimizer.log_memory_usage("(시스템 초기화 전)")
     
-    system = IntegratedSearchSystem()
+    # RAG 색인은 백그라운드에서 생성 (준비 전 분석은 RAG 'warming' 상태로 진행)
+    system = IntegratedSearchSystem(background_rag=True)
     
     # 초기화 후 메모리 정리
     MemoryOptimizer.force_gc()
@@ -239,6 +254,9 @@ def perform_background_analysis(analysis_id, script, upload_date, channel_name,
         time.sleep(1)
         
         pdf_results = ""
+        rag_status = system.pdf_processor.rag_status()['status']
+        if rag_status == 'warming':
+            print("⏳ RAG 색인 준비 중(warming) - PDF 검색 건너뜀")
         if system.pdf_processor.chunks:
             print("3단계: PDF 검색 중...")
             try:
@@ -248,10 +266,7 @@ def perform_background_analysis(analysis_id, script, upload_date, channel_name,
                 )
                 
                 if similar_chunks:
-                    pdf_results = "\n\n=== RAG 데이터베이스 참고 자료 ==="
-                    for i, result in enumerate(similar_chunks):
-                        pdf_results += f"\n[참고 {i+1}] (관련도: {result['similarity']:.3f})\n"
-                        pdf_results += result['chunk'][:400] + "...\n"
+                    pdf_results = system.pdf_processor.format_evidence(similar_chunks)
                         
             except Exception as e:
                 print(f"❌ PDF 검색 오류: {e}")
@@ -349,6 +364,7 @@ def perform_background_analysis(analysis_id, script, upload_date, channel_name,
                 'channel_name': channel_name,
                 'upload_date': upload_date,
                 'script_length': len(script),
+                'rag_status': rag_status,
                 'processed_at': datetime.now().isoformat()
             }
             
@@ -457,6 +473,7 @@ def analyze_script():
                 print(f"❌ 1차 검증 오류: {e}, 2차 검증으로 진행")
         
         # 분석 실행 (검증 결과 전달)
+        rag_status = system.pdf_processor.rag_status()['status']
         result = system.search_and_answer(
             user_query=script,  # 이미 정제됨
             video_date=upload_date,
@@ -474,6 +491,7 @@ def analyze_script():
                 "analysis": result,
                 "upload_date": upload_date,
                 "script_length": len(script),
+                "rag_status": rag_status,
                 "processed_at": datetime.now().isoformat()
             }
         })
@@ -560,9 +578,22 @@ def health_check():
                 "message": "시스템이 초기화되지 않았습니다."
             }), 500
         
+        # RAG 색인은 준비 중(warming)이어도 서버는 요청을 받을 수 있음
+        rag = system.pdf_processor.rag_status()
+        message = "모든 시스템이 정상 작동 중입니다."
+        if rag['status'] == 'warming':
+            message = "서버 정상 작동 중 (RAG 색인 준비 중)"
+        
         return jsonify({
             "status": "healthy",
-            "message": "모든 시스템이 정상 작동 중입니다.",
+            "message": message,
+            "rag": rag,
+            "http_pools": pool_stats(),
+            "search_cache": system.web_searcher.cache.stats(),
+            "search_scheduler": system.web_searcher.scheduler.stats(),
+            "serper_rate_limit": system.web_searcher.rate_limiter.stats(),
+            "dart_cache": system.stock_checker.dart_client.stats(),
+            "financial_snapshot": system.stock_checker.financial_snapshot.stats(),
             "timestamp": datetime.now().isoformat()
         })
         
@@ -0,0 +1,214 @@
+# bm25_index.py - 한국어 문자 n-gram 기반 BM25 역색인
+
+import math
+import re
+import unicodedata
+
+import numpy as np
+
+# 한글 연속 구간 / 영문·숫자 연속 구간
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+_ALNUM_RUN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text, ngram=2):
+    """
+    BM25용 토큰화 (형태소 분석기 없이 동작)
+
+    한글은 어절 경계와 무관하게 문자 n-gram으로 분해하고
+    (예: "삼성전자가" → 삼성, 성전, 전자, 자가), 영문/숫자는 단어 단위로 유지합니다.
+
+    Args:
+        text: 원문
+        ngram: 한글 n-gram 크기
+
+    Returns:
+        토큰 리스트
+    """
+    if not text:
+        return []
+
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = []
+
+    for run in _HANGUL_RUN.findall(text):
+        if len(run) <= ngram:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + ngram] for i in range(len(run) - ngram + 1))
+
+    tokens.extend(_ALNUM_RUN.findall(text))
+    return tokens
+
+
+class BM25Index:
+    """청크 단위 BM25 역색인 (임베딩 호출 없이 로컬에서 검색)"""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+
+        # 빌드 중 누적되는 postings: term -> ([doc_id...], [tf...])
+        self._pending = {}
+        self._pending_lengths = []
+
+        # 확정된 색인 (flat 배열)
+        self.term_offsets = {}        # term -> (start, end) 범위
+        self.doc_ids = np.zeros(0, dtype=np.int32)
+        self.term_freqs = np.zeros(0, dtype=np.float32)
+        self.doc_lengths = np.zeros(0, dtype=np.float32)
+        self.avg_doc_length = 0.0
+
+    def __len__(self):
+        return len(self.doc_lengths) + len(self._pending_lengths)
+
+    def add_document(self, text):
+        """
+        문서(청크) 하나를 색인에 추가
+
+        Args:
+            text: 청크 텍스트
+
+        Returns:
+            부여된 문서 번호
+        """
+        doc_id = len(self)
+        counts = {}
+        tokens = tokenize(text)
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        for term, tf in counts.items():
+            ids, tfs = self._pending.setdefault(term, ([], []))
+            ids.append(doc_id)
+            tfs.append(tf)
+
+        self._pending_lengths.append(len(tokens))
+        return doc_id
+
+    def build(self, texts):
+        """텍스트 목록 전체로 색인 생성"""
+        for text in texts:
+            self.add_document(text)
+        self._finalize()
+        return self
+
+    def _finalize(self):
+        """누적된 postings를 flat 배열로 병합"""
+        if not self._pending_lengths:
+            return
+
+        merged = {}
+        for term, (start, end) in self.term_offsets.items():
+            merged[term] = (self.doc_ids[start:end].tolist(), self.term_freqs[start:end].tolist())
+        for term, (ids, tfs) in self._pending.items():
+            old_ids, old_tfs = merged.get(term, ([], []))
+            merged[term] = (old_ids + ids, old_tfs + tfs)
+
+        term_offsets = {}
+        all_ids = []
+        all_tfs = []
+        for term, (ids, tfs) in merged.items():
+            term_offsets[term] = (len(all_ids), len(all_ids) + len(ids))
+            all_ids.extend(ids)
+            all_tfs.extend(tfs)
+
+        self.term_offsets = term_offsets
+        self.doc_ids = np.array(all_ids, dtype=np.int32)
+        self.term_freqs = np.array(all_tfs, dtype=np.float32)
+        self.doc_lengths = np.concatenate([
+            self.doc_lengths, np.array(self._pending_lengths, dtype=np.float32)
+        ])
+        self.avg_doc_length = float(self.doc_lengths.mean()) if len(self.doc_lengths) else 0.0
+
+        self._pending = {}
+        self._pending_lengths = []
+
+    def search(self, query, top_k=10):
+        """
+        BM25 점수 상위 문서 검색
+
+        Args:
+            query: 검색 질의 (키워드 나열도 가능)
+            top_k: 반환할 개수
+
+        Returns:
+            [(문서 번호, 점수), ...] 점수 내림차순
+        """
+        self._finalize()
+        num_docs = len(self.doc_lengths)
+        if num_docs == 0:
+            return []
+
+        scores = np.zeros(num_docs, dtype=np.float32)
+        length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths / max(self.avg_doc_length, 1e-9))
+
+        for term in set(tokenize(query)):
+            span = self.term_offsets.get(term)
+            if span is None:
+                continue
+
+            ids = self.doc_ids[span[0]:span[1]]
+            tfs = self.term_freqs[span[0]:span[1]]
+            df = len(ids)
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            scores[ids] += idf * tfs * (self.k1 + 1) / (tfs + length_norm[ids])
+
+        matched = np.flatnonzero(scores)
+        if len(matched) == 0:
+            return []
+
+        top = matched[np.argsort(scores[matched])[::-1][:top_k]]
+        return [(int(idx), float(scores[idx])) for idx in top]
+
+    def save(self, path):
+        """색인을 npz 파일로 저장"""
+        self._finalize()
+        terms = list(self.term_offsets.keys())
+        offsets = np.array([self.term_offsets[t] for t in terms], dtype=np.int64).reshape(-1, 2)
+
+        np.savez(
+            path,
+            terms=np.array(terms, dtype=str),
+            offsets=offsets,
+            doc_ids=self.doc_ids,
+            term_freqs=self.term_freqs,
+            doc_lengths=self.doc_lengths,
+            params=np.array([self.k1, self.b], dtype=np.float64)
+        )
+
+    @classmethod
+    def load(cls, path):
+        """npz 파일에서 색인 로드"""
+        with np.load(path, allow_pickle=False) as data:
+            k1, b = data['params'].tolist()
+            index = cls(k1=k1, b=b)
+            index.term_offsets = {
+                term: (int(start), int(end))
+                for term, (start, end) in zip(data['terms'].tolist(), data['offsets'])
+            }
+            index.doc_ids = data['doc_ids']
+            index.term_freqs = data['term_freqs']
+            index.doc_lengths = data['doc_lengths']
+
+        index.avg_doc_length = float(index.doc_lengths.mean()) if len(index.doc_lengths) else 0.0
+        return index
+
+
+def reciprocal_rank_fusion(rankings, k=60):
+    """
+    여러 순위 리스트를 Reciprocal Rank Fusion으로 결합
+
+    Args:
+        rankings: [[문서 번호, ...], ...] 각 검색기의 순위 리스트
+        k: RRF 상수 (클수록 하위 순위 영향 증가)
+
+    Returns:
+        [(문서 번호, 융합 점수), ...] 점수 내림차순
+    """
+    fused = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank + 1)
+
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
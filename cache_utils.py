@@ -0,0 +1,180 @@
+# cache_utils.py - 공용 캐시 유틸리티
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """스레드 안전한 메모리 LRU 캐시 (적중/미스 통계 포함)"""
+
+    def __init__(self, max_size=256):
+        """
+        Args:
+            max_size: 최대 항목 수 (0이면 캐시 비활성화)
+        """
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """키 조회 (적중 시 최근 사용으로 갱신)"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """값 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """전체 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+
+class DiskCache:
+    """
+    sqlite 기반 영속 캐시 (항목별 TTL, 최대 개수 초과 시 LRU 제거, 적중/미스 통계)
+
+    값은 JSON으로 직렬화해 저장하며, 여러 스레드·프로세스가 같은 파일을 공유할 수 있습니다.
+    """
+
+    # put 몇 번마다 만료/초과 항목을 정리할지 (그 사이에는 최대 개수를 잠시 넘을 수 있음)
+    EVICT_EVERY = 50
+
+    def __init__(self, path, max_entries=10000):
+        """
+        Args:
+            path: sqlite 파일 경로
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache(accessed_at)")
+            self._conn.commit()
+
+    def get(self, key, default=None):
+        """키 조회 (만료된 항목은 미스로 처리하고 삭제)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return default
+
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def put(self, key, value, ttl):
+        """
+        값 저장
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+            ttl: 유효 기간(초)
+        """
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now + ttl, now)
+            )
+            self._conn.commit()
+
+            self._puts += 1
+            if self._puts % self.EVICT_EVERY == 0:
+                self._evict(now)
+
+    def _evict(self, now):
+        """만료 항목 삭제 후 최대 개수를 넘는 만큼 LRU 제거 (lock 보유 상태에서 호출)"""
+        self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+        self._conn.commit()
+
+    def clear(self):
+        """전체 항목 제거"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def stats(self):
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self),
+            'max_size': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
@@ -0,0 +1,137 @@
+# chunk_store.py - 메모리 매핑 기반 청크 저장소
+
+import mmap
+import os
+
+import numpy as np
+
+
+def save_array(path, array):
+    """npy 파일을 임시 파일에 쓴 뒤 교체 (매핑 중인 이전 파일은 그대로 유지)"""
+    with open(path + ".tmp", 'wb') as f:
+        np.save(f, array)
+    os.replace(path + ".tmp", path)
+
+
+class ChunkStore:
+    """
+    청크 텍스트 저장소 (UTF-8 blob + 오프셋 배열)
+
+    모든 청크를 하나의 UTF-8 파일에 이어 붙이고, 경계 오프셋은 별도 npy로 저장합니다.
+    두 파일 모두 메모리 매핑으로 열기 때문에 시작 시 파싱이 없고,
+    실제로 조회된 청크(top-k)만 디코딩되어 힙에 올라옵니다.
+    """
+
+    def __init__(self, blob, offsets, handle=None):
+        """
+        Args:
+            blob: bytes 또는 mmap 객체
+            offsets: 청크 경계 배열 (길이 = 청크 수 + 1)
+            handle: 매핑에 사용한 파일 객체 (close 시 함께 닫음)
+        """
+        self._blob = blob
+        self._offsets = offsets
+        self._handle = handle
+
+    @classmethod
+    def open(cls, blob_path, offsets_path):
+        """저장된 청크 저장소를 메모리 매핑으로 열기"""
+        offsets = np.load(offsets_path, mmap_mode='r')
+
+        handle = open(blob_path, 'rb')
+        if os.fstat(handle.fileno()).st_size == 0:
+            # 빈 파일은 매핑할 수 없음
+            handle.close()
+            return cls(b"", offsets)
+
+        blob = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(blob, offsets, handle)
+
+    @classmethod
+    def from_texts(cls, texts):
+        """메모리 상의 텍스트 목록으로 저장소 생성 (파일 없이 사용할 때)"""
+        encoded = [text.encode('utf-8') for text in texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+        if encoded:
+            offsets[1:] = np.cumsum([len(data) for data in encoded])
+        return cls(b"".join(encoded), offsets)
+
+    def __len__(self):
+        return max(len(self._offsets) - 1, 0)
+
+    def __getitem__(self, idx):
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("chunk index out of range")
+
+        start = int(self._offsets[idx])
+        end = int(self._offsets[idx + 1])
+        return self._blob[start:end].decode('utf-8')
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def nbytes(self):
+        """저장된 텍스트 바이트 수"""
+        return int(self._offsets[-1]) if len(self._offsets) else 0
+
+    def close(self):
+        """매핑 해제"""
+        if isinstance(self._blob, mmap.mmap):
+            self._blob.close()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class ChunkStoreWriter:
+    """
+    청크를 하나씩 받아 blob 파일에 바로 기록 (전체 목록을 메모리에 두지 않음)
+
+    임시 파일에 쓴 뒤 close 시 교체하므로, 같은 경로를 매핑 중인 저장소가 있어도
+    기존 매핑은 이전 내용을 그대로 봅니다.
+    """
+
+    def __init__(self, blob_path, offsets_path):
+        self.blob_path = blob_path
+        self.offsets_path = offsets_path
+        self._file = open(blob_path + ".tmp", 'wb')
+        self._offsets = [0]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, text):
+        """
+        청크 추가
+
+        Returns:
+            청크 번호
+        """
+        data = text.encode('utf-8')
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+        return len(self) - 1
+
+    def truncate(self, length):
+        """지정 개수 이후 청크 제거 (실패한 문서 롤백용)"""
+        del self._offsets[length + 1:]
+        self._file.seek(self._offsets[-1])
+        self._file.truncate()
+
+    def close(self):
+        """blob을 닫고 오프셋 배열 저장"""
+        if self._file.closed:
+            return
+        self._file.close()
+        save_array(self.offsets_path, np.array(self._offsets, dtype=np.uint64))
+        os.replace(self.blob_path + ".tmp", self.blob_path)
@@ -26,6 +26,61 @@ class Config:
     # 메모리 설정
     MAX_MEMORY_MB = int(os.getenv('MAX_MEMORY_MB', '500'))
     
+    # RAG 검색 설정
+    RAG_SEARCH_MODE = os.getenv('RAG_SEARCH_MODE', 'hybrid')  # hybrid / dense / lexical
+    RAG_CANDIDATES = int(os.getenv('RAG_CANDIDATES', '20'))  # 융합 전 검색기별 후보 수
+    RAG_RRF_K = int(os.getenv('RAG_RRF_K', '60'))
+    RAG_QUERY_CACHE_SIZE = int(os.getenv('RAG_QUERY_CACHE_SIZE', '256'))  # 질의 임베딩/결과 LRU 크기
+    RAG_QUANTIZATION = os.getenv('RAG_QUANTIZATION', 'none')  # none / int8 / pq (임베딩 양자화)
+    RAG_PQ_SUBVECTORS = int(os.getenv('RAG_PQ_SUBVECTORS', '96'))  # PQ 부분 벡터 수 (384차원 기준 96 → 16배 압축)
+    RAG_RERANK_CANDIDATES = int(os.getenv('RAG_RERANK_CANDIDATES', '100'))  # 양자화 검색 후 float32로 재계산할 후보 수
+    RAG_MMR_LAMBDA = float(os.getenv('RAG_MMR_LAMBDA', '0.7'))  # MMR 관련도 가중치 (낮을수록 다양성 우선)
+    RAG_RERANKER_MODEL = os.getenv('RAG_RERANKER_MODEL', '')  # 로컬 cross-encoder 모델 (비우면 MMR만 사용)
+    RAG_RERANK_BUDGET_MS = int(os.getenv('RAG_RERANK_BUDGET_MS', '300'))  # 다양화/재순위 단계 시간 예산
+    RAG_WATCH_INTERVAL = int(os.getenv('RAG_WATCH_INTERVAL', '60'))  # PDF 폴더 변경 감시 주기(초), 0이면 감시 안 함
+    
+    # PDF 텍스트 추출 병렬화 (Windows는 spawn 방식이라 기본 단일 프로세스)
+    PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', str(os.cpu_count() or 1) if os.name != 'nt' else '1'))
+    PDF_PAGES_PER_TASK = int(os.getenv('PDF_PAGES_PER_TASK', '8'))
+    
+    # 외부 API HTTP 설정 (연결 풀 / 타임아웃 / 재시도)
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3.05'))  # 초
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '15'))  # 초
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))  # 호스트당 유지할 keep-alive 연결 수
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))  # 429/5xx/연결 오류 재시도 횟수
+    HTTP_BACKOFF_FACTOR = float(os.getenv('HTTP_BACKOFF_FACTOR', '0.5'))  # 재시도 간격 0.5, 1, 2초...
+    
+    # 웹 검색(Serper) 결과 디스크 캐시
+    SEARCH_CACHE_PATH = os.getenv('SEARCH_CACHE_PATH', os.path.join(CACHE_DIR, 'search_cache.sqlite'))
+    SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '20000'))
+    SEARCH_CACHE_HISTORICAL_TTL = int(os.getenv('SEARCH_CACHE_HISTORICAL_TTL', str(180 * 24 * 3600)))  # 이미 지난 기간 검색
+    SEARCH_CACHE_CURRENT_TTL = int(os.getenv('SEARCH_CACHE_CURRENT_TTL', str(6 * 3600)))  # 오늘이 포함된 검색
+    
+    # 웹 검색 스케줄러 (프로세스 전체 동시성 / 요청 속도 제한)
+    SEARCH_MAX_WORKERS = int(os.getenv('SEARCH_MAX_WORKERS', '4'))  # 동시에 진행할 Serper 요청 수
+    SERPER_RATE_LIMIT = float(os.getenv('SERPER_RATE_LIMIT', '5'))  # 초당 요청 수 (요금제 한도에 맞춤)
+    SERPER_BURST = int(os.getenv('SERPER_BURST', '10'))  # 순간적으로 허용할 최대 요청 수
+    
+    # DART API 응답 디스크 캐시 (보고 기간이 끝난 정기보고서는 바뀌지 않음)
+    DART_CACHE_PATH = os.getenv('DART_CACHE_PATH', os.path.join(CACHE_DIR, 'dart_cache.sqlite'))
+    DART_CACHE_MAX_ENTRIES = int(os.getenv('DART_CACHE_MAX_ENTRIES', '50000'))
+    DART_CACHE_CLOSED_TTL = int(os.getenv('DART_CACHE_CLOSED_TTL', str(10 * 365 * 24 * 3600)))  # 끝난 기간 보고서 (사실상 무기한)
+    DART_CACHE_NO_DATA_TTL = int(os.getenv('DART_CACHE_NO_DATA_TTL', str(6 * 3600)))  # 013 데이터 없음 (곧 제출될 수 있음)
+    DART_CACHE_DAILY_TTL = int(os.getenv('DART_CACHE_DAILY_TTL', str(24 * 3600)))  # 공시 목록 등
+    DART_PROBE_WORKERS = int(os.getenv('DART_PROBE_WORKERS', '8'))  # 보고서 후보 동시 조회 스레드 수
+    DART_MEMO_SIZE = int(os.getenv('DART_MEMO_SIZE', '512'))  # 종목별 조회 결과 메모리 LRU 크기
+    DART_RATE_LIMIT = float(os.getenv('DART_RATE_LIMIT', '10'))  # 프로세스 전체 초당 DART 요청 수
+    DART_BURST = int(os.getenv('DART_BURST', '10'))  # 순간적으로 허용할 최대 요청 수
+    DART_CIRCUIT_COOLDOWN = int(os.getenv('DART_CIRCUIT_COOLDOWN', '900'))  # 020(한도 초과) 후 호출을 멈출 시간(초)
+    DART_DOWNLOAD_TIMEOUT = float(os.getenv('DART_DOWNLOAD_TIMEOUT', '60'))  # corpCode.zip 다운로드 읽기 타임아웃(초)
+    DART_LIST_MAX_PAGES = int(os.getenv('DART_LIST_MAX_PAGES', '10'))  # 공시 목록 최대 페이지 수 (페이지당 100건)
+    
+    # 상장사 재무 지표 사전 수집 (python dart_prefetch.py)
+    DART_SNAPSHOT_PATH = os.getenv('DART_SNAPSHOT_PATH', os.path.join(CACHE_DIR, 'dart_snapshot'))  # 확장자 제외 (.parquet / .pkl)
+    DART_SNAPSHOT_MAX_AGE_DAYS = int(os.getenv('DART_SNAPSHOT_MAX_AGE_DAYS', '14'))  # 이보다 오래된 행은 DART 직접 조회
+    DART_PREFETCH_RATE = float(os.getenv('DART_PREFETCH_RATE', '5'))  # 사전 수집 시 초당 DART 요청 수
+    DART_PREFETCH_WORKERS = int(os.getenv('DART_PREFETCH_WORKERS', '4'))  # 동시에 수집할 기업 수
+    
     # AWS 배포 감지
     IS_AWS = bool(os.getenv('AWS_EXECUTION_ENV'))
     
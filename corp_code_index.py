@@ -0,0 +1,151 @@
+# corp_code_index.py - DART corpCode.xml 메모리 색인 (종목명/종목코드/기업코드 조회)
+
+import xml.etree.ElementTree as ET
+
+# 자주 쓰는 약칭 → 공식 종목명
+CORP_NAME_ALIASES = {
+    '삼성': '삼성전자',
+    'LG': 'LG전자',
+    '네이버': 'NAVER',
+    '현대차': '현대자동차',
+    '포스코': 'POSCO',
+    'SK': 'SK이노베이션',
+    'KT': 'KT',
+    '하나': '하나금융지주',
+    '우리': '우리금융지주',
+    'CJ': 'CJ제일제당',
+    '아모레': '아모레퍼시픽',
+    '셀트리온': '셀트리온',
+    'KB': 'KB금융',
+    'LG화학': 'LG에너지솔루션',
+    'LG솔루션': 'LG에너지솔루션',
+    'LS 일레트릭': 'LS ELECTRIC',
+    'LGU플러스': 'LG유플러스'
+}
+
+
+def normalize_corp_name(name):
+    """종목명 정규화 (앞뒤 공백, (주)/㈜, 공백 제거)"""
+    if not name:
+        return ""
+    return name.strip().replace("(주)", "").replace("㈜", "").replace(" ", "")
+
+
+def _bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class CorpCodeIndex:
+    """
+    상장 기업 corpCode 색인 (XML은 시작 시 한 번만 파싱)
+
+    - names: 기업명 (XML 순서, 부분 일치 시 앞선 기업 우선)
+    - exact / normalized: 기업명 → 행 번호
+    - stock_to_corp: 종목코드 → 기업코드
+    - corp_to_name: 기업코드 → 기업명
+    - 부분 일치는 글자 bigram 역색인으로 후보를 좁힌 뒤 확인
+    """
+
+    def __init__(self, rows=()):
+        """
+        Args:
+            rows: (기업명, 종목코드, 기업코드) 튜플들 (상장 기업만, XML 순서)
+        """
+        self.names = []
+        self.stock_codes = []
+        self.exact = {}
+        self.normalized = {}
+        self.stock_to_corp = {}
+        self.corp_to_name = {}
+        self._bigram_postings = {}
+
+        for corp_name, stock_code, corp_code in rows:
+            row = len(self.names)
+            self.names.append(corp_name)
+            self.stock_codes.append(stock_code)
+            self.exact.setdefault(corp_name, row)
+            self.normalized.setdefault(normalize_corp_name(corp_name), row)
+            self.stock_to_corp[stock_code] = corp_code
+            self.corp_to_name[corp_code] = corp_name
+            for bigram in _bigrams(corp_name):
+                self._bigram_postings.setdefault(bigram, []).append(row)
+
+    @classmethod
+    def from_xml(cls, xml_path):
+        """
+        corpCode.xml 스트리밍 파싱 (6자리 종목코드가 있는 상장 기업만 색인)
+
+        Args:
+            xml_path: corpCode.xml 경로
+
+        Returns:
+            CorpCodeIndex
+        """
+        def iter_rows():
+            for _, elem in ET.iterparse(xml_path, events=('end',)):
+                if elem.tag != 'list':
+                    continue
+                corp_name = (elem.findtext('corp_name') or '').strip()
+                stock_code = (elem.findtext('stock_code') or '').strip()
+                corp_code = (elem.findtext('corp_code') or '').strip()
+                elem.clear()  # 처리한 항목은 바로 해제 (전체 트리를 메모리에 두지 않음)
+                if corp_name and corp_code and len(stock_code) == 6:
+                    yield corp_name, stock_code, corp_code
+
+        return cls(iter_rows())
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_corp_code(self, stock_code):
+        """종목코드(6자리) → 기업코드(8자리), 없으면 None"""
+        return self.stock_to_corp.get(str(stock_code).zfill(6))
+
+    def get_corp_name(self, corp_code):
+        """기업코드 → 기업명, 없으면 None"""
+        return self.corp_to_name.get(corp_code)
+
+    def _find_substring(self, name):
+        """입력이 기업명에 포함되는 첫 번째(XML 순서) 기업 행 번호"""
+        if len(name) < 2:
+            candidates = range(len(self.names))
+        else:
+            postings = [self._bigram_postings.get(bigram) for bigram in _bigrams(name)]
+            if not all(postings):
+                return None
+            # 가장 짧은 목록부터 교집합 (목록은 행 번호 오름차순)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return None
+            candidates = sorted(candidates)
+
+        for row in candidates:
+            if name in self.names[row]:
+                return row
+        return None
+
+    def find_stock_code(self, stock_name, use_aliases=True):
+        """
+        종목명으로 종목코드 검색 (정확 → 정규화 → 약칭 → 부분 일치)
+
+        Args:
+            stock_name: 검색할 종목명
+            use_aliases: 약칭 사전 사용 여부
+
+        Returns:
+            str: 6자리 종목코드 또는 None
+        """
+        if not stock_name:
+            return None
+
+        row = self.exact.get(stock_name)
+        if row is None:
+            row = self.normalized.get(normalize_corp_name(stock_name))
+        if row is None and use_aliases and stock_name in CORP_NAME_ALIASES:
+            return self.find_stock_code(CORP_NAME_ALIASES[stock_name], use_aliases=False)
+        if row is None:
+            row = self._find_substring(stock_name)
+        return self.stock_codes[row] if row is not None else None
@@ -0,0 +1,457 @@
+# dart_client.py - DART OpenAPI 호출 (공유 세션 / 속도 제한 / 한도 차단기) + 보고서 기간을 고려한 영속 캐시
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+
+from cache_utils import DiskCache
+from config import Config
+from http_utils import default_timeout, get_rate_limiter, get_session
+
+DART_BASE_URL = "https://opendart.fss.or.kr/api"
+
+# DART 응답 상태 코드
+STATUS_OK = '000'
+STATUS_NO_DATA = '013'
+STATUS_QUOTA_EXCEEDED = '020'  # 요청 제한 초과 (일일 한도)
+
+# 보고서 코드 → 보고 기간 종료 (월, 일)
+REPORT_PERIOD_END = {
+    '11013': (3, 31),   # 1분기보고서
+    '11012': (6, 30),   # 반기보고서
+    '11014': (9, 30),   # 3분기보고서
+    '11011': (12, 31)   # 사업보고서
+}
+
+# 같은 연도 안에서의 보고서 우선순위: 사업보고서 -> 3Q -> 2Q -> 1Q
+REPORT_PRIORITY = ('11011', '11014', '11012', '11013')
+
+_probe_executor = None
+_probe_lock = threading.Lock()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def is_closed_period(bsns_year, reprt_code, today=None):
+    """
+    보고 기간이 이미 끝났는지 (끝난 기간의 정기보고서는 내용이 바뀌지 않음)
+
+    Args:
+        bsns_year: 사업연도
+        reprt_code: 보고서 코드 (11011/11012/11013/11014)
+        today: 기준일 (없으면 오늘)
+
+    Returns:
+        bool
+    """
+    period_end = REPORT_PERIOD_END.get(str(reprt_code))
+    if period_end is None:
+        return False
+    try:
+        end = date(int(bsns_year), *period_end)
+    except (TypeError, ValueError):
+        return False
+    return end < (today or date.today())
+
+
+def recent_report_periods(count=5, today=None):
+    """
+    기간이 끝난 최근 정기보고서 후보 (최근 기간부터)
+
+    사업보고서는 결산 후 3개월 안에 제출되므로 연초에는 전년도 사업보고서와
+    3분기보고서가 함께 후보에 들어가도록 기본 5개를 반환합니다.
+
+    Args:
+        count: 후보 수
+        today: 기준일 (없으면 오늘)
+
+    Returns:
+        [(사업연도, 보고서 코드), ...]
+    """
+    today = today or date.today()
+    periods = []
+    year = today.year
+    while len(periods) < count:
+        for reprt_code in REPORT_PRIORITY:
+            if is_closed_period(year, reprt_code, today):
+                periods.append((year, reprt_code))
+        year -= 1
+    return periods[:count]
+
+
+def _get_probe_executor():
+    global _probe_executor
+    with _probe_lock:
+        if _probe_executor is None:
+            _probe_executor = ThreadPoolExecutor(max_workers=Config.DART_PROBE_WORKERS,
+                                                 thread_name_prefix='dart-probe')
+        return _probe_executor
+
+
+def submit_request(func, *args):
+    """
+    DART 조회 하나를 공유 스레드 풀에 제출
+
+    제출한 함수 안에서 다시 이 풀의 결과를 기다리면 풀이 가득 찼을 때 멈출 수 있으므로,
+    말단 조회(get_json 한두 번)만 제출하세요.
+
+    Returns:
+        concurrent.futures.Future
+    """
+    return _get_probe_executor().submit(func, *args)
+
+
+def probe_first(candidates, fetch):
+    """
+    후보들을 동시에 조회하고 우선순위가 가장 높은 성공 결과 반환
+
+    앞선 후보가 성공하면 뒤 후보의 결과는 기다리지 않고, 아직 시작하지 않은 조회는 취소합니다.
+    (이미 진행 중인 조회는 끝까지 실행돼 응답 캐시에 남음)
+
+    Args:
+        candidates: 우선순위 순서의 후보 목록
+        fetch: 후보 하나를 받아 결과 또는 None(실패)을 반환하는 함수
+
+    Returns:
+        (후보, 결과) 또는 (None, None)
+    """
+    futures = [submit_request(fetch, candidate) for candidate in candidates]
+    try:
+        for candidate, future in zip(candidates, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"⚠️ DART 조회 실패 ({candidate}): {e}")
+                continue
+            if result is not None:
+                return candidate, result
+        return None, None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+class DARTQuotaExceeded(Exception):
+    """DART 요청 한도 초과 (status 020, 또는 차단기가 열려 있어 요청하지 않음)"""
+
+
+class CircuitBreaker:
+    """
+    요청 한도 초과 차단기
+
+    020을 받으면 열려서 cooldown 동안 DART를 호출하지 않고 바로 실패합니다.
+    cooldown이 지나면 요청 하나만 시험으로 보내고(half-open), 성공하면 닫고 다시 020이면 또 엽니다.
+    시험 요청이 그 밖의 이유(네트워크 오류, 잘못된 응답 등)로 실패하면 다음 요청을 다시 시험으로 보냅니다.
+    """
+
+    def __init__(self, cooldown):
+        self.cooldown = cooldown
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self):
+        """요청을 보내도 되는지 (열린 상태면 False)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """020이 아닌 실패 (한도 상태를 알 수 없으므로 열린 상태면 시험 요청 자리만 비움)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def trip(self):
+        with self._lock:
+            if self._opened_at is None or self._trial_in_flight:
+                self.trips += 1
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None
+
+    def stats(self):
+        with self._lock:
+            remaining = 0.0
+            if self._opened_at is not None:
+                remaining = max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+            return {
+                'state': 'open' if self._opened_at is not None else 'closed',
+                'retry_in_seconds': round(remaining, 1),
+                'trips': self.trips,
+                'rejected': self.rejected
+            }
+
+
+def get_circuit_breaker(api_key):
+    """API 키별 공유 차단기 (같은 키를 쓰는 모든 클라이언트가 한도를 함께 씀)"""
+    with _breakers_lock:
+        breaker = _breakers.get(api_key)
+        if breaker is None:
+            breaker = CircuitBreaker(Config.DART_CIRCUIT_COOLDOWN)
+            _breakers[api_key] = breaker
+        return breaker
+
+
+class EndpointMetrics:
+    """엔드포인트별 요청 수 / 캐시 적중 / 오류 / 지연 시간 (최근 LATENCY_WINDOW개 기준 p95)"""
+
+    LATENCY_WINDOW = 200
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _entry(self, endpoint):
+        entry = self._endpoints.get(endpoint)
+        if entry is None:
+            entry = {'requests': 0, 'cache_hits': 0, 'errors': {}, 'total_ms': 0.0,
+                     'max_ms': 0.0, 'recent_ms': deque(maxlen=self.LATENCY_WINDOW)}
+            self._endpoints[endpoint] = entry
+        return entry
+
+    def record_cache_hit(self, endpoint):
+        with self._lock:
+            self._entry(endpoint)['cache_hits'] += 1
+
+    def record_request(self, endpoint, elapsed_ms, error=None):
+        """
+        Args:
+            endpoint: 엔드포인트
+            elapsed_ms: 응답까지 걸린 시간 (대기 시간 제외)
+            error: 오류 종류 (예: 'http_503', 'timeout', 'status_020'), 성공이면 None
+        """
+        with self._lock:
+            entry = self._entry(endpoint)
+            entry['requests'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['recent_ms'].append(elapsed_ms)
+            if error:
+                entry['errors'][error] = entry['errors'].get(error, 0) + 1
+
+    def record_error(self, endpoint, error):
+        """HTTP 200이지만 DART 상태가 오류인 응답 (요청 수/지연 시간은 이미 기록됨)"""
+        with self._lock:
+            errors = self._entry(endpoint)['errors']
+            errors[error] = errors.get(error, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._endpoints.items():
+                recent = sorted(entry['recent_ms'])
+                result[endpoint] = {
+                    'requests': entry['requests'],
+                    'cache_hits': entry['cache_hits'],
+                    'errors': dict(entry['errors']),
+                    'avg_ms': round(entry['total_ms'] / entry['requests'], 1) if entry['requests'] else 0.0,
+                    'p95_ms': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 1) if recent else 0.0,
+                    'max_ms': round(entry['max_ms'], 1)
+                }
+            return result
+
+
+class DARTClient:
+    """
+    DART OpenAPI 클라이언트 (응답을 디스크에 캐시해 같은 종목을 다시 조회할 때 API를 호출하지 않음)
+
+    캐시 키: (엔드포인트, corp_code, bsns_year, reprt_code, 나머지 파라미터)
+    유효 기간:
+    - 끝난 기간의 정기보고서 조회 성공: 사실상 무기한 (DART_CACHE_CLOSED_TTL)
+    - 데이터 없음(013): 짧게 (DART_CACHE_NO_DATA_TTL, 보고서가 곧 제출될 수 있음)
+    - 공시 목록(list.json) 등 그 외 성공 응답: 하루 (DART_CACHE_DAILY_TTL)
+    - HTTP 오류 / 그 외 오류 상태: 캐시하지 않음
+
+    실제 호출은 공유 세션(연결 풀 + 429/5xx 재시도·백오프)과 공유 토큰 버킷을 거치며,
+    020을 받으면 차단기가 열려 한도가 풀릴 때까지 바로 실패합니다.
+    """
+
+    def __init__(self, api_key, cache=None, rate_limiter=None):
+        """
+        Args:
+            api_key: DART API 키
+            cache: DiskCache (없으면 Config.DART_CACHE_PATH)
+            rate_limiter: 실제 API 호출 전에 토큰을 받을 TokenBucket (없으면 프로세스 공유 'dart' 제한기)
+        """
+        self.api_key = api_key
+        self.cache = cache if cache is not None else DiskCache(Config.DART_CACHE_PATH, Config.DART_CACHE_MAX_ENTRIES)
+        self.session = get_session('dart')
+        self.rate_limiter = rate_limiter or get_rate_limiter('dart', Config.DART_RATE_LIMIT, Config.DART_BURST)
+        self.circuit = get_circuit_breaker(api_key)
+        self.metrics = EndpointMetrics()
+        self._calls_lock = threading.Lock()
+        self.api_calls = 0
+
+    @property
+    def quota_exceeded(self):
+        """요청 한도 초과로 차단기가 열려 있는지 (배치 작업 중단 판단용)"""
+        return self.circuit.is_open()
+
+    @staticmethod
+    def cache_key(endpoint, params):
+        """정규화된 캐시 키 (API 키 제외)"""
+        params = {k: str(v) for k, v in params.items() if k != 'crtfc_key'}
+        fixed = [params.pop(name, '') for name in ('corp_code', 'bsns_year', 'reprt_code')]
+        extra = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+        return '|'.join(['dart', endpoint, *fixed, extra])
+
+    @staticmethod
+    def cache_ttl(endpoint, params, data):
+        """
+        응답별 캐시 유효 기간(초)
+
+        Returns:
+            int 또는 None (캐시하지 않음)
+        """
+        status = data.get('status')
+        if status == STATUS_NO_DATA:
+            return Config.DART_CACHE_NO_DATA_TTL
+        if status != STATUS_OK:
+            return None
+        if endpoint != 'list.json' and is_closed_period(params.get('bsns_year'), params.get('reprt_code')):
+            return Config.DART_CACHE_CLOSED_TTL
+        return Config.DART_CACHE_DAILY_TTL
+
+    def _request(self, endpoint, params, timeout, stream=False):
+        """
+        차단기 / 속도 제한 / 지표 기록을 거친 실제 GET 요청
+
+        Returns:
+            requests.Response (HTTP 200)
+        """
+        if not self.circuit.allow():
+            raise DARTQuotaExceeded("DART 요청 한도 초과 - 차단기 열림")
+
+        self.rate_limiter.acquire()
+        with self._calls_lock:
+            self.api_calls += 1
+
+        started = time.monotonic()
+        try:
+            response = self.session.get(
+                f"{DART_BASE_URL}/{endpoint}",
+                params={'crtfc_key': self.api_key, **params},
+                timeout=timeout or default_timeout(),
+                stream=stream
+            )
+            response.raise_for_status()
+        except Exception as e:
+            status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+            error = f"http_{status_code}" if status_code else type(e).__name__
+            self.metrics.record_request(endpoint, (time.monotonic() - started) * 1000, error)
+            self.circuit.record_failure()
+            raise
+        self.metrics.record_request(endpoint, (time.monotonic() - started) * 1000)
+        return response
+
+    def get_json(self, endpoint, params, timeout=None):
+        """
+        DART API GET 요청 (캐시 우선)
+
+        Args:
+            endpoint: 엔드포인트 (예: 'fnlttSinglIndx.json')
+            params: 요청 파라미터 (crtfc_key는 자동 추가)
+            timeout: 요청 타임아웃 (없으면 http_utils.default_timeout())
+
+        Returns:
+            dict: DART 응답 JSON ('status', 'message', 'list' ...)
+
+        Raises:
+            requests.RequestException: HTTP 오류 (일시적 오류는 세션에서 재시도한 뒤)
+            DARTQuotaExceeded: 요청 한도 초과 (020) 또는 차단기 열림
+        """
+        key = self.cache_key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.metrics.record_cache_hit(endpoint)
+            return cached
+
+        response = self._request(endpoint, params, timeout)
+        try:
+            data = response.json()
+        except ValueError:
+            self.metrics.record_error(endpoint, 'invalid_json')
+            self.circuit.record_failure()
+            raise
+        if data.get('status') == STATUS_QUOTA_EXCEEDED:
+            self.circuit.trip()
+            self.metrics.record_error(endpoint, f"status_{STATUS_QUOTA_EXCEEDED}")
+            print(f"⛔ DART 요청 한도 초과 - {Config.DART_CIRCUIT_COOLDOWN}초 동안 DART 호출 중단")
+            raise DARTQuotaExceeded(data.get('message', 'DART 요청 한도 초과'))
+        self.circuit.record_success()
+
+        ttl = self.cache_ttl(endpoint, params, data)
+        if ttl:
+            self.cache.put(key, data, ttl)
+        return data
+
+    def download(self, endpoint, path, params=None, timeout=None):
+        """
+        파일 다운로드 (예: corpCode.xml → ZIP), 임시 파일에 받은 뒤 교체
+
+        Args:
+            endpoint: 엔드포인트
+            path: 저장 경로
+            params: 추가 파라미터
+            timeout: (연결, 읽기) 타임아웃 (없으면 읽기 DART_DOWNLOAD_TIMEOUT초)
+
+        Returns:
+            int: 받은 바이트 수
+        """
+        timeout = timeout or (Config.HTTP_CONNECT_TIMEOUT, Config.DART_DOWNLOAD_TIMEOUT)
+        response = self._request(endpoint, params or {}, timeout, stream=True)
+
+        # 오류는 ZIP 대신 JSON/XML 본문으로 옴
+        content_type = response.headers.get('Content-Type', '')
+        if 'json' in content_type or 'xml' in content_type:
+            body = response.text
+            if f'<status>{STATUS_QUOTA_EXCEEDED}</status>' in body or f'"status":"{STATUS_QUOTA_EXCEEDED}"' in body:
+                self.circuit.trip()
+                raise DARTQuotaExceeded("DART 요청 한도 초과")
+            self.circuit.record_failure()
+            raise requests.HTTPError(f"DART 다운로드 오류 응답: {body[:200]}", response=response)
+
+        tmp_path = path + '.tmp'
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                for block in response.iter_content(chunk_size=1 << 16):
+                    f.write(block)
+                    size += len(block)
+            os.replace(tmp_path, path)
+        except Exception:
+            self.circuit.record_failure()  # 받는 도중 끊김 / 디스크 오류
+            raise
+        self.circuit.record_success()
+        return size
+
+    def stats(self):
+        """캐시 통계 + 실제 API 호출 수 + 차단기 / 속도 제한 / 엔드포인트별 지표"""
+        return {
+            **self.cache.stats(),
+            'api_calls': self.api_calls,
+            'circuit': self.circuit.stats(),
+            'rate_limit': self.rate_limiter.stats(),
+            'endpoints': self.metrics.stats()
+        }
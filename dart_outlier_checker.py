@@ -1,16 +1,81 @@
-import requests
 import logging
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
 
+from cache_utils import LRUCache
+from config import Config
+from dart_client import DARTClient, probe_first, submit_request
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 공시 제목 기반 위험 신호 키워드
+RISK_DISCLOSURE_KEYWORDS = {
+    # 자본조달 관련 키워드 (확장된 키워드 리스트)
+    'capital_raising': [
+        '유상증자', '무상증자', '전환사채', 'CB', 'BW',
+        '신주인수권부사채', '자본조달', '증자', '사채발행',
+        '신주발행', '주식발행'
+    ],
+    'control_change': ['최대주주변경', '최대주주 변경'],
+    'capital_reduction': ['감자결정', '감자 결정'],
+    'unfaithful_disclosure': ['불성실공시법인'],
+    'delisting_risk': ['관리종목', '상장폐지', '상장적격성', '매매거래정지'],
+    'embezzlement': ['횡령', '배임'],
+    'audit_opinion': ['감사의견거절', '의견거절', '한정의견', '감사범위제한'],
+    'rehabilitation': ['회생절차', '파산신청']
+}
+
+RISK_SIGNAL_LABELS = {
+    'governance_risk': '지배구조위험',
+    'capital_risk': '자본조달위험',
+    'control_change': '최대주주변경',
+    'capital_reduction': '감자',
+    'unfaithful_disclosure': '불성실공시',
+    'delisting_risk': '관리종목·상장폐지 사유',
+    'embezzlement': '횡령·배임',
+    'audit_opinion': '감사의견 비적정',
+    'rehabilitation': '회생·파산'
+}
+
+# 신호별 이름 붙은 그룹 하나로 묶은 정규식 (공시 제목을 한 번만 훑음, 긴 키워드 우선)
+_RISK_PATTERN = re.compile('|'.join(
+    f"(?P<{signal}>{'|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))})"
+    for signal, keywords in RISK_DISCLOSURE_KEYWORDS.items()
+))
+
+def scan_disclosures(disclosures):
+    """
+    공시 목록을 한 번 훑어 신호별 공시 제목 수집 (같은 공시번호는 한 번만)
+    Returns: {신호 이름: [공시 제목, ...]}
+    """
+    matches = {signal: [] for signal in RISK_DISCLOSURE_KEYWORDS}
+    seen = {signal: set() for signal in RISK_DISCLOSURE_KEYWORDS}
+    
+    for report in disclosures:
+        report_title = report.get('report_nm', '')
+        rcept_no = report.get('rcept_no', '')  # 공시번호
+        if not rcept_no:
+            continue
+        
+        for match in _RISK_PATTERN.finditer(report_title):
+            signal = match.lastgroup
+            # 중복 제거 (같은 공시번호는 한 번만 카운트)
+            if rcept_no not in seen[signal]:
+                seen[signal].add(rcept_no)
+                matches[signal].append(report_title)
+    
+    return matches
+
 class DARTOutlierChecker:
-    def __init__(self, dart_api_key):
+    def __init__(self, dart_api_key, dart_client=None, snapshot=None):
         self.dart_api_key = dart_api_key
-        self.base_url = "https://opendart.fss.or.kr/api"
+        self.dart_client = dart_client or DARTClient(dart_api_key)
+        self.snapshot = snapshot  # FinancialSnapshot (사전 수집 값이 있으면 DART를 호출하지 않음)
+        self.shareholder_memo = LRUCache(Config.DART_MEMO_SIZE)  # 기업코드 → (최대주주 지분율, 연도)
         
     def check_major_shareholder_outlier(self, corp_code):
         """
@@ -18,50 +83,74 @@ class DARTOutlierChecker:
         Returns: True if outlier (지분율 < 10%), False otherwise
         """
         try:
-            current_year = datetime.now().year
-            
-            # 최신 연도부터 시도, 실패시 이전 연도로 fallback
-            for year_offset in range(0, 3):  # 최대 3년 전까지 시도
-                target_year = current_year - year_offset
-                
-                url = f"{self.base_url}/majorShareHolder.json"
-                params = {
-                    'crtfc_key': self.dart_api_key,
-                    'corp_code': corp_code,
-                    'bsns_year': str(target_year),
-                    'reprt_code': '11011'  # 사업보고서
-                }
-                
-                response = requests.get(url, params=params, timeout=10)
-                
-                if response.status_code != 200:
-                    logger.warning(f"HTTP {response.status_code} for year {target_year}")
-                    continue
-                    
-                data = response.json()
-                
-                if data.get('status') == '000':  # 성공
-                    return self._parse_major_shareholder_data(data, target_year)
-                elif data.get('status') == '013':  # 데이터 없음
-                    logger.info(f"No data for year {target_year}, trying previous year")
-                    continue
-                else:
-                    logger.warning(f"API error {data.get('status')}: {data.get('message', '')}")
-                    continue
+            found = self.get_major_shareholder_ratio(corp_code)
+            if found is None:
+                return False
             
-            logger.warning("No shareholder data available for recent years")
-            return False
+            # 10% 미만이면 outlier
+            return found[0] < 10.0
             
         except Exception as e:
             logger.error(f"Error in major shareholder check: {str(e)}")
             return False  # 오류 발생시 조용히 False 반환
     
+    def get_major_shareholder_ratio(self, corp_code):
+        """
+        최대주주 지분율 조회 (스냅샷 → 메모리 캐시 → DART 최근 3개 연도 동시 조회)
+        Returns: (지분율, 사업연도) or None
+        """
+        record = self.snapshot.get(corp_code) if self.snapshot else None
+        if record is not None and record.get('shareholder_ratio') is not None:
+            return record['shareholder_ratio'], int(record['shareholder_year'])
+        
+        cached = self.shareholder_memo.get(corp_code)
+        if cached is not None:
+            return cached
+        
+        current_year = datetime.now().year
+        
+        # 최근 3개 연도를 동시에 조회해 가장 최신 연도의 성공 결과 사용
+        target_year, data = probe_first(
+            [current_year - year_offset for year_offset in range(0, 3)],
+            lambda year: self._fetch_major_shareholder(corp_code, year)
+        )
+        
+        if data is None:
+            logger.warning("No shareholder data available for recent years")
+            return None
+        
+        max_ratio = self._parse_major_shareholder_data(data, target_year)
+        if max_ratio is None:
+            return None
+        
+        found = (max_ratio, target_year)
+        self.shareholder_memo.put(corp_code, found)
+        return found
+    
+    def _fetch_major_shareholder(self, corp_code, year):
+        """사업보고서 최대주주 현황 조회 - 성공(000)이면 응답, 아니면 None"""
+        params = {
+            'corp_code': corp_code,
+            'bsns_year': str(year),
+            'reprt_code': '11011'  # 사업보고서
+        }
+        
+        data = self.dart_client.get_json('majorShareHolder.json', params)
+        
+        if data.get('status') == '000':  # 성공
+            return data
+        elif data.get('status') == '013':  # 데이터 없음
+            logger.info(f"No data for year {year}, trying previous year")
+        else:
+            logger.warning(f"API error {data.get('status')}: {data.get('message', '')}")
+        return None
+    
     def _parse_major_shareholder_data(self, data, year):
-        """최대주주 데이터 파싱 - 내부 메서드"""
+        """최대주주 데이터 파싱 - 내부 메서드 (가장 높은 지분율, 없으면 None)"""
         shareholders = data.get('list', [])
         if not shareholders:
             logger.warning(f"No shareholder data for {year}")
-            return False
+            return None
         
         # 최대주주 찾기 (지분율이 가장 높은 주주)
         max_ratio = 0.0
@@ -84,12 +173,10 @@ class DARTOutlierChecker:
         
         if max_ratio == 0.0:
             logger.warning("Cannot determine major shareholder ratio")
-            return False
+            return None
         
         logger.info(f"Major shareholder ratio: {max_ratio}% ({year})")
-        
-        # 10% 미만이면 outlier
-        return max_ratio < 10.0
+        return max_ratio
             
     def check_capital_increase_outlier(self, corp_code):
         """
@@ -97,78 +184,168 @@ class DARTOutlierChecker:
         Returns: True if outlier (3회 이상), False otherwise
         """
         try:
-            # 검색 기간 설정 (3년)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=3*365)
-            
-            url = f"{self.base_url}/list.json"
-            params = {
-                'crtfc_key': self.dart_api_key,
-                'corp_code': corp_code,
-                'bgn_de': start_date.strftime('%Y%m%d'),
-                'end_de': end_date.strftime('%Y%m%d'),
-                'page_count': '100'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code != 200:
-                logger.warning(f"HTTP {response.status_code} in capital increase check")
-                return False
-                
-            data = response.json()
-            if data.get('status') != '000':
-                logger.warning(f"API error in capital increase: {data.get('message', '')}")
-                return False
-                
-            # 자본조달 관련 키워드 검색 (확장된 키워드 리스트)
-            keywords = [
-                '유상증자', '무상증자', '전환사채', 'CB', 'BW', 
-                '신주인수권부사채', '자본조달', '증자', '사채발행',
-                '신주발행', '주식발행'
-            ]
-            
-            unique_reports = set()  # 중복 제거용
-            
-            for report in data.get('list', []):
-                report_title = report.get('report_nm', '')
-                rcept_no = report.get('rcept_no', '')  # 공시번호
-                
-                # 키워드 매칭
-                if any(keyword in report_title for keyword in keywords):
-                    # 중복 제거 (같은 공시번호는 한 번만 카운트)
-                    if rcept_no and rcept_no not in unique_reports:
-                        unique_reports.add(rcept_no)
-                        logger.info(f"Capital increase found: {report_title}")
-            
-            capital_count = len(unique_reports)
-            logger.info(f"Total capital increases in 3 years: {capital_count}")
+            capital_count = self.count_capital_raisings(corp_code)
             
             # 3회 이상이면 outlier
-            return capital_count >= 3
+            return capital_count is not None and capital_count >= 3
                         
         except Exception as e:
             logger.error(f"Error in capital increase check: {str(e)}")
             return False  # 오류 발생시 False 반환
-
-    def check_all_outliers(self, corp_code):
+    
+    def count_capital_raisings(self, corp_code):
         """
-        모든 outlier 체크를 한 번에 수행 (새로운 메서드)
-        Returns: dict with all check results
+        최근 3년간 자본조달 공시 수 (스냅샷 → DART 공시 목록)
+        Returns: int or None (조회 실패)
+        """
+        record = self.snapshot.get(corp_code) if self.snapshot else None
+        if record is not None and record.get('capital_raising_count') is not None:
+            return int(record['capital_raising_count'])
+        
+        disclosures = self.list_disclosures(corp_code)
+        if disclosures is None:
+            return None
+        
+        capital_count = len(scan_disclosures(disclosures)['capital_raising'])
+        logger.info(f"Total capital increases in 3 years: {capital_count}")
+        return capital_count
+    
+    def _fetch_disclosure_page(self, corp_code, bgn_de, end_de, page_no):
+        """공시 목록 한 페이지 (공시 목록은 하루 단위로 캐시)"""
+        params = {
+            'corp_code': corp_code,
+            'bgn_de': bgn_de,
+            'end_de': end_de,
+            'page_no': str(page_no),
+            'page_count': '100'
+        }
+        return self.dart_client.get_json('list.json', params)
+    
+    @staticmethod
+    def _disclosure_period(years=3):
+        """공시 검색 기간 (시작일, 종료일) - YYYYMMDD"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=years*365)
+        return start_date.strftime('%Y%m%d'), end_date.strftime('%Y%m%d')
+    
+    def list_disclosures(self, corp_code, years=3):
+        """
+        최근 공시 목록 전체 (100건 넘으면 나머지 페이지를 동시에 조회, 최대 DART_LIST_MAX_PAGES 페이지)
+        Returns: list of disclosures, [] if none (013), None on API error
+        """
+        bgn_de, end_de = self._disclosure_period(years)
+        data = self._fetch_disclosure_page(corp_code, bgn_de, end_de, 1)
+        return self._collect_disclosures(corp_code, bgn_de, end_de, data)
+    
+    def _collect_disclosures(self, corp_code, bgn_de, end_de, data):
+        """
+        첫 페이지 응답을 받아 나머지 페이지를 모아 공시 목록 완성
+        
+        나머지 페이지는 공유 풀에 페이지 단위로 제출하고 이 스레드에서 기다리므로,
+        풀 작업 안에서 호출하면 안 됩니다 (풀이 가득 차면 서로를 기다리며 멈춤).
+        """
+        if data.get('status') == '013':  # 기간 내 공시 없음
+            return []
+        if data.get('status') != '000':
+            logger.warning(f"API error in disclosure list: {data.get('message', '')}")
+            return None
+        
+        disclosures = list(data.get('list', []))
+        total_page = min(int(data.get('total_page') or 1), Config.DART_LIST_MAX_PAGES)
+        if total_page > 1:
+            futures = [submit_request(self._fetch_disclosure_page, corp_code, bgn_de, end_de, page_no)
+                       for page_no in range(2, total_page + 1)]
+            for future in futures:
+                page = future.result()
+                if page.get('status') == '000':
+                    disclosures.extend(page.get('list', []))
+        
+        if int(data.get('total_page') or 1) > total_page:
+            logger.warning(f"Disclosure list truncated at {total_page} pages ({data.get('total_count')} total)")
+        return disclosures
+    
+    def evaluate_risk_signals(self, corp_code):
+        """
+        DART 위험 신호 한 번에 평가 (최대주주 지분율 + 공시 목록 1회 스캔)
+        
+        공시 목록 첫 페이지와 최대주주 현황(최근 3개 연도)을 동시에 조회하고,
+        공시 제목은 한 번만 훑어 모든 공시 기반 신호를 함께 판정합니다.
+        
+        Returns: dict
+            signals: {신호 이름: bool} (governance_risk, capital_risk, 그 외 RISK_DISCLOSURE_KEYWORDS)
+            reasons: 감지된 신호의 한글 이름 목록
+            details: 지분율 / 자본조달 횟수 / 신호별 공시 수와 예시 제목
+            has_any_risk, errors, timings_ms
         """
+        started = time.perf_counter()
         result = {
             'corp_code': corp_code,
-            'governance_risk': False,
-            'capital_risk': False,
-            'has_any_risk': False
+            'signals': {'governance_risk': False, 'capital_risk': False},
+            'reasons': [],
+            'details': {},
+            'has_any_risk': False,
+            'errors': [],
+            'timings_ms': {}
         }
+        result['signals'].update({signal: False for signal in RISK_DISCLOSURE_KEYWORDS if signal != 'capital_raising'})
+        
+        # 공시 목록 첫 페이지만 풀에 제출하고, 최대주주 조회(연도별 동시 조회)와
+        # 나머지 페이지 취합은 이 스레드에서 진행 (풀 작업이 다시 풀을 기다리지 않도록)
+        disclosures_started = time.perf_counter()
+        bgn_de, end_de = self._disclosure_period()
+        first_page_future = submit_request(self._fetch_disclosure_page, corp_code, bgn_de, end_de, 1)
+        
+        shareholder_started = time.perf_counter()
+        try:
+            shareholder = self.get_major_shareholder_ratio(corp_code)
+        except Exception as e:
+            shareholder = None
+            result['errors'].append(f"major_shareholder: {e}")
+        result['timings_ms']['major_shareholder'] = round((time.perf_counter() - shareholder_started) * 1000, 1)
         
-        # 지배구조 위험 체크
-        result['governance_risk'] = self.check_major_shareholder_outlier(corp_code)
+        if shareholder is not None:
+            ratio, year = shareholder
+            result['details']['major_shareholder_ratio'] = ratio
+            result['details']['major_shareholder_year'] = year
+            result['signals']['governance_risk'] = ratio < 10.0  # 10% 미만이면 outlier
         
-        # 자본조달 위험 체크  
-        result['capital_risk'] = self.check_capital_increase_outlier(corp_code)
+        try:
+            disclosures = self._collect_disclosures(corp_code, bgn_de, end_de, first_page_future.result())
+        except Exception as e:
+            disclosures = None
+            result['errors'].append(f"disclosures: {e}")
+        result['timings_ms']['disclosures'] = round((time.perf_counter() - disclosures_started) * 1000, 1)
+        
+        if disclosures is not None:
+            matches = scan_disclosures(disclosures)
+            capital_count = len(matches['capital_raising'])
+            result['details']['disclosures_scanned'] = len(disclosures)
+            result['details']['capital_raising_count'] = capital_count
+            result['details']['match_counts'] = {signal: len(titles) for signal, titles in matches.items() if titles}
+            result['details']['matched'] = {signal: titles[:5] for signal, titles in matches.items() if titles}  # 신호별 예시 공시 제목
+            result['signals']['capital_risk'] = capital_count >= 3  # 3회 이상이면 outlier
+            for signal, titles in matches.items():
+                if signal != 'capital_raising':
+                    result['signals'][signal] = bool(titles)
         
-        # 하나라도 위험이 있으면 True
-        result['has_any_risk'] = result['governance_risk'] or result['capital_risk']
+        result['reasons'] = [RISK_SIGNAL_LABELS[signal] for signal, found in result['signals'].items() if found]
+        result['has_any_risk'] = bool(result['reasons'])
+        result['timings_ms']['total'] = round((time.perf_counter() - started) * 1000, 1)
+        
+        logger.info(f"Risk signals for {corp_code}: {result['reasons'] or 'none'} ({result['timings_ms']})")
+        return result
+    
+    def check_all_outliers(self, corp_code):
+        """
+        모든 outlier 체크를 한 번에 수행 (evaluate_risk_signals 결과 요약)
+        Returns: dict with all check results
+        """
+        signals = self.evaluate_risk_signals(corp_code)
         
-        return result
\ No newline at end of file
+        return {
+            'corp_code': corp_code,
+            'governance_risk': signals['signals']['governance_risk'],
+            'capital_risk': signals['signals']['capital_risk'],
+            'has_any_risk': signals['has_any_risk'],
+            'risk_signals': signals
+        }
\ No newline at end of file
@@ -0,0 +1,203 @@
+# dart_prefetch.py - 상장사 재무 지표 일괄 사전 수집 (오프라인 배치, 중단 후 이어서 실행 가능)
+
+"""
+모든 상장사의 부채비율 / 최대주주 지분율 / 최근 3년 자본조달 공시 수를 DART에서 미리 받아
+열 단위 스냅샷(financial_snapshot.py)으로 저장합니다. StockChecker는 스냅샷을 먼저 보고,
+없는 값만 DART에 직접 요청합니다.
+
+사용법:
+    python dart_prefetch.py            # 이어서 수집 (최근 수집한 기업은 건너뜀)
+    python dart_prefetch.py 100        # 최대 100개 기업만 수집
+    python dart_prefetch.py --fresh    # 진행 기록을 지우고 처음부터 수집
+
+- 요청 속도: DART_PREFETCH_RATE (초당 요청 수, 캐시 적중은 제외)
+- 일일 한도 초과(020)를 받으면 그때까지의 결과를 저장하고 멈춤 → 다음 날 다시 실행하면 이어서 수집
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config import Config
+from corp_code_index import CorpCodeIndex
+from dart_client import DARTClient, DARTQuotaExceeded
+from dart_outlier_checker import DARTOutlierChecker
+from financial_snapshot import write_snapshot
+from http_utils import get_rate_limiter
+from stock_checker import fetch_debt_ratio
+import stock_mappings
+
+PROGRESS_PATH = Config.DART_SNAPSHOT_PATH + '.progress.jsonl'
+SNAPSHOT_EVERY = 200  # 이 개수만큼 수집할 때마다 중간 스냅샷 저장
+
+
+def load_targets(corp_code_xml=None):
+    """
+    수집 대상 상장사 (stock_mappings 종목 중 corpCode.xml에 기업코드가 있는 것)
+
+    Returns:
+        [(기업코드, 종목코드, 종목명), ...]
+    """
+    corp_code_xml = corp_code_xml or os.path.join(Config.CACHE_DIR, 'corpCode.xml')
+    if not os.path.exists(corp_code_xml):
+        raise FileNotFoundError(f"{corp_code_xml} 없음 - 서버를 한 번 실행해 corpCode.xml을 받으세요")
+
+    corp_index = CorpCodeIndex.from_xml(corp_code_xml)
+    targets = {}
+    for name, stock_code in stock_mappings.MAJOR_STOCK_CODES.items():
+        corp_code = corp_index.get_corp_code(stock_code)
+        if corp_code:
+            targets.setdefault(corp_code, (corp_code, stock_code, name))
+    return list(targets.values())
+
+
+def load_progress(path=PROGRESS_PATH):
+    """진행 기록 (기업코드 → 가장 최근 수집 결과)"""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # 중단 시점에 잘린 마지막 줄
+            records[record['corp_code']] = record
+    return records
+
+
+def collect_company(dart_client, outlier_checker, corp_code, stock_code, corp_name):
+    """
+    기업 하나의 지표 수집
+
+    Returns:
+        dict (financial_snapshot.SNAPSHOT_COLUMNS)
+
+    Raises:
+        DARTQuotaExceeded: 요청 한도 초과 (결과를 저장하지 않음)
+    """
+    if dart_client.quota_exceeded:
+        raise DARTQuotaExceeded("DART 요청 한도 초과")
+
+    debt = fetch_debt_ratio(dart_client, corp_code)
+    shareholder = outlier_checker.get_major_shareholder_ratio(corp_code)
+    capital_count = outlier_checker.count_capital_raisings(corp_code)
+
+    # 후보 동시 조회 중 받은 020은 조회 함수 안에서 실패로 처리되므로 여기서 확인
+    if dart_client.quota_exceeded:
+        raise DARTQuotaExceeded("DART 요청 한도 초과")
+
+    success = debt['status'] == 'success'
+    return {
+        'corp_code': corp_code,
+        'stock_code': stock_code,
+        'corp_name': corp_name,
+        'debt_ratio': debt['debt_ratio'] if success else None,
+        'debt_report_type': debt['report_type'] if success else None,
+        'debt_year': debt['year'] if success else None,
+        'shareholder_ratio': shareholder[0] if shareholder else None,
+        'shareholder_year': shareholder[1] if shareholder else None,
+        'capital_raising_count': capital_count,
+        'fetched_at': time.time()
+    }
+
+
+def run_prefetch(dart_api_key, limit=None, fresh=False):
+    """
+    전체 상장사 사전 수집
+
+    Args:
+        dart_api_key: DART API 키
+        limit: 이번 실행에서 수집할 최대 기업 수
+        fresh: True면 진행 기록을 지우고 처음부터
+
+    Returns:
+        dict: 수집 통계
+    """
+    if fresh and os.path.exists(PROGRESS_PATH):
+        os.remove(PROGRESS_PATH)
+
+    records = load_progress()
+    max_age = Config.DART_SNAPSHOT_MAX_AGE_DAYS * 86400
+    now = time.time()
+    targets = [target for target in load_targets()
+               if now - records.get(target[0], {}).get('fetched_at', 0) > max_age]
+    if limit:
+        targets = targets[:limit]
+
+    print(f"📥 DART 사전 수집 시작: {len(targets)}개 기업 (기존 {len(records)}개)")
+
+    rate_limiter = get_rate_limiter('dart_prefetch', Config.DART_PREFETCH_RATE,
+                                    max(int(Config.DART_PREFETCH_RATE), 1))
+    dart_client = DARTClient(dart_api_key, rate_limiter=rate_limiter)
+    outlier_checker = DARTOutlierChecker(dart_api_key, dart_client=dart_client)
+
+    collected = 0
+    failed = 0
+    remaining = 0  # 한도 초과로 거부되거나 취소되어 다음 실행으로 넘긴 기업
+    quota_exceeded = False
+    started = time.time()
+
+    os.makedirs(os.path.dirname(PROGRESS_PATH), exist_ok=True)
+    with open(PROGRESS_PATH, 'a', encoding='utf-8') as progress, \
+            ThreadPoolExecutor(max_workers=Config.DART_PREFETCH_WORKERS) as executor:
+        futures = [executor.submit(collect_company, dart_client, outlier_checker, *target)
+                   for target in targets]
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                remaining += 1
+                continue
+            try:
+                record = future.result()
+            except DARTQuotaExceeded:
+                remaining += 1
+                if not quota_exceeded:
+                    quota_exceeded = True
+                    print("⛔ DART 요청 한도 초과 - 지금까지 결과를 저장하고 중단합니다 (다시 실행하면 이어서 수집)")
+                    for pending in futures:
+                        pending.cancel()
+                continue
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ 수집 실패: {e}")
+                continue
+
+            records[record['corp_code']] = record
+            progress.write(json.dumps(record, ensure_ascii=False) + '\n')
+            progress.flush()
+            collected += 1
+
+            if collected % SNAPSHOT_EVERY == 0:
+                write_snapshot(records.values())
+                elapsed = time.time() - started
+                print(f"📊 {collected}/{len(targets)}개 수집 ({elapsed:.0f}초, API 호출 {dart_client.api_calls}회)")
+
+    path = write_snapshot(records.values())
+    stats = {
+        'collected': collected,
+        'failed': failed,
+        'remaining': remaining,
+        'total_in_snapshot': len(records),
+        'api_calls': dart_client.api_calls,
+        'quota_exceeded': quota_exceeded,
+        'elapsed_seconds': round(time.time() - started, 1),
+        'snapshot': path
+    }
+    print(f"✅ DART 사전 수집 완료: {stats}")
+    return stats
+
+
+if __name__ == "__main__":
+    fresh = '--fresh' in sys.argv
+    numbers = [arg for arg in sys.argv[1:] if arg.isdigit()]
+    limit = int(numbers[0]) if numbers else None
+
+    if not Config.DART_API_KEY:
+        print("❌ DART_API_KEY가 설정되지 않았습니다.")
+        sys.exit(1)
+
+    result = run_prefetch(Config.DART_API_KEY, limit=limit, fresh=fresh)
+    sys.exit(0 if not result['quota_exceeded'] else 2)
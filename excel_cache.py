@@ -0,0 +1,156 @@
+# excel_cache.py - KRX 엑셀 원본(.xls/.xlsx)을 바이너리 캐시로 변환해 빠르게 로드
+
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+from config import Config
+
+# 선택적 Parquet 지원 (pyarrow 미설치 시 pickle 사용)
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+EXCEL_CACHE_DIR = os.path.join(Config.CACHE_DIR, 'excel')
+MANIFEST_NAME = 'manifest.json'
+
+_lock = threading.Lock()
+_memory = {}  # 원본 경로 → (파일 상태, DataFrame)
+
+
+def _signature(path):
+    """원본 파일 상태 (크기, 수정시간 ns) - 바뀌면 해시를 다시 계산"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _content_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(cache_dir, manifest):
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_binary(cache_path, fmt):
+    if fmt == 'parquet':
+        return pd.read_parquet(cache_path, memory_map=True)
+    return pd.read_pickle(cache_path)
+
+
+def _write_binary(df, cache_base):
+    """
+    Parquet으로 저장 (불가능하면 pickle)
+
+    엑셀 열에 문자열과 날짜가 섞여 있으면 Parquet 변환이 실패할 수 있어 pickle로 대체합니다.
+
+    Returns:
+        (캐시 파일 경로, 형식)
+    """
+    if PARQUET_AVAILABLE:
+        cache_path = cache_base + '.parquet'
+        tmp_path = cache_path + '.tmp'
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+            return cache_path, 'parquet'
+        except Exception as e:
+            print(f"⚠️ Parquet 변환 실패, pickle 사용: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    cache_path = cache_base + '.pkl'
+    tmp_path = cache_path + '.tmp'
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, cache_path)
+    return cache_path, 'pickle'
+
+
+def read_excel_cached(source_path, cache_dir=EXCEL_CACHE_DIR, **read_kwargs):
+    """
+    엑셀 파일을 바이너리 캐시를 거쳐 DataFrame으로 로드
+
+    - 같은 프로세스에서 원본이 바뀌지 않았으면 메모리에 있는 DataFrame을 그대로 반환
+    - 원본 상태(크기·수정시간)가 같으면 Parquet/pickle 캐시 로드
+    - 상태가 바뀌었으면 내용 해시를 비교해 실제로 바뀐 경우에만 엑셀을 다시 파싱
+
+    반환된 DataFrame은 호출자 사이에 공유되므로 수정하지 마세요.
+
+    Args:
+        source_path: 원본 .xls/.xlsx 경로
+        cache_dir: 캐시 폴더
+        **read_kwargs: pd.read_excel 인자
+
+    Returns:
+        DataFrame
+    """
+    key = os.path.abspath(source_path)
+    if read_kwargs:
+        key += f"|{sorted(read_kwargs.items())}"
+    signature = _signature(source_path)
+
+    with _lock:
+        cached = _memory.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        os.makedirs(cache_dir, exist_ok=True)
+        manifest = _load_manifest(cache_dir)
+        entry = manifest.get(key)
+        content_hash = None  # 상태가 바뀐 경우에만 한 번 계산해 재사용
+
+        if entry is not None and os.path.exists(entry['cache_path']):
+            fresh = entry['signature'] == signature
+            if not fresh:
+                content_hash = _content_hash(source_path)
+            if not fresh and entry['sha1'] == content_hash:
+                # 수정시간만 바뀐 경우 (복사/체크아웃) - 캐시 그대로 사용
+                entry['signature'] = signature
+                _save_manifest(cache_dir, manifest)
+                fresh = True
+            if fresh:
+                try:
+                    df = _read_binary(entry['cache_path'], entry['format'])
+                    _memory[key] = (signature, df)
+                    return df
+                except Exception as e:
+                    print(f"⚠️ 엑셀 캐시 로드 실패, 다시 변환: {e}")
+
+        print(f"🔄 엑셀 변환 중: {os.path.basename(source_path)}")
+        df = pd.read_excel(source_path, **read_kwargs)
+
+        cache_base = os.path.join(cache_dir, hashlib.md5(key.encode()).hexdigest())
+        cache_path, fmt = _write_binary(df, cache_base)
+        if entry is not None and entry.get('cache_path') not in (None, cache_path) and os.path.exists(entry['cache_path']):
+            os.remove(entry['cache_path'])
+
+        manifest[key] = {
+            'signature': signature,
+            'sha1': content_hash or _content_hash(source_path),
+            'cache_path': cache_path,
+            'format': fmt
+        }
+        _save_manifest(cache_dir, manifest)
+        _memory[key] = (signature, df)
+        return df
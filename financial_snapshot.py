@@ -0,0 +1,146 @@
+# financial_snapshot.py - 상장사 재무 지표 사전 수집 스냅샷 (dart_prefetch.py가 생성, StockChecker가 먼저 조회)
+
+import os
+import threading
+import time
+
+import pandas as pd
+
+from config import Config
+
+# 선택적 Parquet 지원 (pyarrow 미설치 시 pickle 사용)
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 스냅샷 열 (기업 하나당 한 행)
+SNAPSHOT_COLUMNS = [
+    'corp_code', 'stock_code', 'corp_name',
+    'debt_ratio', 'debt_report_type', 'debt_year',          # 부채비율 (최근 정기보고서)
+    'shareholder_ratio', 'shareholder_year',                # 최대주주 지분율 (사업보고서)
+    'capital_raising_count',                                # 최근 3년 자본조달 공시 수
+    'fetched_at'                                            # 수집 시각 (epoch 초)
+]
+
+
+def snapshot_files(base_path=None):
+    """스냅샷 후보 파일 (Parquet 우선, 없으면 pickle)"""
+    base_path = base_path or Config.DART_SNAPSHOT_PATH
+    return [base_path + '.parquet', base_path + '.pkl']
+
+
+def write_snapshot(records, base_path=None):
+    """
+    수집 결과를 열 단위 파일로 저장 (임시 파일 후 교체)
+
+    Args:
+        records: 기업별 지표 dict 목록 (SNAPSHOT_COLUMNS)
+        base_path: 확장자를 뺀 저장 경로 (없으면 Config.DART_SNAPSHOT_PATH)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    parquet_path, pickle_path = snapshot_files(base_path)
+    os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+
+    df = pd.DataFrame(list(records), columns=SNAPSHOT_COLUMNS)
+    for column in ('debt_ratio', 'shareholder_ratio', 'capital_raising_count', 'debt_year',
+                   'shareholder_year', 'fetched_at'):
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+
+    if PARQUET_AVAILABLE:
+        path, stale = parquet_path, pickle_path
+        df.to_parquet(path + '.tmp', index=False)
+    else:
+        path, stale = pickle_path, parquet_path
+        df.to_pickle(path + '.tmp')
+    os.replace(path + '.tmp', path)
+    if os.path.exists(stale):
+        os.remove(stale)  # 다른 형식의 예전 스냅샷이 먼저 읽히지 않도록
+    return path
+
+
+class FinancialSnapshot:
+    """
+    사전 수집된 재무 지표 조회 (첫 조회 시 로드, 파일이 갱신되면 다시 로드)
+
+    오래된 행(DART_SNAPSHOT_MAX_AGE_DAYS 초과)은 없는 것으로 보고 DART 직접 조회로 넘깁니다.
+    """
+
+    def __init__(self, base_path=None, max_age_days=None):
+        self.base_path = base_path or Config.DART_SNAPSHOT_PATH
+        self.max_age_days = Config.DART_SNAPSHOT_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self._records = {}
+        self._loaded_from = None  # (경로, 수정시간)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _current_file(self):
+        for path in snapshot_files(self.base_path):
+            if os.path.exists(path):
+                return path, os.path.getmtime(path)
+        return None
+
+    def _reload_if_changed(self):
+        current = self._current_file()
+        if current == self._loaded_from:
+            return
+
+        records = {}
+        if current is not None:
+            path = current[0]
+            try:
+                df = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_pickle(path)
+                df = df.astype(object).where(df.notna(), None)
+                records = {row['corp_code']: row for row in df.to_dict('records')}
+                print(f"📦 재무 스냅샷 로드: {len(records)}개 기업 ({os.path.basename(path)})")
+            except Exception as e:
+                print(f"⚠️ 재무 스냅샷 로드 실패: {e}")
+
+        self._records = records
+        self._loaded_from = current
+
+    def get(self, corp_code):
+        """
+        기업 하나의 사전 수집 지표
+
+        Args:
+            corp_code: 8자리 기업코드
+
+        Returns:
+            dict (SNAPSHOT_COLUMNS) 또는 None (없거나 오래됨)
+        """
+        if not corp_code:
+            return None
+
+        with self._lock:
+            self._reload_if_changed()
+            record = self._records.get(corp_code)
+
+        if record is not None and record.get('fetched_at'):
+            age_days = (time.time() - record['fetched_at']) / 86400
+            if age_days > self.max_age_days:
+                record = None
+
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    def __len__(self):
+        with self._lock:
+            self._reload_if_changed()
+            return len(self._records)
+
+    def stats(self):
+        """스냅샷 통계"""
+        return {
+            'companies': len(self),
+            'file': self._loaded_from[0] if self._loaded_from else None,
+            'hits': self.hits,
+            'misses': self.misses
+        }
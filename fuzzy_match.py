@@ -0,0 +1,118 @@
+# fuzzy_match.py - 한글 자모 단위 편집 거리 + BK-tree (음성 인식 오타 종목명 매칭)
+
+import threading
+
+# 한글 음절 분해용 자모 표
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+
+def to_jamo(text):
+    """
+    한글 음절을 초성/중성/종성 자모로 분해 (그 외 글자는 대문자로 그대로)
+
+    예: "삼성" → "ㅅㅏㅁㅅㅓㅇ" ("삼송"과는 자모 1개 차이)
+    """
+    result = []
+    for char in text:
+        offset = ord(char) - 0xAC00
+        if 0 <= offset < 11172:
+            result.append(_CHOSEONG[offset // 588])
+            result.append(_JUNGSEONG[(offset % 588) // 28])
+            if offset % 28:
+                result.append(_JONGSEONG[offset % 28])
+        else:
+            result.append(char.upper())
+    return "".join(result)
+
+
+def levenshtein(a, b):
+    """편집 거리 (삽입/삭제/치환 1)"""
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """
+    편집 거리 기반 BK-tree (거리 d 이내 후보만 방문)
+
+    노드: [키, 값 리스트, {거리: 자식 노드}]
+    """
+
+    def __init__(self, items=()):
+        """
+        Args:
+            items: (키 문자열, 값) 쌍들
+        """
+        self._root = None
+        self.size = 0
+        for key, value in items:
+            self.add(key, value)
+
+    def add(self, key, value):
+        if self._root is None:
+            self._root = [key, [value], {}]
+            self.size += 1
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, key, max_distance):
+        """
+        거리 max_distance 이내 항목
+
+        Returns:
+            [(거리, 키, 값), ...] 거리 오름차순
+        """
+        if self._root is None:
+            return []
+
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(key, node[0])  # 가지치기에 정확한 거리가 필요
+            if distance <= max_distance:
+                found.extend((distance, node[0], value) for value in node[1])
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda item: (item[0], item[1]))
+        return found
+
+
+class LazyBKTree:
+    """첫 검색 시 BK-tree를 만드는 래퍼 (import 시간에 비용을 쓰지 않음)"""
+
+    def __init__(self, items_factory):
+        self._items_factory = items_factory
+        self._tree = None
+        self._lock = threading.Lock()
+
+    def search(self, key, max_distance):
+        if self._tree is None:
+            with self._lock:
+                if self._tree is None:
+                    self._tree = BKTree(self._items_factory())
+        return self._tree.search(key, max_distance)
@@ -1,9 +1,136 @@
 ﻿# historical_checker.py - 과거 vs 현재 비교 분석 모듈 (종목명 추가 개선)
 
+import re
+import unicodedata
 import requests
 import json
 from datetime import datetime, timedelta
 
+# 주가/종목 관련 키워드들 (이 키워드가 있는 주장에만 종목명을 붙여 검색)
+STOCK_RELATED_KEYWORDS = (
+    # 주가 관련
+    "주가", "주식", "급등", "급락", "상승", "하락", "조정", "반등", "고점", "저점",
+    "상승세", "하락세", "조정받고", "반등하고", "고점 찍고", "저점 찍고",
+    "오르고", "내려가고", "올랐다", "내려갔다", "상승중", "하락중",
+    
+    # 거래량 관련
+    "거래량", "거래대금", "거래 활발", "거래 증가", "거래 감소",
+    
+    # 시가총액 관련
+    "시가총액", "시총", "대형주", "중형주", "소형주",
+    
+    # 투자 관련
+    "투자", "매수", "매도", "매수세", "매도세", "기관매수", "기관매도",
+    "외국인매수", "외국인매도", "개인매수", "개인매도",
+    
+    # 종목 관련
+    "종목", "기업", "회사", "주식회사", "(주)", "㈜",
+    
+    # 차트/기술적 분석
+    "차트", "이동평균선", "지지선", "저항선", "브레이크아웃", "브레이크다운",
+    "골든크로스", "데드크로스", "RSI", "MACD", "볼린저밴드",
+    
+    # 뉴스/이벤트 관련 (주가에 영향)
+    "실적 발표", "분기 실적", "연간 실적", "실적 예상", "실적 전망",
+    "배당", "배당금", "배당률", "유상증자", "무상증자", "감자",
+    "합병", "분할", "스핀오프", "M&A", "인수",
+    "상장", "IPO", "코스닥", "코스피", "신규상장",
+    "상장폐지", "관리종목", "투자주의", "투자경고", "투자위험",
+    
+    # 산업/섹터 관련
+    "업종", "섹터", "테마주", "관련주", "수혜주", "대장주", "벤처주"
+)
+
+# 유사 주장 묶기 기준 (글자 bigram Dice 계수)
+CLAIM_SIMILARITY_THRESHOLD = 0.6
+
+# 방향어 (같은 묶음이 되려면 방향이 같아야 함: 급등 ≠ 급락, 상향 ≠ 하향, 증가 ≠ 감소)
+CLAIM_DIRECTION_WORDS = {
+    "up": ("급등", "폭등", "상승", "오르", "올랐", "오름", "상향", "증가", "반등", "흑자", "호조", "확대"),
+    "down": ("급락", "폭락", "하락", "내리", "내렸", "내려", "하향", "감소", "적자", "부진", "축소")
+}
+
+# 첫 어절(주어)에서 떼어낼 조사 - 종목명 끝 글자와 겹치기 쉬운 이/로/도 등은 제외
+_SUBJECT_PARTICLES = ("에서", "에게", "은", "는", "을", "를", "가", "의", "에")
+
+
+def _claim_bigrams(text):
+    """공백·문장부호를 뺀 글자 bigram 집합 (조사/어미 차이에 둔감)"""
+    compact = re.sub(r"[^\w]", "", unicodedata.normalize("NFKC", text).lower())
+    if len(compact) < 2:
+        return {compact} if compact else set()
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _claim_signature(text):
+    """
+    묶음 판별용 핵심 요소 (주어 어절, 숫자, 방향)
+    
+    글자 유사도가 높아도 이 값이 다르면 다른 주장으로 봅니다.
+    예: "에코프로 급등" / "에코프로비엠 급등", "목표주가 10만원 상향" / "목표주가 7만원 하향"
+    
+    Returns:
+        tuple: (조사를 뗀 첫 어절, 숫자 튜플, 방향 집합)
+    """
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    words = re.findall(r"\w+", normalized)
+    subject = words[0] if words else ""
+    for particle in _SUBJECT_PARTICLES:
+        if subject.endswith(particle) and len(subject) > len(particle) + 1:
+            subject = subject[:-len(particle)]
+            break
+    
+    numbers = tuple(re.findall(r"\d+(?:[.,]\d+)*", normalized))
+    directions = frozenset(
+        direction for direction, stems in CLAIM_DIRECTION_WORDS.items()
+        if any(stem in normalized for stem in stems)
+    )
+    return subject, numbers, directions
+
+
+def cluster_claims(claims, threshold=CLAIM_SIMILARITY_THRESHOLD):
+    """
+    거의 같은 내용의 주장끼리 묶기 (묶음마다 검색은 한 번만 수행)
+    
+    주어 어절·숫자·방향어가 모두 같은 주장끼리만 비교하고, 그중 글자 유사도가
+    기준 이상인 경우에만 묶습니다.
+    
+    예: "삼성전자가 급등했다" / "삼성전자 주가 급등" → 같은 묶음
+        "삼성전자가 급등했다" / "삼성전자가 급락했다" → 다른 묶음
+    
+    Args:
+        claims: 주장 문장 리스트
+        threshold: 묶음 대표 문장과의 bigram Dice 계수 하한
+        
+    Returns:
+        list: 묶음별 주장 위치 리스트 (첫 번째가 대표 문장)
+    """
+    clusters = []
+    leader_bigrams = []
+    leader_signatures = []
+    
+    for i, claim in enumerate(claims):
+        bigrams = _claim_bigrams(claim)
+        signature = _claim_signature(claim)
+        best, best_score = None, threshold
+        for c, leader in enumerate(leader_bigrams):
+            if leader_signatures[c] != signature:
+                continue
+            total = len(bigrams) + len(leader)
+            score = 2 * len(bigrams & leader) / total if total else 0.0
+            if score >= best_score:
+                best, best_score = c, score
+        
+        if best is None:
+            clusters.append([i])
+            leader_bigrams.append(bigrams)
+            leader_signatures.append(signature)
+        else:
+            clusters[best].append(i)
+    
+    return clusters
+
+
 class HistoricalChecker:
     def __init__(self, web_searcher, llm_client, dart_api_key=None):
         """
@@ -46,33 +173,18 @@ class HistoricalChecker:
         historical_results = {}
         print("🔍 과거 시점 정보 수집 중...")
         
-        # 중복 제거 및 정리
-        unique_claims = []
-        seen_claims = set()
-        
-        for claim in factual_claims:
-            # 간단한 정규화 (공백 제거, 소문자 변환)
-            normalized_claim = claim.strip().lower()
-            if normalized_claim not in seen_claims and len(claim.strip()) > 3:  # 최소 길이를 3자로 낮춤
-                unique_claims.append(claim)
-                seen_claims.add(normalized_claim)
-        
-        print(f"📝 총 {len(factual_claims)}개 문장에서 {len(unique_claims)}개 고유 문장 추출")
+        # 중복 제거 + 유사 주장 묶기 (묶음당 검색 한 번)
+        unique_claims, claim_queries = self._plan_claim_searches(factual_claims, stock_list)
+        search_queries = list(dict.fromkeys(claim_queries))
         
-        # 병렬 검색을 위한 쿼리 준비
-        search_queries = []
-        for claim in unique_claims:
-            search_query = self._create_search_query(claim, stock_list)
-            search_queries.append(search_query)
+        print(f"🔍 {len(search_queries)}개 쿼리 병렬 검색 시작...")
         
-        print(f"🔍 {len(unique_claims)}개 쿼리 병렬 검색 시작...")
+        # 병렬 검색 실행 (업로드일 전후 구간 - 지난 구간은 검색 캐시에 오래 보관)
+        search_results = self.web_searcher.search_multiple_with_date(search_queries, upload_date)
         
-        # 병렬 검색 실행
-        search_results = self.web_searcher.search_multiple_parallel(search_queries, max_workers=3)
-        
-        # 결과 정리
+        # 결과 정리 (같은 묶음의 주장들은 검색 결과를 공유)
         for i, claim in enumerate(unique_claims):
-            search_query = search_queries[i]
+            search_query = claim_queries[i]
             search_result = search_results[search_query]
             
             historical_results[f"claim_{i+1}"] = {
@@ -91,24 +203,21 @@ class HistoricalChecker:
             print("🔍 현재 시점 검색을 생략합니다. (과거와 현재 차이가 크지 않음)")
             
             # 현재 검색 결과를 과거 검색 결과와 동일하게 설정
-            for i, claim in enumerate(factual_claims):
+            for i, claim in enumerate(unique_claims):
                 historical_results[f"claim_{i+1}"]["current_search"] = historical_results[f"claim_{i+1}"]["historical_search"]
                 historical_results[f"claim_{i+1}"]["search_skipped"] = True
         else:
             print(f"📅 영상 업로드일이 {days_diff}일 전으로, 한 달을 초과합니다.")
             print("🔍 현재 시점 정보 수집 중...")
             
-            # 현재 시점 검색 쿼리 준비
-            current_search_queries = [historical_results[f"claim_{i+1}"]["search_query"] for i in range(len(unique_claims))]
-            
-            print(f"🔍 {len(unique_claims)}개 현재 시점 쿼리 병렬 검색 시작...")
+            print(f"🔍 {len(search_queries)}개 현재 시점 쿼리 병렬 검색 시작...")
             
-            # 병렬 검색 실행
-            current_search_results = self.web_searcher.search_multiple_parallel(current_search_queries, max_workers=3)
+            # 병렬 검색 실행 (묶음별 쿼리 그대로 사용)
+            current_search_results = self.web_searcher.search_multiple_parallel(search_queries, max_workers=3)
             
             # 결과 정리
             for i, claim in enumerate(unique_claims):
-                search_query = current_search_queries[i]
+                search_query = claim_queries[i]
                 current_search = current_search_results[search_query]
                 
                 historical_results[f"claim_{i+1}"]["current_search"] = current_search
@@ -163,33 +272,18 @@ class HistoricalChecker:
         historical_results = {}
         print("🔍 업로드 시점 정보 수집 중...")
         
-        # 중복 제거 및 정리
-        unique_claims = []
-        seen_claims = set()
-        
-        for claim in factual_claims:
-            # 간단한 정규화 (공백 제거, 소문자 변환)
-            normalized_claim = claim.strip().lower()
-            if normalized_claim not in seen_claims and len(claim.strip()) > 3:
-                unique_claims.append(claim)
-                seen_claims.add(normalized_claim)
-        
-        print(f"📝 총 {len(factual_claims)}개 문장에서 {len(unique_claims)}개 고유 문장 추출")
+        # 중복 제거 + 유사 주장 묶기 (묶음당 검색 한 번)
+        unique_claims, claim_queries = self._plan_claim_searches(factual_claims, stock_list)
+        search_queries = list(dict.fromkeys(claim_queries))
         
-        # 병렬 검색을 위한 쿼리 준비
-        search_queries = []
-        for claim in unique_claims:
-            search_query = self._create_search_query(claim, stock_list)
-            search_queries.append(search_query)
+        print(f"🔍 {len(search_queries)}개 업로드 시점 쿼리 병렬 검색 시작...")
         
-        print(f"🔍 {len(unique_claims)}개 업로드 시점 쿼리 병렬 검색 시작...")
+        # 병렬 검색 실행 (업로드일 전후 구간 - 지난 구간은 검색 캐시에 오래 보관)
+        search_results = self.web_searcher.search_multiple_with_date(search_queries, upload_date)
         
-        # 병렬 검색 실행 (업로드 시점 검색)
-        search_results = self.web_searcher.search_multiple_parallel(search_queries, max_workers=3)
-        
-        # 결과 정리
+        # 결과 정리 (같은 묶음의 주장들은 검색 결과를 공유)
         for i, claim in enumerate(unique_claims):
-            search_query = search_queries[i]
+            search_query = claim_queries[i]
             search_result = search_results[search_query]
             
             historical_results[f"claim_{i+1}"] = {
@@ -222,10 +316,46 @@ class HistoricalChecker:
         print("✅ 업로드 시점 분석 완료")
         return results
     
+    def _plan_claim_searches(self, factual_claims, stock_list):
+        """
+        주장 정리 → 유사 주장 묶기 → 묶음별 검색 쿼리 생성
+        
+        Args:
+            factual_claims: AI가 추출한 주장 문장들
+            stock_list: 종목 리스트
+            
+        Returns:
+            tuple: (고유 주장 리스트, 주장별 검색 쿼리 리스트)
+                   같은 묶음의 주장들은 대표 문장의 쿼리를 함께 사용
+        """
+        # 완전 중복 제거 (공백 제거, 소문자 변환 기준)
+        unique_claims = []
+        seen_claims = set()
+        
+        for claim in factual_claims:
+            normalized_claim = claim.strip().lower()
+            if normalized_claim not in seen_claims and len(claim.strip()) > 3:  # 최소 길이를 3자로 낮춤
+                unique_claims.append(claim)
+                seen_claims.add(normalized_claim)
+        
+        # 유사 주장 묶기 (대표 문장 = 묶음의 첫 문장)
+        clusters = cluster_claims(unique_claims)
+        claim_queries = [None] * len(unique_claims)
+        for members in clusters:
+            search_query = self._create_search_query(unique_claims[members[0]], stock_list)
+            for i in members:
+                claim_queries[i] = search_query
+        
+        print(f"📝 총 {len(factual_claims)}개 문장에서 {len(unique_claims)}개 고유 문장 추출 "
+              f"→ {len(clusters)}개 검색 묶음")
+        return unique_claims, claim_queries
+    
     def _create_search_query(self, claim, stock_list):
         """
         검색 쿼리 생성 (주가/종목 관련 문장에만 종목명 추가)
         
+        문장에 이미 종목명이 들어 있으면 다시 붙이지 않습니다.
+        
         Args:
             claim: 원본 문장
             stock_list: 종목 리스트
@@ -233,48 +363,17 @@ class HistoricalChecker:
         Returns:
             str: 개선된 검색 쿼리
         """
-        # 주가/종목 관련 키워드들
-        stock_related_keywords = [
-            # 주가 관련
-            "주가", "주식", "급등", "급락", "상승", "하락", "조정", "반등", "고점", "저점",
-            "상승세", "하락세", "조정받고", "반등하고", "고점 찍고", "저점 찍고",
-            "오르고", "내려가고", "올랐다", "내려갔다", "상승중", "하락중",
-            
-            # 거래량 관련
-            "거래량", "거래대금", "거래 활발", "거래 증가", "거래 감소",
-            
-            # 시가총액 관련
-            "시가총액", "시총", "대형주", "중형주", "소형주",
-            
-            # 투자 관련
-            "투자", "매수", "매도", "매수세", "매도세", "기관매수", "기관매도",
-            "외국인매수", "외국인매도", "개인매수", "개인매도",
-            
-            # 종목 관련
-            "종목", "기업", "회사", "주식회사", "(주)", "㈜",
-            
-            # 차트/기술적 분석
-            "차트", "이동평균선", "지지선", "저항선", "브레이크아웃", "브레이크다운",
-            "골든크로스", "데드크로스", "RSI", "MACD", "볼린저밴드",
-            
-            # 뉴스/이벤트 관련 (주가에 영향)
-            "실적 발표", "분기 실적", "연간 실적", "실적 예상", "실적 전망",
-            "배당", "배당금", "배당률", "유상증자", "무상증자", "감자",
-            "합병", "분할", "스핀오프", "M&A", "인수",
-            "상장", "IPO", "코스닥", "코스피", "신규상장",
-            "상장폐지", "관리종목", "투자주의", "투자경고", "투자위험",
-            
-            # 산업/섹터 관련
-            "업종", "섹터", "테마주", "관련주", "수혜주", "대장주", "벤처주"
-        ]
-        
         # 종목 리스트가 있고, 주가/종목 관련 키워드가 포함된 경우에만 종목명 추가
         if stock_list and len(stock_list) > 0:
             main_stock = stock_list[0]  # 첫 번째 종목을 메인으로 사용
             
-            # 주가/종목 관련 키워드가 포함되어 있는지 확인
+            # 이미 종목명이 언급된 문장은 그대로 사용
             claim_lower = claim.lower()
-            is_stock_related = any(keyword in claim_lower for keyword in stock_related_keywords)
+            if any(stock and stock.lower() in claim_lower for stock in stock_list):
+                return claim
+            
+            # 주가/종목 관련 키워드가 포함되어 있는지 확인
+            is_stock_related = any(keyword.lower() in claim_lower for keyword in STOCK_RELATED_KEYWORDS)
             
             if is_stock_related:
                 return f"{main_stock} {claim}"
@@ -373,18 +472,27 @@ class HistoricalChecker:
         # 비교 데이터를 텍스트로 정리
         comparison_text = ""
         search_skipped = False
+        shown_queries = {}
         
         for key, data in comparison_data.items():
             comparison_text += f"\n=== {data['claim']} ===\n"
+            
+            # 같은 묶음의 검색 결과는 한 번만 넣음
+            if data['search_query'] in shown_queries:
+                comparison_text += f"검색 결과: 위 \"{shown_queries[data['search_query']]}\" 항목과 동일\n"
+                search_skipped = search_skipped or data.get('search_skipped', False)
+                continue
+            shown_queries[data['search_query']] = data['claim']
+            
             comparison_text += f"검색 쿼리: {data['search_query']}\n"
-            comparison_text += f"과거 시점({upload_date}) 검색 결과:\n{data['historical_search'][:400]}...\n"
+            comparison_text += f"과거 시점({upload_date}) 검색 결과:\n{data['historical_search'].to_prompt_text()}\n"
             
             # 검색이 생략된 경우 표시
             if data.get('search_skipped', False):
                 comparison_text += f"현재 시점 검색: 생략됨 (영상 업로드일이 한 달 이내)\n"
                 search_skipped = True
             else:
-                comparison_text += f"현재 시점 검색 결과:\n{data['current_search'][:400]}...\n"
+                comparison_text += f"현재 시점 검색 결과:\n{data['current_search'].to_prompt_text()}\n"
         
         current_date = datetime.now().strftime("%Y-%m-%d")
         
@@ -493,11 +601,19 @@ class HistoricalChecker:
         """
         # 비교 데이터를 텍스트로 정리
         comparison_text = ""
+        shown_queries = {}
         
         for key, data in comparison_data.items():
             comparison_text += f"\n=== {data['claim']} ===\n"
+            
+            # 같은 묶음의 검색 결과는 한 번만 넣음
+            if data['search_query'] in shown_queries:
+                comparison_text += f"검색 결과: 위 \"{shown_queries[data['search_query']]}\" 항목과 동일\n"
+                continue
+            shown_queries[data['search_query']] = data['claim']
+            
             comparison_text += f"검색 쿼리: {data['search_query']}\n"
-            comparison_text += f"업로드 시점({upload_date}) 검색 결과:\n{data['historical_search'][:400]}...\n"
+            comparison_text += f"업로드 시점({upload_date}) 검색 결과:\n{data['historical_search'].to_prompt_text()}\n"
             comparison_text += f"현재 시점 검색: 생략됨 (영상 업로드일이 한 달 이내)\n"
         
         system_prompt = f"""당신은 투자 영상의 업로드 시점 상황을 분석하는 전문가입니다.
@@ -0,0 +1,187 @@
+# http_utils.py - 외부 API 공용 HTTP 세션 (연결 풀 / keep-alive / 타임아웃 / 재시도)
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+
+# 재시도할 HTTP 상태 (요청 한도 초과 / 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+_rate_limiters = {}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기 (스레드 안전)
+
+    초당 rate개씩 토큰이 차고 최대 capacity개까지 모이며,
+    요청 하나가 토큰 하나를 사용합니다. 토큰이 없으면 찰 때까지 기다립니다.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = max(int(capacity), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        토큰 하나 사용 (필요하면 대기)
+
+        Returns:
+            대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    self.waited_seconds += waited
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def stats(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'available_tokens': round(self._tokens, 2),
+                'acquired': self.acquired,
+                'waited_seconds': round(self.waited_seconds, 3)
+            }
+
+
+def get_rate_limiter(name, rate, capacity):
+    """
+    이름별 공유 속도 제한기 (프로세스 전체에서 같은 한도를 나눠 씀)
+
+    Args:
+        name: 제한기 이름 (예: 'serper', 'dart')
+        rate: 초당 허용 요청 수 (처음 생성할 때만 사용)
+        capacity: 순간 최대 요청 수 (처음 생성할 때만 사용)
+
+    Returns:
+        TokenBucket
+    """
+    with _sessions_lock:
+        limiter = _rate_limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate, capacity)
+            _rate_limiters[name] = limiter
+        return limiter
+
+
+def default_timeout():
+    """(연결, 읽기) 타임아웃 튜플"""
+    return (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+
+
+def create_session(pool_size=None, max_retries=None, backoff_factor=None):
+    """
+    연결 풀과 재시도 정책이 설정된 requests.Session 생성
+
+    Args:
+        pool_size: 호스트당 유지할 연결 수 (없으면 Config.HTTP_POOL_SIZE)
+        max_retries: 재시도 횟수 (없으면 Config.HTTP_MAX_RETRIES)
+        backoff_factor: 지수 백오프 계수 (없으면 Config.HTTP_BACKOFF_FACTOR)
+
+    Returns:
+        requests.Session
+    """
+    pool_size = pool_size or Config.HTTP_POOL_SIZE
+    max_retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+    backoff_factor = Config.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+
+    # Serper/DART 호출은 조회성이라 POST도 재시도 대상에 포함
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(name, **kwargs):
+    """
+    이름별 공유 세션 (프로세스 전체에서 같은 연결 풀 재사용)
+
+    Args:
+        name: 세션 이름 (예: 'serper', 'dart')
+        **kwargs: 처음 생성할 때 create_session에 전달할 인자
+
+    Returns:
+        requests.Session
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = create_session(**kwargs)
+            _sessions[name] = session
+        return session
+
+
+def pool_stats():
+    """
+    공유 세션별 연결 풀 통계
+
+    Returns:
+        {세션 이름: [{host, connections_opened, requests, idle_connections}, ...]}
+        connections_opened는 새로 맺은 연결(TLS 핸드셰이크) 수이므로 requests보다 훨씬 작아야 정상
+    """
+    stats = {}
+    with _sessions_lock:
+        sessions = list(_sessions.items())
+
+    for name, session in sessions:
+        hosts = []
+        seen = set()
+        for adapter in session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts.append({
+                    'host': f"{key.key_scheme}://{key.key_host}",
+                    'connections_opened': pool.num_connections,
+                    'requests': pool.num_requests,
+                    'idle_connections': sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                    if pool.pool is not None else 0
+                })
+        stats[name] = hosts
+    return stats
@@ -571,7 +571,7 @@ class LLMHandler:
                     참고 자료:
                     실제 제공된 검색 결과나 데이터에서 확인된 출처만 나열
                     - 웹 검색 결과: 실제 검색된 내용 요약 (신뢰할 수 있는 소스에서 수집됨)
-                    - PDF 자료: 실제 RAG에서 찾은 내용 요약
+                    - PDF 자료: 실제 RAG에서 찾은 내용 요약 (제공된 출처의 파일명과 페이지를 함께 표기)
                     - 종목 데이터: 실제 조회된 데이터만 명시 (DART API)
                     - 과거 vs 현재 비교: 실제 확인된 시간 변화 정보
 
@@ -13,8 +13,13 @@ from datetime import datetime
 
 
 class IntegratedSearchSystem:
-    def __init__(self):
-        """통합 검색 시스템 초기화"""
+    def __init__(self, background_rag=False):
+        """
+        통합 검색 시스템 초기화
+        
+        Args:
+            background_rag: True면 RAG 색인을 백그라운드에서 생성 (서버는 즉시 요청 처리, 준비 전에는 'warming')
+        """
         
         # 설정 검증
         Config.validate()
@@ -42,7 +47,7 @@ class IntegratedSearchSystem:
         self._initialize_recommendation_system()        
         
         # RAG 자동 로딩
-        self._auto_load_rag()
+        self._auto_load_rag(background=background_rag)
         
         print("=== 통합 검색 시스템 초기화 완료 ===")
     
@@ -59,8 +64,13 @@ class IntegratedSearchSystem:
             print("   - 더미 추천으로 대체됩니다")
             self.recommendation_system = None
 
-    def _auto_load_rag(self):
-        """pdfs 폴더 자동 로딩"""
+    def _auto_load_rag(self, background=False):
+        """
+        pdfs 폴더 자동 로딩
+        
+        background=True면 색인 생성을 기다리지 않고, 이후 폴더 변경(PDF 추가/변경/삭제)도
+        감시해 재시작 없이 변경분만 다시 색인합니다.
+        """
         default_pdf_folder = "pdfs"
         
         # pdfs 폴더와 PDF 파일 존재 확인
@@ -70,7 +80,13 @@ class IntegratedSearchSystem:
             
             if pdf_files:
                 print(f"pdfs 폴더 발견 - 자동 로딩 중...")
-                self.pdf_processor.process_pdf_folder(default_pdf_folder)
+                if background:
+                    self.pdf_processor.start_background_build(default_pdf_folder)
+                else:
+                    self.pdf_processor.process_pdf_folder(default_pdf_folder)
+            
+            if background:
+                self.pdf_processor.start_watching(default_pdf_folder)
     
     def load_pdf(self, pdf_path):
         """
@@ -175,10 +191,7 @@ class IntegratedSearchSystem:
                     )
                     
                     if similar_chunks:
-                        pdf_results = "\n\n=== RAG 데이터베이스 참고 자료 ==="
-                        for i, result in enumerate(similar_chunks):
-                            pdf_results += f"\n[참고 {i+1}] (관련도: {result['similarity']:.3f})\n"
-                            pdf_results += result['chunk'][:400] + "...\n"
+                        pdf_results = self.pdf_processor.format_evidence(similar_chunks)
                         print(f"RAG 검색 완료: {len(similar_chunks)}개 문서 매칭")
                     else:
                         print("RAG 검색 결과 없음")
@@ -186,7 +199,10 @@ class IntegratedSearchSystem:
                 except Exception as e:
                     print(f"RAG 검색 오류: {e}")
             elif use_pdf and not self.pdf_processor.chunks:
-                print("PDF 데이터가 로드되지 않았습니다.")
+                if self.pdf_processor.rag_status()['status'] == 'warming':
+                    print("⏳ RAG 색인 준비 중(warming) - PDF 참고 자료 없이 분석합니다.")
+                else:
+                    print("PDF 데이터가 로드되지 않았습니다.")
             
             # 4단계: 과거 vs 현재 비교 분석 (조건부 실행)
             historical_results = {}
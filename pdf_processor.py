@@ -5,8 +5,151 @@ import numpy as np
 import os
 import glob
 import json
+import re
 import hashlib
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from config import Config
+from bm25_index import BM25Index, reciprocal_rank_fusion
+from cache_utils import LRUCache
+from chunk_store import ChunkStore, ChunkStoreWriter, save_array
+from rag_reranker import CrossEncoderReranker, candidate_similarity, merge_overlapping, mmr_select
+from vector_index import INDEX_TYPES, build_vector_index, measure_recall, normalize_rows
+
+# 캐시 포맷 버전 (청크 구성이 바뀌면 올려서 이전 캐시를 무효화)
+RAG_CACHE_VERSION = 3
+
+# 토큰 단위 청크 크기 계산용 (공백 기준 어절)
+_TOKEN_PATTERN = re.compile(r"\S+")
+
+
+def _extract_page_range(pdf_path, start, end):
+    """
+    지정된 페이지 범위의 텍스트 추출 (워커 프로세스에서 실행)
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (미포함)
+    
+    Returns:
+        [(페이지 번호, 텍스트), ...] 텍스트가 있는 페이지만
+    """
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for i in range(start, end):
+            page_text = pdf.pages[i].extract_text()
+            if page_text:  # 텍스트가 있는 경우만
+                pages.append((i + 1, page_text))
+    return pages
+
+
+class ChunkMetadata:
+    """
+    청크 출처 메타데이터 (컬럼 단위 저장)
+    
+    청크마다 dict를 두는 대신 컬럼별 배열로 보관하고, 캐시에는 npz 사이드카로 저장합니다.
+    """
+    
+    COLUMNS = ('source_id', 'page_start', 'page_end', 'char_start', 'char_end')
+    
+    def __init__(self):
+        self.sources = []  # 출처 파일명 목록 (source_id로 참조)
+        self._source_ids = {}
+        self.signatures = {}  # 출처 파일명 → 파일 상태(크기_수정시간), 증분 색인용
+        self.columns = {name: [] for name in self.COLUMNS}
+    
+    def __len__(self):
+        return len(self.columns['source_id'])
+    
+    def append(self, chunk):
+        """iter_chunks가 만든 청크의 메타데이터 추가"""
+        source = chunk.get('source') or ''
+        if source not in self._source_ids:
+            self._source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        
+        self.columns['source_id'].append(self._source_ids[source])
+        for name in self.COLUMNS[1:]:
+            self.columns[name].append(chunk[name])
+    
+    def truncate(self, length):
+        """지정 길이 이후 항목 제거 (실패한 문서 롤백용)"""
+        for name in self.COLUMNS:
+            del self.columns[name][length:]
+    
+    def rows_by_source(self):
+        """출처 파일명 → 청크 번호 배열"""
+        source_ids = np.asarray(self.columns['source_id'], dtype=np.int32)
+        return {source: np.flatnonzero(source_ids == i) for i, source in enumerate(self.sources)}
+    
+    def get(self, idx):
+        """청크 번호로 메타데이터 조회"""
+        if idx >= len(self):
+            return {}
+        
+        meta = {name: int(self.columns[name][idx]) for name in self.COLUMNS[1:]}
+        meta['source'] = self.sources[int(self.columns['source_id'][idx])]
+        return meta
+    
+    def save(self, path):
+        """npz 사이드카로 저장"""
+        np.savez(
+            path,
+            sources=np.array(self.sources, dtype=str),
+            signatures=np.array([self.signatures.get(source, '') for source in self.sources], dtype=str),
+            source_id=np.asarray(self.columns['source_id'], dtype=np.int32),
+            page_start=np.asarray(self.columns['page_start'], dtype=np.int32),
+            page_end=np.asarray(self.columns['page_end'], dtype=np.int32),
+            char_start=np.asarray(self.columns['char_start'], dtype=np.int64),
+            char_end=np.asarray(self.columns['char_end'], dtype=np.int64)
+        )
+    
+    @classmethod
+    def load(cls, path):
+        """npz 사이드카에서 로드"""
+        meta = cls()
+        with np.load(path, allow_pickle=False) as data:
+            meta.sources = data['sources'].tolist()
+            meta.columns = {name: data[name] for name in cls.COLUMNS}
+            if 'signatures' in data.files:
+                meta.signatures = {
+                    source: signature
+                    for source, signature in zip(meta.sources, data['signatures'].tolist()) if signature
+                }
+        meta._source_ids = {source: i for i, source in enumerate(meta.sources)}
+        return meta
+
+
+class RAGIndex:
+    """
+    검색 색인 스냅샷 (청크 + 임베딩 색인 + BM25 + 출처 메타데이터)
+    
+    완성된 스냅샷만 PDFProcessor에 통째로 교체되므로, 진행 중인 검색은
+    시작 시점의 스냅샷 하나만 사용하고 만들어지는 중인 색인을 보지 않습니다.
+    """
+    
+    def __init__(self, chunks, vector_index=None, bm25=None, chunk_meta=None, version=None, folder=None):
+        self.chunks = chunks
+        self.vector_index = vector_index
+        self.bm25 = bm25 if bm25 is not None else BM25Index()
+        self.chunk_meta = chunk_meta if chunk_meta is not None else ChunkMetadata()
+        self.version = version  # 폴더/파일 해시
+        self.folder = folder  # 폴더 색인이면 폴더 경로 (증분 색인 기준)
+        self.built_at = time.strftime("%Y-%m-%dT%H:%M:%S") if version else None
+    
+    def __len__(self):
+        return len(self.chunks)
+    
+    @property
+    def embeddings(self):
+        """정규화된 float32 임베딩 행렬 (캐시에서는 메모리 매핑)"""
+        return self.vector_index.vectors if self.vector_index is not None else None
+
 
 class PDFProcessor:
     def __init__(self, client):
@@ -17,88 +160,558 @@ class PDFProcessor:
             client: Hugging Face InferenceClient
         """
         self.client = client
-        self.chunks = []
-        self.embeddings = []
+        self.rag_index = RAGIndex([])  # 현재 공개된 색인 스냅샷 (교체는 _publish로만)
+        
+        # 색인 상태 (백그라운드 생성)
+        self._state_lock = threading.Lock()
+        self._build_lock = threading.Lock()  # 색인 생성은 한 번에 하나만
+        self._build_thread = None
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
+        self.rag_error = None
+        
+        # 질의 캐시: 정규화된 질의 → 임베딩, (질의, top_k, mode) → 검색 결과 순위
+        self._query_embedding_cache = LRUCache(Config.RAG_QUERY_CACHE_SIZE)
+        self._search_result_cache = LRUCache(Config.RAG_QUERY_CACHE_SIZE)
+        self.reranker = CrossEncoderReranker(Config.RAG_RERANKER_MODEL)  # 선택적 로컬 재순위 모델
         self.cache_dir = "cache"  # 캐시 디렉토리
         
+        self.page_cache_dir = os.path.join(self.cache_dir, "pdf_text")  # 파일별 추출 텍스트 캐시
+        
         # 캐시 디렉토리 생성
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
             print(f"캐시 디렉토리 생성: {self.cache_dir}")
+        os.makedirs(self.page_cache_dir, exist_ok=True)
+    
+    # 현재 스냅샷 조회용 (기존 속성 호환)
+    @property
+    def chunks(self):
+        return self.rag_index.chunks
+    
+    @property
+    def embeddings(self):
+        return self.rag_index.embeddings
+    
+    @property
+    def vector_index(self):
+        return self.rag_index.vector_index
+    
+    @property
+    def bm25(self):
+        return self.rag_index.bm25
+    
+    @property
+    def chunk_meta(self):
+        return self.rag_index.chunk_meta
+    
+    @property
+    def index_version(self):
+        return self.rag_index.version
+    
+    def _publish(self, index):
+        """새 색인 스냅샷으로 원자적 교체 (버전이 바뀌면 질의 캐시 무효화)"""
+        with self._state_lock:
+            if index.version != self.rag_index.version:
+                self._query_embedding_cache.clear()
+                self._search_result_cache.clear()
+            self.rag_index = index
+            self.rag_error = None
+        print(f"📚 RAG 색인 교체 완료: {len(index)}개 청크 (버전 {str(index.version)[:8]})")
+    
+    def start_background_build(self, folder_path, **kwargs):
+        """
+        폴더 색인 생성을 백그라운드 스레드에서 시작 (서버는 바로 요청 처리 가능)
+        
+        Args:
+            folder_path: PDF 폴더 경로
+            **kwargs: process_pdf_folder 인자 (chunk_size, overlap, unit)
+        
+        Returns:
+            새로 시작했으면 True, 이미 생성 중이면 False
+        """
+        with self._state_lock:
+            if self._build_thread is not None and self._build_thread.is_alive():
+                return False
+            self._build_thread = threading.Thread(
+                target=self._run_background_build,
+                args=(folder_path,),
+                kwargs=kwargs,
+                name="rag-build",
+                daemon=True
+            )
+            self._build_thread.start()
+        print(f"⏳ RAG 색인 백그라운드 생성 시작: {folder_path}")
+        return True
+    
+    def _run_background_build(self, folder_path, **kwargs):
+        try:
+            if not self.process_pdf_folder(folder_path, **kwargs) and not len(self.rag_index):
+                self.rag_error = "처리된 PDF가 없습니다."
+        except Exception as e:
+            print(f"❌ RAG 색인 백그라운드 생성 실패: {e}")
+            self.rag_error = str(e)
+    
+    def wait_for_build(self, timeout=None):
+        """백그라운드 색인 생성 완료 대기 (완료되었으면 True)"""
+        thread = self._build_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+    
+    def start_watching(self, folder_path, interval=None):
+        """
+        PDF 폴더 감시 시작 (주기적 stat 스캔)
+        
+        PDF가 추가/변경/삭제되면 변경분만 백그라운드에서 다시 색인하고,
+        완성된 스냅샷으로 교체합니다. 복사 중인 파일을 피하기 위해
+        같은 상태가 두 번 연속 관측된 뒤에 색인합니다.
+        
+        Args:
+            folder_path: PDF 폴더 경로
+            interval: 스캔 간격(초), 없으면 Config.RAG_WATCH_INTERVAL (0이면 감시 안 함)
+        
+        Returns:
+            감시를 시작했으면 True
+        """
+        interval = Config.RAG_WATCH_INTERVAL if interval is None else interval
+        if interval <= 0 or (self._watch_thread is not None and self._watch_thread.is_alive()):
+            return False
+        
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(folder_path, interval),
+            name="rag-watch",
+            daemon=True
+        )
+        self._watch_thread.start()
+        print(f"👀 PDF 폴더 감시 시작: {folder_path} ({interval}초 간격)")
+        return True
+    
+    def stop_watching(self):
+        """PDF 폴더 감시 중지"""
+        self._watch_stop.set()
+    
+    def _watch_loop(self, folder_path, interval):
+        last_seen = None
+        last_attempted = None
+        
+        while not self._watch_stop.wait(interval):
+            try:
+                current = self._get_folder_hash(folder_path)
+            except OSError:
+                continue  # 스캔 중 파일이 사라진 경우 다음 주기에 다시 확인
+            
+            previous_seen, last_seen = last_seen, current
+            if current == self.rag_index.version or current == last_attempted or current != previous_seen:
+                continue
+            
+            if self._build_thread is not None and self._build_thread.is_alive():
+                continue  # 진행 중인 생성이 끝난 뒤 다시 비교
+            
+            print("🔄 PDF 폴더 변경 감지 - 변경분 색인 시작")
+            self.start_background_build(folder_path)
+            last_attempted = current
+    
+    def rag_status(self):
+        """
+        RAG 색인 상태
+        
+        Returns:
+            dict: status ('ready' / 'warming' / 'error' / 'empty'), building, chunks, version, built_at, error
+        """
+        index = self.rag_index
+        building = self._build_thread is not None and self._build_thread.is_alive()
+        
+        if len(index):
+            status = 'ready'  # 새 버전을 만드는 중이어도 이전 스냅샷으로 검색 가능
+        elif building:
+            status = 'warming'
+        elif self.rag_error:
+            status = 'error'
+        else:
+            status = 'empty'
+        
+        return {
+            'status': status,
+            'building': building,
+            'chunks': len(index),
+            'version': index.version,
+            'built_at': index.built_at,
+            'error': self.rag_error
+        }
     
     def _get_folder_hash(self, folder_path):
         """폴더 내 PDF 파일들의 해시값 계산 (변경 감지용)"""
         pdf_files = glob.glob(os.path.join(folder_path, "*.pdf"))
         pdf_files.sort()  # 순서 일정하게
         
-        hash_string = ""
+        hash_string = f"v{RAG_CACHE_VERSION}"
         for pdf_file in pdf_files:
             # 파일명 + 파일 크기 + 수정 시간
-            stat = os.stat(pdf_file)
-            hash_string += f"{pdf_file}_{stat.st_size}_{stat.st_mtime}"
+            hash_string += f"{pdf_file}_{self._file_signature(pdf_file)}"
         
         return hashlib.md5(hash_string.encode()).hexdigest()
     
-    def _save_cache(self, folder_path, chunks, embeddings):
-        """캐시 저장"""
-        folder_hash = self._get_folder_hash(folder_path)
+    def _file_signature(self, pdf_file):
+        """파일 상태 (크기_수정시간)"""
+        stat = os.stat(pdf_file)
+        return f"{stat.st_size}_{stat.st_mtime}"
+    
+    def _cache_paths(self, folder_hash):
+        """폴더 해시별 캐시 파일 경로"""
+        return {
+            'chunks': os.path.join(self.cache_dir, f"chunks_{folder_hash}.bin"),
+            'offsets': os.path.join(self.cache_dir, f"chunks_{folder_hash}.offsets.npy"),
+            'embeddings': os.path.join(self.cache_dir, f"embeddings_{folder_hash}.npy"),
+            'quantized': os.path.join(self.cache_dir, f"vectors_{folder_hash}_{self._quantization_tag()}.npz"),
+            'bm25': os.path.join(self.cache_dir, f"bm25_{folder_hash}.npz"),
+            'meta': os.path.join(self.cache_dir, f"chunk_meta_{folder_hash}.npz")
+        }
+    
+    def _quantization_tag(self):
+        """양자화 설정별 캐시 파일 구분자"""
+        if Config.RAG_QUANTIZATION == 'pq':
+            return f"pq{Config.RAG_PQ_SUBVECTORS}"
+        return Config.RAG_QUANTIZATION
+    
+    def _save_cache(self, folder_hash, embeddings, bm25=None, chunk_meta=None, vector_index=None):
+        """
+        캐시 저장 (청크 텍스트는 분할 중 ChunkStoreWriter로 이미 기록됨)
         
-        # 청크 저장
-        chunks_file = os.path.join(self.cache_dir, f"chunks_{folder_hash}.json")
-        with open(chunks_file, 'w', encoding='utf-8') as f:
-            json.dump(chunks, f, ensure_ascii=False, indent=2)
+        임베딩 파일을 마지막에 저장하므로, 임베딩 파일이 있으면 캐시가 완성된 것으로 봅니다.
+        """
+        paths = self._cache_paths(folder_hash)
         
-        # 임베딩 저장
-        embeddings_file = os.path.join(self.cache_dir, f"embeddings_{folder_hash}.npy")
-        np.save(embeddings_file, np.array(embeddings))
+        # 청크 메타데이터(출처) 사이드카 저장
+        if chunk_meta is not None:
+            chunk_meta.save(paths['meta'])
+        
+        # BM25 색인 저장
+        if bm25 is not None:
+            bm25.save(paths['bm25'])
+        
+        # 양자화 코드 저장
+        if vector_index is not None and vector_index.method != 'none':
+            vector_index.save_codes(paths['quantized'])
+        
+        # 임베딩 저장 (정규화된 float32)
+        save_array(paths['embeddings'], normalize_rows(embeddings))
         
         print(f"캐시 저장 완료: {folder_hash}")
     
-    def _load_cache(self, folder_path):
-        """캐시 로드"""
-        folder_hash = self._get_folder_hash(folder_path)
-        
-        chunks_file = os.path.join(self.cache_dir, f"chunks_{folder_hash}.json")
-        embeddings_file = os.path.join(self.cache_dir, f"embeddings_{folder_hash}.npy")
+    def _load_cache(self, folder_hash):
+        """캐시 로드 (청크 텍스트는 메모리 매핑, 조회 시에만 디코딩)"""
+        paths = self._cache_paths(folder_hash)
         
         # 캐시 파일 존재 확인
-        if not (os.path.exists(chunks_file) and os.path.exists(embeddings_file)):
-            return False, None, None
+        required = ('chunks', 'offsets', 'embeddings', 'meta')
+        if not all(os.path.exists(paths[name]) for name in required):
+            return False, None, None, None, None
         
         try:
-            # 청크 로드
-            with open(chunks_file, 'r', encoding='utf-8') as f:
-                chunks = json.load(f)
+            # 청크 저장소 열기 (파싱 없음)
+            chunks = ChunkStore.open(paths['chunks'], paths['offsets'])
+            
+            # 임베딩 로드 (메모리 매핑, 재순위 후보만 읽음)
+            embeddings = np.load(paths['embeddings'], mmap_mode='r')
+            if embeddings.dtype != np.float32:
+                # 이전 포맷(float64, 비정규화)은 한 번 변환해 다시 저장
+                print("임베딩 캐시를 float32 정규화 포맷으로 변환합니다...")
+                save_array(paths['embeddings'], normalize_rows(embeddings))
+                embeddings = np.load(paths['embeddings'], mmap_mode='r')
             
-            # 임베딩 로드
-            embeddings = np.load(embeddings_file).tolist()
+            # 양자화 색인 로드 (설정이 바뀌었으면 임베딩으로부터 다시 생성, 원격 호출 없음)
+            if Config.RAG_QUANTIZATION != 'none' and os.path.exists(paths['quantized']):
+                vector_index = INDEX_TYPES[Config.RAG_QUANTIZATION].load_codes(paths['quantized'], embeddings)
+            else:
+                vector_index = self.build_dense_index(embeddings)
+                if vector_index.method != 'none':
+                    vector_index.save_codes(paths['quantized'])
+            
+            # BM25 색인 로드 (없으면 로컬에서 재생성)
+            if os.path.exists(paths['bm25']):
+                bm25 = BM25Index.load(paths['bm25'])
+            else:
+                print("BM25 색인 캐시가 없어 청크로부터 생성합니다...")
+                bm25 = BM25Index().build(chunks)
+                bm25.save(paths['bm25'])
             
-            print(f"캐시 로드 완료: {len(chunks)}개 청크, {len(embeddings)}개 임베딩")
-            return True, chunks, embeddings
+            chunk_meta = ChunkMetadata.load(paths['meta'])
+            
+            print(f"캐시 로드 완료: {len(chunks)}개 청크 ({chunks.nbytes() / 1024**2:.1f}MB 매핑), "
+                  f"{len(embeddings)}개 임베딩 ({vector_index.method}, {vector_index.nbytes() / 1024**2:.1f}MB 상주)")
+            return True, chunks, vector_index, bm25, chunk_meta
             
         except Exception as e:
             print(f"캐시 로드 실패: {e}")
-            return False, None, None
+            return False, None, None, None, None
+        
+    def _remove_cache_files(self, folder_hash):
+        """교체된 이전 버전의 폴더 캐시 파일 삭제 (매핑 중이라 지울 수 없으면 건너뜀)"""
+        for pattern in (f"*_{folder_hash}.*", f"vectors_{folder_hash}_*"):
+            for path in glob.glob(os.path.join(self.cache_dir, pattern)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def _reusable_sources(self, previous, folder_path, pdf_files):
+        """
+        이전 스냅샷에서 그대로 재사용할 수 있는 문서 (파일 상태가 같은 PDF)
+        
+        Returns:
+            {출처 파일명: 이전 스냅샷의 청크 번호 배열}
+        """
+        if previous.folder != folder_path or previous.embeddings is None or not len(previous):
+            return {}
+        
+        rows_by_source = previous.chunk_meta.rows_by_source()
+        reusable = {}
+        for pdf_file in pdf_files:
+            source = os.path.basename(pdf_file)
+            signature = previous.chunk_meta.signatures.get(source)
+            if signature and signature == self._file_signature(pdf_file) and len(rows_by_source.get(source, ())):
+                reusable[source] = rows_by_source[source]
+        return reusable
+    
+    def _get_file_hash(self, pdf_path):
+        """PDF 파일 내용 해시 (추출 텍스트 캐시 키)"""
+        sha1 = hashlib.sha1()
+        with open(pdf_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha1.update(block)
+        return sha1.hexdigest()
+    
+    def _load_page_cache(self, file_hash):
+        """파일 해시로 추출 텍스트 캐시 로드 (없으면 None)"""
+        cache_file = os.path.join(self.page_cache_dir, f"{file_hash}.json")
+        if not os.path.exists(cache_file):
+            return None
         
-    def extract_text_from_pdf(self, pdf_path):
-        """PDF에서 텍스트를 추출하는 함수"""
-        text = ""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                print(f"PDF 총 페이지 수: {len(pdf.pages)}")
-                
-                for i, page in enumerate(pdf.pages):
-                    page_text = page.extract_text()
-                    if page_text:  # 텍스트가 있는 경우만
-                        text += f"\n--- 페이지 {i+1} ---\n"
-                        text += page_text + "\n"
-                        
-                print(f"추출된 텍스트 길이: {len(text)}자")
-                return text
-                
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return [(page_no, text) for page_no, text in json.load(f)]
+        except Exception as e:
+            print(f"추출 텍스트 캐시 로드 실패: {e}")
+            return None
+    
+    def _save_page_cache(self, file_hash, pages):
+        """파일 해시별 추출 텍스트 캐시 저장"""
+        cache_file = os.path.join(self.page_cache_dir, f"{file_hash}.json")
+        tmp_file = cache_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(pages, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"추출 텍스트 캐시 저장 실패: {e}")
+    
+    def _create_extract_executor(self):
+        """페이지 추출용 실행기 생성 (프로세스 풀, 불가하면 단일 스레드)"""
+        workers = max(1, Config.PDF_EXTRACT_WORKERS)
+        if workers > 1:
+            try:
+                return ProcessPoolExecutor(max_workers=workers)
+            except Exception as e:
+                print(f"프로세스 풀 생성 실패, 단일 프로세스로 추출합니다: {e}")
+        return ThreadPoolExecutor(max_workers=1)
+    
+    def _schedule_extraction(self, pdf_path, executor):
+        """
+        PDF 한 개의 추출 작업 예약 (캐시 적중 시 작업 없음)
+        
+        Returns:
+            (파일 해시, 캐시된 페이지 또는 None, 페이지 범위별 future 리스트)
+        """
+        file_hash = self._get_file_hash(pdf_path)
+        cached_pages = self._load_page_cache(file_hash)
+        if cached_pages is not None:
+            print(f"추출 텍스트 캐시 사용: {os.path.basename(pdf_path)}")
+            return file_hash, cached_pages, []
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            num_pages = len(pdf.pages)
+        print(f"PDF 총 페이지 수: {num_pages} ({os.path.basename(pdf_path)})")
+        
+        batch = max(1, Config.PDF_PAGES_PER_TASK)
+        futures = [
+            executor.submit(_extract_page_range, pdf_path, start, min(start + batch, num_pages))
+            for start in range(0, num_pages, batch)
+        ]
+        return file_hash, None, futures
+    
+    def _iter_scheduled_pages(self, file_hash, cached_pages, futures):
+        """예약된 추출 결과를 페이지 순서대로 흘려보내고, 끝까지 읽으면 캐시 저장"""
+        if cached_pages is not None:
+            yield from cached_pages
+            return
+        
+        pages = []
+        for future in futures:
+            for page in future.result():
+                pages.append(page)
+                yield page
+        self._save_page_cache(file_hash, pages)
+    
+    def iter_folder_pages(self, pdf_files, executor):
+        """
+        여러 PDF의 페이지를 병렬 추출하며 문서 순서대로 스트리밍
+        
+        앞선 문서를 소비하는 동안 다음 문서들의 페이지가 워커에서 미리 추출됩니다.
+        
+        Args:
+            pdf_files: PDF 파일 경로 리스트
+            executor: 페이지 추출 실행기
+        
+        Yields:
+            (PDF 경로, (페이지 번호, 텍스트) 이터레이터)
+        """
+        lookahead = max(2, Config.PDF_EXTRACT_WORKERS)
+        pending = deque()
+        remaining = iter(pdf_files)
+        
+        def schedule_next():
+            for pdf_file in remaining:
+                try:
+                    pending.append((pdf_file, self._schedule_extraction(pdf_file, executor)))
+                except Exception as e:
+                    print(f"PDF 읽기 오류 ({os.path.basename(pdf_file)}): {e}")
+                    continue
+                return
+        
+        for _ in range(lookahead):
+            schedule_next()
+        
+        while pending:
+            pdf_file, scheduled = pending.popleft()
+            schedule_next()
+            yield pdf_file, self._iter_scheduled_pages(*scheduled)
+    
+    def extract_pages(self, pdf_path):
+        """
+        PDF에서 페이지별 텍스트 추출 (파일 해시 캐시 + 멀티프로세스)
+        
+        Returns:
+            [(페이지 번호, 텍스트), ...] 또는 실패 시 None
+        """
+        try:
+            with self._create_extract_executor() as executor:
+                for _, pages in self.iter_folder_pages([pdf_path], executor):
+                    return list(pages)
         except Exception as e:
             print(f"PDF 읽기 오류: {e}")
+        return None
+        
+    def extract_text_from_pdf(self, pdf_path):
+        """PDF에서 텍스트를 추출하는 함수"""
+        pages = self.extract_pages(pdf_path)
+        if pages is None:
             return None
+        
+        text = "".join(f"\n--- 페이지 {page_no} ---\n{page_text}\n" for page_no, page_text in pages)
+        print(f"추출된 텍스트 길이: {len(text)}자")
+        return text
+
+    def _advance(self, buf, start, count, unit):
+        """start에서 count 단위(글자 또는 토큰)만큼 진행한 위치"""
+        if unit == 'token':
+            for i, match in enumerate(_TOKEN_PATTERN.finditer(buf, start)):
+                if i + 1 == count:
+                    return match.end()
+            return len(buf)
+        return min(start + count, len(buf))
+    
+    def _overlap_start(self, buf, start, end, overlap, unit):
+        """다음 청크 시작 위치 (overlap 단위만큼 되돌아가되 항상 전진)"""
+        if overlap <= 0:
+            return end
+        
+        if unit == 'token':
+            token_starts = [match.start() for match in _TOKEN_PATTERN.finditer(buf, start, end)]
+            next_start = token_starts[-overlap] if overlap < len(token_starts) else end
+        else:
+            next_start = end - overlap
+        return max(next_start, start + 1)
+    
+    def _find_chunk_end(self, buf, start, end):
+        """문장 중간에 끊어지지 않도록 마지막 마침표나 줄바꿈 위치로 조정"""
+        for i in range(end, max(start + (end - start) // 2, end - 100), -1):
+            if buf[i] in '.!?\n':
+                return i + 1
+        return end
+    
+    def iter_chunks(self, pages, source=None, chunk_size=1000, overlap=200, unit="char"):
+        """
+        페이지 스트림을 받아 문서 단위로 청크를 생성하는 제너레이터
+        
+        문서 전체를 하나의 문자열로 만들지 않고, 아직 청크로 내보내지 않은
+        구간만 버퍼에 유지합니다. 청크는 문서 경계를 넘지 않습니다.
+        
+        Args:
+            pages: (페이지 번호, 텍스트) 이터러블
+            source: 출처 파일명
+            chunk_size: 각 청크의 크기
+            overlap: 청크 간 겹치는 부분 (연결성 유지용)
+            unit: 크기 단위 ('char' 글자 수 / 'token' 공백 기준 어절 수)
+        
+        Yields:
+            dict: text, source, page_start, page_end, char_start, char_end
+        """
+        buf = ""
+        buf_offset = 0      # 문서 내에서 buf[0]의 위치
+        page_offsets = []   # 문서 내 각 페이지 시작 위치
+        page_numbers = []
+        start = 0
+        
+        def make_chunk(chunk_start, chunk_end):
+            char_start = buf_offset + chunk_start
+            char_end = buf_offset + chunk_end
+            first = max(bisect_right(page_offsets, char_start) - 1, 0)
+            last = max(bisect_right(page_offsets, char_end - 1) - 1, 0)
+            return {
+                'text': buf[chunk_start:chunk_end],
+                'source': source,
+                'page_start': page_numbers[first],
+                'page_end': page_numbers[last],
+                'char_start': char_start,
+                'char_end': char_end
+            }
+        
+        for page_no, page_text in pages:
+            if not page_text:
+                continue
+            
+            if page_offsets:
+                buf += "\n"
+            page_offsets.append(buf_offset + len(buf))
+            page_numbers.append(page_no)
+            buf += page_text
+            
+            # 버퍼에 청크 하나 이상이 쌓일 때마다 내보내기
+            while True:
+                end = self._advance(buf, start, chunk_size, unit)
+                if end >= len(buf):
+                    break
+                
+                end = self._find_chunk_end(buf, start, end)
+                yield make_chunk(start, end)
+                start = self._overlap_start(buf, start, end, overlap, unit)
+            
+            # 이미 내보낸 앞부분은 버퍼에서 제거
+            if start > 0:
+                buf = buf[start:]
+                buf_offset += start
+                start = 0
+                
+                keep_from = max(bisect_right(page_offsets, buf_offset) - 1, 0)
+                del page_offsets[:keep_from]
+                del page_numbers[:keep_from]
+        
+        if buf[start:].strip():
+            yield make_chunk(start, len(buf))
 
     def chunk_text(self, text, chunk_size=1000, overlap=200):
         """
@@ -115,31 +728,24 @@ class PDFProcessor:
         if not text:
             return []
         
-        chunks = []
-        start = 0
+        return [chunk['text'] for chunk in self.iter_chunks([(1, text)], None, chunk_size, overlap)]
+
+    def build_lexical_index(self, chunks=None):
+        """
+        텍스트 청크들로 BM25 어휘 색인 생성 (로컬 연산, API 호출 없음)
         
-        while start < len(text):
-            # 청크 끝 위치 계산
-            end = start + chunk_size
-            
-            # 텍스트가 남은 길이보다 청크 크기가 크면 끝까지
-            if end >= len(text):
-                chunks.append(text[start:])
-                break
-            
-            # 문장 중간에 끊어지지 않도록 조정
-            # 마지막 마침표나 줄바꿈을 찾아서 거기서 자르기
-            chunk_end = end
-            for i in range(end, max(start + chunk_size//2, end - 100), -1):
-                if text[i] in '.!?\n':
-                    chunk_end = i + 1
-                    break
-            
-            chunks.append(text[start:chunk_end])
-            start = chunk_end - overlap  # 겹치는 부분 설정
+        Args:
+            chunks: 텍스트 청크 리스트 (없으면 self.chunks 사용)
         
-        self.chunks = chunks
-        return chunks
+        Returns:
+            BM25Index
+        """
+        if chunks is None:
+            chunks = self.chunks
+        
+        bm25 = BM25Index().build(chunks)
+        print(f"BM25 색인 생성 완료: {len(bm25)}개 청크")
+        return bm25
 
     def create_embeddings(self, chunks=None):
         """
@@ -149,7 +755,7 @@ class PDFProcessor:
             chunks: 텍스트 청크 리스트 (없으면 self.chunks 사용)
         
         Returns:
-            임베딩 벡터 리스트
+            정규화된 float32 임베딩 행렬 (청크 수 x 384)
         """
         if chunks is None:
             chunks = self.chunks
@@ -176,57 +782,228 @@ class PDFProcessor:
                 embeddings.append([0] * 384)  # all-MiniLM-L6-v2는 384차원
         
         print("임베딩 생성 완료!")
-        self.embeddings = embeddings
-        return embeddings
+        return normalize_rows(embeddings) if embeddings else np.zeros((0, 384), dtype=np.float32)
+    
+    def build_dense_index(self, embeddings=None):
+        """
+        임베딩 검색 색인 생성 (Config.RAG_QUANTIZATION: none / int8 / pq)
+        
+        Args:
+            embeddings: 정규화된 float32 임베딩 행렬 (없으면 self.embeddings 사용)
+        
+        Returns:
+            VectorIndex
+        """
+        if embeddings is None:
+            embeddings = self.embeddings
+        
+        method = Config.RAG_QUANTIZATION
+        if method != 'none':
+            print(f"임베딩 양자화 중 ({method})...")
+        return build_vector_index(embeddings, method, Config.RAG_PQ_SUBVECTORS)
+    
+    def measure_index_recall(self, num_queries=50, k=10):
+        """
+        현재 색인의 양자화 recall@k 측정 (저장된 청크 임베딩에 잡음을 더해 질의로 사용)
+        
+        Returns:
+            dict: recall, 평균 검색 시간, 상주 메모리, 압축률
+        """
+        vector_index = self.vector_index
+        if vector_index is None or len(vector_index) == 0:
+            return None
+        
+        rng = np.random.default_rng(0)
+        sample_ids = rng.choice(len(vector_index), size=min(num_queries, len(vector_index)), replace=False)
+        queries = np.asarray(vector_index.vectors[np.sort(sample_ids)], dtype=np.float32)
+        queries = normalize_rows(queries + 0.05 * rng.standard_normal(queries.shape).astype(np.float32))
+        return measure_recall(vector_index, queries, k=k, rerank_candidates=Config.RAG_RERANK_CANDIDATES)
 
-    def search_similar_chunks(self, query, top_k=3, show_preview=True, show_full_text=False):
+    def _normalize_query(self, query):
+        """캐시 키용 질의 정규화 (공백 정리)"""
+        return " ".join(query.split())
+    
+    def _embed_query(self, query):
+        """
+        질의 임베딩 (LRU 캐시 적중 시 원격 호출 생략)
+        
+        Returns:
+            L2 정규화된 float32 벡터
+        """
+        cache_key = self._normalize_query(query)
+        query_vector = self._query_embedding_cache.get(cache_key)
+        if query_vector is not None:
+            print("⚡ 질의 임베딩 캐시 적중")
+            return query_vector
+        
+        query_embedding = self.client.feature_extraction(
+            text=query,
+            model="sentence-transformers/all-MiniLM-L6-v2"
+        )
+        query_vector = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query_vector)
+        if norm > 0:
+            query_vector = query_vector / norm
+        
+        self._query_embedding_cache.put(cache_key, query_vector)
+        return query_vector
+    
+    def _rank_chunks(self, index, query, top_k, mode):
+        """
+        하이브리드 순위 계산 (index: 검색 시작 시점의 RAGIndex 스냅샷)
+        
+        Returns:
+            ([(청크 번호, 관련도, BM25 점수, 융합 점수), ...], 캐시 가능 여부)
+            dense 모드에서 임베딩 실패 시 (None, False)
         """
-        사용자 질문과 가장 유사한 PDF 청크들을 찾는 함수
+        num_candidates = max(top_k, Config.RAG_CANDIDATES)
+        rankings = []
+        query_vector = None
+        dense_scores = {}
+        degraded = False  # 임베딩 실패로 BM25만 사용한 경우 (캐시하지 않음)
+        
+        # 1. 임베딩 검색 (dense)
+        if mode in ('hybrid', 'dense') and index.vector_index is not None and len(index.vector_index):
+            try:
+                query_vector = self._embed_query(query)
+                
+                # 양자화 점수로 후보를 고른 뒤 float32 임베딩으로 정확히 재순위
+                dense_ids, similarities = index.vector_index.search(
+                    query_vector, top_k=num_candidates, rerank_candidates=Config.RAG_RERANK_CANDIDATES
+                )
+                dense_scores = dict(zip(dense_ids.tolist(), similarities.tolist()))
+                rankings.append(dense_ids.tolist())
+            except Exception as e:
+                print(f"질문 임베딩 생성 실패: {e}")
+                if mode == 'dense':
+                    return None, False
+                print("⚡ 로컬 BM25 검색만으로 진행합니다.")
+                degraded = True
+        
+        # 2. 어휘 검색 (BM25) - 임베딩 실패 시에도 로컬에서 동작
+        lexical_scores = {}
+        if mode in ('hybrid', 'lexical') or query_vector is None:
+            lexical_hits = index.bm25.search(query, top_k=num_candidates)
+            lexical_scores = dict(lexical_hits)
+            rankings.append([idx for idx, _ in lexical_hits])
+        
+        # 3. Reciprocal Rank Fusion으로 순위 결합
+        fused = reciprocal_rank_fusion(rankings, k=Config.RAG_RRF_K)[:top_k]
+        max_lexical = max(lexical_scores.values()) if lexical_scores else 0.0
+        
+        # BM25로만 들어온 청크는 관련도 표시용 코사인 유사도를 따로 계산
+        if query_vector is not None:
+            missing = [idx for idx, _ in fused if idx not in dense_scores]
+            dense_scores.update(zip(missing, index.vector_index.exact_scores(query_vector, missing).tolist()))
+        
+        ranked = []
+        for idx, fused_score in fused:
+            if query_vector is not None:
+                similarity = float(dense_scores[idx])
+            else:
+                # 임베딩이 없으면 BM25 점수를 0~1로 정규화해 관련도로 사용
+                similarity = lexical_scores.get(idx, 0.0) / max_lexical if max_lexical else 0.0
+            ranked.append((idx, similarity, lexical_scores.get(idx, 0.0), fused_score))
+        return ranked, not degraded
+    
+    def _diversify(self, index, query, ranked, top_k):
+        """
+        후보 N개 → MMR 다양화 → (선택) cross-encoder 재순위
+        
+        전체 단계를 Config.RAG_RERANK_BUDGET_MS 안에서 수행하며,
+        예산을 넘기면 그 시점까지의 순서를 그대로 사용합니다.
+        
+        Returns:
+            (상위 top_k 순위, 예산 내 완료 여부)
+        """
+        if len(ranked) <= 1:
+            return ranked[:top_k], True
+        
+        started = time.perf_counter()
+        deadline = started + Config.RAG_RERANK_BUDGET_MS / 1000
+        
+        ids = [item[0] for item in ranked]
+        texts = [index.chunks[idx] for idx in ids]
+        vectors = None
+        if index.embeddings is not None and len(index.embeddings):
+            vectors = index.embeddings[ids]
+        
+        # 1. MMR: 관련도(융합 점수)와 이미 고른 청크와의 유사도를 함께 고려
+        fused = np.array([item[3] for item in ranked], dtype=np.float32)
+        relevance = fused / fused.max() if fused.max() > 0 else fused
+        pool = top_k * 2 if self.reranker.available else top_k
+        order = mmr_select(relevance, candidate_similarity(texts, vectors), pool,
+                           Config.RAG_MMR_LAMBDA, deadline)
+        complete = time.perf_counter() <= deadline
+        
+        # 2. cross-encoder 재순위 (남은 예산 안에서만)
+        if self.reranker.available and len(order) > top_k:
+            scores = self.reranker.score(query, [texts[i] for i in order], deadline - time.perf_counter())
+            if scores is None:
+                complete = False
+            else:
+                order = [order[i] for i in np.argsort(scores)[::-1]]
+        
+        print(f"🔀 다양화/재순위: 후보 {len(ranked)}개 → {min(top_k, len(order))}개 "
+              f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return [ranked[i] for i in order[:top_k]], complete
+    
+    def search_similar_chunks(self, query, top_k=3, show_preview=True, show_full_text=False, mode=None,
+                              diversify=True):
+        """
+        사용자 질문과 가장 유사한 PDF 청크들을 찾는 함수 (BM25 + 임베딩 하이브리드)
         
         Args:
             query: 사용자 질문
             top_k: 반환할 상위 결과 개수
             show_preview: 검색 결과 미리보기 출력 여부
             show_full_text: 검색된 전체 문단 출력 여부
+            mode: 'hybrid' / 'dense' / 'lexical' (없으면 Config.RAG_SEARCH_MODE)
+            diversify: 후보를 넓게 뽑아 MMR/재순위로 중복을 줄이고, 겹치는 이웃 청크는 병합
         
         Returns:
-            가장 유사한 청크들과 유사도 점수
+            가장 유사한 청크들과 유사도 점수 (병합된 경우 chunk_indices 포함)
         """
-        if not self.chunks or not self.embeddings:
+        index = self.rag_index  # 검색 중 색인이 교체되어도 이 스냅샷만 사용
+        if not len(index):
             print("PDF 데이터가 없습니다. 먼저 PDF를 처리하세요.")
             return []
-            
-        print(f"🔍 질문 분석 중: {query}")
         
-        # 1. 사용자 질문을 임베딩으로 변환
-        try:
-            query_embedding = self.client.feature_extraction(
-                text=query,
-                model="sentence-transformers/all-MiniLM-L6-v2"
-            )
-        except Exception as e:
-            print(f"질문 임베딩 생성 실패: {e}")
-            return []
-        
-        # 2. 질문 임베딩과 모든 청크 임베딩 간 유사도 계산
-        query_embedding = np.array(query_embedding).reshape(1, -1)
-        chunk_embeddings = np.array(self.embeddings)
-        
-        # 코사인 유사도 계산
-        similarities = cosine_similarity(query_embedding, chunk_embeddings)[0]
+        mode = mode or Config.RAG_SEARCH_MODE
+        print(f"🔍 질문 분석 중 ({mode}): {query}")
         
-        # 3. 유사도가 높은 순으로 정렬
-        similar_indices = np.argsort(similarities)[::-1][:top_k]
+        # 동일 질의 결과 캐시 확인 (색인 버전이 바뀌면 비워짐)
+        cache_key = (index.version, self._normalize_query(query), top_k, mode, diversify)
+        ranked = self._search_result_cache.get(cache_key)
+        if ranked is not None:
+            print("⚡ 검색 결과 캐시 적중")
+        else:
+            pool = max(top_k, Config.RAG_CANDIDATES) if diversify else top_k
+            ranked, cacheable = self._rank_chunks(index, query, pool, mode)
+            if ranked is None:
+                return []
+            if diversify:
+                ranked, complete = self._diversify(index, query, ranked, top_k)
+                cacheable = cacheable and complete
+            if cacheable:
+                self._search_result_cache.put(cache_key, ranked)
         
         # 4. 결과 반환
         results = []
-        for i, idx in enumerate(similar_indices):
-            results.append({
+        for i, (idx, similarity, bm25_score, fused_score) in enumerate(ranked):
+            result = {
                 'rank': i + 1,
-                'chunk': self.chunks[idx],
-                'similarity': similarities[idx],
+                'chunk': index.chunks[idx],
+                'similarity': similarity,
+                'bm25_score': bm25_score,
+                'fused_score': fused_score,
                 'chunk_index': idx
-            })
+            }
+            result.update(index.chunk_meta.get(idx))  # source, page_start, page_end, char_start, char_end
+            results.append(result)
+        
+        if diversify:
+            results = merge_overlapping(results)
         
         # 5. 간단한 미리보기 출력 (옵션)
         if show_preview:
@@ -236,7 +1013,7 @@ class PDFProcessor:
                 if show_full_text:
                     # 전체 문단 출력
                     print(f"\n🏆 {result['rank']}위 (유사도: {score:.3f})")
-                    print(f"📍 청크 인덱스: {result['chunk_index']}")
+                    print(f"📍 청크 인덱스: {result['chunk_index']} ({self.format_citation(result)})")
                     print(f"📝 전체 내용:")
                     print("=" * 80)
                     print(result['chunk'])
@@ -247,10 +1024,52 @@ class PDFProcessor:
                     print(f"  {result['rank']}위 (유사도: {score:.3f}) - {preview}")
             print()
         
-        print(f"✅ 가장 관련성 높은 {top_k}개 결과를 찾았습니다.")
+        print(f"✅ 가장 관련성 높은 {len(results)}개 결과를 찾았습니다.")
         return results
     
-    def process_pdf(self, pdf_path, chunk_size=1000, overlap=200):
+    def format_citation(self, result):
+        """
+        검색 결과의 출처 표기 (예: "가이드라인.pdf p.3-4")
+        
+        Args:
+            result: search_similar_chunks 결과 항목
+        
+        Returns:
+            출처 문자열 (메타데이터가 없으면 청크 번호)
+        """
+        source = result.get('source')
+        if not source:
+            return f"청크 #{result['chunk_index']}"
+        
+        if result['page_start'] == result['page_end']:
+            return f"{source} p.{result['page_start']}"
+        return f"{source} p.{result['page_start']}-{result['page_end']}"
+    
+    def format_evidence(self, results, max_chars=400):
+        """
+        검색 결과를 LLM 프롬프트용 참고 자료 문자열로 변환
+        
+        Args:
+            results: search_similar_chunks 결과
+            max_chars: 근거 하나당 최대 글자 수
+        
+        Returns:
+            참고 자료 문자열 (결과가 없으면 빈 문자열)
+        """
+        if not results:
+            return ""
+        
+        evidence = "\n\n=== RAG 데이터베이스 참고 자료 ==="
+        for i, result in enumerate(results):
+            citation = self.format_citation(result)
+            text = result['chunk']
+            if len(text) > max_chars:
+                text = text[:max_chars] + "..."
+            evidence += f"\n[참고 {i+1}] (출처: {citation}, 관련도: {result['similarity']:.3f})\n"
+            evidence += text + "\n"
+        return evidence
+    
+    def process_pdf(self, pdf_path, chunk_size=1000, overlap=200, unit="char"):
         """
         PDF 전체 처리 파이프라인 (텍스트 추출 → 분할 → 임베딩)
         
@@ -258,6 +1077,7 @@ class PDFProcessor:
             pdf_path: PDF 파일 경로
             chunk_size: 청크 크기
             overlap: 청크 겹침
+            unit: 청크 크기 단위 ('char' / 'token')
         
         Returns:
             처리 성공 여부 (bool)
@@ -265,89 +1085,164 @@ class PDFProcessor:
         print("=== PDF 처리 시작 ===")
         
         # 1. 텍스트 추출
-        text = self.extract_text_from_pdf(pdf_path)
-        if not text:
+        pages = self.extract_pages(pdf_path)
+        if not pages:
             return False
         
-        # 2. 텍스트 분할
-        chunks = self.chunk_text(text, chunk_size, overlap)
+        # 2. 페이지 단위 분할 (출처 메타데이터 포함)
+        chunks = []
+        chunk_meta = ChunkMetadata()
+        for chunk in self.iter_chunks(pages, os.path.basename(pdf_path), chunk_size, overlap, unit):
+            chunks.append(chunk['text'])
+            chunk_meta.append(chunk)
         print(f"텍스트 분할 완료: {len(chunks)}개 청크")
         
-        # 3. 임베딩 생성
+        # 3. 임베딩 + BM25 색인 생성
         embeddings = self.create_embeddings(chunks)
         print(f"임베딩 생성 완료: {len(embeddings)}개")
+        vector_index = self.build_dense_index(embeddings)
+        bm25 = self.build_lexical_index(chunks)
+        
+        self._publish(RAGIndex(ChunkStore.from_texts(chunks), vector_index, bm25, chunk_meta,
+                               version=self._get_file_hash(pdf_path)))
         
         print("=== PDF 처리 완료 ===")
         return True
     
-    def process_pdf_folder(self, folder_path, chunk_size=1000, overlap=200):
+    def process_pdf_folder(self, folder_path, chunk_size=1000, overlap=200, unit="char"):
         """
         폴더 내 모든 PDF 파일을 처리하는 함수 (캐싱 지원)
         
+        완성된 색인은 스냅샷으로 한 번에 교체되며, 생성은 한 번에 하나만 실행됩니다.
+        
         Args:
             folder_path: PDF 파일들이 있는 폴더 경로
             chunk_size: 청크 크기
             overlap: 청크 겹침
+            unit: 청크 크기 단위 ('char' / 'token')
         
         Returns:
             처리 성공 여부 (bool)
         """
+        with self._build_lock:
+            return self._process_pdf_folder(folder_path, chunk_size, overlap, unit)
+    
+    def _process_pdf_folder(self, folder_path, chunk_size, overlap, unit):
+        """process_pdf_folder 본체 (_build_lock 안에서 실행)"""
         print(f"=== 폴더 내 PDF 처리 시작: {folder_path} ===")
+        folder_hash = self._get_folder_hash(folder_path)
+        previous = self.rag_index
         
         # 1. 캐시 확인
-        cache_loaded, cached_chunks, cached_embeddings = self._load_cache(folder_path)
+        cache_loaded, cached_chunks, cached_index, cached_bm25, cached_meta = self._load_cache(folder_hash)
         
         if cache_loaded:
             print("🚀 캐시에서 데이터 로드 완료! (즉시 사용 가능)")
-            self.chunks = cached_chunks
-            self.embeddings = cached_embeddings
+            self._publish(RAGIndex(cached_chunks, cached_index, cached_bm25, cached_meta,
+                                   version=folder_hash, folder=folder_path))
             return True
         
         # 2. 캐시가 없으면 새로 처리
         print("⏳ 캐시가 없습니다. 새로 처리합니다...")
         
         # PDF 파일 목록 찾기
-        pdf_files = glob.glob(os.path.join(folder_path, "*.pdf"))
+        pdf_files = sorted(glob.glob(os.path.join(folder_path, "*.pdf")))
         
         if not pdf_files:
             print("폴더에 PDF 파일이 없습니다.")
+            if previous.folder == folder_path and len(previous):
+                # 모든 PDF가 삭제된 경우 빈 색인으로 교체
+                self._publish(RAGIndex([], version=folder_hash, folder=folder_path))
             return False
         
         print(f"발견된 PDF 파일: {len(pdf_files)}개")
         for pdf_file in pdf_files:
             print(f"  - {os.path.basename(pdf_file)}")
         
-        all_text = ""
+        # 이전 스냅샷에서 파일 상태가 같은 문서는 청크/임베딩을 그대로 재사용
+        reusable = self._reusable_sources(previous, folder_path, pdf_files)
+        reused_rows = []
+        
+        paths = self._cache_paths(folder_hash)
+        chunk_meta = ChunkMetadata()
         processed_count = 0
         
-        # 각 PDF 파일 처리
-        for pdf_file in pdf_files:
-            print(f"\n처리 중: {os.path.basename(pdf_file)}")
-            text = self.extract_text_from_pdf(pdf_file)
-            
-            if text:
-                all_text += f"\n\n=== {os.path.basename(pdf_file)} ===\n"
-                all_text += text
+        # 페이지 단위 병렬 추출 결과를 문서별로 받아 바로 분할하고,
+        # 청크 텍스트는 메모리에 쌓지 않고 청크 저장소 파일에 바로 기록
+        with ChunkStoreWriter(paths['chunks'], paths['offsets']) as writer, \
+                self._create_extract_executor() as executor:
+            for pdf_file in pdf_files:
+                source = os.path.basename(pdf_file)
+                rows = reusable.get(source)
+                if rows is None:
+                    continue
+                
+                for idx in rows:
+                    writer.append(previous.chunks[idx])
+                    chunk_meta.append(previous.chunk_meta.get(idx))
+                chunk_meta.signatures[source] = previous.chunk_meta.signatures[source]
+                reused_rows.extend(rows.tolist())
                 processed_count += 1
-            else:
-                print(f"실패: {os.path.basename(pdf_file)}")
+            
+            if reusable:
+                print(f"♻️ 변경 없는 PDF {len(reusable)}개 재사용 ({len(reused_rows)}개 청크)")
+            
+            changed_files = [f for f in pdf_files if os.path.basename(f) not in reusable]
+            for pdf_file, pages in self.iter_folder_pages(changed_files, executor):
+                source = os.path.basename(pdf_file)
+                print(f"\n처리 중: {source}")
+                
+                chunk_count = len(writer)
+                try:
+                    signature = self._file_signature(pdf_file)
+                    for chunk in self.iter_chunks(pages, source, chunk_size, overlap, unit):
+                        writer.append(chunk['text'])
+                        chunk_meta.append(chunk)
+                except Exception as e:
+                    print(f"PDF 읽기 오류: {e}")
+                    # 일부만 분할된 문서는 제외
+                    writer.truncate(chunk_count)
+                    chunk_meta.truncate(chunk_count)
+                
+                if len(writer) > chunk_count:
+                    chunk_meta.signatures[source] = signature
+                    processed_count += 1
+                else:
+                    print(f"실패: {source}")
         
-        if not all_text:
+        if len(chunk_meta) == 0:
             print("처리된 PDF가 없습니다.")
             return False
         
         print(f"\n성공적으로 처리된 PDF: {processed_count}개")
+        chunks = ChunkStore.open(paths['chunks'], paths['offsets'])
+        print(f"문서별 텍스트 분할 완료: {len(chunks)}개 청크")
         
-        # 통합 텍스트 분할
-        chunks = self.chunk_text(all_text, chunk_size, overlap)
-        print(f"통합 텍스트 분할 완료: {len(chunks)}개 청크")
+        # 임베딩 생성 (재사용 문서는 이전 벡터를 복사하고 새 청크만 원격 호출)
+        num_reused = len(reused_rows)
+        new_embeddings = self.create_embeddings([chunks[i] for i in range(num_reused, len(chunks))])
+        if num_reused:
+            embeddings = np.concatenate([
+                np.asarray(previous.embeddings[reused_rows], dtype=np.float32), new_embeddings
+            ])
+        else:
+            embeddings = new_embeddings
+        print(f"임베딩 생성 완료: {len(embeddings)}개 (신규 {len(new_embeddings)}개)")
         
-        # 임베딩 생성
-        embeddings = self.create_embeddings(chunks)
-        print(f"임베딩 생성 완료: {len(embeddings)}개")
+        # 임베딩 검색 색인(양자화) + BM25 색인 생성
+        vector_index = self.build_dense_index(embeddings)
+        bm25 = self.build_lexical_index(chunks)
         
         # 3. 캐시 저장
-        self._save_cache(folder_path, chunks, embeddings)
+        self._save_cache(folder_hash, embeddings, bm25, chunk_meta, vector_index)
+        
+        # 저장한 임베딩을 메모리 매핑으로 다시 열어 힙에서 해제
+        vector_index.vectors = np.load(paths['embeddings'], mmap_mode='r')
+        
+        # 4. 완성된 색인 공개 후 이전 버전 캐시 정리
+        self._publish(RAGIndex(chunks, vector_index, bm25, chunk_meta, version=folder_hash, folder=folder_path))
+        if previous.folder == folder_path and previous.version not in (None, folder_hash):
+            self._remove_cache_files(previous.version)
         
         print("=== 폴더 내 PDF 처리 완료 ===")
-        return True
\ No newline at end of file
+        return True
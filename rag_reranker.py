@@ -0,0 +1,199 @@
+# rag_reranker.py - RAG 검색 결과 다양화(MMR) / 재순위 / 중복 제거
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import numpy as np
+
+from bm25_index import tokenize
+
+# 선택적 로컬 cross-encoder (sentence-transformers 미설치 시 MMR만 사용)
+try:
+    from sentence_transformers import CrossEncoder
+    CROSS_ENCODER_AVAILABLE = True
+except ImportError:
+    CROSS_ENCODER_AVAILABLE = False
+
+
+def _token_jaccard_matrix(texts):
+    """임베딩이 없을 때 사용하는 토큰 집합 Jaccard 유사도 행렬"""
+    token_sets = [set(tokenize(text)) for text in texts]
+    size = len(token_sets)
+    matrix = np.eye(size, dtype=np.float32)
+    for i in range(size):
+        for j in range(i + 1, size):
+            union = len(token_sets[i] | token_sets[j])
+            score = len(token_sets[i] & token_sets[j]) / union if union else 0.0
+            matrix[i, j] = matrix[j, i] = score
+    return matrix
+
+
+def mmr_select(relevance, similarity, count, lambda_mult=0.7, deadline=None):
+    """
+    Maximal Marginal Relevance 선택
+
+    Args:
+        relevance: 후보별 관련도 (0~1)
+        similarity: 후보 간 유사도 행렬
+        count: 선택할 개수
+        lambda_mult: 관련도 가중치 (1이면 관련도 순, 0이면 다양성만)
+        deadline: time.perf_counter() 기준 마감 시각 (넘으면 남은 자리는 관련도 순으로 채움)
+
+    Returns:
+        선택된 후보 위치 리스트 (선택 순)
+    """
+    relevance = np.asarray(relevance, dtype=np.float32)
+    count = min(count, len(relevance))
+    if count <= 0:
+        return []
+
+    selected = [int(np.argmax(relevance))]
+    max_similarity = np.array(similarity[selected[0]], dtype=np.float32)
+
+    while len(selected) < count:
+        if deadline is not None and time.perf_counter() > deadline:
+            remaining = [i for i in np.argsort(relevance)[::-1].tolist() if i not in selected]
+            selected.extend(remaining[:count - len(selected)])
+            break
+
+        scores = lambda_mult * relevance - (1 - lambda_mult) * max_similarity
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        max_similarity = np.maximum(max_similarity, similarity[best])
+
+    return selected
+
+
+def candidate_similarity(texts, vectors=None):
+    """
+    후보 간 유사도 행렬 (임베딩이 있으면 코사인, 없으면 토큰 Jaccard)
+
+    Args:
+        texts: 후보 청크 텍스트
+        vectors: 정규화된 후보 임베딩 (없으면 None)
+    """
+    if vectors is not None and len(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return vectors @ vectors.T
+    return _token_jaccard_matrix(texts)
+
+
+def merge_overlapping(results):
+    """
+    같은 문서에서 글자 구간이 겹치는 결과를 하나의 근거로 병합
+
+    청크 겹침(overlap) 때문에 이웃 청크가 함께 선택되면 같은 문장이 프롬프트에
+    두 번 들어가므로, 구간을 합쳐 겹친 부분은 한 번만 남깁니다.
+
+    Args:
+        results: search_similar_chunks 결과 항목 (순위 순)
+
+    Returns:
+        병합된 결과 리스트 (rank 재부여, 병합된 청크 번호는 chunk_indices)
+    """
+    merged = []
+    for result in results:
+        target = None
+        if result.get('source') is not None:
+            for evidence in merged:
+                if (evidence.get('source') == result['source']
+                        and result['char_start'] <= evidence['char_end']
+                        and evidence['char_start'] <= result['char_end']):
+                    target = evidence
+                    break
+
+        if target is None:
+            evidence = dict(result)
+            evidence['chunk_indices'] = [result['chunk_index']]
+            merged.append(evidence)
+            continue
+
+        # 구간 합치기 (겹친 글자는 한 번만)
+        if result['char_start'] < target['char_start']:
+            keep = target['char_start'] - result['char_start']
+            target['chunk'] = result['chunk'][:keep] + target['chunk']
+            target['char_start'] = result['char_start']
+            target['page_start'] = result['page_start']
+        if result['char_end'] > target['char_end']:
+            skip = target['char_end'] - result['char_start']
+            target['chunk'] += result['chunk'][skip:]
+            target['char_end'] = result['char_end']
+            target['page_end'] = result['page_end']
+        target['chunk_indices'].append(result['chunk_index'])
+
+    for i, evidence in enumerate(merged):
+        evidence['rank'] = i + 1
+    return merged
+
+
+class CrossEncoderReranker:
+    """
+    로컬 cross-encoder 재순위 (시간 예산 초과 시 결과를 버리고 기존 순서 유지)
+
+    모델은 생성 시 전용 스레드에서 미리 로드하고(로드 중에는 재순위 생략),
+    추론도 같은 스레드에서 실행해 예산이 지나면 기다리지 않고 바로 반환합니다.
+    이전 추론이 아직 끝나지 않았으면 새 작업을 뒤에 쌓지 않고 재순위를 생략합니다.
+    """
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self._model = None
+        self.load_error = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-rerank")
+        self._lock = threading.Lock()
+        self._pending = None  # 전용 스레드에서 실행 중인 작업 (모델 로드 또는 추론)
+        self.timeouts = 0
+        self.skipped = 0
+
+        if self.available:
+            self._pending = self._executor.submit(self._load)
+
+    @property
+    def available(self):
+        return bool(self.model_name) and CROSS_ENCODER_AVAILABLE and self.load_error is None
+
+    def _load(self):
+        print(f"🔄 재순위 모델 로드 중: {self.model_name}")
+        try:
+            self._model = CrossEncoder(self.model_name)
+            print(f"✅ 재순위 모델 로드 완료: {self.model_name}")
+        except Exception as e:
+            self.load_error = str(e)
+            print(f"⚠️ 재순위 모델 로드 실패 - MMR만 사용: {e}")
+
+    def _predict(self, query, texts):
+        return self._model.predict([(query, text) for text in texts])
+
+    def score(self, query, texts, timeout):
+        """
+        질의-청크 쌍 점수 계산
+
+        Args:
+            query: 검색 질의
+            texts: 후보 청크 텍스트
+            timeout: 남은 시간 예산(초)
+
+        Returns:
+            점수 배열 (모델 로드 중·이전 추론 진행 중·예산 초과·실패 시 None)
+        """
+        if not self.available or timeout <= 0:
+            return None
+
+        with self._lock:
+            if self._model is None or (self._pending is not None and not self._pending.done()):
+                self.skipped += 1
+                return None
+            future = self._executor.submit(self._predict, query, texts)
+            self._pending = future
+
+        try:
+            return np.asarray(future.result(timeout=timeout), dtype=np.float32)
+        except FutureTimeoutError:
+            self.timeouts += 1
+            print(f"⏱️ 재순위 시간 예산 초과 ({timeout * 1000:.0f}ms) - MMR 순서 사용")
+            return None
+        except Exception as e:
+            print(f"재순위 실패: {e}")
+            return None
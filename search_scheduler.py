@@ -0,0 +1,145 @@
+# search_scheduler.py - 프로세스 전체 웹 검색 스케줄러 (공유 워커 / 우선순위 / 동일 질의 공유)
+
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+
+from config import Config
+
+# 우선순위 (숫자가 작을수록 먼저 실행)
+PRIORITY_INTERACTIVE = 0   # 사용자가 결과를 기다리는 분석
+PRIORITY_BACKGROUND = 10   # 사전 수집 / 배치 작업
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+class _SearchJob:
+    """대기열 항목 하나 (같은 키의 호출자들이 future를 공유)"""
+
+    __slots__ = ('key', 'func', 'future', 'priority', 'started')
+
+    def __init__(self, key, func, priority):
+        self.key = key
+        self.func = func
+        self.future = Future()
+        self.priority = priority
+        self.started = False
+
+
+class SearchScheduler:
+    """
+    여러 분석이 동시에 진행돼도 Serper 동시 요청 수를 프로세스 전체에서 제한하는 스케줄러
+
+    - 고정 개수의 워커 스레드를 모든 호출자가 공유 (호출마다 스레드 풀을 만들지 않음)
+    - 우선순위 큐: 대화형 요청이 백그라운드 요청보다 먼저 실행
+    - 같은 키로 진행 중인 작업이 있으면 새로 실행하지 않고 같은 Future를 돌려줌
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or Config.SEARCH_MAX_WORKERS
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._workers = []
+        self.submitted = 0
+        self.shared = 0
+        self.completed = 0
+
+    def _ensure_workers(self):
+        # 첫 제출 시 워커 시작 (import만 하는 스크립트에서는 스레드를 만들지 않음)
+        if self._workers:
+            return
+        for i in range(self.max_workers):
+            worker = threading.Thread(target=self._work, name=f"search-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, key, func, priority=PRIORITY_INTERACTIVE):
+        """
+        검색 작업 제출
+
+        Args:
+            key: 동일 질의 판별 키 (캐시 키와 같은 정규화 키)
+            func: 인자 없이 호출할 검색 함수
+            priority: PRIORITY_INTERACTIVE / PRIORITY_BACKGROUND
+
+        Returns:
+            concurrent.futures.Future (같은 키가 진행 중이면 그 Future)
+        """
+        with self._lock:
+            self._ensure_workers()
+            job = self._in_flight.get(key)
+            if job is not None:
+                self.shared += 1
+                # 아직 시작 전인 백그라운드 작업에 대화형 요청이 합류하면 앞쪽으로 다시 넣음
+                if not job.started and priority < job.priority:
+                    job.priority = priority
+                    self._queue.put((priority, next(self._sequence), job))
+                return job.future
+
+            job = _SearchJob(key, func, priority)
+            self._in_flight[key] = job
+            self.submitted += 1
+            self._queue.put((priority, next(self._sequence), job))
+            return job.future
+
+    def map(self, items, priority=PRIORITY_INTERACTIVE):
+        """
+        여러 작업을 제출하고 모두 끝날 때까지 대기
+
+        Args:
+            items: {결과 키: (작업 키, 검색 함수)}
+            priority: 우선순위
+
+        Returns:
+            {결과 키: Future} (모두 완료된 상태)
+        """
+        futures = {name: self.submit(key, func, priority) for name, (key, func) in items.items()}
+        for future in futures.values():
+            try:
+                future.result()
+            except Exception:
+                pass  # 예외는 호출자가 future별로 처리
+        return futures
+
+    def _work(self):
+        while True:
+            _, _, job = self._queue.get()
+            with self._lock:
+                # 우선순위 상향으로 중복 등록된 항목은 한 번만 실행
+                if job.started:
+                    continue
+                job.started = True
+
+            if job.future.set_running_or_notify_cancel():
+                try:
+                    job.future.set_result(job.func())
+                except BaseException as e:
+                    job.future.set_exception(e)
+
+            with self._lock:
+                self._in_flight.pop(job.key, None)
+                self.completed += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.max_workers,
+                'queued': sum(1 for job in self._in_flight.values() if not job.started),
+                'running': sum(1 for job in self._in_flight.values() if job.started),
+                'submitted': self.submitted,
+                'shared_in_flight': self.shared,
+                'completed': self.completed
+            }
+
+
+def get_search_scheduler():
+    """프로세스 전체에서 공유하는 검색 스케줄러"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = SearchScheduler()
+        return _scheduler
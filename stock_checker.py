@@ -1,13 +1,102 @@
 # stock_checker.py - 종목 데이터 검증 모듈
 
 import pandas as pd
-import requests
 import json
 from datetime import datetime, timedelta
 import os
 import zipfile
-import xml.etree.ElementTree as ET
-from urllib.request import urlretrieve
+
+from alert_index import AlertIndex
+from cache_utils import LRUCache
+from config import Config
+from corp_code_index import CorpCodeIndex, normalize_corp_name
+from dart_client import DARTClient, REPORT_PRIORITY, probe_first, recent_report_periods
+from excel_cache import read_excel_cached
+from financial_snapshot import FinancialSnapshot
+import stock_mappings
+
+def debt_ratio_result(debt_ratio, report_type, year):
+    """부채비율 조회 성공 결과 (200% 이상이면 고위험)"""
+    return {
+        'status': 'success',
+        'debt_ratio': debt_ratio,
+        'report_type': report_type,
+        'year': year,
+        'is_high_risk': debt_ratio >= 200.0
+    }
+
+def fetch_debt_ratio(dart_client, corp_code, bsns_year=None):
+    """
+    DART API에서 부채비율 조회 (StockChecker와 사전 수집 작업이 공유)
+    
+    후보 보고서를 동시에 조회해 우선순위가 가장 높은(가장 최근) 보고서의 값을 사용합니다.
+    
+    Args:
+        dart_client: DARTClient
+        corp_code: 8자리 기업코드
+        bsns_year: 사업연도 (없으면 기간이 끝난 최근 보고서들 중에서 조회)
+        
+    Returns:
+        dict: 부채비율 정보
+    """
+    if bsns_year is None:
+        candidates = recent_report_periods()
+    else:
+        # 보고서 우선순위: 사업보고서 -> 3Q -> 2Q -> 1Q
+        candidates = [(bsns_year, reprt_code) for reprt_code in REPORT_PRIORITY]
+    
+    print(f"🔍 DART API 부채비율 조회 시작 - 기업코드: {corp_code}, 후보: {candidates}")
+    
+    _, result = probe_first(
+        candidates,
+        lambda candidate: fetch_debt_ratio_report(dart_client, corp_code, *candidate)
+    )
+    if result is not None:
+        print(f"🎉 부채비율 조회 성공: {result}")
+        return result
+    
+    print(f"❌ 모든 보고서에서 부채비율 데이터를 찾을 수 없음")
+    return {
+        'status': 'not_found',
+        'message': f'{bsns_year}년 부채비율 데이터를 찾을 수 없습니다.' if bsns_year
+                   else '최근 보고서에서 부채비율 데이터를 찾을 수 없습니다.'
+    }
+
+def fetch_debt_ratio_report(dart_client, corp_code, bsns_year, reprt_code):
+    """
+    보고서 하나에서 부채비율 조회
+    
+    Returns:
+        dict: 부채비율 정보 또는 None (데이터 없음)
+    """
+    # DART API 호출 (끝난 기간 보고서는 캐시에서 바로 반환)
+    params = {
+        'corp_code': corp_code,
+        'bsns_year': str(bsns_year),
+        'reprt_code': reprt_code,
+        'idx_cl_code': 'M220000'  # 안정성지표(부채비율)
+    }
+    
+    print(f"🌐 DART API 조회 중 - 연도: {bsns_year}, 보고서코드: {reprt_code}")
+    
+    data = dart_client.get_json('fnlttSinglIndx.json', params)
+    
+    if data.get('status') != '000':
+        print(f"❌ DART API 상태 오류 ({bsns_year}/{reprt_code}): {data.get('status')} - {data.get('message', '')}")
+        return None
+    
+    # 부채비율 찾기
+    for item in data.get('list', []):
+        if '부채비율' in item.get('idx_nm', ''):
+            debt_ratio = item.get('idx_val', '').replace(',', '')
+            print(f"✅ 부채비율 발견 ({bsns_year}/{reprt_code}): {debt_ratio}")
+            try:
+                return debt_ratio_result(float(debt_ratio), reprt_code, int(bsns_year))
+            except ValueError:
+                print(f"❌ 부채비율 파싱 실패: {debt_ratio}")
+                continue
+    
+    return None
 
 class StockChecker:
     def __init__(self, dart_api_key):
@@ -29,23 +118,38 @@ class StockChecker:
         self.caution_file = os.path.join(self.data_dir, "투자주의종목_3년.xls")
         self.warning_file = os.path.join(self.data_dir, "투자경고종목_3년.xls")
         self.risk_file = os.path.join(self.data_dir, "투자위험종목_3년.xls")
+        self.preliminary_file = os.path.join(self.data_dir, "예비심사기업.xlsx")
+        self._preliminary_source = None  # 색인을 만든 예비심사 DataFrame
+        self._preliminary_index = {}     # 정규화된 회사명 → 행
+        
+        # DART API 클라이언트 (응답 디스크 캐시 공유)
+        self.dart_client = DARTClient(dart_api_key)
+        self.debt_ratio_memo = LRUCache(Config.DART_MEMO_SIZE)  # (기업코드, 사업연도) → 부채비율 결과
+        
+        # 사전 수집 재무 스냅샷 (python dart_prefetch.py, 없으면 DART 직접 조회)
+        self.financial_snapshot = FinancialSnapshot()
         
         # DART Outlier Checker 초기화
         from dart_outlier_checker import DARTOutlierChecker
-        self.outlier_checker = DARTOutlierChecker(dart_api_key)
+        self.outlier_checker = DARTOutlierChecker(dart_api_key, dart_client=self.dart_client,
+                                                  snapshot=self.financial_snapshot)
         
         # corpCode 파일 경로
         self.corp_code_zip = os.path.join(self.cache_dir, "corpCode.zip")
         self.corp_code_xml = os.path.join(self.cache_dir, "corpCode.xml")
         
+        # corpCode 메모리 색인 (load_corp_code_mapping에서 채움)
+        self.corp_index = CorpCodeIndex()
+        
         # 데이터 로드
         self.load_data()
+        self.build_alert_index()
         
         # DART 기업코드 매핑 로드
         self.corp_code_mapping = self.load_corp_code_mapping()
     
     def load_data(self):
-        """데이터 파일들 로드"""
+        """데이터 파일들 로드 (엑셀은 바이너리 캐시를 거쳐 원본이 바뀐 경우에만 다시 파싱)"""
         try:
             # data 폴더 생성
             if not os.path.exists(self.data_dir):
@@ -55,7 +159,7 @@ class StockChecker:
             
             # 투자주의종목 로드
             if os.path.exists(self.caution_file):
-                self.caution_df = pd.read_excel(self.caution_file)
+                self.caution_df = read_excel_cached(self.caution_file)
                 print(f"투자주의종목 로드: {len(self.caution_df)}건")
             else:
                 self.caution_df = pd.DataFrame()
@@ -63,7 +167,7 @@ class StockChecker:
             
             # 투자경고종목 로드
             if os.path.exists(self.warning_file):
-                self.warning_df = pd.read_excel(self.warning_file)
+                self.warning_df = read_excel_cached(self.warning_file)
                 print(f"투자경고종목 로드: {len(self.warning_df)}건")
             else:
                 self.warning_df = pd.DataFrame()
@@ -71,7 +175,7 @@ class StockChecker:
             
             # 투자위험종목 로드
             if os.path.exists(self.risk_file):
-                self.risk_df = pd.read_excel(self.risk_file)
+                self.risk_df = read_excel_cached(self.risk_file)
                 print(f"투자위험종목 로드: {len(self.risk_df)}건")
             else:
                 self.risk_df = pd.DataFrame()
@@ -83,27 +187,19 @@ class StockChecker:
             self.warning_df = pd.DataFrame()
             self.risk_df = pd.DataFrame()
     
+    def build_alert_index(self):
+        """종목명 → 코드, 종목코드별 지정 구간 색인 생성 (조회 시 DataFrame을 다시 훑지 않음)"""
+        self.alert_index = AlertIndex(
+            getattr(self, 'caution_df', None),
+            getattr(self, 'warning_df', None),
+            getattr(self, 'risk_df', None)
+        )
+    
     def normalize_stock_name(self, stock_name):
         """종목명 정규화(간단한 버전)"""
-        if not stock_name:
-            return ""
-        
-        # 공백 제거, 특수문자 정리
-        normalized = stock_name.strip()
-        normalized = normalized.replace("(주)", "").replace("㈜", "")
-        normalized = normalized.replace(" ", "")
-        
-        return normalized
+        # 공백 제거, 특수문자 정리 (corpCode 색인과 같은 규칙)
+        return normalize_corp_name(stock_name)
     
-    def safe_parse_date(self, date_value):
-        """안전한 날짜 파싱"""
-        if pd.isna(date_value) or str(date_value).strip() in ['-', '', 'NaT']:
-            return None
-        try:
-            return pd.to_datetime(date_value).date()
-        except:
-            return None
-        
     def find_stock_info(self, stock_name):
         """
         종목명으로 종목 정보 찾기
@@ -114,20 +210,15 @@ class StockChecker:
         Returns:
             dict: 종목 정보 (종목코드, 정규화된 종목명)
         """
-        normalized_name = self.normalize_stock_name(stock_name)
-        
-        # 우선순위: 투자주의 -> 투자경고 -> 투자위험 순서로 검색
-        dfs = [self.caution_df, self.warning_df, self.risk_df]
-        
-        for df in dfs:
-            if not df.empty and '종목명' in df.columns:
-                for _, row in df.iterrows():
-                    if self.normalize_stock_name(str(row['종목명'])) == normalized_name:
-                        return {
-                            'code': str(row['종목코드']).zfill(6),
-                            'name': str(row['종목명']),
-                            'found': True
-                        }
+        # 우선순위: 투자주의 -> 투자경고 -> 투자위험 순서로 색인됨
+        match = self.alert_index.find(stock_name)
+        if match:
+            code, name = match
+            return {
+                'code': code,
+                'name': name,
+                'found': True
+            }
         
         return {'code': None, 'name': stock_name, 'found': False}
     
@@ -153,74 +244,8 @@ class StockChecker:
         if not stock_info['found']:
             return result
         
-        stock_code = stock_info['code']
-        
-        # 투자주의종목 확인
-        if not self.caution_df.empty:
-            caution_stocks = self.caution_df[self.caution_df['종목코드'].astype(str).str.zfill(6) == stock_code]
-            
-            # 가장 최근 지정만 유효하도록 정렬
-            if not caution_stocks.empty:
-                # 지정일 기준으로 최신순 정렬
-                caution_stocks = caution_stocks.sort_values('지정일', ascending=False)
-                
-                # 가장 최근 지정만 확인
-                latest_row = caution_stocks.iloc[0]
-                start_date = self.safe_parse_date(latest_row['지정일'])
-                
-                if start_date and start_date <= today:
-                    result['caution'].append({
-                        'type': latest_row.get('구분', '투자주의'),
-                        'start_date': start_date.strftime('%Y-%m-%d'),
-                        'end_date': '현재'  # 투자주의는 해제일이 없음
-                    })
-                    result['any_alert'] = True
-        
-        # 투자경고종목 확인
-        if not self.warning_df.empty:
-            warning_stocks = self.warning_df[self.warning_df['종목코드'].astype(str).str.zfill(6) == stock_code]
-            
-            # 가장 최근 지정만 유효하도록 정렬
-            if not warning_stocks.empty:
-                # 공시일 기준으로 최신순 정렬
-                warning_stocks = warning_stocks.sort_values('공시일', ascending=False)
-                
-                # 가장 최근 지정만 확인
-                latest_row = warning_stocks.iloc[0]
-                start_date = self.safe_parse_date(latest_row['공시일'])
-                end_date = self.safe_parse_date(latest_row.get('해제일', None))
-                
-                # 공시일과 해제일 사이에 현재 날짜가 있는지 확인
-                if start_date and (not end_date or start_date <= today <= end_date):
-                    result['warning'].append({
-                        'start_date': start_date.strftime('%Y-%m-%d'),
-                        'end_date': end_date.strftime('%Y-%m-%d') if end_date else '현재'
-                    })
-                    result['any_alert'] = True
-        
-        # 투자위험종목 확인
-        if not self.risk_df.empty:
-            risk_stocks = self.risk_df[self.risk_df['종목코드'].astype(str).str.zfill(6) == stock_code]
-            
-            # 가장 최근 지정만 유효하도록 정렬
-            if not risk_stocks.empty:
-                # 공시일 기준으로 최신순 정렬
-                risk_stocks = risk_stocks.sort_values('공시일', ascending=False)
-                
-                # 가장 최근 지정만 확인
-                latest_row = risk_stocks.iloc[0]
-                start_date = self.safe_parse_date(latest_row['공시일'])
-                end_date = self.safe_parse_date(latest_row.get('해제일', None))
-                
-                # 공시일과 해제일 사이에 현재 날짜가 있는지 확인
-                if start_date and (not end_date or start_date <= today <= end_date):
-                    result['risk'].append({
-                        'start_date': start_date.strftime('%Y-%m-%d'),
-                        'end_date': end_date.strftime('%Y-%m-%d') if end_date else '현재'
-                    })
-                    result['any_alert'] = True
-        
-        return result
+        # 종목코드별 지정 구간에서 오늘 기준 가장 최근 지정만 확인 (이분 탐색)
+        return self.alert_index.status(stock_info['code'], today)
     
     def load_corp_code_mapping(self):
         """
@@ -239,9 +264,8 @@ class StockChecker:
         # corpCode.zip 다운로드
         try:
             print("DART corpCode.zip 다운로드 중...")
-            url = f"https://opendart.fss.or.kr/api/corpCode.xml?crtfc_key={self.dart_api_key}"
-            urlretrieve(url, self.corp_code_zip)
-            print("다운로드 완료")
+            size = self.dart_client.download('corpCode.xml', self.corp_code_zip)
+            print(f"다운로드 완료 ({size / 1024 / 1024:.1f}MB)")
             
             # ZIP 압축 해제
             print("압축 해제 중...")
@@ -250,7 +274,12 @@ class StockChecker:
             print("압축 해제 완료")
             
             # XML 파싱
-            return self.parse_corp_code_xml()
+            mapping = self.parse_corp_code_xml()
+            
+            # 새 corpCode로 종목명 매핑 파일도 갱신 (요청 처리를 막지 않도록 백그라운드)
+            if mapping:
+                stock_mappings.refresh_in_background(self.corp_index)
+            return mapping
             
         except Exception as e:
             print(f"corpCode 다운로드/파싱 실패: {e}")
@@ -258,7 +287,7 @@ class StockChecker:
     
     def parse_corp_code_xml(self):
         """
-        corpCode.xml 파싱하여 종목코드 -> 기업코드 매핑 생성
+        corpCode.xml을 한 번 파싱해 메모리 색인(self.corp_index) 생성
         
         Returns:
             dict: {종목코드: 기업코드} 매핑
@@ -269,27 +298,10 @@ class StockChecker:
         
         try:
             print("corpCode.xml 파싱 중...")
-            tree = ET.parse(self.corp_code_xml)
-            root = tree.getroot()
-            
-            mapping = {}
-            count = 0
-            
-            for company in root.findall('list'):
-                stock_code = company.find('stock_code')
-                corp_code = company.find('corp_code')
-                
-                if stock_code is not None and corp_code is not None:
-                    stock_code_text = stock_code.text
-                    corp_code_text = corp_code.text
-                    
-                    # 6자리 종목코드만 처리
-                    if stock_code_text and len(stock_code_text.strip()) == 6:
-                        mapping[stock_code_text.strip()] = corp_code_text.strip()
-                        count += 1
+            self.corp_index = CorpCodeIndex.from_xml(self.corp_code_xml)
             
-            print(f"corpCode 매핑 완료: {count}개 기업")
-            return mapping
+            print(f"corpCode 매핑 완료: {len(self.corp_index)}개 기업")
+            return self.corp_index.stock_to_corp
             
         except Exception as e:
             print(f"corpCode.xml 파싱 실패: {e}")
@@ -309,85 +321,42 @@ class StockChecker:
         stock_code = str(stock_code).zfill(6)
         return self.corp_code_mapping.get(stock_code)
     
-    def fetch_debt_ratio_from_dart(self, corp_code, bsns_year=2024):
+    def fetch_debt_ratio_from_dart(self, corp_code, bsns_year=None):
         """
         DART API에서 부채비율 조회
         
+        사전 수집 스냅샷(최근 보고서 기준) → 메모리 캐시 → DART 조회 순서로 확인합니다.
+        
         Args:
             corp_code: 8자리 기업코드
-            bsns_year: 사업연도
+            bsns_year: 사업연도 (없으면 기간이 끝난 최근 보고서들 중에서 조회)
             
         Returns:
             dict: 부채비율 정보
         """
-        print(f"🔍 DART API 부채비율 조회 시작 - 기업코드: {corp_code}, 연도: {bsns_year}")
-        
-        # 보고서 우선순위: 사업보고서 -> 3Q -> 2Q -> 1Q
-        report_codes = ["11011", "11014", "11012", "11013"]
-        
-        for reprt_code in report_codes:
-            try:
-                # DART API 호출
-                url = "https://opendart.fss.or.kr/api/fnlttSinglIndx.json"
-                params = {
-                    'crtfc_key': self.dart_api_key,
-                    'corp_code': corp_code,
-                    'bsns_year': str(bsns_year),
-                    'reprt_code': reprt_code,
-                    'idx_cl_code': 'M220000'  # 안정성지표(부채비율)
-                }
-                
-                print(f"🌐 DART API 호출 중 - 보고서코드: {reprt_code}")
-                print(f"📋 요청 파라미터: {params}")
-                
-                response = requests.get(url, params=params, timeout=10)
-                
-                print(f"📡 응답 상태코드: {response.status_code}")
-                
-                if response.status_code != 200:
-                    print(f"❌ HTTP 오류: {response.status_code}")
-                    continue
-                
-                data = response.json()
-                print(f"📄 응답 데이터: {json.dumps(data, ensure_ascii=False, indent=2)}")
-                
-                if data.get('status') != '000':
-                    print(f"❌ DART API 상태 오류: {data.get('status')} - {data.get('message', '')}")
-                    continue
-                
-                # 부채비율 찾기
-                for item in data.get('list', []):
-                    if '부채비율' in item.get('idx_nm', ''):
-                        debt_ratio = item.get('idx_val', '').replace(',', '')
-                        print(f"✅ 부채비율 발견: {debt_ratio}")
-                        try:
-                            debt_ratio_float = float(debt_ratio)
-                            result = {
-                                'status': 'success',
-                                'debt_ratio': debt_ratio_float,
-                                'report_type': reprt_code,
-                                'year': bsns_year,
-                                'is_high_risk': debt_ratio_float >= 200.0
-                            }
-                            print(f"🎉 부채비율 조회 성공: {result}")
-                            return result
-                        except ValueError:
-                            print(f"❌ 부채비율 파싱 실패: {debt_ratio}")
-                            continue
-                            
-            except Exception as e:
-                print(f"❌ DART API 호출 오류 ({reprt_code}): {e}")
-                continue
-        
-        print(f"❌ 모든 보고서에서 부채비율 데이터를 찾을 수 없음")
-        return {
-            'status': 'not_found',
-            'message': f'{bsns_year}년 부채비율 데이터를 찾을 수 없습니다.'
-        }
+        if bsns_year is None:
+            record = self.financial_snapshot.get(corp_code)
+            if record is not None and record.get('debt_ratio') is not None:
+                print(f"📦 재무 스냅샷 사용 - 기업코드: {corp_code}")
+                return debt_ratio_result(record['debt_ratio'], record['debt_report_type'],
+                                         int(record['debt_year']))
+        
+        memo_key = (corp_code, bsns_year)
+        cached = self.debt_ratio_memo.get(memo_key)
+        if cached is not None:
+            print(f"📦 부채비율 메모리 캐시 사용 - 기업코드: {corp_code}")
+            return cached
+        
+        result = fetch_debt_ratio(self.dart_client, corp_code, bsns_year)
+        if result['status'] == 'success':
+            self.debt_ratio_memo.put(memo_key, result)
+        return result
     
     def find_stock_code_by_name(self, stock_name):
         """
-        종목명으로 corpCode.xml에서 직접 종목코드 검색
+        종목명으로 corpCode 색인에서 종목코드 검색
+        
+        정확 → 정규화 → 약칭 → 부분 일치 순서로 찾으며, XML은 다시 읽지 않습니다.
         
         Args:
             stock_name: 검색할 종목명
@@ -395,84 +364,7 @@ class StockChecker:
         Returns:
             str: 종목코드 (6자리) 또는 None
         """
-        if not os.path.exists(self.corp_code_xml):
-            return None
-        
-        try:
-            tree = ET.parse(self.corp_code_xml)
-            root = tree.getroot()
-            
-            # 1단계: 정확한 매칭
-            for company in root.findall('list'):
-                corp_name_elem = company.find('corp_name')
-                stock_code_elem = company.find('stock_code')
-                
-                if corp_name_elem is not None and stock_code_elem is not None:
-                    corp_name = corp_name_elem.text
-                    stock_code = stock_code_elem.text
-                    
-                    # 정확히 일치하는 경우
-                    if corp_name == stock_name:
-                        return stock_code
-            
-            # 2단계: 정규화 후 매칭
-            normalized_input = self.normalize_stock_name(stock_name)
-            
-            for company in root.findall('list'):
-                corp_name_elem = company.find('corp_name')
-                stock_code_elem = company.find('stock_code')
-                
-                if corp_name_elem is not None and stock_code_elem is not None:
-                    corp_name = corp_name_elem.text
-                    stock_code = stock_code_elem.text
-                    
-                    # 정규화 후 일치하는 경우
-                    normalized_corp_name = self.normalize_stock_name(corp_name)
-                    if normalized_corp_name == normalized_input:
-                        return stock_code
-            
-            # 3단계: 주요 별칭 매칭
-            common_aliases = {
-                '삼성': '삼성전자',
-                'LG': 'LG전자',
-                '네이버': 'NAVER',
-                '현대차': '현대자동차',
-                '포스코': 'POSCO',
-                'SK': 'SK이노베이션',
-                'KT': 'KT',
-                '하나': '하나금융지주',
-                '우리': '우리금융지주',
-                'CJ': 'CJ제일제당',
-                '아모레': '아모레퍼시픽',
-                '셀트리온': '셀트리온',
-                'KB': 'KB금융',
-                'LG화학': 'LG에너지솔루션',
-                'LG솔루션' : 'LG에너지솔루션',
-                'LS 일레트릭' : 'LS ELECTRIC',
-                'LGU플러스' : 'LG유플러스'
-
-            }
-            
-            if stock_name in common_aliases:
-                return self.find_stock_code_by_name(common_aliases[stock_name])
-            
-            # 4단계: 부분 매칭 (포함 관계)
-            for company in root.findall('list'):
-                corp_name_elem = company.find('corp_name')
-                stock_code_elem = company.find('stock_code')
-                
-                if corp_name_elem is not None and stock_code_elem is not None:
-                    corp_name = corp_name_elem.text
-                    stock_code = stock_code_elem.text
-                    
-                    # 입력한 이름이 회사명에 포함되는 경우
-                    if stock_name in corp_name:
-                        return stock_code
-            
-            return None
-            
-        except Exception as e:
-            return None
+        return self.corp_index.find_stock_code(stock_name)
 
     def check_financial_status_dart(self, stock_name):
         """
@@ -537,8 +429,8 @@ class StockChecker:
         
         print(f"✅ 기업코드 발견: {corp_code}")
         
-        # DART API로 부채비율 조회
-        result = self.fetch_debt_ratio_from_dart(corp_code)
+        # DART API로 부채비율 조회 (위험 신호 평가에 쓸 수 있도록 확인된 코드도 함께 반환)
+        result = {**self.fetch_debt_ratio_from_dart(corp_code), 'stock_code': stock_code, 'corp_code': corp_code}
         
         print(f"🎯 최종 결과: {result}")
         return result
@@ -561,6 +453,7 @@ class StockChecker:
             'investment_alerts': {},
             'financial_status': {},
             'preliminary_status': {},
+            'risk_signals': {},
             'summary': []
         }
             
@@ -600,23 +493,19 @@ class StockChecker:
                 
             # 추가 DART outlier 체크 - 기존 투자알림이 없는 경우만
             if not investment_status['any_alert']:
-                corp_code = self.get_corp_code(stock_name)
+                # 재무 조회에서 확인한 기업코드 사용 (종목명으로는 기업코드를 찾을 수 없음)
+                corp_code = financial_status.get('corp_code')
                 if corp_code:
-                    # 지배구조 outlier 체크
-                    shareholder_outlier = self.outlier_checker.check_major_shareholder_outlier(corp_code)
-                    # 자본조달 outlier 체크
-                    capital_outlier = self.outlier_checker.check_capital_increase_outlier(corp_code)
+                    # 지배구조 / 자본조달 / 공시 기반 신호를 한 번에 평가 (DART 요청은 동시에)
+                    risk_signals = self.outlier_checker.evaluate_risk_signals(corp_code)
+                    result['risk_signals'] = risk_signals
                     
                     # outlier가 감지되면 투자주의로 변경
-                    if shareholder_outlier or capital_outlier:
+                    if risk_signals['has_any_risk']:
                         investment_status['any_alert'] = True
                         investment_status['caution'] = []
                         
-                        outlier_reasons = []
-                        if shareholder_outlier:
-                            outlier_reasons.append('지배구조위험')
-                        if capital_outlier:
-                            outlier_reasons.append('자본조달위험')
+                        outlier_reasons = risk_signals['reasons']
                         
                         investment_status['caution'].append({
                             'type': ', '.join(outlier_reasons),
@@ -654,6 +543,25 @@ class StockChecker:
         
         return result
     
+    def _get_preliminary_index(self):
+        """
+        예비심사 명단 색인 (첫 사용 시 로드, 원본 파일이 바뀌면 다시 생성)
+        
+        Returns:
+            dict: {정규화된 회사명: 행(Series)} 또는 None (데이터 없음)
+        """
+        preliminary_df = read_excel_cached(self.preliminary_file)
+        if preliminary_df.empty or '회사명' not in preliminary_df.columns:
+            return None
+        
+        if preliminary_df is not self._preliminary_source:
+            index = {}
+            for _, row in preliminary_df.iterrows():
+                index.setdefault(self.normalize_stock_name(str(row['회사명'])), row)
+            self._preliminary_index = index
+            self._preliminary_source = preliminary_df
+        return self._preliminary_index
+    
     def check_preliminary_listing(self, company_name):
             """
             예비심사 기업 여부 확인
@@ -665,41 +573,35 @@ class StockChecker:
                 dict: 예비심사 정보
             """
             try:
-                # 예비심사 파일 경로
-                preliminary_file = os.path.join(self.data_dir, "예비심사기업.xlsx")
-                
-                if not os.path.exists(preliminary_file):
+                if not os.path.exists(self.preliminary_file):
                     return {
                         'status': 'file_not_found',
                         'message': '예비심사 데이터 파일을 찾을 수 없습니다.'
                     }
                 
-                # Excel 파일 읽기
-                preliminary_df = pd.read_excel(preliminary_file)
+                # 캐시된 명단 색인 (엑셀은 원본이 바뀐 경우에만 다시 파싱)
+                preliminary_index = self._get_preliminary_index()
                 
-                if preliminary_df.empty or '회사명' not in preliminary_df.columns:
+                if preliminary_index is None:
                     return {
                         'status': 'no_data',
                         'message': '예비심사 데이터가 없습니다.'
                     }
                 
                 # 회사명 정규화해서 매칭
-                normalized_input = self.normalize_stock_name(company_name)
+                row = preliminary_index.get(self.normalize_stock_name(company_name))
                 
-                for _, row in preliminary_df.iterrows():
+                if row is not None:
                     company_in_file = str(row['회사명'])
-                    normalized_company = self.normalize_stock_name(company_in_file)
-                    
-                    if normalized_company == normalized_input:
-                        return {
-                            'status': 'found',
-                            'company_name': company_in_file,
-                            'listing_type': row.get('상장유형', ''),
-                            'request_date': str(row.get('신청일', '')),
-                            'result_date': str(row.get('결과확정일', '')),
-                            'result': str(row.get('심사결과', '')),
-                            'message': f'{company_in_file}는 예비심사 신청 기업입니다.'
-                        }
+                    return {
+                        'status': 'found',
+                        'company_name': company_in_file,
+                        'listing_type': row.get('상장유형', ''),
+                        'request_date': str(row.get('신청일', '')),
+                        'result_date': str(row.get('결과확정일', '')),
+                        'result': str(row.get('심사결과', '')),
+                        'message': f'{company_in_file}는 예비심사 신청 기업입니다.'
+                    }
                 
                 # 못 찾은 경우
                 return {
@@ -1,3860 +1,23 @@
-# stock_mappings.py - 자동 생성된 종목 매핑 파일
-# 생성 시간: 2025-08-01 18:19:25
-# 생성 방식: CORPCODE.xml 자동 추출
+# stock_mappings.py - 종목명 → 종목코드 매핑 (데이터 파일 기반, 첫 사용 시 로드)
 
 """
 종목명 -> 종목코드 매핑 데이터
-DART CORPCODE.xml에서 자동 추출된 상장 기업 정보
+DART CORPCODE.xml에서 추출한 상장 기업 목록을 stock_codes.tsv에서 읽습니다.
+
+- 기본 데이터: 저장소의 stock_codes.tsv
+- 최신 데이터: StockChecker가 corpCode.zip을 새로 받으면 CACHE_DIR/stock_codes.tsv로
+  다시 생성하고 메모리 매핑도 교체합니다 (코드 수정 없이 최신 상태 유지)
 """
 
-# 상장 기업 종목코드 매핑 (총 3845개)
-MAJOR_STOCK_CODES = {
-    '3S': '060310',
-    '3노드디지탈그룹유한공사': '900010',
-    'AJ네트웍스': '095570',
-    'AK홀딩스': '006840',
-    'APS': '054620',
-    'AP시스템': '265520',
-    'AP우주통신': '015670',
-    'AP위성': '211270',
-    'AP헬스케어': '109960',
-    'BF랩스': '139050',
-    'BGF': '027410',
-    'BGF리테일': '282330',
-    'BGF에코머티리얼즈': '126600',
-    'BHK': '003990',
-    'BNK금융지주': '138930',
-    'BYC': '001460',
-    'CG인바이츠': '083790',
-    'CJ': '001040',
-    'CJ CGV': '079160',
-    'CJ ENM': '035760',
-    'CJ 바이오사이언스': '311690',
-    'CJ대한통운': '000120',
-    'CJ씨푸드': '011150',
-    'CJ제일제당': '097950',
-    'CJ프레시웨이': '051500',
-    'CMG제약': '058820',
-    'CNT85': '056730',
-    'CS': '065770',
-    'CSA 코스믹': '083660',
-    'CS홀딩스': '000590',
-    'DB': '012030',
-    'DB손해보험': '005830',
-    'DB증권': '016610',
-    'DB하이텍': '000990',
-    'DGI': '099520',
-    'DGP': '060900',
-    'DH오토넥스': '000300',
-    'DH오토리드': '290120',
-    'DH오토웨어': '025440',
-    'DKME': '015590',
-    'DL': '000210',
-    'DL이앤씨': '375500',
-    'DMS': '068790',
-    'DN오토모티브': '007340',
-    'DRB동일': '004840',
-    'DSC인베스트먼트': '241520',
-    'DSR': '155660',
-    'DSR제강': '069730',
-    'DS단석': '017860',
-    'DXVX': '180400',
-    'DYP': '092780',
-    'E1': '017940',
-    'E8': '418620',
-    'EDGC': '245620',
-    'EG': '037370',
-    'EMB': '278990',
-    'ESR켄달스퀘어리츠': '365550',
-    'ES큐브': '050120',
-    'F&F': '383220',
-    'F&F 홀딩스': '007700',
-    'FSN': '214270',
-    'FnC코오롱': '001370',
-    'GB블루오션베트남주식혼합형투자회사1호': '094950',
-    'GH신소재': '130500',
-    'GKL': '114090',
-    'GRT': '900290',
-    'GS': '078930',
-    'GST': '083450',
-    'GS건설': '006360',
-    'GS글로벌': '001250',
-    'GS리테일': '007070',
-    'GS피앤엘': '499790',
-    'HB솔루션': '297890',
-    'HB인베스트먼트': '440290',
-    'HB테크놀러지': '078150',
-    'HC보광산업': '225530',
-    'HC홈센타': '060560',
-    'HDC': '012630',
-    'HDC랩스': '039570',
-    'HDC현대EP': '089470',
-    'HDC현대산업개발': '294870',
-    'HD한국조선해양': '009540',
-    'HD현대': '267250',
-    'HD현대건설기계': '267270',
-    'HD현대마린솔루션': '443060',
-    'HD현대마린엔진': '071970',
-    'HD현대미포': '010620',
-    'HD현대에너지솔루션': '322000',
-    'HD현대인프라코어': '042670',
-    'HD현대일렉트릭': '267260',
-    'HD현대중공업': '329180',
-    'HJ중공업': '097230',
-    'HK이노엔': '195940',
-    'HL D&I': '014790',
-    'HLB': '028300',
-    'HLB글로벌': '003580',
-    'HLB바이오스텝': '278650',
-    'HLB사이언스': '343090',
-    'HLB생명과학': '067630',
-    'HLB이노베이션': '024850',
-    'HLB제넥스': '187420',
-    'HLB제약': '047920',
-    'HLB테라퓨틱스': '115450',
-    'HLB파나진': '046210',
-    'HLB펩': '196300',
-    'HL만도': '204320',
-    'HL홀딩스': '060980',
-    'HMM': '011200',
-    'HPSP': '403870',
-    'HRS': '036640',
-    'HS애드': '035000',
-    'HS화성': '002460',
-    'HS효성': '487570',
-    'HS효성첨단소재': '298050',
-    'IBKS제21호스팩': '442770',
-    'IBKS제22호스팩': '448760',
-    'IBKS제23호스팩': '467930',
-    'IBKS제24호스팩': '469480',
-    'INVENI': '015360',
-    'ISC': '095340',
-    'JB금융지주': '175330',
-    'JTC': '950170',
-    'JW생명과학': '234080',
-    'JW신약': '067290',
-    'JW중외제약': '001060',
-    'JW홀딩스': '096760',
-    'JYP Ent.': '035900',
-    'KBG': '318000',
-    'KBI메탈': '024840',
-    'KB금융': '105560',
-    'KB발해인프라': '415640',
-    'KB손해보험': '002550',
-    'KB스타리츠': '432320',
-    'KB오토시스': '024120',
-    'KB제25호스팩': '455250',
-    'KB제27호스팩': '464680',
-    'KB제29호스팩': '478390',
-    'KB제30호스팩': '486630',
-    'KB제31호스팩': '492220',
-    'KCC건설': '021320',
-    'KC그린홀딩스': '009440',
-    'KC산업': '112190',
-    'KC코트렐': '119650',
-    'KD': '044180',
-    'KEC': '092220',
-    'KG모빌리언스': '046440',
-    'KG모빌리티': '003620',
-    'KG스틸': '016380',
-    'KG에코솔루션': '151860',
-    'KG이니시스': '035600',
-    'KG케미칼': '001390',
-    'KH 건설': '226360',
-    'KH 미래물산': '111870',
-    'KH 필룩스': '033180',
-    'KH바텍': '060720',
-    'KISCO홀딩스': '001940',
-    'KNN': '058400',
-    'KPX케미칼': '025000',
-    'KPX홀딩스': '092230',
-    'KR모터스': '000040',
-    'KSS해운': '044450',
-    'KS인더스트리': '101000',
-    'KTcs': '058850',
-    'KTis': '058860',
-    'KT나스미디어': '089600',
-    'KT밀리의서재': '418470',
-    'KT지니뮤직': '043610',
-    'KX': '122450',
-    'KX하이텍': '052900',
-    'KZ정밀': '036560',
-    'LB세미콘': '061970',
-    'LB인베스트먼트': '309960',
-    'LF': '093050',
-    'LG': '003550',
-    'LG디스플레이': '034220',
-    'LG마이크론': '016990',
-    'LG생명과학': '068870',
-    'LG생활건강': '051900',
-    'LG석유화학': '012990',
-    'LG씨엔에스': '064400',
-    'LG에너지솔루션': '373220',
-    'LG유플러스': '032640',
-    'LG이노텍': '011070',
-    'LG전자': '066570',
-    'LG파워콤': '045820',
-    'LG헬로비전': '037560',
-    'LG화학': '051910',
-    'LIG넥스원': '079550',
-    'LK삼양': '225190',
-    'LS': '006260',
-    'LS네트웍스': '000680',
-    'LS마린솔루션': '060370',
-    'LS머트리얼즈': '417200',
-    'LS에코에너지': '229640',
-    'LS증권': '078020',
-    'LS티라유텍': '322180',
-    'LX세미콘': '108320',
-    'LX인터내셔널': '001120',
-    'LX하우시스': '108670',
-    'LX홀딩스': '383800',
-    'M83': '476080',
-    'MDS테크': '086960',
-    'MH에탄올': '023150',
-    'NAVER': '035420',
-    'NEW': '160550',
-    'NE능률': '053290',
-    'NHN KCP': '060250',
-    'NHN벅스': '104200',
-    'NH농협증권': '016420',
-    'NH올원리츠': '400760',
-    'NH투자증권': '005940',
-    'NH프라임리츠': '338100',
-    'NICE': '034310',
-    'NICE인프라': '063570',
-    'NICE평가정보': '030190',
-    'NI스틸': '008260',
-    'NPX': '222160',
-    'OCI': '456040',
-    'OCI홀딩스': '010060',
-    'PI첨단소재': '178920',
-    'PKC': '001340',
-    'PN풍년': '024940',
-    'POSCO홀딩스': '005490',
-    'PS일렉트로닉스': '332570',
-    'RFHIC': '218410',
-    'RF머트리얼즈': '327260',
-    'RF시스템즈': '474610',
-    'S&K폴리텍': '091340',
-    'S-Oil': '010950',
-    'SAMG엔터': '419530',
-    'SBI인베스트먼트': '019550',
-    'SBI핀테크솔루션즈': '950110',
-    'SBS': '034120',
-    'SBS미디어홀딩스': '101060',
-    'SB성보': '003080',
-    'SCL사이언스': '246960',
-    'SDN': '099220',
-    'SFA반도체': '036540',
-    'SG': '255220',
-    'SG&G': '040610',
-    'SGA': '049470',
-    'SGA솔루션즈': '184230',
-    'SGC E&C': '016250',
-    'SGC에너지': '005090',
-    'SG글로벌': '001380',
-    'SG세계물산': '004060',
-    'SHD': '001770',
-    'SH에너지화학': '002360',
-    'SIMPAC': '009160',
-    'SJG세종': '033530',
-    'SK': '034730',
-    'SKAI': '357880',
-    'SKC': '011790',
-    'SK가스': '018670',
-    'SK네트웍스': '001740',
-    'SK디스커버리': '006120',
-    'SK디앤디': '210980',
-    'SK리츠': '395400',
-    'SK바이오사이언스': '302440',
-    'SK스퀘어': '402340',
-    'SK시그넷': '260870',
-    'SK아이이테크놀로지': '361610',
-    'SK오션플랜트': '100090',
-    'SK이노베이션': '096770',
-    'SK이터닉스': '475150',
-    'SK증권': '001510',
-    'SK증권제10호스팩': '457940',
-    'SK증권제11호스팩': '472230',
-    'SK증권제12호스팩': '473000',
-    'SK증권제13호스팩': '473950',
-    'SK증권제9호스팩': '455910',
-    'SK케미칼': '285130',
-    'SK텔레콤': '017670',
-    'SK하이닉스': '000660',
-    'SM C&C': '048550',
-    'SM Life Design': '063440',
-    'SNT다이내믹스': '003570',
-    'SNT모티브': '064960',
-    'SNT에너지': '100840',
-    'SNT홀딩스': '036530',
-    'SOOP': '067160',
-    'SPC삼립': '005610',
-    'STX': '011810',
-    'STX그린로지스': '465770',
-    'STX엔진': '077970',
-    'SUN&L': '002820',
-    'SV인베스트먼트': '289080',
-    'TCC스틸': '002710',
-    'THE CUBE&': '013720',
-    'THE E&M': '089230',
-    'TJ미디어': '032540',
-    'TP': '007980',
-    'TPC': '048770',
-    'TS인베스트먼트': '246690',
-    'TS트릴리온': '317240',
-    'TYM': '002900',
-    'WISCOM': '024070',
-    'YBM넷': '057030',
-    'YG PLUS': '037270',
-    'YTN': '040300',
-    'YW': '051390',
-    'iMBC': '052220',
-    'iM금융지주': '139130',
-    '가비아': '079940',
-    '가온그룹': '078890',
-    '가온전선': '000500',
-    '가온칩스': '399720',
-    '가이아코퍼레이션': '296520',
-    '감성코퍼레이션': '036620',
-    '강남제비스코': '000860',
-    '강동씨앤엘': '198440',
-    '강스템바이오텍': '217730',
-    '강원랜드': '035250',
-    '강원에너지': '114190',
-    '갤럭시아머니트리': '094480',
-    '갤럭시아에스엠': '011420',
-    '거북선1호선박투자회사': '092970',
-    '거북선2호선박투자회사': '101380',
-    '거북선3호선박투자회사': '102000',
-    '거북선4호선박투자회사': '108890',
-    '거북선5호선박투자회사': '114130',
-    '거북선6호선박투자회사': '114140',
-    '거북선7호선박투자회사': '134000',
-    '건영': '012720',
-    '경남기업': '000800',
-    '경남모직': '001670',
-    '경남스틸': '039240',
-    '경남에너지': '008020',
-    '경남은행': '192520',
-    '경남제약': '053950',
-    '경농': '002100',
-    '경동나비엔': '009450',
-    '경동도시가스': '267290',
-    '경동인베스트': '012320',
-    '경동제약': '011040',
-    '경방': '000050',
-    '경보제약': '214390',
-    '경윤하이드로에너지': '019120',
-    '경인양행': '012610',
-    '경인전자': '009140',
-    '경창산업': '024910',
-    '계룡건설산업': '013580',
-    '계양전기': '012200',
-    '고려개발': '004200',
-    '고려산업': '002140',
-    '고려시멘트': '003660',
-    '고려신용정보': '049720',
-    '고려아연': '010130',
-    '고려제강': '002240',
-    '고려제약': '014570',
-    '고바이오랩': '348150',
-    '고스트스튜디오': '950190',
-    '고영': '098460',
-    '고제': '002540',
-    '골드앤에스': '035290',
-    '골든브릿지더블유엠경매부동산일호투자회사': '084160',
-    '골든브릿지제2호기업인수목적': '206660',
-    '골든브릿지제3호기업인수목적': '219580',
-    '골프존': '215000',
-    '골프존클라우드': '183410',
-    '골프존홀딩스': '121440',
-    '공구우먼': '366030',
-    '광덕물산': '003590',
-    '광동제약': '009290',
-    '광동헬스바이오': '086220',
-    '광림': '014200',
-    '광명전기': '017040',
-    '광무': '029480',
-    '광전자': '017900',
-    '광주신세계': '037710',
-    '광주은행': '192530',
-    '광진실업': '026910',
-    '교보11호기업인수목적': '397880',
-    '교보12호기업인수목적': '421800',
-    '교보13호기업인수목적': '440790',
-    '교보14호스팩': '456490',
-    '교보15호스팩': '465320',
-    '교보16호스팩': '482520',
-    '교보17호스팩': '489210',
-    '교보5호기업인수목적': '223040',
-    '교보메리츠퍼스트기업구조조정부동산투자회사': '064900',
-    '교보증권': '030610',
-    '교촌에프앤비': '339770',
-    '구스앤홈': '329050',
-    '구영테크': '053270',
-    '국도화학': '007690',
-    '국민은행': '060000',
-    '국보': '001140',
-    '국보디자인': '066620',
-    '국순당': '043650',
-    '국영지앤엠': '006050',
-    '국일신동': '060480',
-    '국일제지': '078130',
-    '국전약품': '307750',
-    '국제개발': '080570',
-    '국제약품': '002720',
-    '국제엘렉트릭코리아': '053740',
-    '굿앤리치부동산공경매투자회사1호': '085450',
-    '굿앤리치부동산공경매투자회사2호': '088510',
-    '굿이엠지': '051530',
-    '그래디언트': '035080',
-    '그로웰전자': '009220',
-    '그로웰텔레콤': '035780',
-    '그리드위즈': '453450',
-    '그리티': '204020',
-    '그린기술투자': '025340',
-    '그린리소스': '402490',
-    '그린생명과학': '114450',
-    '그린손해보험': '000470',
-    '그린케미칼': '083420',
-    '그린플러스': '186230',
-    '극동유화': '014530',
-    '극동자동화': '272420',
-    '극동전선': '006250',
-    '극동제혁': '010200',
-    '글라소울': '045050',
-    '글로벌에스엠': '900070',
-    '글로벌텍스프리': '204620',
-    '글로본': '019660',
-    '글로스텍': '012410',
-    '글로앤웰': '035480',
-    '글로웍스': '034600',
-    '글로포스트': '037830',
-    '금강공업': '014280',
-    '금강제강': '105070',
-    '금강철강': '053260',
-    '금강화섬': '010730',
-    '금비': '008870',
-    '금빛': '045890',
-    '금양': '001570',
-    '금양그린파워': '282720',
-    '금오하이텍': '165270',
-    '금호건설': '002990',
-    '금호석유화학': '011780',
-    '금호에이치티': '214330',
-    '금호전기': '001210',
-    '금호타이어': '073240',
-    '금화피에스시': '036190',
-    '기가레인': '049080',
-    '기가비스': '420770',
-    '기라정보통신': '019930',
-    '기린': '006070',
-    '기산텔레콤': '035460',
-    '기신정기': '092440',
-    '기아': '000270',
-    '기업은행': '024110',
-    '길교이앤씨': '456700',
-    '까뮤이앤씨': '013700',
-    '깨끗한나라': '004540',
-    '꿈비': '407400',
-    '나노': '187790',
-    '나노신소재': '121600',
-    '나노실리칸첨단소재': '286750',
-    '나노씨엠에스': '247660',
-    '나노엔텍': '039860',
-    '나노캠텍': '091970',
-    '나노트로닉스': '010670',
-    '나노팀': '417010',
-    '나노하이텍': '071360',
-    '나눔테크': '244880',
-    '나라셀라': '405920',
-    '나라소프트': '288490',
-    '나라엠앤디': '051490',
-    '나래나노텍': '137080',
-    '나리지*온': '036850',
-    '나무가': '190510',
-    '나무기술': '242040',
-    '나우IB': '293580',
-    '나우로보틱스': '459510',
-    '나우코스': '257990',
-    '나이벡': '138610',
-    '나이스디앤비': '130580',
-    '나이스메탈': '072530',
-    '나이스정보통신': '036800',
-    '나이코': '192240',
-    '나인테크': '267320',
-    '남광토건': '001260',
-    '남산물산': '036280',
-    '남선알미늄': '008350',
-    '남성': '004270',
-    '남양': '003020',
-    '남양유업': '003920',
-    '남한제지': '001950',
-    '남해화학': '025860',
-    '남화산업': '111710',
-    '남화토건': '091590',
-    '내츄럴엔도텍': '168330',
-    '네스테크': '037540',
-    '네오리소스': '058550',
-    '네오리진': '094860',
-    '네오세미테크': '089240',
-    '네오셈': '253590',
-    '네오오토': '212560',
-    '네오위즈': '095660',
-    '네오위즈홀딩스': '042420',
-    '네오이뮨텍': '950220',
-    '네오크레마': '311390',
-    '네오티스': '085910',
-    '네오팜': '092730',
-    '네오퍼플': '028090',
-    '네오펙트': '290660',
-    '네온테크': '306620',
-    '네이블': '153460',
-    '네이처셀': '007390',
-    '네이쳐글로벌': '088020',
-    '네이트커뮤니케이션즈': '066270',
-    '네패스': '033640',
-    '네패스아크': '330860',
-    '네프로아이티': '950030',
-    '넥사다이내믹스': '351320',
-    '넥센': '005720',
-    '넥센타이어': '002350',
-    '넥솔론': '110570',
-    '넥스쳐': '194510',
-    '넥스콘테크놀러지': '038990',
-    '넥스턴바이오': '089140',
-    '넥스텔': '037220',
-    '넥스트바이오메디컬': '389650',
-    '넥스트아이': '137940',
-    '넥스트칩': '396270',
-    '넥스틴': '348210',
-    '넥스틸': '092790',
-    '넥스피안': '079560',
-    '넥슨게임즈': '225570',
-    '넥슨지티': '041140',
-    '넥써쓰': '205500',
-    '넵튠': '217270',
-    '넷마블': '251270',
-    '넷컴스토리지': '037010',
-    '노드메이슨': '317860',
-    '노랑풍선': '104620',
-    '노루페인트': '090350',
-    '노루홀딩스': '000320',
-    '노머스': '473980',
-    '노바렉스': '194700',
-    '노바텍': '285490',
-    '노보믹스': '283100',
-    '노브랜드': '145170',
-    '노브메타파마': '229500',
-    '노블엠앤비': '106520',
-    '노을': '376930',
-    '녹십자': '006280',
-    '녹십자셀': '031390',
-    '녹십자엠에스': '142280',
-    '녹십자웰빙': '234690',
-    '녹십자홀딩스': '005250',
-    '녹원씨엔아이': '065560',
-    '농심': '004370',
-    '농심홀딩스': '072710',
-    '농우바이오': '054050',
-    '누리플랜': '069140',
-    '누리플렉스': '040160',
-    '누보': '332290',
-    '뉴로메카': '348340',
-    '뉴로핏': '380550',
-    '뉴보텍': '060260',
-    '뉴아세아': '013340',
-    '뉴엔AI': '463020',
-    '뉴온': '123840',
-    '뉴인텍': '012340',
-    '뉴젠비아이티': '054650',
-    '뉴젠아이씨티': '054150',
-    '뉴키즈온': '462310',
-    '뉴트리': '270870',
-    '뉴파워프라즈마': '144960',
-    '뉴프렉스': '085670',
-    '닉스테크': '063840',
-    '다날': '064260',
-    '다린': '204690',
-    '다보링크': '340360',
-    '다산네트웍스': '039560',
-    '다산솔루에타': '154040',
-    '다산자기관리부동산투자회사': '105380',
-    '다스코': '058730',
-    '다올투자증권': '030210',
-    '다우기술': '023590',
-    '다우데이타': '032190',
-    '다원넥스뷰': '323350',
-    '다원시스': '068240',
-    '다이나믹디자인': '145210',
-    '다이노나': '086080',
-    '다이오진': '271850',
-    '다함이텍': '009280',
-    '다휘': '055250',
-    '달바글로벌': '483650',
-    '닷밀': '464580',
-    '대교': '019680',
-    '대구백화점': '006370',
-    '대국': '042340',
-    '대덕': '008060',
-    '대덕GDS': '004130',
-    '대덕전자': '353200',
-    '대동': '000490',
-    '대동고려삼': '178600',
-    '대동금속': '020400',
-    '대동기어': '008830',
-    '대동스틸': '048470',
-    '대동전자': '008110',
-    '대륙제관': '004780',
-    '대림바스': '005750',
-    '대림제지': '017650',
-    '대림통상': '006570',
-    '대명에너지': '389260',
-    '대모': '317850',
-    '대백쇼핑': '027700',
-    '대백저축은행': '026970',
-    '대보마그네틱': '290670',
-    '대봉엘에스': '078140',
-    '대산F&B': '065150',
-    '대상': '001680',
-    '대상홀딩스': '084690',
-    '대선조선': '031990',
-    '대성미생물': '036480',
-    '대성산업': '128820',
-    '대성에너지': '117580',
-    '대성창투': '027830',
-    '대성파인텍': '104040',
-    '대성하이텍': '129920',
-    '대성합동지주': '005620',
-    '대성홀딩스': '016710',
-    '대신밸런스제10호기업인수목적': '387310',
-    '대신밸런스제11호기업인수목적': '397500',
-    '대신밸런스제12호기업인수목적': '426670',
-    '대신밸런스제13호기업인수목적': '438220',
-    '대신밸런스제14호기업인수목적': '442310',
-    '대신밸런스제15호기업인수목적': '457390',
-    '대신밸런스제16호스팩': '457630',
-    '대신밸런스제17호스팩': '471050',
-    '대신밸런스제18호스팩': '478780',
-    '대신밸런스제19호스팩': '482690',
-    '대신밸런스제4호기업인수목적': '262830',
-    '대신정보통신': '020180',
-    '대신증권': '003540',
-    '대신증권그로쓰알파기업인수목적': '123550',
-    '대아건설': '000380',
-    '대아리드선': '009940',
-    '대아티아이': '045390',
-    '대양글로벌': '040180',
-    '대양금속': '009190',
-    '대양전기공업': '108380',
-    '대양제지공업': '006580',
-    '대영포장': '014160',
-    '대우건설': '047040',
-    '대우기업인수목적2호': '204440',
-    '대우기업인수목적3호': '215580',
-    '대우송도개발': '004550',
-    '대우증권그린코리아기업인수목적회사': '121910',
-    '대웅': '003090',
-    '대웅바이오': '016890',
-    '대웅제약': '069620',
-    '대원': '007680',
-    '대원강업': '000430',
-    '대원모방': '311840',
-    '대원미디어': '048910',
-    '대원산업': '005710',
-    '대원전선': '006340',
-    '대원제약': '003220',
-    '대원화성': '024890',
-    '대유': '290380',
-    '대유에이텍': '002880',
-    '대정화금': '120240',
-    '대주산업': '003310',
-    '대주이엔티': '114920',
-    '대주전자재료': '078600',
-    '대주코레스': '008340',
-    '대진첨단소재': '393970',
-    '대창': '012800',
-    '대창단조': '015230',
-    '대창솔루션': '096350',
-    '대창스틸': '140520',
-    '대한과학': '131220',
-    '대한광통신': '010170',
-    '대한뉴팜': '054670',
-    '대한방직': '001070',
-    '대한약품': '023910',
-    '대한유화': '006650',
-    '대한은박지': '007480',
-    '대한전선': '001440',
-    '대한제강': '084010',
-    '대한제당': '001790',
-    '대한제분': '001130',
-    '대한항공': '003490',
-    '대한해운': '005880',
-    '대한화섬': '003830',
-    '대현': '016090',
-    '대호': '001980',
-    '대호에이엘': '069460',
-    '대호특수강': '021040',
-    '대화제약': '067080',
-    '대흥멀티미디어통신': '037250',
-    '더네이쳐홀딩스': '298540',
-    '더라미': '032860',
-    '더미동': '161570',
-    '더바이오메드': '214610',
-    '더본코리아': '475560',
-    '더블유게임즈': '192080',
-    '더블유씨피': '393890',
-    '더블유에스아이': '299170',
-    '더스텔라': '065310',
-    '더존디지털웨어': '045380',
-    '더존비즈온': '012510',
-    '더즌': '462860',
-    '더체인지': '054120',
-    '더코디': '224060',
-    '더콘텐츠온': '302920',
-    '더테크놀로지': '043090',
-    '덕산네오룩스': '213420',
-    '덕산테코피아': '317330',
-    '덕산하이메탈': '077360',
-    '덕성': '004830',
-    '덕신이피씨': '090410',
-    '덕우전자': '263600',
-    '데브시스터즈': '194480',
-    '데이드림엔터테인먼트': '348840',
-    '데이원컴퍼니': '373160',
-    '데이타솔루션': '263800',
-    '데이터스트림즈': '199150',
-    '데코': '013650',
-    '데코앤에프': '017680',
-    '덱스터': '206560',
-    '덴소코리아': '047060',
-    '덴티스': '261200',
-    '덴티움': '145720',
-    '도레이케미칼': '008000',
-    '도부': '227420',
-    '도우인시스': '484120',
-    '도움': '078610',
-    '도이치모터스': '067990',
-    '도화엔지니어링': '002150',
-    '동구바이오제약': '006620',
-    '동국S&C': '100130',
-    '동국산업': '005160',
-    '동국생명과학': '303810',
-    '동국씨엠': '460850',
-    '동국알앤에스': '075970',
-    '동국제강': '460860',
-    '동국제약': '086450',
-    '동국홀딩스': '001230',
-    '동남합성': '023450',
-    '동방': '004140',
-    '동방라이텍': '025690',
-    '동방메디컬': '240550',
-    '동방선기': '099410',
-    '동방아그로': '007590',
-    '동부건설': '005960',
-    '동부씨엔아이': '044640',
-    '동부일렉트로닉스': '001830',
-    '동부제4호기업인수목적': '230490',
-    '동부티에스블랙펄기업인수목적': '128910',
-    '동북아10호선박투자회사': '083350',
-    '동북아11호선박투자회사': '083360',
-    '동북아12호선박투자회사': '083370',
-    '동북아13호선박투자회사': '083380',
-    '동북아14호선박투자회사': '083390',
-    '동북아15호선박투자회사': '084240',
-    '동북아1호선박투자회사': '078420',
-    '동북아21호선박투자회사': '088010',
-    '동북아27호선박투자회사': '089170',
-    '동북아28호선박투자회사': '089180',
-    '동북아29호선박투자회사': '089190',
-    '동북아2호선박투자회사': '080030',
-    '동북아30호선박투자회사': '089200',
-    '동북아31호선박투자회사': '093730',
-    '동북아3호선박투자회사': '080960',
-    '동북아4호선박투자회사': '080970',
-    '동북아5호선박투자회사': '080980',
-    '동북아6호선박투자회사': '080410',
-    '동북아8호선박투자회사': '082110',
-    '동북아9호선박투자회사': '083120',
-    '동산진흥': '031960',
-    '동서': '026960',
-    '동서정보기술': '055000',
-    '동성제약': '002210',
-    '동성케미컬': '102260',
-    '동성하이켐': '013450',
-    '동성화인텍': '033500',
-    '동성화학': '005190',
-    '동신건설': '025950',
-    '동신제약': '006600',
-    '동아쏘시오홀딩스': '000640',
-    '동아에스티': '170900',
-    '동아엘텍': '088130',
-    '동아지질': '028100',
-    '동아타이어공업': '282690',
-    '동아화성': '041930',
-    '동양': '001520',
-    '동양건설산업': '005900',
-    '동양고속': '084670',
-    '동양매직': '023020',
-    '동양밸류오션기업인수목적': '122290',
-    '동양생명': '082640',
-    '동양에스텍': '060380',
-    '동양이엔피': '079960',
-    '동양철관': '008970',
-    '동양텔레콤': '007150',
-    '동양파일': '228340',
-    '동우팜투테이블': '088910',
-    '동운아나텍': '094170',
-    '동원F&B': '049770',
-    '동원개발': '013120',
-    '동원금속': '018500',
-    '동원데어리푸드': '003900',
-    '동원산업': '006040',
-    '동원수산': '030720',
-    '동원시스템즈': '014820',
-    '동원증권': '005890',
-    '동인기연': '111380',
-    '동일고무벨트': '163560',
-    '동일금속': '109860',
-    '동일기연': '032960',
-    '동일산업': '004890',
-    '동일스틸럭스': '023790',
-    '동일제강': '002690',
-    '동진쎄미켐': '005290',
-    '동화기업': '025900',
-    '동화약품': '000020',
-    '두림티앤씨': '033330',
-    '두산': '000150',
-    '두산건설': '011160',
-    '두산로보틱스': '454910',
-    '두산밥캣': '241560',
-    '두산에너빌리티': '034020',
-    '두산테스나': '131970',
-    '두산퓨얼셀': '336260',
-    '두올': '016740',
-    '두함지개발': '016140',
-    '듀오백': '073190',
-    '듀켐바이오': '176750',
-    '드래곤플라이': '030350',
-    '드림라인': '035430',
-    '드림시큐리티': '203650',
-    '드림씨아이에스': '223250',
-    '드림어스컴퍼니': '060570',
-    '드림인사이트': '362990',
-    '드림텍': '192650',
-    '드림티엔터테인먼트': '220110',
-    '디모아': '016670',
-    '디바이스': '187870',
-    '디보스': '080140',
-    '디비금융스팩12호': '477760',
-    '디비금융제10호기업인수목적': '404950',
-    '디비금융제11호기업인수목적': '456440',
-    '디비금융제13호스팩': '489730',
-    '디비금융제8호기업인수목적': '367340',
-    '디비금융제9호기업인수목적': '367360',
-    '디비엘': '041500',
-    '디씨엠': '024090',
-    '디아이': '003160',
-    '디아이동일': '001530',
-    '디아이디': '074130',
-    '디아이씨': '092200',
-    '디아이티': '110990',
-    '디알젬': '263690',
-    '디알텍': '214680',
-    '디앤디파마텍': '347850',
-    '디앤디플랫폼리츠': '377190',
-    '디앤샵': '090090',
-    '디앤씨미디어': '263720',
-    '디어유': '376300',
-    '디에스': '051710',
-    '디에스앤엘': '141020',
-    '디에스케이': '109740',
-    '디에스티': '033430',
-    '디에스피이엔티': '016040',
-    '디에이치엑스컴퍼니': '031860',
-    '디에이치패션': '045260',
-    '디에이테크놀로지': '196490',
-    '디에이피': '066900',
-    '디엔에프': '092070',
-    '디엘건설': '001880',
-    '디오': '039840',
-    '디와이': '013570',
-    '디와이덕양': '024900',
-    '디와이디': '219550',
-    '디와이씨': '310870',
-    '디와이엘엔제이': '207230',
-    '디와이파워': '210540',
-    '디와이피엔에프': '104460',
-    '디와이홀딩스': '004510',
-    '디이시스': '053200',
-    '디이엔티': '079810',
-    '디젠스': '113810',
-    '디지아이': '043360',
-    '디지캡': '197140',
-    '디지털대성': '068930',
-    '디지텍시스템스': '091690',
-    '디지틀조선': '033130',
-    '디케이락': '105740',
-    '디케이씨': '047440',
-    '디케이앤디': '263020',
-    '디케이티': '290550',
-    '디티씨': '066670',
-    '디티앤씨': '187220',
-    '디티앤씨알오': '383930',
-    '디패션': '030420',
-    '디피앤케이': '189700',
-    '디피코': '163430',
-    '딜리': '131180',
-    '딥노이드': '315640',
-    '딥마인드': '223310',
-    '라닉스': '317120',
-    '라메디텍': '462510',
-    '라온시큐어': '042510',
-    '라온테크': '232680',
-    '라온텍': '418420',
-    '라온피플': '300120',
-    '라이온켐텍': '171120',
-    '라이콤': '388790',
-    '라이프사이언스테크놀로지': '285770',
-    '라임': '065160',
-    '라파스': '214260',
-    '라피치': '403360',
-    '락앤락': '115390',
-    '램테크놀러지': '171010',
-    '랩지노믹스': '084650',
-    '러셀': '217500',
-    '럭스피아': '092590',
-    '럭슬': '033600',
-    '레드로버': '060300',
-    '레드캡투어': '038390',
-    '레몬': '294140',
-    '레뷰코퍼레이션': '443250',
-    '레이': '228670',
-    '레이더스컴퍼니': '047420',
-    '레이언스': '228850',
-    '레이저쎌': '412350',
-    '레이저옵텍': '199550',
-    '레이크머티리얼즈': '281740',
-    '레인보우로보틱스': '277810',
-    '렉스엘이앤지': '004790',
-    '로보로보': '215100',
-    '로보스타': '090360',
-    '로보쓰리에이아이': '238500',
-    '로보티즈': '108490',
-    '로스웰': '900260',
-    '로아앤코': '214310',
-    '로지스몬': '223220',
-    '로지시스': '067730',
-    '로체시스템즈': '071280',
-    '로케트전기': '000420',
-    '로킷헬스케어': '376900',
-    '롯데관광개발': '032350',
-    '롯데렌탈': '089860',
-    '롯데리츠': '330590',
-    '롯데미도파': '004010',
-    '롯데손해보험': '000400',
-    '롯데쇼핑': '023530',
-    '롯데에너지머티리얼즈': '020150',
-    '롯데웰푸드': '280360',
-    '롯데이노베이트': '286940',
-    '롯데정밀화학': '004000',
-    '롯데지주': '004990',
-    '롯데칠성음료': '005300',
-    '롯데케미칼': '011170',
-    '롯데푸드': '002270',
-    '롯데하이마트': '071840',
-    '루닛': '328130',
-    '루멘스': '038060',
-    '루미르': '474170',
-    '루켄테크놀러지스': '162120',
-    '루트락': '253610',
-    '루트로닉': '085370',
-    '룩소네이트': '033880',
-    '리가켐바이오': '141080',
-    '리노공업': '058470',
-    '리더스코스메틱': '016100',
-    '리더컴': '056140',
-    '리드': '197210',
-    '리드코프': '012700',
-    '리메드': '302550',
-    '리얼티코리아제1호기업구조조정부동산투자': '072450',
-    '리튬포어스': '073570',
-    '리파인': '377450',
-    '린드먼아시아': '277070',
-    '링네트': '042500',
-    '링세오코리아': '003050',
-    '링크드': '193250',
-    '링크솔루션': '474650',
-    '링크제니시스': '219420',
-    '마녀공장': '439090',
-    '마니커': '027740',
-    '마니커에프앤지': '195500',
-    '마스턴프리미어리츠': '357430',
-    '마음AI': '377480',
-    '마이스코': '088700',
-    '마이크로닉스': '001190',
-    '마이크로디지탈': '305090',
-    '마이크로엔엑스': '448780',
-    '마이크로컨텍솔': '098120',
-    '마이크로투나노': '424980',
-    '마크로젠': '038290',
-    '만호제강': '001080',
-    '맘스터치앤컴퍼니': '220630',
-    '매일유업': '267980',
-    '매일홀딩스': '005990',
-    '매직마이크로': '127160',
-    '매커스': '093520',
-    '맥스로텍': '141070',
-    '맥스브로': '088810',
-    '맥슨텔레콤': '009890',
-    '맥시스템': '036880',
-    '맥쿼리센트럴오피스기업구조조정부동산투자회사': '076850',
-    '맥쿼리인프라': '088980',
-    '맵스리얼티1': '094800',
-    '머니무브': '179720',
-    '머큐리': '100590',
-    '멀티캠퍼스': '067280',
-    '메가스터디': '072870',
-    '메가스터디교육': '215200',
-    '메가엠디': '133750',
-    '메가터치': '446540',
-    '메드팩토': '235980',
-    '메디쎄이': '200580',
-    '메디아나': '041920',
-    '메디안디노스틱': '233250',
-    '메디앙스': '014100',
-    '메디젠휴먼케어': '236340',
-    '메디콕스': '054180',
-    '메디톡스': '086900',
-    '메디포스트': '078160',
-    '메리츠금융지주': '138040',
-    '메리츠종합금융': '012420',
-    '메리츠증권': '008560',
-    '메리츠화재해상보험': '000060',
-    '메쎄이상': '408920',
-    '메이슨캐피탈': '021880',
-    '메지온': '140410',
-    '메카로': '241770',
-    '메카포럼': '035830',
-    '메타랩스': '090370',
-    '메타바이오메드': '059210',
-    '메타케어': '118000',
-    '멕아이씨에스': '058110',
-    '멜파스': '096640',
-    '명문제약': '017180',
-    '명신산업': '009900',
-    '명진홀딩스': '267060',
-    '모나리자': '012690',
-    '모나미': '005360',
-    '모나용평': '070960',
-    '모니터랩': '434480',
-    '모다': '149940',
-    '모다이노칩': '080420',
-    '모닷텔': '048150',
-    '모델라인': '064720',
-    '모델솔루션': '417970',
-    '모두투어': '080160',
-    '모디아': '046000',
-    '모린스': '110310',
-    '모바일어플라이언스': '087260',
-    '모베이스': '101330',
-    '모베이스전자': '012860',
-    '모보': '051810',
-    '모비데이즈': '363260',
-    '모비릭스': '348030',
-    '모비스': '250060',
-    '모빌링크텔레콤': '041310',
-    '모빌탑': '085680',
-    '모아데이타': '288980',
-    '모아라이프플러스': '142760',
-    '모아에스앤에스': '052880',
-    '모아텍': '033200',
-    '모코엠시스': '333050',
-    '모토닉': '009680',
-    '모트렉스': '118990',
-    '모티브링크': '463480',
-    '모헨즈': '006920',
-    '무궁화인포메이션테크놀로지': '038340',
-    '무림P&P': '009580',
-    '무림SP': '001810',
-    '무림페이퍼': '009200',
-    '무송지오씨': '135160',
-    '무진메디': '322970',
-    '무학': '033920',
-    '무한투자': '034510',
-    '문배철강': '008420',
-    '미디어젠': '279600',
-    '미디어코프': '053890',
-    '미래SCI': '028040',
-    '미래나노텍': '095500',
-    '미래반도체': '254490',
-    '미래산업': '025560',
-    '미래생명자원': '218150',
-    '미래아이앤지': '007120',
-    '미래에셋굿라이프혼합형자녀를위한투자회사10-1': '037510',
-    '미래에셋굿라이프혼합형자녀를위한펀드5-1': '037500',
-    '미래에셋글로벌리츠': '396690',
-    '미래에셋대우기업인수목적1호': '265480',
-    '미래에셋대우기업인수목적5호': '353490',
-    '미래에셋드림스팩1호': '442900',
-    '미래에셋맵스리츠': '357250',
-    '미래에셋맵스오퍼튜니티베트남주식혼합형투자회사1호': '094520',
-    '미래에셋벤처투자': '100790',
-    '미래에셋비전기업인수목적1호': '412930',
-    '미래에셋비전스팩2호': '446190',
-    '미래에셋비전스팩3호': '448830',
-    '미래에셋비전스팩4호': '477380',
-    '미래에셋비전스팩5호': '477470',
-    '미래에셋비전스팩6호': '478440',
-    '미래에셋비전스팩7호': '482680',
-    '미래에셋새천년코리아벤처펀드일호': '042950',
-    '미래에셋생명': '085620',
-    '미래에셋제1호기업인수목적': '121950',
-    '미래에셋제3호기업인수목적': '215750',
-    '미래에셋증권': '006800',
-    '미래엔에듀파트너': '208890',
-    '미래오토스': '176440',
-    '미래자원엠엘': '233190',
-    '미래컴퍼니': '049950',
-    '미래테크놀로지': '213090',
-    '미리넷': '056710',
-    '미성포리테크': '094700',
-    '미스터블루': '207760',
-    '미스토홀딩스': '081660',
-    '미애부': '225850',
-    '미원상사': '002840',
-    '미원에스씨': '268280',
-    '미원홀딩스': '107590',
-    '미원화학': '134380',
-    '미주제강': '002670',
-    '미쥬': '351020',
-    '미창석유공업': '003650',
-    '미코': '059090',
-    '미투온': '201490',
-    '미트박스': '475460',
-    '민테크': '452200',
-    '바다로19호선박투자회사': '155900',
-    '바다로3호선박투자회사': '092630',
-    '바디텍메드': '206640',
-    '바른손': '018700',
-    '바른손이앤에이': '035620',
-    '바스칸바이오제약': '354390',
-    '바이나믹': '067850',
-    '바이넥스': '053030',
-    '바이브컴퍼니': '301300',
-    '바이오노트': '377740',
-    '바이오니아': '064550',
-    '바이오다인': '314930',
-    '바이오비쥬': '489460',
-    '바이오빌': '065940',
-    '바이오솔루션': '086820',
-    '바이오스마트': '038460',
-    '바이오시네틱스': '281310',
-    '바이오시스': '035960',
-    '바이오에프디엔씨': '251120',
-    '바이오인프라': '199730',
-    '바이오인프라생명과학': '266470',
-    '바이오텐': '289170',
-    '바이오톡스텍': '086040',
-    '바이오포트': '188040',
-    '바이오프로테크': '199290',
-    '바이오플러스': '099430',
-    '바이온': '032980',
-    '바이젠셀': '308080',
-    '바텍': '043150',
-    '박셀바이오': '323990',
-    '방림': '003610',
-    '배럴': '267790',
-    '배명금속': '011800',
-    '배터리솔루션즈': '199870',
-    '백금T&A': '046310',
-    '백산': '035150',
-    '밸로프': '331520',
-    '뱅크웨어글로벌': '199480',
-    '버넥트': '438700',
-    '버킷스튜디오': '066410',
-    '범양건영': '002410',
-    '범양사': '002480',
-    '범한퓨얼셀': '382900',
-    '베네데스하이텍': '009360',
-    '베노티앤알': '206400',
-    '베뉴지': '019010',
-    '베른': '322190',
-    '베셀': '177350',
-    '베스트플로우': '060410',
-    '벡트': '457600',
-    '벨로크': '424760',
-    '벽산': '007210',
-    '벽산건설': '002530',
-    '보광티에스': '066690',
-    '보라티알': '250000',
-    '보락': '002760',
-    '보령': '003850',
-    '보로노이': '310210',
-    '보루네오가구': '004740',
-    '보성파워텍': '006910',
-    '보진재': '030950',
-    '보해양조': '000890',
-    '보홍': '041320',
-    '본느': '226340',
-    '볼빅': '206950',
-    '부광약품': '003000',
-    '부국증권': '001270',
-    '부국철강': '026940',
-    '부국퓨쳐스타즈기업인수목적': '123300',
-    '부방': '014470',
-    '부산도시가스': '015350',
-    '부산방직공업': '025270',
-    '부산산업': '011390',
-    '부산은행': '005280',
-    '부산저축은행': '007830',
-    '부산주공': '005030',
-    '부스타': '008470',
-    '부흥': '003930',
-    '뷰노': '338220',
-    '뷰웍스': '100120',
-    '뷰티스킨': '406820',
-    '브레인즈컴퍼니': '099390',
-    '브리지텍': '064480',
-    '브릿지바이오': '288330',
-    '브이씨': '365900',
-    '브이엠': '089970',
-    '브이오산업': '018890',
-    '브이원텍': '251630',
-    '브이케이': '048760',
-    '브이티': '018290',
-    '블랙야크아이앤씨': '478560',
-    '블루스톤디앤아이': '033720',
-    '블루엠텍': '439580',
-    '블루젬디앤씨': '053040',
-    '블루콤': '033560',
-    '블루탑': '191600',
-    '블리츠웨이엔터테인먼트': '369370',
-    '비나텍': '126340',
-    '비덴트': '121800',
-    '비디아이': '148140',
-    '비보존 제약': '082800',
-    '비비씨': '318410',
-    '비비안': '002070',
-    '비상교육': '100220',
-    '비스토스': '419540',
-    '비씨엔씨': '146320',
-    '비씨월드제약': '200780',
-    '비아이매트릭스': '413640',
-    '비아트론': '141000',
-    '비앤에스미디어': '156170',
-    '비에이치': '090460',
-    '비에이치아이': '083650',
-    '비엔디': '047940',
-    '비엔디생활건강': '215050',
-    '비엔씨컴퍼니': '058370',
-    '비엔에프머티리얼즈': '271780',
-    '비엔케이제1호기업인수목적': '445360',
-    '비엔케이제2호스팩': '473370',
-    '비엘사이언스': '228180',
-    '비엘팜텍': '065170',
-    '비엠티': '086670',
-    '비올': '335890',
-    '비유테크놀러지': '230980',
-    '비이티': '036820',
-    '비즈니스온커뮤니케이션': '138580',
-    '비지스틸': '179440',
-    '비츠로셀': '082920',
-    '비츠로시스': '054220',
-    '비츠로테크': '042370',
-    '비케이탑스': '030790',
-    '비케이홀딩스': '050090',
-    '비큐AI': '148780',
-    '비투엔': '307870',
-    '비트맥스': '377030',
-    '비트컴퓨터': '032850',
-    '비피도': '238200',
-    '빅솔론': '093190',
-    '빅텍': '065450',
-    '빌리언스': '044480',
-    '빙그레': '005180',
-    '빛과전자': '069540',
-    '빛샘전자': '072950',
-    '뿌리깊은나무들': '266170',
-    '삐아': '451250',
-    '사라콤': '040020',
-    '사람인': '143240',
-    '사이냅소프트': '466410',
-    '사이노젠': '064060',
-    '사이버패스': '063280',
-    '사조대림': '003960',
-    '사조동아원': '008040',
-    '사조산업': '007160',
-    '사조씨푸드': '014710',
-    '사조오양': '006090',
-    '사조해표': '079660',
-    '사피엔반도체': '452430',
-    '산돌': '419120',
-    '산양전기': '079870',
-    '산은캐피탈': '008270',
-    '산일전기': '062040',
-    '삼기': '122350',
-    '삼기에너지솔루션즈': '419050',
-    '삼도물산': '002930',
-    '삼륭물산': '014970',
-    '삼목강업': '158380',
-    '삼목에스폼': '018310',
-    '삼미금속': '012210',
-    '삼보모터스': '053700',
-    '삼보산업': '009620',
-    '삼보오토': '070080',
-    '삼보판지': '023600',
-    '삼부토건': '001470',
-    '삼성E&A': '028050',
-    '삼성FN리츠': '448730',
-    '삼성SDI': '006400',
-    '삼성공조': '006660',
-    '삼성기업인수목적4호': '377630',
-    '삼성기업인수목적6호': '425290',
-    '삼성기업인수목적7호': '439250',
-    '삼성기업인수목적9호': '468510',
-    '삼성디지털이미징': '108070',
-    '삼성머스트기업인수목적5호': '380320',
-    '삼성물산': '028260',
-    '삼성바이오로직스': '207940',
-    '삼성생명': '032830',
-    '삼성수산': '052560',
-    '삼성스팩8호': '448740',
-    '삼성에스디에스': '018260',
-    '삼성전기': '009150',
-    '삼성전자': '005930',
-    '삼성제약': '001360',
-    '삼성중공업': '010140',
-    '삼성증권': '016360',
-    '삼성출판사': '068290',
-    '삼성카드': '029780',
-    '삼성화재해상보험': '000810',
-    '삼아알미늄': '006110',
-    '삼아제약': '009300',
-    '삼양사': '145990',
-    '삼양식품': '003230',
-    '삼양엔씨켐': '482630',
-    '삼양엔텍': '008720',
-    '삼양제넥스': '003940',
-    '삼양케이씨아이': '036670',
-    '삼양통상': '002170',
-    '삼양패키징': '272550',
-    '삼양홀딩스': '000070',
-    '삼영': '003720',
-    '삼영무역': '002810',
-    '삼영에스앤씨': '361670',
-    '삼영엠텍': '054540',
-    '삼영이엔씨': '065570',
-    '삼영전자공업': '005680',
-    '삼우이엠씨': '026250',
-    '삼원강재': '023000',
-    '삼익THK': '004380',
-    '삼익악기': '002450',
-    '삼일': '032280',
-    '삼일기업공사': '002290',
-    '삼일씨엔에스': '004440',
-    '삼일제약': '000520',
-    '삼정펄프': '009770',
-    '삼지전자': '037460',
-    '삼진': '032750',
-    '삼진엘앤디': '054090',
-    '삼진제약': '005500',
-    '삼천당제약': '000250',
-    '삼천리': '004690',
-    '삼천리자전거': '024950',
-    '삼표시멘트': '038500',
-    '삼현': '437730',
-    '삼현철강': '017480',
-    '삼호개발': '010960',
-    '삼화기연': '033210',
-    '삼화네트웍스': '046390',
-    '삼화왕관': '004450',
-    '삼화전기': '009470',
-    '삼화전자공업': '011230',
-    '삼화콘덴서공업': '001820',
-    '삼화페인트공업': '000390',
-    '삼환기업': '000360',
-    '상보': '027580',
-    '상상인': '038540',
-    '상상인이안제2호기업인수목적': '329560',
-    '상상인제3호기업인수목적': '415580',
-    '상상인제4호스팩': '452670',
-    '상상인증권': '001290',
-    '상신브레이크': '041650',
-    '상신이디피': '091580',
-    '상신전자': '263810',
-    '상아프론테크': '089980',
-    '상지건설': '042940',
-    '새로닉스': '042600',
-    '새론오토모티브': '075180',
-    '새빗켐': '107600',
-    '샌즈랩': '411080',
-    '샘씨엔에스': '252990',
-    '샘표': '007540',
-    '샘표식품': '248170',
-    '생고뱅코리아홀딩스': '002000',
-    '샤인시스템': '066300',
-    '샤페론': '378800',
-    '서광건설산업': '001600',
-    '서남': '294630',
-    '서린바이오': '038070',
-    '서부T&D': '006730',
-    '서산': '079650',
-    '서암기계공업': '100660',
-    '서연': '007860',
-    '서연이화': '200880',
-    '서연탑메탈': '019770',
-    '서울도시가스': '017390',
-    '서울리거': '043710',
-    '서울바이오시스': '092190',
-    '서울반도체': '046890',
-    '서울보증보험': '031210',
-    '서울상호저축은행': '016560',
-    '서울식품공업': '004410',
-    '서울옥션': '063170',
-    '서울전자통신': '027040',
-    '서울제약': '018680',
-    '서울평가정보': '036120',
-    '서원': '021050',
-    '서원인텍': '093920',
-    '서전기전': '189860',
-    '서진시스템': '178320',
-    '서진오토모티브': '122690',
-    '서통': '001150',
-    '서플러스글로벌': '140070',
-    '서한': '011370',
-    '서호전기': '065710',
-    '서흥': '008490',
-    '서희건설': '035890',
-    '석경에이티': '357550',
-    '선광': '003100',
-    '선도전기': '007610',
-    '선바이오': '067370',
-    '선샤인푸드': '217620',
-    '선우중공업': '068770',
-    '선익시스템': '171090',
-    '선진': '136490',
-    '선진뷰티사이언스': '086710',
-    '선진지주': '014300',
-    '선팩테크': '054010',
-    '성광벤드': '014620',
-    '성도이엔지': '037350',
-    '성문전자': '014910',
-    '성신양회': '004980',
-    '성안머티리얼스': '011300',
-    '성우': '458650',
-    '성우몰드': '053440',
-    '성우전자': '081580',
-    '성우테크론': '045300',
-    '성우하이텍': '015750',
-    '성원': '015200',
-    '성원건설': '012090',
-    '성융광전투자유한공사': '900150',
-    '성일하이텍': '365340',
-    '성지건설': '005980',
-    '성진산업': '037650',
-    '성창기업지주': '000180',
-    '성창오토텍': '080470',
-    '성호전자': '043260',
-    '세경하이테크': '148150',
-    '세계투어': '047600',
-    '세기상사': '002420',
-    '세니젠': '188260',
-    '세니콘': '056060',
-    '세동': '053060',
-    '세라온홀딩스': '050600',
-    '세림B&G': '340440',
-    '세명전기': '017510',
-    '세미텍': '081220',
-    '세방': '004360',
-    '세방전지': '004490',
-    '세보엠이씨': '011560',
-    '세븐브로이맥주': '267080',
-    '세븐코스프': '017160',
-    '세신': '004230',
-    '세실': '084450',
-    '세아메카닉스': '396300',
-    '세아메탈': '033020',
-    '세아베스틸지주': '001430',
-    '세아제강': '306200',
-    '세아제강지주': '003030',
-    '세아특수강': '019440',
-    '세아홀딩스': '058650',
-    '세영디앤씨': '052190',
-    '세왕': '111610',
-    '세우글로벌': '013000',
-    '세운메디칼': '100700',
-    '세원물산': '024830',
-    '세원이앤씨': '091090',
-    '세원정공': '021820',
-    '세원텔레콤': '036910',
-    '세원화성': '007910',
-    '세이브존I&C': '067830',
-    '세이프아시아': '066330',
-    '세종머티리얼즈': '135270',
-    '세종메디칼': '258830',
-    '세종텔레콤': '036630',
-    '세중': '039310',
-    '세진중공업': '075580',
-    '세진티에스': '067770',
-    '세코닉스': '053450',
-    '세토피아': '222810',
-    '세화피앤씨': '252500',
-    '센서뷰': '321370',
-    '센추리': '006750',
-    '센코': '347000',
-    '셀런': '013240',
-    '셀레믹스': '331920',
-    '셀레스트라': '352770',
-    '셀로맥스사이언스': '471820',
-    '셀루메드': '049180',
-    '셀리드': '299660',
-    '셀리버리': '268600',
-    '셀바스AI': '108860',
-    '셀바스헬스케어': '208370',
-    '셀바이오휴먼텍': '318160',
-    '셀비온': '308430',
-    '셀젠텍': '258250',
-    '셀텍': '019260',
-    '셀트리온': '068270',
-    '셀트리온제약': '068760',
-    '셀트리온헬스케어': '091990',
-    '셀피글로벌': '068940',
-    '셰프라인': '012250',
-    '소노스퀘어': '007720',
-    '소니드': '060230',
-    '소룩스': '290690',
-    '소리바다': '053110',
-    '소마젠': '950200',
-    '소예': '035010',
-    '소프트센': '032680',
-    '소프트캠프': '258790',
-    '손오공': '066910',
-    '솔디펜스': '215090',
-    '솔로몬저축은행': '007800',
-    '솔루스첨단소재': '336370',
-    '솔루엠': '248070',
-    '솔본': '035610',
-    '솔브레인': '357780',
-    '솔브레인홀딩스': '036830',
-    '솔빛미디어': '044440',
-    '솔트룩스': '304100',
-    '솔트웍스': '222520',
-    '솔트웨어': '328380',
-    '송원산업': '004430',
-    '쇼박스': '086980',
-    '수산세보틱스': '017550',
-    '수산아이앤티': '050960',
-    '수산인더스트리': '126720',
-    '수성웹툰': '084180',
-    '수젠텍': '253840',
-    '수프로': '185190',
-    '슈마일렉트론': '056500',
-    '슈어소프트테크': '298830',
-    '슈프리마': '236200',
-    '슈프리마에이치큐': '094840',
-    '슈피겐코리아': '192440',
-    '스마텔': '004190',
-    '스마트레이더시스템': '424960',
-    '스마트솔루션즈': '136510',
-    '스맥': '099440',
-    '스코넥': '276040',
-    '스타맥스': '017050',
-    '스타에스엠리츠': '204210',
-    '스타코링크': '060240',
-    '스타플렉스': '115570',
-    '스탠다드펌': '179280',
-    '스톤브릿지벤처스': '330730',
-    '스톰이앤에프': '043680',
-    '스톰테크': '352090',
-    '스튜디오드래곤': '253450',
-    '스튜디오미르': '408900',
-    '스튜디오산타클로스': '204630',
-    '스튜디오삼익': '415380',
-    '스튜디오에스': '046140',
-    '스틱인베스트먼트': '026890',
-    '스틸플라워': '087220',
-    '스페이스솔루션': '245030',
-    '스페코': '013810',
-    '스포츠서울': '039670',
-    '스피어': '347700',
-    '승일': '049830',
-    '시공테크': '020710',
-    '시그네틱스': '033170',
-    '시냅스엠': '246830',
-    '시너지이노베이션': '048870',
-    '시노펙스': '025320',
-    '시노펙스그린테크': '037320',
-    '시디즈': '134790',
-    '시선AI': '340810',
-    '시스웍': '269620',
-    '시알홀딩스': '000480',
-    '시지메드텍': '056090',
-    '시지트로닉스': '429270',
-    '시큐레터': '418250',
-    '시큐브': '131090',
-    '시큐어소프트': '037060',
-    '시프트업': '462870',
-    '신광기업': '001580',
-    '신대양제지': '016590',
-    '신도기연': '290520',
-    '신도리코': '029530',
-    '신동방CP': '004660',
-    '신라교역': '004970',
-    '신라섬유': '001000',
-    '신라에스지': '025870',
-    '신라젠': '215600',
-    '신비앤텍': '070480',
-    '신성델타테크': '065350',
-    '신성에스티': '416180',
-    '신성에프에이': '104120',
-    '신성이엔지': '011930',
-    '신성통상': '005390',
-    '신세계': '004170',
-    '신세계I&C': '035510',
-    '신세계건설': '034300',
-    '신세계인터내셔날': '031430',
-    '신세계톰보이': '012580',
-    '신세계푸드': '031440',
-    '신송홀딩스': '006880',
-    '신스틸': '162300',
-    '신시웨이': '290560',
-    '신신제약': '002800',
-    '신양오라컴디스플레이': '086830',
-    '신영스팩10호': '472220',
-    '신영스팩8호': '430220',
-    '신영스팩9호': '445970',
-    '신영와코루': '005800',
-    '신영증권': '001720',
-    '신영해피투모로우제6호기업인수목적': '344050',
-    '신영해피투모로우제7호기업인수목적': '419270',
-    '신원': '009270',
-    '신원종합개발': '017000',
-    '신일건업': '014350',
-    '신일전자': '002700',
-    '신일제약': '012790',
-    '신지소프트': '078700',
-    '신진에스엠': '138070',
-    '신테카바이오': '226330',
-    '신텍': '099660',
-    '신풍': '002870',
-    '신풍제약': '019170',
-    '신한': '005450',
-    '신한SIT': '054530',
-    '신한글로벌액티브리츠': '481850',
-    '신한서부티엔디리츠': '404990',
-    '신한알파리츠': '293940',
-    '신한은행': '000010',
-    '신한제10호기업인수목적': '418210',
-    '신한제11호스팩': '452980',
-    '신한제12호스팩': '474660',
-    '신한제13호스팩': '474930',
-    '신한제14호스팩': '487360',
-    '신한제15호스팩': '487830',
-    '신한제16호스팩': '496070',
-    '신한제3호기업인수목적': '257730',
-    '신한제4호기업인수목적': '277480',
-    '신한제7호기업인수목적': '366330',
-    '신한제8호기업인수목적': '393360',
-    '신한제9호기업인수목적': '405640',
-    '신한지주': '055550',
-    '신한카드': '032710',
-    '신한투자증권': '008670',
-    '신화인터텍': '056700',
-    '신화콘텍': '187270',
-    '신흥': '004080',
-    '신흥에스이씨': '243840',
-    '실리콘투': '257720',
-    '실리콘화일': '082930',
-    '심텍': '222800',
-    '심텍홀딩스': '036710',
-    '심팩메탈': '090730',
-    '심팩인더스트리': '005350',
-    '심플랫폼': '444530',
-    '싸이닉솔루션': '234030',
-    '싸이맥스': '160980',
-    '싸이버원': '356890',
-    '싸이토젠': '217330',
-    '쌈지': '033260',
-    '쌍방울': '102280',
-    '쌍용건설': '012650',
-    '쌍용씨앤이': '003410',
-    '써니전자': '004770',
-    '써니트렌드': '035500',
-    '써미트테크놀로지': '039000',
-    '썬코어': '051170',
-    '썬테크': '217320',
-    '썬테크놀로지스': '122800',
-    '썸에이지': '208640',
-    '쎄노텍': '222420',
-    '쎄니트': '037760',
-    '쎄라텍': '041550',
-    '쎄크': '081180',
-    '쎄트렉아이': '099320',
-    '쎌바이오텍': '049960',
-    '쏘닉스': '088280',
-    '쏘카': '403550',
-    '쏠라엔텍': '030390',
-    '쏠리드': '050890',
-    '쓰리디넷': '035400',
-    '쓰리디월드': '065340',
-    '쓰리빌리언': '394800',
-    '쓰리소프트': '036360',
-    '쓰리알': '037730',
-    '쓰리에이로직스': '177900',
-    '씨그널엔터테인먼트그룹': '099830',
-    '씨디네트웍스': '073710',
-    '씨메스': '475400',
-    '씨모스': '037600',
-    '씨모텍': '081090',
-    '씨싸이트': '109670',
-    '씨씨에스': '066790',
-    '씨아이에스': '222080',
-    '씨아이테크': '004920',
-    '씨알푸드': '236030',
-    '씨앗': '103660',
-    '씨앤상선': '000790',
-    '씨앤씨인터내셔널': '352480',
-    '씨앤에스링크': '245450',
-    '씨앤에스자산관리': '032040',
-    '씨앤에이치': '023460',
-    '씨앤중공업': '008400',
-    '씨앤지하이테크': '264660',
-    '씨앤케이인터내셔널': '039530',
-    '씨앤투스': '352700',
-    '씨어스테크놀로지': '458870',
-    '씨에스베어링': '297090',
-    '씨에스윈드': '112610',
-    '씨엑스아이': '900120',
-    '씨엔씨엔터프라이즈': '038420',
-    '씨엔알리서치': '359090',
-    '씨엔티드림': '286000',
-    '씨엔플러스': '115530',
-    '씨엘엘씨디': '035710',
-    '씨엠에스에듀': '225330',
-    '씨유메디칼': '115480',
-    '씨유전자': '056340',
-    '씨유테크': '376290',
-    '씨이랩': '189330',
-    '씨제이엔터테인먼트': '049370',
-    '씨제이이앤엠': '130960',
-    '씨제이인터넷': '037150',
-    '씨젠': '096530',
-    '씨케이솔루션': '480370',
-    '씨큐브': '101240',
-    '씨크롭': '016970',
-    '씨티네트웍스': '189540',
-    '씨티씨바이오': '060590',
-    '씨티알모빌리티': '308170',
-    '씨티앤티': '050470',
-    '씨티엘테크': '088960',
-    '씨티케이': '260930',
-    '씨피시스템': '413630',
-    '아가방컴퍼니': '013990',
-    '아구스': '078670',
-    '아나패스': '123860',
-    '아난티': '025980',
-    '아남전자': '008700',
-    '아라온테크': '041060',
-    '아루히': '950100',
-    '아리온테크놀로지': '058220',
-    '아모그린텍': '125210',
-    '아모레퍼시픽': '090430',
-    '아모레퍼시픽홀딩스': '002790',
-    '아모센스': '357580',
-    '아모텍': '052710',
-    '아미노로직스': '074430',
-    '아미코젠': '092040',
-    '아바코': '083930',
-    '아바텍': '149950',
-    '아비코전자': '036010',
-    '아세아': '002030',
-    '아세아시멘트': '183190',
-    '아세아제지': '002310',
-    '아세아텍': '050860',
-    '아세아페이퍼텍': '009380',
-    '아센디오': '012170',
-    '아셈스': '136410',
-    '아스타': '246720',
-    '아스테라시스': '450950',
-    '아스트': '067390',
-    '아스팩오일': '232360',
-    '아스플로': '159010',
-    '아시아경제': '127710',
-    '아시아나IDT': '267850',
-    '아시아나항공': '020560',
-    '아시아미디어홀딩스': '052810',
-    '아시아종묘': '154030',
-    '아시아퍼시픽10호선박투자회사': '083570',
-    '아시아퍼시픽11호선박투자회사': '083580',
-    '아시아퍼시픽12호선박투자회사': '083590',
-    '아시아퍼시픽13호선박투자회사': '083600',
-    '아시아퍼시픽14호선박투자회사': '083610',
-    '아시아퍼시픽15호선박투자회사': '083620',
-    '아시아퍼시픽1호선박투자회사': '080180',
-    '아시아퍼시픽2호선박투자회사': '081190',
-    '아시아퍼시픽3호선박투자회사': '081200',
-    '아시아퍼시픽4호선박투자회사': '081210',
-    '아시아퍼시픽5호선박투자회사': '082240',
-    '아시아퍼시픽6호선박투자회사': '082250',
-    '아시아퍼시픽7호선박투자회사': '082260',
-    '아시아퍼시픽8호선박투자회사': '081930',
-    '아시아퍼시픽9호선박투자회사': '081940',
-    '아우딘퓨쳐스': '227610',
-    '아우토크립트': '331740',
-    '아이드림': '066850',
-    '아이디스': '143160',
-    '아이디스홀딩스': '054800',
-    '아이디에스': '078780',
-    '아이디에이치': '026230',
-    '아이디피': '332370',
-    '아이레보': '072430',
-    '아이로보틱스': '066430',
-    '아이마켓코리아': '122900',
-    '아이비김영': '339950',
-    '아이비젼웍스': '469750',
-    '아이비진': '039060',
-    '아이비케이에스스마트에스엠이기업인수목적1호': '126680',
-    '아이비케이에스제13호기업인수목적': '351340',
-    '아이비케이에스제17호기업인수목적': '405350',
-    '아이비케이에스제19호기업인수목적': '426550',
-    '아이비케이에스제20호기업인수목적': '439730',
-    '아이비케이에스제7호기업인수목적': '276920',
-    '아이빔테크놀로지': '460470',
-    '아이센스': '099190',
-    '아이스크림미디어': '461300',
-    '아이스크림에듀': '289010',
-    '아이스테이션': '056010',
-    '아이쓰리시스템': '214430',
-    '아이씨디': '040910',
-    '아이씨에이치': '368600',
-    '아이씨티케이': '456010',
-    '아이알디': '084810',
-    '아이앤씨': '052860',
-    '아이언디바이스': '464500',
-    '아이에스동서': '010780',
-    '아이에스티이': '212710',
-    '아이에이': '038880',
-    '아이에이치큐': '003560',
-    '아이엘': '307180',
-    '아이엘사이언스': '122050',
-    '아이엠': '101390',
-    '아이엠뱅크': '005270',
-    '아이엠비디엑스': '461030',
-    '아이엠아이티': '038100',
-    '아이엠지티': '456570',
-    '아이엠텍': '226350',
-    '아이엠티': '451220',
-    '아이오바이오': '447690',
-    '아이윈': '090150',
-    '아이윈플러스': '123010',
-    '아이이': '023430',
-    '아이인프라': '008780',
-    '아이즈비전': '031310',
-    '아이지넷': '462980',
-    '아이진': '185490',
-    '아이컴포넌트': '059100',
-    '아이케이세미콘': '149010',
-    '아이퀘스트': '262840',
-    '아이큐어': '175250',
-    '아이크래프트': '052460',
-    '아이텍': '119830',
-    '아이텍스필': '008030',
-    '아이톡시': '052770',
-    '아이티센글로벌': '124500',
-    '아이티센네트웍스': '057110',
-    '아이티센씨티에스': '031820',
-    '아이티센엔텍': '010280',
-    '아이티센코어': '243870',
-    '아이티센피엔에스': '232830',
-    '아이티아이즈': '372800',
-    '아이티엠반도체': '084850',
-    '아이패밀리에스씨': '114840',
-    '아이팩토리': '053810',
-    '아이피에스': '051820',
-    '아인스엠앤엠': '040740',
-    '아주IB투자': '027360',
-    '아주스틸': '139990',
-    '아즈텍WB': '032080',
-    '아진산업': '013310',
-    '아진엑스텍': '059120',
-    '아진전자부품': '009320',
-    '아진카인텍': '011400',
-    '아큐텍': '013780',
-    '아크솔루션스': '203690',
-    '아톤': '158430',
-    '아티스트스튜디오': '200350',
-    '아티스트컴퍼니': '321820',
-    '아퓨어스': '149300',
-    '아하': '102950',
-    '안국약품': '001540',
-    '안랩': '053800',
-    '안지오랩': '251280',
-    '안트로젠': '065660',
-    '알덱스': '025970',
-    '알로이스': '297570',
-    '알루코': '021570',
-    '알리코제약': '260660',
-    '알멕': '354320',
-    '알바이오': '003190',
-    '알보젠코리아': '002250',
-    '알비더블유': '361570',
-    '알서포트': '131370',
-    '알에스넷': '046430',
-    '알에스오토메이션': '140670',
-    '알에프세미': '096610',
-    '알에프텍': '061040',
-    '알엔투테크놀로지': '148250',
-    '알이네트웍스': '023670',
-    '알체라': '347860',
-    '알테오젠': '196170',
-    '알톤': '123750',
-    '알티캐스트': '085810',
-    '알파녹스': '043100',
-    '알파칩스': '117670',
-    '알피바이오': '314140',
-    '압타머사이언스': '291650',
-    '압타바이오': '293780',
-    '앙츠': '267810',
-    '애경산업': '018250',
-    '애경케미칼': '161000',
-    '애니메디솔루션': '390110',
-    '애니플러스': '310200',
-    '애닉': '299910',
-    '애드모바일': '032600',
-    '애드바이오텍': '179530',
-    '애머릿지': '900100',
-    '애큐온저축은행': '007640',
-    '액토즈소프트': '052790',
-    '액트로': '290740',
-    '액티투오': '047710',
-    '앤디포스': '238090',
-    '앤씨앤': '092600',
-    '앤에스': '126870',
-    '앱코': '129890',
-    '앱클론': '174900',
-    '앱트뉴로사이언스': '270520',
-    '야스': '255440',
-    '야호커뮤니케이션': '059720',
-    '양지사': '030960',
-    '어보브반도체': '102120',
-    '어스앤에어로스페이스': '263540',
-    '어울림네트웍스': '042820',
-    '어울림엘시스': '033280',
-    '어울림정보기술': '038320',
-    '얼라인드': '238120',
-    '엄지하우스': '224810',
-    '업필': '054370',
-    '에너윈': '055970',
-    '에너토크': '019990',
-    '에넥스': '011090',
-    '에듀아크': '046350',
-    '에듀언스': '009010',
-    '에듀패스': '031950',
-    '에르코스': '435570',
-    '에버리소스': '020070',
-    '에브리봇': '270660',
-    '에스넷': '038680',
-    '에스디바이오센서': '137310',
-    '에스디생명공학': '217480',
-    '에스디시스템': '121890',
-    '에스마크': '030270',
-    '에스바이오메딕스': '304360',
-    '에스브이에이치': '046240',
-    '에스비비테크': '389500',
-    '에스비아이앤솔로몬드림기업인수목적': '123910',
-    '에스비엠': '037630',
-    '에스씨디': '042110',
-    '에스씨엠생명과학': '298060',
-    '에스아이리소스': '065420',
-    '에스알바이오텍': '270210',
-    '에스앤더블류': '103230',
-    '에스앤디': '260970',
-    '에스앤씨엔진그룹리미티드': '900080',
-    '에스앤에스텍': '101490',
-    '에스앤케이': '950180',
-    '에스에너지': '095910',
-    '에스에스씨피': '071660',
-    '에스에스알': '275630',
-    '에스에스컴텍': '036500',
-    '에스에이엠티': '031330',
-    '에스에이치엔엘': '050320',
-    '에스에이티': '060540',
-    '에스에프씨': '112240',
-    '에스에프에이': '056190',
-    '에스엔유프리시젼': '080000',
-    '에스엘': '005850',
-    '에스엘에스바이오': '246250',
-    '에스엘테라퓨틱스': '258540',
-    '에스엠': '041510',
-    '에스엠로보틱스': '252940',
-    '에스엠벡셀': '010580',
-    '에스엠비나': '299670',
-    '에스엠씨지': '460870',
-    '에스엠코어': '007820',
-    '에스엠화진': '134780',
-    '에스오에스랩': '464080',
-    '에스오케이': '032610',
-    '에스와이': '109610',
-    '에스와이스틸텍': '365330',
-    '에스와이이노베이션': '194860',
-    '에스와이제이': '251540',
-    '에스와이코퍼레이션': '008080',
-    '에스원': '012750',
-    '에스유앤피': '019590',
-    '에스제이그룹': '306040',
-    '에스제이엠': '123700',
-    '에스제이엠홀딩스': '025530',
-    '에스제이케이': '080440',
-    '에스제이켐': '217910',
-    '에스지신성건설': '001970',
-    '에스지에이시스템즈': '232290',
-    '에스지에이클라우드서비스': '224880',
-    '에스지피엠': '074000',
-    '에스지헬스케어': '398120',
-    '에스컴': '014900',
-    '에스케이렌터카': '068400',
-    '에스케이머티리얼즈': '036490',
-    '에스케이바이오팜': '326030',
-    '에스케이브로드밴드': '033630',
-    '에스케이씨에스': '224020',
-    '에스케이에이씨피씨제4호기업인수목적': '307070',
-    '에스케이엔펄스': '057500',
-    '에스케이제1호기업인수목적': '207930',
-    '에스케이제3호기업인수목적': '232330',
-    '에스케이제5호기업인수목적': '337450',
-    '에스케이제6호기업인수목적': '340350',
-    '에스케이증권제8호기업인수목적': '435870',
-    '에스켐': '475660',
-    '에스코넥': '096630',
-    '에스텍': '069510',
-    '에스트라': '016570',
-    '에스트래픽': '234300',
-    '에스티씨라이프': '026220',
-    '에스티아이': '039440',
-    '에스티앤아이': '031800',
-    '에스티오': '098660',
-    '에스티큐브': '052020',
-    '에스티팜': '237690',
-    '에스폴리텍': '050760',
-    '에스퓨얼셀': '288620',
-    '에스피소프트': '443670',
-    '에스피시스템스': '317830',
-    '에스피지': '058610',
-    '에스피컴텍': '039110',
-    '에스피코프': '048130',
-    '에쎈테크': '043340',
-    '에쓰씨엔지니어링': '023960',
-    '에어레인': '163280',
-    '에어부산': '298690',
-    '에이디모터스': '038120',
-    '에이디칩스': '054630',
-    '에이디테크놀로지': '200710',
-    '에이럭스': '475580',
-    '에이루트': '096690',
-    '에이리츠': '140910',
-    '에이블씨엔씨': '078520',
-    '에이비엘바이오': '298380',
-    '에이비온': '203400',
-    '에이비프로바이오': '195990',
-    '에이스디지텍': '036550',
-    '에이스앤파트너스': '032930',
-    '에이스일렉트로닉스': '038690',
-    '에이스침대': '003800',
-    '에이스테크': '088800',
-    '에이스토리': '241840',
-    '에이스하이텍': '071930',
-    '에이아이코리아': '364950',
-    '에이에스텍': '453860',
-    '에이에프더블류': '312610',
-    '에이엔피': '015260',
-    '에이엘티': '172670',
-    '에이엠시지': '495900',
-    '에이엠에스': '044770',
-    '에이원마이크로': '037380',
-    '에이원알폼': '234070',
-    '에이유브랜즈': '481070',
-    '에이직랜드': '445090',
-    '에이치디씨영창': '001890',
-    '에이치브이엠': '295310',
-    '에이치비이에너지': '017300',
-    '에이치시티': '072990',
-    '에이치씨코퍼레이션': '037340',
-    '에이치앤아이': '103650',
-    '에이치에스씨홀딩스': '038920',
-    '에이치엔에스하이텍': '044990',
-    '에이치엘사이언스': '239610',
-    '에이치엠넥스': '036170',
-    '에이치엠씨아이비제4호기업인수목적': '353070',
-    '에이치엠씨아이비제5호기업인수목적': '353060',
-    '에이치엠씨제6호스팩': '462020',
-    '에이치엠씨제7호스팩': '477340',
-    '에이치와이티씨': '148930',
-    '에이치원바이오': '052310',
-    '에이치이엠파마': '376270',
-    '에이치케이': '044780',
-    '에이치피오': '357230',
-    '에이텀': '355690',
-    '에이테크솔루션': '071670',
-    '에이텍': '045660',
-    '에이텍모빌리티': '224110',
-    '에이티넘인베스트': '021080',
-    '에이티세미콘': '089530',
-    '에이팩트': '200470',
-    '에이팸': '073070',
-    '에이펙스인텍': '207490',
-    '에이프로': '262260',
-    '에이프로젠': '007460',
-    '에이프로젠바이오로직스': '003060',
-    '에이프로테크놀로지': '045470',
-    '에이프릴바이오': '397030',
-    '에이플러스에셋': '244920',
-    '에이피알': '278470',
-    '에임하이글로벌': '043580',
-    '에치에프알': '230240',
-    '에코글로우': '159910',
-    '에코마케팅': '230360',
-    '에코바이브': '015540',
-    '에코바이오': '038870',
-    '에코볼트': '097780',
-    '에코솔루션': '052510',
-    '에코아이': '448280',
-    '에코앤드림': '101360',
-    '에코캡': '128540',
-    '에코페트로시스템': '042870',
-    '에코프로': '086520',
-    '에코프로머티': '450080',
-    '에코프로비엠': '247540',
-    '에코프로에이치엔': '383310',
-    '에코플라스틱': '038110',
-    '에프아이투어': '047370',
-    '에프알텍': '073540',
-    '에프앤가이드': '064850',
-    '에프에스티': '036810',
-    '에프엔씨엔터': '173940',
-    '에프엔에스테크': '083500',
-    '에프지엔개발전문자기관리부동산투자회사': '119250',
-    '에피바이오텍': '446440',
-    '에피밸리': '068630',
-    '엑사이엔씨': '054940',
-    '엑세스바이오': '950130',
-    '엑셀세라퓨틱스': '373110',
-    '엑셈': '205100',
-    '엑스게이트': '356680',
-    '엑스로드': '074140',
-    '엑스씨이': '081500',
-    '엑스큐어': '070300',
-    '엑스페릭스': '317770',
-    '엑스플러스': '373200',
-    '엑시온그룹': '069920',
-    '엑시콘': '092870',
-    '엑시큐어하이트론': '019490',
-    '엑큐리스': '048460',
-    '엔바이오니아': '317870',
-    '엔브이에이치코리아': '067570',
-    '엔비티': '236810',
-    '엔빅스': '054170',
-    '엔솔바이오사이언스': '140610',
-    '엔스퍼트': '098400',
-    '엔시스': '333620',
-    '엔시트론': '101400',
-    '엔써커뮤니티': '037750',
-    '엔씨소프트': '036570',
-    '엔알비': '475230',
-    '엔에스브이': '095300',
-    '엔에스쇼핑': '138250',
-    '엔에스아이': '053250',
-    '엔에스엠': '238170',
-    '엔에스이엔엠': '078860',
-    '엔에스컴퍼니': '224760',
-    '엔에이치기업인수목적13호': '310840',
-    '엔에이치기업인수목적19호': '380440',
-    '엔에이치기업인수목적20호': '391060',
-    '엔에이치기업인수목적22호': '396770',
-    '엔에이치기업인수목적23호': '422040',
-    '엔에이치기업인수목적24호': '437780',
-    '엔에이치기업인수목적25호': '438580',
-    '엔에이치기업인수목적26호': '439410',
-    '엔에이치기업인수목적27호': '440820',
-    '엔에이치기업인수목적28호': '450410',
-    '엔에이치기업인수목적7호': '217810',
-    '엔에이치스팩29호': '451700',
-    '엔에이치스팩30호': '466910',
-    '엔에이치스팩31호': '481890',
-    '엔에이치에스엘기업인수목적': '207720',
-    '엔에이치엔': '181710',
-    '엔에프씨': '265740',
-    '엔젠바이오': '354200',
-    '엔젤로보틱스': '455900',
-    '엔젯': '419080',
-    '엔지브이아이': '093510',
-    '엔지스테크널러지': '208860',
-    '엔지켐생명과학': '183490',
-    '엔케이': '085310',
-    '엔케이맥스': '182400',
-    '엔켐': '348370',
-    '엔터미디어': '068420',
-    '엔텔스': '069410',
-    '엔토리노': '032590',
-    '엔투텍': '227950',
-    '엔플렉스': '040130',
-    '엔피': '291230',
-    '엔피씨': '004250',
-    '엔피케이': '048830',
-    '엔하이테크': '046720',
-    '엘디티': '096870',
-    '엘리비젼': '276240',
-    '엘브이엠씨': '900140',
-    '엘비루셈': '376190',
-    '엘아이에스': '138690',
-    '엘앤씨바이오': '290650',
-    '엘앤씨피': '015390',
-    '엘앤에프': '066970',
-    '엘앤케이바이오': '156100',
-    '엘앤피아너스': '061140',
-    '엘에스일렉트릭': '010120',
-    '엘에이티': '311060',
-    '엘엠에스': '073110',
-    '엘오티베큠': '083310',
-    '엘지데이콤': '015940',
-    '엘컴텍': '037950',
-    '엘케이켐': '489500',
-    '엘트온': '015050',
-    '엘티씨': '170920',
-    '엘피케이로보틱스': '183350',
-    '엠게임': '058630',
-    '엠넷미디어': '056200',
-    '엠디바이스': '226590',
-    '엠로': '058970',
-    '엠바이엔': '031970',
-    '엠브레인': '169330',
-    '엠소닉': '008120',
-    '엠씨넥스': '097520',
-    '엠씨티티코어': '052210',
-    '엠아이큐브솔루션': '373170',
-    '엠아이텍': '179290',
-    '엠앤씨생명과학': '225860',
-    '엠앤씨솔루션': '484870',
-    '엠에스씨': '009780',
-    '엠에스오토텍': '123040',
-    '엠에프씨': '432980',
-    '엠에프엠코리아': '323230',
-    '엠엔에프씨': '048640',
-    '엠오티': '413390',
-    '엠제이비': '074150',
-    '엠젠솔루션': '032790',
-    '엠케이전자': '033160',
-    '엠텍반도체': '054440',
-    '엠투아이': '347890',
-    '엠투엔': '033310',
-    '엠트론스토리지테크놀로지': '046320',
-    '엠플러스': '259630',
-    '엠피씨플러스': '050540',
-    '엣지파운드리': '105550',
-    '연우': '115960',
-    '연합과기공고유한공사': '900030',
-    '영림원소프트랩': '060850',
-    '영보화학': '014440',
-    '영우디에스피': '143540',
-    '영원무역': '111770',
-    '영원무역홀딩스': '009970',
-    '영진약품': '003520',
-    '영진코퍼레이션': '053330',
-    '영찬테크': '085990',
-    '영풍': '000670',
-    '영풍산업': '002850',
-    '영풍제지': '006740',
-    '영현무역': '242850',
-    '영화금속': '012280',
-    '영화테크': '265560',
-    '영흥': '012160',
-    '예당컴퍼니': '049000',
-    '예림당': '036000',
-    '예선테크': '250930',
-    '예스24': '053280',
-    '예스티': '122640',
-    '예일바이오텍': '054250',
-    '오가노이드사이언스': '476040',
-    '오가닉티코스메틱': '900300',
-    '오건에코텍': '212310',
-    '오공': '045060',
-    '오늘이엔엠': '192410',
-    '오디텍': '080520',
-    '오뚜기': '007310',
-    '오라바이오틱스': '016160',
-    '오렌지라이프생명보험': '079440',
-    '오로라': '039830',
-    '오로스테크놀로지': '322310',
-    '오르비텍': '046120',
-    '오름테라퓨틱': '475830',
-    '오리엔탈정공': '014940',
-    '오리엔트바이오': '002630',
-    '오리엔트정공': '065500',
-    '오리온': '271560',
-    '오리온홀딩스': '001800',
-    '오리콤': '010470',
-    '오브제': '058680',
-    '오브젠': '417860',
-    '오비고': '352910',
-    '오상자이엘': '053980',
-    '오상헬스케어': '036220',
-    '오성첨단소재': '052420',
-    '오션스바이오': '332190',
-    '오션스톤': '329020',
-    '오션인더블유': '052300',
-    '오스코텍': '039200',
-    '오스테오닉': '226400',
-    '오스템': '031510',
-    '오스템임플란트': '048260',
-    '오에스피': '368970',
-    '오이솔루션': '138080',
-    '오킨스전자': '080580',
-    '오텍': '067170',
-    '오토앤': '353590',
-    '오파스넷': '173130',
-    '오페스': '053470',
-    '오픈놀': '440320',
-    '오픈베이스': '049480',
-    '오픈엣지테크놀로지': '394280',
-    '오하임앤컴퍼니': '309930',
-    '옥션': '043790',
-    '온미디어': '045710',
-    '온코닉테라퓨틱스': '476060',
-    '온코크로스': '382150',
-    '온타이드': '005320',
-    '올리브나인': '052970',
-    '올리패스': '244460',
-    '올릭스': '226950',
-    '옴니시스템': '057540',
-    '옵투스제약': '131030',
-    '옵트론텍': '082210',
-    '옵티시스': '109080',
-    '옵티코어': '380540',
-    '옵티팜': '153710',
-    '와이랩': '432430',
-    '와이바이오로직스': '338840',
-    '와이솔': '122990',
-    '와이씨': '232140',
-    '와이씨켐': '112290',
-    '와이앤넥스트': '090740',
-    '와이어블': '065530',
-    '와이엔텍': '067900',
-    '와이엠': '007530',
-    '와이엠씨': '155650',
-    '와이엠텍': '273640',
-    '와이엠티': '251370',
-    '와이제이링크': '209640',
-    '와이즈넛': '096250',
-    '와이즈버즈': '273060',
-    '와이즈파워': '040670',
-    '와이지-원': '019210',
-    '와이지엔터테인먼트': '122870',
-    '와이투솔루션': '011690',
-    '와토스코리아': '079000',
-    '완리인터내셔널홀딩스': '900180',
-    '외환신용카드': '038400',
-    '우경': '025920',
-    '우듬지팜': '403490',
-    '우리금융지주': '316140',
-    '우리금융캐피탈': '033660',
-    '우리기술': '032820',
-    '우리기술투자': '041190',
-    '우리기업인수목적1호': '122750',
-    '우리넷': '115440',
-    '우리로': '046970',
-    '우리바이오': '082850',
-    '우리벤처파트너스': '298870',
-    '우리산업': '215360',
-    '우리산업홀딩스': '072470',
-    '우리손에프앤지': '073560',
-    '우리엔터프라이즈': '037400',
-    '우리은행': '000030',
-    '우리이앤엘': '153490',
-    '우리종합금융': '010050',
-    '우리증권': '001280',
-    '우림피티에스': '101170',
-    '우방': '013200',
-    '우성': '006980',
-    '우성아이비': '194610',
-    '우수AMS': '066590',
-    '우수씨엔에스': '060550',
-    '우신시스템': '017370',
-    '우양': '103840',
-    '우양에이치씨': '101970',
-    '우영': '012460',
-    '우원개발': '046940',
-    '우전': '052270',
-    '우정바이오': '215380',
-    '우주일렉트로': '065680',
-    '우주통신': '054080',
-    '우진': '105840',
-    '우진비앤지': '018620',
-    '우진아이엔에스': '010400',
-    '우진엔텍': '457550',
-    '우진플라임': '049800',
-    '웅진': '016880',
-    '웅진씽크빅': '095720',
-    '웅진에너지': '103130',
-    '워트': '396470',
-    '원림': '005820',
-    '원바이오젠': '278380',
-    '원익': '032940',
-    '원익IPS': '240810',
-    '원익QnC': '074600',
-    '원익머트리얼즈': '104830',
-    '원익큐브': '014190',
-    '원익테라세미콘': '123100',
-    '원익피앤이': '217820',
-    '원익홀딩스': '030530',
-    '원일특강': '012620',
-    '원일티엔아이': '136150',
-    '원준': '382840',
-    '원텍': '216280',
-    '원티드랩': '376980',
-    '원포유': '122830',
-    '원풍': '008370',
-    '원풍물산': '008290',
-    '월덱스': '101160',
-    '월드텔레콤': '047610',
-    '웨이버스': '336060',
-    '웨이브일렉트로': '095270',
-    '웨이비스': '289930',
-    '웨이포트유한공사': '900130',
-    '웰바이오텍': '010600',
-    '웰크론': '065950',
-    '웰크론한텍': '076080',
-    '웰킵스하이텍': '043590',
-    '웹솔루스': '160350',
-    '웹스': '196700',
-    '웹젠': '069080',
-    '웹케시': '053580',
-    '위너스': '479960',
-    '위너스인프라인': '005760',
-    '위너지스': '026260',
-    '위노바': '039790',
-    '위니아': '071460',
-    '위니아에이드': '377460',
-    '위닉스': '044340',
-    '위다스': '056810',
-    '위더스기술금융': '019430',
-    '위더스제약': '330350',
-    '위드텍': '348350',
-    '위메이드': '112040',
-    '위메이드맥스': '101730',
-    '위메이드플레이': '123420',
-    '위세아이텍': '065370',
-    '위월드': '140660',
-    '위즈코프': '038620',
-    '위지윅스튜디오': '299900',
-    '위지트': '036090',
-    '위츠': '459100',
-    '윈스테크넷': '136540',
-    '윈팩': '097800',
-    '윈하이텍': '192390',
-    '윌비스': '008600',
-    '윌텍정보통신': '039390',
-    '윙스풋': '335870',
-    '윙입푸드': '900340',
-    '유나이티드': '033270',
-    '유네코': '064510',
-    '유니드': '014830',
-    '유니드비티플러스': '446070',
-    '유니드코리아': '110500',
-    '유니셈': '036200',
-    '유니슨': '018000',
-    '유니온': '000910',
-    '유니온머티리얼': '047400',
-    '유니온바이오메트릭스': '203450',
-    '유니온스틸': '003640',
-    '유니켐': '011330',
-    '유니퀘스트': '077500',
-    '유니크': '011320',
-    '유니테스트': '086390',
-    '유니테크노': '241690',
-    '유니텍전자': '039040',
-    '유니트론텍': '142210',
-    '유니포인트': '121060',
-    '유디엠텍': '389680',
-    '유디피': '091270',
-    '유라클': '088340',
-    '유라테크': '048430',
-    '유레스메리츠제1호': '073470',
-    '유리이에스': '007050',
-    '유바이오로직스': '206650',
-    '유비벨록스': '089850',
-    '유비씨': '495810',
-    '유비온': '084440',
-    '유비케어': '032620',
-    '유비쿼스': '264450',
-    '유비쿼스홀딩스': '078070',
-    '유성기업': '002920',
-    '유성티에스아이': '024870',
-    '유성티엔에스': '024800',
-    '유수홀딩스': '000700',
-    '유신': '054930',
-    '유쎌': '252370',
-    '유씨아이콜스': '065810',
-    '유아이디': '069330',
-    '유아이에너지': '050050',
-    '유아이엘': '049520',
-    '유안타제10호기업인수목적': '435380',
-    '유안타제11호스팩': '444920',
-    '유안타제12호스팩': '446150',
-    '유안타제13호스팩': '449020',
-    '유안타제14호스팩': '450940',
-    '유안타제15호스팩': '473050',
-    '유안타제16호스팩': '474490',
-    '유안타제17호스팩': '493790',
-    '유안타제2호기업인수목적': '219960',
-    '유안타제4호기업인수목적': '313750',
-    '유안타제7호기업인수목적': '367460',
-    '유안타제8호기업인수목적': '367480',
-    '유안타제9호기업인수목적': '430700',
-    '유안타증권': '003470',
-    '유에스티': '263770',
-    '유에이블': '071530',
-    '유엑스엔': '337840',
-    '유엔젤': '072130',
-    '유유제약': '000220',
-    '유일로보틱스': '388720',
-    '유일에너테크': '340930',
-    '유일엔시스': '038720',
-    '유진기업': '023410',
-    '유진기업인수목적3호': '221200',
-    '유진기업인수목적6호': '373340',
-    '유진기업인수목적7호': '388800',
-    '유진기업인수목적9호': '442130',
-    '유진로봇': '056080',
-    '유진스팩10호': '468760',
-    '유진스팩11호': '488060',
-    '유진종합개발': '023420',
-    '유진증권': '001200',
-    '유진테크': '084370',
-    '유진테크놀로지': '240600',
-    '유투바이오': '221800',
-    '유티아이': '179900',
-    '유티엑스': '045880',
-    '유틸렉스': '263050',
-    '유퍼트': '060670',
-    '유한양행': '000100',
-    '유화증권': '003460',
-    '육일씨엔에쓰': '191410',
-    '윤성에프앤씨': '372170',
-    '율촌': '146060',
-    '율촌화학': '008730',
-    '율호': '072770',
-    '으뜸상호저축은행': '032150',
-    '이건산업': '008250',
-    '이건홀딩스': '039020',
-    '이구산업': '025820',
-    '이글루': '067920',
-    '이글벳': '044960',
-    '이노뎁': '303530',
-    '이노룰스': '296640',
-    '이노메트리': '302430',
-    '이노벡스': '279060',
-    '이노블루': '066200',
-    '이노션': '214320',
-    '이노스페이스': '462350',
-    '이노시뮬레이션': '274400',
-    '이노와이어리스': '073490',
-    '이노인스트루먼트': '215790',
-    '이노진': '344860',
-    '이녹스': '088390',
-    '이녹스첨단소재': '272290',
-    '이니텍': '053350',
-    '이닉스': '452400',
-    '이디디컴퍼니': '052650',
-    '이랜시스': '264850',
-    '이랜텍': '054210',
-    '이레아이엔씨': '036900',
-    '이레전자산업': '045310',
-    '이렘': '009730',
-    '이롬텍': '045400',
-    '이루넷': '041030',
-    '이루다': '164060',
-    '이루온': '065440',
-    '이룸지엔지': '050640',
-    '이리츠코크렙': '088260',
-    '이마트': '139480',
-    '이마트에브리데이': '010090',
-    '이매진아시아': '036260',
-    '이뮨온시아': '424870',
-    '이미지스': '115610',
-    '이베스트기업인수목적3호': '225440',
-    '이베스트기업인수목적5호': '349720',
-    '이베스트스팩6호': '478110',
-    '이베스트이안기업인수목적1호': '323210',
-    '이브이첨단소재': '131400',
-    '이브이파킹서비스': '419700',
-    '이비테크': '208850',
-    '이삭엔지니어링': '351330',
-    '이상네트웍스': '080010',
-    '이성씨엔아이': '379390',
-    '이수세라믹': '032180',
-    '이수스페셜티케미컬': '457190',
-    '이수앱지스': '086890',
-    '이수페타시스': '007660',
-    '이수화학': '005950',
-    '이스타코': '015020',
-    '이스트소프트': '047560',
-    '이스트아시아홀딩스': '900110',
-    '이스트에이드': '239340',
-    '이십일스토어': '270020',
-    '이씨에스': '067010',
-    '이아이디': '093230',
-    '이앤에치': '341310',
-    '이앤텍': '047450',
-    '이에스산업': '241510',
-    '이엔셀': '456070',
-    '이엔에프테크놀로지': '102710',
-    '이엔플러스': '074610',
-    '이엘씨': '041520',
-    '이엘케이': '094190',
-    '이엘피': '063760',
-    '이엠네트웍스': '087730',
-    '이엠넷': '123570',
-    '이엠앤아이': '083470',
-    '이엠코리아': '095190',
-    '이엠텍': '091120',
-    '이엠티': '232530',
-    '이연제약': '102460',
-    '이오테크닉스': '039030',
-    '이오플로우': '294090',
-    '이원컴포텍': '088290',
-    '이월드': '084680',
-    '이즈미디어': '181340',
-    '이지바이오': '353810',
-    '이지스레지던스리츠': '350520',
-    '이지스밸류플러스리츠': '334890',
-    '이지케어텍': '099750',
-    '이지클럽': '038980',
-    '이지트로닉스': '377330',
-    '이지홀딩스': '035810',
-    '이코리아자기관리부동산투자회사': '138440',
-    '이큐셀': '160600',
-    '이크레더블': '092130',
-    '이트론': '096040',
-    '이푸른': '185280',
-    '이퓨쳐': '134060',
-    '이화공영': '001840',
-    '이화산업': '000760',
-    '이화전기': '024810',
-    '인네트': '041450',
-    '인디에프': '014990',
-    '인바디': '041830',
-    '인바이오': '352940',
-    '인바이오젠': '101140',
-    '인바이츠바이오코아': '216400',
-    '인베니아': '079950',
-    '인벤티지랩': '389470',
-    '인산가': '062580',
-    '인선이엔티': '060150',
-    '인성정보': '033230',
-    '인스웨이브': '450520',
-    '인스코비': '006490',
-    '인스프리트': '073130',
-    '인스피언': '465480',
-    '인젠': '041630',
-    '인지디스플레': '037330',
-    '인지소프트': '100030',
-    '인지컨트롤스': '023800',
-    '인천도시가스': '034590',
-    '인카금융서비스': '211050',
-    '인콘': '083640',
-    '인크레더블버즈': '064090',
-    '인크로스': '216050',
-    '인탑스': '049070',
-    '인터로이드': '311960',
-    '인터로조': '119610',
-    '인터엠': '017250',
-    '인터지스': '129260',
-    '인터코스': '240340',
-    '인터파크': '108790',
-    '인터플렉스': '051370',
-    '인터피온반도체': '014010',
-    '인텍플러스': '064290',
-    '인텔리안테크': '189300',
-    '인투셀': '287840',
-    '인트로메딕': '150840',
-    '인트론바이오': '048530',
-    '인팩': '023810',
-    '인포바인': '115310',
-    '인포뱅크': '039290',
-    '인프라웨어테크놀러지': '247300',
-    '인피니트헬스케어': '071200',
-    '인화정공': '101930',
-    '일공공일안경콘택트': '032030',
-    '일동제약': '249420',
-    '일동홀딩스': '000230',
-    '일레덱스홀딩스': '033550',
-    '일성건설': '013360',
-    '일성아이에스': '003120',
-    '일승': '333430',
-    '일신바이오': '068330',
-    '일신방직': '003200',
-    '일신석재': '007110',
-    '일양약품': '007570',
-    '일월지엠엘': '178780',
-    '일정실업': '008500',
-    '일지테크': '019540',
-    '일진다이아': '081000',
-    '일진디스플': '020760',
-    '일진전기': '103590',
-    '일진파워': '094820',
-    '일진하이솔루스': '271940',
-    '일진홀딩스': '015860',
-    '일화모직공업': '001590',
-    '잇츠한불': '226320',
-    '잉글우드랩': '950140',
-    '잉크테크': '049550',
-    '자강': '036790',
-    '자람테크놀로지': '389020',
-    '자비스': '254120',
-    '자안바이오': '221610',
-    '자연과환경': '043910',
-    '자원메디칼': '181980',
-    '자유투어': '046840',
-    '자이글': '234920',
-    '자이언트스텝': '289220',
-    '자이에스앤디': '317400',
-    '자화전자': '033240',
-    '잘만테크': '090120',
-    '장원테크': '174880',
-    '재영솔루텍': '049630',
-    '저스템': '417840',
-    '전방': '000950',
-    '전북은행': '006350',
-    '전우정밀': '120780',
-    '전진건설로봇': '079900',
-    '전진바이오팜': '110020',
-    '정다운': '208140',
-    '정상제이엘에스': '040420',
-    '정원엔시스': '045510',
-    '제낙스': '065620',
-    '제너비오믹스': '017010',
-    '제너셈': '217190',
-    '제너시스템즈': '073930',
-    '제네시스디벨롭먼트홀딩스': '053320',
-    '제네시스엔알디': '052640',
-    '제넥셀세인': '034660',
-    '제넥신': '095700',
-    '제넨바이오': '072520',
-    '제노레이': '122310',
-    '제노코': '361390',
-    '제노텍': '066830',
-    '제놀루션': '225220',
-    '제닉': '123330',
-    '제닉스': '381620',
-    '제로원인터랙티브': '069470',
-    '제로투세븐': '159580',
-    '제룡산업': '147830',
-    '제룡전기': '033100',
-    '제우스': '079370',
-    '제이브이엠': '054950',
-    '제이스코홀딩스': '023440',
-    '제이스텍': '090470',
-    '제이시스메디칼': '287410',
-    '제이씨케미칼': '137950',
-    '제이씨현시스템': '033320',
-    '제이아이테크': '417500',
-    '제이알글로벌리츠': '348950',
-    '제이앤유글로벌': '086200',
-    '제이앤케이인더스트리': '039230',
-    '제이앤티씨': '204270',
-    '제이에스': '037110',
-    '제이에스링크': '127120',
-    '제이에스전선': '005560',
-    '제이에스코퍼레이션': '194370',
-    '제이에스티나': '026040',
-    '제이에스피브이': '250300',
-    '제이엔비': '452160',
-    '제이엔케이글로벌': '126880',
-    '제이엘케이': '322510',
-    '제이엠멀티': '254160',
-    '제이엠아이': '033050',
-    '제이엠티': '094970',
-    '제이엠피': '054790',
-    '제이오': '418550',
-    '제이웨이': '058420',
-    '제이준코스메틱': '025620',
-    '제이콤': '060750',
-    '제이투케이바이오': '420570',
-    '제이티': '089790',
-    '제일기획': '030000',
-    '제일모직': '001300',
-    '제일바이오': '052670',
-    '제일약품': '271980',
-    '제일엠앤에스': '412540',
-    '제일연마': '001560',
-    '제일일렉트릭': '199820',
-    '제일저축은행': '024100',
-    '제일창업투자': '026540',
-    '제일테크노스': '038010',
-    '제일파마홀딩스': '002620',
-    '제일화재해상보험': '000610',
-    '제주반도체': '080220',
-    '제주은행': '006220',
-    '제주항공': '089590',
-    '제테마': '216080',
-    '젝시믹스': '337930',
-    '젠큐릭스': '229000',
-    '젬': '248020',
-    '젬백스': '082270',
-    '조광ILI': '044060',
-    '조광페인트': '004910',
-    '조광피혁': '004700',
-    '조비': '001550',
-    '조선내화': '462520',
-    '조선선재': '120030',
-    '조아제약': '034940',
-    '조은저축은행': '031920',
-    '조이시티': '067000',
-    '조이토토': '044370',
-    '조인에너지': '004820',
-    '조일알미늄': '018470',
-    '조흥': '002600',
-    '종근당': '185750',
-    '종근당바이오': '063160',
-    '종근당홀딩스': '001630',
-    '좋은사람들': '033340',
-    '주노콜렉션': '221670',
-    '주성엔지니어링': '036930',
-    '주성코퍼레이션': '109070',
-    '주연테크': '044380',
-    '줌인터넷': '229480',
-    '중국고섬공고유한공사': '950070',
-    '중국식품포장유한공사': '900060',
-    '중국원양자원유한공사': '900050',
-    '중앙건설': '015110',
-    '중앙디자인': '030030',
-    '중앙바이오텍': '015170',
-    '중앙백신': '072020',
-    '중앙에너비스': '000440',
-    '중앙제지': '005600',
-    '중앙첨단소재': '051980',
-    '지나인제약': '078650',
-    '지노믹트리': '228760',
-    '지노시스템': '033850',
-    '지놈앤컴퍼니': '314130',
-    '지누스': '013890',
-    '지니너스': '389030',
-    '지니언스': '263860',
-    '지니웍스': '036600',
-    '지니틱스': '303030',
-    '지더블유바이텍': '036180',
-    '지디': '155960',
-    '지디코프': '036610',
-    '지란지교시큐리티': '208350',
-    '지비에스': '076170',
-    '지성이씨에스': '138290',
-    '지스마트글로벌': '114570',
-    '지슨': '289860',
-    '지씨셀': '144510',
-    '지씨지놈': '340450',
-    '지아이바이오': '035450',
-    '지아이이노베이션': '358570',
-    '지아이텍': '382480',
-    '지앤디윈텍': '061050',
-    '지앤비에스 에코': '382800',
-    '지앤알': '043630',
-    '지앤에스티': '036920',
-    '지앤엘': '014590',
-    '지앤이헬스케어': '299480',
-    '지어소프트': '051160',
-    '지에스엔텍': '037640',
-    '지에스이': '053050',
-    '지에스홈쇼핑': '028150',
-    '지에이이노더스': '076340',
-    '지에프씨생명과학': '388610',
-    '지엔씨에너지': '119850',
-    '지엔코': '065060',
-    '지엔텍홀딩스': '065410',
-    '지엘팜텍': '204840',
-    '지엠비코리아': '013870',
-    '지역난방공사': '071320',
-    '지오엘리먼트': '311320',
-    '지오엠씨': '033030',
-    '지유온': '111820',
-    '지케이파워': '054020',
-    '지투파워': '388050',
-    '지티앤티': '053870',
-    '진도': '088790',
-    '진로발효': '018120',
-    '진매트릭스': '109820',
-    '진바이오텍': '086060',
-    '진성티이씨': '036890',
-    '진시스템': '363250',
-    '진양산업': '003780',
-    '진양제약': '007370',
-    '진양폴리우레탄': '010640',
-    '진양홀딩스': '100250',
-    '진양화학': '051630',
-    '진에어': '272450',
-    '진영': '285800',
-    '진원생명과학': '011000',
-    '진코스텍': '250030',
-    '진흥기업': '002780',
-    '진흥저축은행': '007200',
-    '질경이': '233990',
-    '차바이오텍': '085660',
-    '차백신연구소': '261780',
-    '차이나그레이트스타인터내셔널리미티드': '900040',
-    '차이나하오란리사이클링유한공사': '900090',
-    '차이커뮤니케이션': '351870',
-    '참엔지니어링': '009310',
-    '참존글로벌': '158310',
-    '참좋은여행': '094850',
-    '창대정밀': '368030',
-    '창민테크': '042960',
-    '창해에탄올': '004650',
-    '천보': '278280',
-    '천일고속': '000650',
-    '천지산업': '001490',
-    '청광건설': '140290',
-    '청담글로벌': '362320',
-    '청람디지탈': '035270',
-    '청호ICT': '012600',
-    '체리부로': '066360',
-    '체시스': '033250',
-    '초록뱀미디어': '047820',
-    '칩스앤미디어': '094360',
-    '카라반케이디이': '032570',
-    '카스': '016920',
-    '카스코': '005330',
-    '카이노스메드': '284620',
-    '카이바이오텍': '446600',
-    '카카오': '035720',
-    '카카오게임즈': '293490',
-    '카카오뱅크': '323410',
-    '카카오엠': '016170',
-    '카카오페이': '377300',
-    '카티스': '140430',
-    '카페24': '042000',
-    '카프로': '006380',
-    '캐로스': '260490',
-    '캐리': '313760',
-    '캐리소프트': '317530',
-    '캐스텍코리아': '071850',
-    '캐프': '198080',
-    '캔버스엔': '210120',
-    '캠브리지코오롱': '004620',
-    '캠시스': '050110',
-    '캡스톤파트너스': '452300',
-    '커넥트웨이브': '119860',
-    '컨텍': '451760',
-    '컬러레이': '900310',
-    '컴투스': '078340',
-    '컴투스홀딩스': '063080',
-    '컴퍼니케이': '307930',
-    '케너텍': '062730',
-    '케드콤': '011050',
-    '케미메디': '205290',
-    '케스피온': '079190',
-    '케어랩스': '263700',
-    '케어룸의료산업': '327970',
-    '케어젠': '214370',
-    '케이디세코': '073780',
-    '케이디지엠텍': '032290',
-    '케이디켐': '221980',
-    '케이만금세기차륜집단유한공사': '900280',
-    '케이맥': '043290',
-    '케이바이오': '038530',
-    '케이비드림투게더제3호기업인수목적': '221950',
-    '케이비물산': '008540',
-    '케이비부국제1호개발전문위탁관리부동산투자회사': '149130',
-    '케이비아이동국실업': '001620',
-    '케이비제17호기업인수목적': '317030',
-    '케이비제18호기업인수목적': '323940',
-    '케이비제19호기업인수목적': '330990',
-    '케이비제20호기업인수목적': '342550',
-    '케이비제21호기업인수목적': '424140',
-    '케이비제22호기업인수목적': '436530',
-    '케이비제23호기업인수목적': '440200',
-    '케이비제26호기업인수목적': '458320',
-    '케이비제28호기업인수목적': '476470',
-    '케이비제8호기업인수목적': '222390',
-    '케이비제9호기업인수목적': '232270',
-    '케이비증권': '003450',
-    '케이비캐피탈': '021960',
-    '케이사인': '192250',
-    '케이쓰리아이': '431190',
-    '케이씨': '029460',
-    '케이씨더블류': '068060',
-    '케이씨씨': '002380',
-    '케이씨씨글라스': '344820',
-    '케이씨에스': '115500',
-    '케이씨텍': '281820',
-    '케이씨티': '089150',
-    '케이씨티시': '009070',
-    '케이씨피드': '025880',
-    '케이아이엔엑스': '093320',
-    '케이알': '035950',
-    '케이알엠': '093640',
-    '케이알제2호개발전문위탁관리부동산투자회사': '101790',
-    '케이에스리소스': '066340',
-    '케이에스피': '073010',
-    '케이엑스넥스지': '081970',
-    '케이엔더블유': '105330',
-    '케이엔솔': '053080',
-    '케이엔씨글로벌': '068150',
-    '케이엔알시스템': '199430',
-    '케이엔에스': '432470',
-    '케이엔에스홀딩스': '036760',
-    '케이엔제이': '272110',
-    '케이엔티': '036590',
-    '케이엘넷': '039420',
-    '케이엠': '083550',
-    '케이엠더블유': '032500',
-    '케이엠에스': '038830',
-    '케이엠에이치': '009690',
-    '케이엠제약': '225430',
-    '케이옥션': '102370',
-    '케이웨더': '068100',
-    '케이이엔지': '077960',
-    '케이이엠텍': '106080',
-    '케이조선': '067250',
-    '케이지에이': '455180',
-    '케이카': '381970',
-    '케이탑리츠': '145270',
-    '케이티': '030200',
-    '케이티비기업인수목적1호': '204650',
-    '케이티스카이라이프': '053210',
-    '케이티씨텔레콤': '055810',
-    '케이티알파': '036030',
-    '케이티앤지': '033780',
-    '케이티프리텔': '032390',
-    '케이프': '064820',
-    '케이프이에스제4호기업인수목적': '347140',
-    '케이피에프': '024880',
-    '케이피엠테크': '042040',
-    '케이피케미칼': '064420',
-    '케이피티유': '054410',
-    '케일럼': '258610',
-    '켄코아에어로스페이스': '274090',
-    '켈스': '402420',
-    '켐온': '217600',
-    '켐트로닉스': '089010',
-    '켐트로스': '220260',
-    '코나솔': '176590',
-    '코나아이': '052400',
-    '코난테크놀로지': '402030',
-    '코너스톤네트웍스': '033110',
-    '코닉오토메이션': '391710',
-    '코다코': '046070',
-    '코데즈컴바인': '047770',
-    '코디': '080530',
-    '코디콤': '041800',
-    '코람코더원리츠': '417310',
-    '코람코라이프인프라리츠': '357120',
-    '코렌텍': '104540',
-    '코리아나': '027050',
-    '코리아센터': '290510',
-    '코리아써키트': '007810',
-    '코리아에셋투자증권': '190650',
-    '코리아에프티': '123410',
-    '코리아오토글라스': '152330',
-    '코리아이앤디': '027440',
-    '코리아퍼시픽01호선박투자회사': '090970',
-    '코리아퍼시픽02호선박투자회사': '090980',
-    '코리아퍼시픽03호선박투자회사': '090990',
-    '코리아퍼시픽04호선박투자회사': '091000',
-    '코리아퍼시픽05호선박투자회사': '093400',
-    '코리아퍼시픽06호선박투자회사': '093410',
-    '코리아퍼시픽07호선박투자회사': '099210',
-    '코리안리': '003690',
-    '코리언일랙트로닉스파워소스': '046810',
-    '코맥스': '036690',
-    '코메론': '049430',
-    '코미코': '183300',
-    '코미팜': '041960',
-    '코세스': '089890',
-    '코셈': '360350',
-    '코셋': '189350',
-    '코스나인': '082660',
-    '코스맥스': '192820',
-    '코스맥스비티아이': '044820',
-    '코스맥스엔비티': '222040',
-    '코스메카코리아': '241710',
-    '코스모스피엘씨': '053170',
-    '코스모신소재': '005070',
-    '코스모화학': '005420',
-    '코스온': '069110',
-    '코스텍시스': '355150',
-    '코스텍시스템': '169670',
-    '코썬바이오': '204990',
-    '코아스': '071950',
-    '코아스템켐온': '166480',
-    '코아시아': '045970',
-    '코아시아씨엠': '196450',
-    '코아에스앤아이': '052350',
-    '코아정보시스템': '039990',
-    '코어라인소프트': '384470',
-    '코어비트': '056850',
-    '코엔텍': '029960',
-    '코오롱': '002020',
-    '코오롱ENP': '138490',
-    '코오롱글로벌': '003070',
-    '코오롱머티리얼': '144620',
-    '코오롱모빌리티그룹': '450140',
-    '코오롱생명과학': '102940',
-    '코오롱아이넷': '022520',
-    '코오롱유화': '011020',
-    '코오롱인더': '120110',
-    '코오롱인터내셔널': '063510',
-    '코오롱티슈진': '950160',
-    '코원에너지서비스': '026870',
-    '코원플레이': '056000',
-    '코웨이': '021240',
-    '코웰이홀딩스유한공사': '900020',
-    '코웰패션': '033290',
-    '코위버': '056360',
-    '코윈테크': '282880',
-    '코이즈': '121850',
-    '코츠테크놀로지': '448710',
-    '코칩': '126730',
-    '코콤': '015710',
-    '코크렙제15호기업구조조정부동산투자회사': '121550',
-    '코크렙제1호기업구조조정부동산투자회사': '067910',
-    '코크렙제2호기업구조조정부동산투자회사': '070540',
-    '코크렙제3호CR리츠': '073530',
-    '코크렙제7호위탁관리부동산투자회사': '086720',
-    '코크렙제8호위탁관리부동산투자회사': '090540',
-    '코텍': '052330',
-    '코퍼스코리아': '322780',
-    '콘텐트리중앙': '036420',
-    '콜마비앤에이치': '200130',
-    '콜마파마': '038710',
-    '콜마홀딩스': '024720',
-    '쿠첸': '225650',
-    '쿠콘': '294570',
-    '쿠쿠홀딩스': '192400',
-    '쿠쿠홈시스': '284740',
-    '쿨투': '056020',
-    '퀀타매트릭스': '317690',
-    '퀀타피아': '078940',
-    '퀀텀온': '227100',
-    '퀄리타스반도체': '432720',
-    '큐라켐': '456190',
-    '큐라클': '365270',
-    '큐라티스': '348080',
-    '큐러블': '086460',
-    '큐렉소': '060280',
-    '큐로셀': '372320',
-    '큐로홀딩스': '051780',
-    '큐리언트': '115180',
-    '큐리옥스바이오시스템즈': '445680',
-    '큐브엔터': '182360',
-    '큐알티': '405100',
-    '큐에스아이': '066310',
-    '큐엠씨': '136660',
-    '큐캐피탈': '016600',
-    '크라우드웍스': '355390',
-    '크라운제과': '264900',
-    '크라운해태홀딩스': '005740',
-    '크래프톤': '259960',
-    '크레버스': '096240',
-    '크레오에스지': '040350',
-    '크로넥스': '215570',
-    '크루셜텍': '114120',
-    '크리스에프앤씨': '110790',
-    '크리스탈신소재': '900250',
-    '크린앤사이언스': '045520',
-    '클라스타': '037550',
-    '클래시스': '214150',
-    '클로봇': '466100',
-    '클루넷': '067130',
-    '클리오': '237880',
-    '키네마스터': '139670',
-    '키다리스튜디오': '020120',
-    '키스트론': '475430',
-    '키움제10호스팩': '487720',
-    '키움제11호스팩': '489480',
-    '키움제3호기업인수목적': '218710',
-    '키움제4호기업인수목적': '226850',
-    '키움제5호기업인수목적': '311270',
-    '키움제6호기업인수목적': '413600',
-    '키움제7호기업인수목적': '433530',
-    '키움제8호스팩': '446840',
-    '키움증권': '039490',
-    '키이스트': '054780',
-    '킵스파마': '256940',
-    '타스컴': '336040',
-    '타이거일렉': '219130',
-    '타이드': '346010',
-    '타임기술': '318660',
-    '타조엔터테인먼트': '476710',
-    '탈로스': '434190',
-    '탑런토탈솔루션': '336680',
-    '탑머티리얼': '360070',
-    '탑선': '180060',
-    '탑엔지니어링': '065130',
-    '탑코미디어': '134580',
-    '태경비케이': '014580',
-    '태경산업': '015890',
-    '태경케미컬': '006890',
-    '태경피엔에스': '235090',
-    '태광': '023160',
-    '태광산업': '003240',
-    '태광이엔시': '048140',
-    '태림페이퍼': '019300',
-    '태림포장': '011280',
-    '태산엘시디': '036210',
-    '태성': '323280',
-    '태양': '053620',
-    '태양3C': '052960',
-    '태양금속공업': '004100',
-    '태양기계': '116100',
-    '태영건설': '009410',
-    '태웅': '044490',
-    '태웅로직스': '124560',
-    '태원물산': '001420',
-    '태창기업': '007490',
-    '태창파로스': '039850',
-    '터보테크': '032420',
-    '테고사이언스': '191420',
-    '테라사이언스': '073640',
-    '테라셈': '182690',
-    '테라젠이텍스': '066700',
-    '테라텍': '151750',
-    '테스': '095610',
-    '테스텍': '048510',
-    '테이크시스템즈': '076090',
-    '테이팩스': '055490',
-    '테크메이트': '043690',
-    '테크엔': '308700',
-    '테크엘': '064520',
-    '테크윙': '089030',
-    '테크트랜스': '258050',
-    '텔라움': '047730',
-    '텔레칩스': '054450',
-    '텔슨전자': '027350',
-    '텔슨정보통신': '018180',
-    '텔코웨어': '078000',
-    '텔콘RF제약': '200230',
-    '토니모리': '214420',
-    '토마토시스템': '393210',
-    '토모큐브': '475960',
-    '토박스코리아': '215480',
-    '토비스': '051360',
-    '토자이홀딩스': '037700',
-    '토탈소프트': '045340',
-    '톱텍': '108230',
-    '투미비티': '058900',
-    '투비소프트': '079970',
-    '툴젠': '199800',
-    '툴코리아': '110660',
-    '트라이써클': '034010',
-    '트라이콤': '038410',
-    '트래픽아이티에스': '038050',
-    '트러스와이제7호위탁관리부동산투자회사': '140890',
-    '트레스': '102210',
-    '트레이스': '052290',
-    '트루엔': '417790',
-    '트리니티': '053070',
-    '트윔': '290090',
-    '특수건설': '026150',
-    '티디에스팜': '464280',
-    '티로보틱스': '117730',
-    '티브로드도봉강북방송': '035210',
-    '티브로드한빛방송': '043890',
-    '티비씨': '033830',
-    '티비에이치글로벌': '084870',
-    '티사이언티픽': '057680',
-    '티쓰리': '204610',
-    '티씨머티리얼즈': '125020',
-    '티씨케이': '064760',
-    '티앤알바이오팹': '246710',
-    '티앤엘': '340570',
-    '티에스넥스젠': '043220',
-    '티에스아이': '277880',
-    '티에스이': '131290',
-    '티에스트릴리온': '284610',
-    '티에이치엔': '019180',
-    '티에프이': '425420',
-    '티엑스알로보틱스': '484810',
-    '티엔아이': '066350',
-    '티엔엔터테인먼트': '131100',
-    '티엘비': '356860',
-    '티엘아이': '062860',
-    '티엘엔지니어링': '413300',
-    '티와이홀딩스': '363280',
-    '티움바이오': '321550',
-    '티웨이항공': '091810',
-    '티웨이홀딩스': '004870',
-    '티이씨': '067950',
-    '티이씨앤코': '008900',
-    '티이엠씨': '425040',
-    '티이엠씨씨엔에스': '241790',
-    '티케이지애강': '022220',
-    '티케이지휴켐스': '069260',
-    '티케이케미칼': '104480',
-    '티티씨디펜스': '309900',
-    '티플랙스': '081150',
-    '티피씨글로벌': '130740',
-    '틸론': '217880',
-    '팅크웨어': '084730',
-    '파나케이아': '058530',
-    '파두': '440110',
-    '파라다이스': '034230',
-    '파라텍': '033540',
-    '파로스아이바이오': '388870',
-    '파루': '043200',
-    '파마리서치': '214450',
-    '파마리서치바이오': '217950',
-    '파멥신': '208340',
-    '파미셀': '005690',
-    '파버나인': '177830',
-    '파브코': '101990',
-    '파세코': '037070',
-    '파수': '150900',
-    '파워넷': '037030',
-    '파워로직스': '047310',
-    '파워풀엑스': '266870',
-    '파이버프로': '368770',
-    '파이오링크': '170790',
-    '파인넥스': '123260',
-    '파인디앤씨': '049120',
-    '파인디지털': '038950',
-    '파인메딕스': '387570',
-    '파인엠텍': '441270',
-    '파인테크닉스': '106240',
-    '파인텍': '131760',
-    '파커스': '065690',
-    '파크시스템스': '140860',
-    '파트론': '091700',
-    '팍스넷': '038160',
-    '판도라티비': '202960',
-    '판타지오': '032800',
-    '팜스빌': '318010',
-    '팜스코': '036580',
-    '팜스토리': '027710',
-    '팜젠사이언스': '004720',
-    '팡스카이': '266350',
-    '패션플랫폼': '225590',
-    '팬스타엔터프라이즈': '054300',
-    '팬엔터테인먼트': '068050',
-    '팬오션': '028670',
-    '팬젠': '222110',
-    '팬택앤큐리텔': '063350',
-    '팬택자산관리': '025930',
-    '팬텀엔터테인먼트그룹': '025460',
-    '팸텍': '271830',
-    '퍼스텍': '010820',
-    '퍼시스': '016800',
-    '퍼시픽글라스': '009080',
-    '펄어비스': '263750',
-    '펌텍코리아': '251970',
-    '페이퍼코리아': '001020',
-    '펨토바이오메드': '327610',
-    '펨트론': '168360',
-    '펩트론': '087010',
-    '평산': '089480',
-    '평산차업집단유한공사': '950010',
-    '평안물산': '037240',
-    '평화산업': '090080',
-    '평화홀딩스': '010770',
-    '포네이처': '045290',
-    '포넷': '048270',
-    '포니링크': '064800',
-    '포메탈': '119500',
-    '포바이포': '389140',
-    '포스뱅크': '105760',
-    '포스코DX': '022100',
-    '포스코스틸리온': '058430',
-    '포스코엠텍': '009520',
-    '포스코인터내셔널': '047050',
-    '포스코티엠씨': '010150',
-    '포스코퓨처엠': '003670',
-    '포시에스': '189690',
-    '포이보스': '038810',
-    '포인트모바일': '318020',
-    '포인트엔지니어링': '256630',
-    '포커스에이아이': '331380',
-    '포톤': '208710',
-    '포휴먼': '049690',
-    '폭스소프트': '354230',
-    '폰드그룹': '472850',
-    '폴라리스AI': '039980',
-    '폴라리스AI파마': '041910',
-    '폴라리스세원': '234100',
-    '폴라리스오피스': '041020',
-    '폴라리스우노': '114630',
-    '폴루스바이오팜': '007630',
-    '폴리플러스': '065610',
-    '폴켐': '033190',
-    '푸드나무': '290720',
-    '푸드웰': '005670',
-    '푸른기술': '094940',
-    '푸른소나무': '057880',
-    '푸른저축은행': '007330',
-    '풀무원': '017810',
-    '풀무원식품': '103160',
-    '풍강': '093380',
-    '풍국주정': '023900',
-    '풍림산업': '001310',
-    '풍산': '103140',
-    '풍산홀딩스': '005810',
-    '풍원정밀': '371950',
-    '퓨런티어': '370090',
-    '퓨릿': '445180',
-    '퓨얼셀파워': '139170',
-    '퓨전': '195440',
-    '퓨처코어': '151910',
-    '퓨쳐메디신': '341170',
-    '퓨쳐비젼': '042570',
-    '퓨쳐인포넷': '058690',
-    '퓨쳐켐': '220100',
-    '프럼파스트': '035200',
-    '프레스티지바이오로직스': '334970',
-    '프레스티지바이오파마': '950210',
-    '프렉코': '082220',
-    '프로비타': '014420',
-    '프로이천': '321260',
-    '프로젠': '296160',
-    '프로텍': '053610',
-    '프로티나': '468530',
-    '프로티아': '303360',
-    '프롬바이오': '377220',
-    '프리시젼바이오': '335810',
-    '프리엠스': '053160',
-    '프리젠': '060910',
-    '플라즈맵': '405000',
-    '플래닛팔이': '057330',
-    '플래스크': '041590',
-    '플래티어': '367000',
-    '플랜텍': '051310',
-    '플랜티넷': '075130',
-    '플러스프로핏': '036660',
-    '플럼라인생명과학': '222670',
-    '플레이그램': '009810',
-    '플레이디': '237820',
-    '플레이위드': '023770',
-    '플렉스컴': '065270',
-    '플루토스': '019570',
-    '플리토': '300080',
-    '피노': '033790',
-    '피노텍': '150440',
-    '피더블유제네틱스': '065910',
-    '피델릭스': '032580',
-    '피씨디렉트': '051380',
-    '피씨엘': '241820',
-    '피아이이': '452450',
-    '피앤씨테크': '237750',
-    '피앤에스로보틱스': '460940',
-    '피앤텔': '054340',
-    '피에스케이': '319660',
-    '피에스케이홀딩스': '031980',
-    '피에스텍': '002230',
-    '피에이치에이': '043370',
-    '피엔아이컴퍼니': '242350',
-    '피엔에스커튼월': '033220',
-    '피엔에이치테크': '239890',
-    '피엔케이피부임상연구센타': '347740',
-    '피엔티': '137400',
-    '피엔티엠에스': '257370',
-    '피엘에이': '082390',
-    '피엠디아카데미': '144740',
-    '피엠티': '147760',
-    '피제이메탈': '128660',
-    '피제이전자': '006140',
-    '피케이엘': '039870',
-    '피코그램': '376180',
-    '피코소프트': '039580',
-    '피플바이오': '304840',
-    '픽셀플러스': '087600',
-    '핀텔': '291810',
-    '필에너지': '378340',
-    '필옵틱스': '161580',
-    '핌스': '347770',
-    '핑거': '163730',
-    '핑거스토리': '417180',
-    '하나26호스팩': '446750',
-    '하나27호스팩': '448370',
-    '하나28호스팩': '454750',
-    '하나29호스팩': '454640',
-    '하나30호스팩': '469880',
-    '하나31호스팩': '469900',
-    '하나32호스팩': '475240',
-    '하나33호스팩': '475250',
-    '하나34호스팩': '484130',
-    '하나IB증권': '003330',
-    '하나금융14호기업인수목적': '332710',
-    '하나금융15호기업인수목적': '341160',
-    '하나금융16호기업인수목적': '343510',
-    '하나금융19호기업인수목적': '388220',
-    '하나금융20호기업인수목적': '400560',
-    '하나금융21호기업인수목적': '406760',
-    '하나금융22호기업인수목적': '418170',
-    '하나금융23호기업인수목적': '427950',
-    '하나금융24호기업인수목적': '430230',
-    '하나금융25호기업인수목적': '435620',
-    '하나금융지주': '086790',
-    '하나기술': '299030',
-    '하나마이크론': '067310',
-    '하나머스트3호기업인수목적': '208870',
-    '하나머스트7호기업인수목적': '372290',
-    '하나머스트제6호기업인수목적': '307160',
-    '하나머티리얼즈': '166090',
-    '하나유비에스암바토비니켈해외자원개발1호': '099340',
-    '하나유비에스암바토비니켈해외자원개발2호': '099350',
-    '하나은행': '004940',
-    '하나제약': '293480',
-    '하나투어': '039130',
-    '하림': '136480',
-    '하림지주': '003380',
-    '하림홀딩스': '024660',
-    '하스': '450330',
-    '하스코': '012760',
-    '하우리': '049130',
-    '하이골드오션12호국제선박투자회사': '172580',
-    '하이골드오션2호선박투자회사': '139200',
-    '하이골드오션3호선박투자회사': '153360',
-    '하이골드오션8호국제선박투자회사': '159650',
-    '하이드로리튬': '101670',
-    '하이딥': '365590',
-    '하이럭스': '079340',
-    '하이로닉': '149980',
-    '하이록코리아': '013030',
-    '하이브': '352820',
-    '하이비젼시스템': '126700',
-    '하이스마텍': '057100',
-    '하이스틸': '071090',
-    '하이에이아이1호기업인수목적': '235010',
-    '하이제5호기업인수목적': '340120',
-    '하이제6호기업인수목적': '377400',
-    '하이제7호기업인수목적': '400840',
-    '하이제8호스팩': '450050',
-    '하이젠알앤엠': '160190',
-    '하이즈항공': '221840',
-    '하이콤정보통신': '048540',
-    '하이텍팜': '106190',
-    '하이트맥주': '103150',
-    '하이트진로': '000080',
-    '하이트진로홀딩스': '000140',
-    '하이퍼코퍼레이션': '065650',
-    '하츠': '066130',
-    '한강구조조정기금': '036060',
-    '한국ANKOR유전': '152550',
-    '한국가구': '004590',
-    '한국가스공사': '036460',
-    '한국경제TV': '039340',
-    '한국고덴시': '027840',
-    '한국공항': '005430',
-    '한국금융지주': '071050',
-    '한국기술산업': '008320',
-    '한국기업평가': '034950',
-    '한국내화': '010040',
-    '한국단자공업': '025540',
-    '한국맥널티': '222980',
-    '한국무브넥스': '010100',
-    '한국미라클피플사': '331660',
-    '한국베트남15-1유전해외자원개발투자회사': '093820',
-    '한국비엔씨': '256840',
-    '한국비티비': '219750',
-    '한국석유공업': '004090',
-    '한국선재': '025550',
-    '한국수출포장공업': '002200',
-    '한국쉘석유': '002960',
-    '한국스탠다드차타드은행': '000110',
-    '한국씨티은행': '016830',
-    '한국아트라스비엑스': '023890',
-    '한국알콜': '017890',
-    '한국애보트진단': '066930',
-    '한국앤컴퍼니': '000240',
-    '한국월드와이드베트남부동산개발특별자산1호투자회사': '096300',
-    '한국월드와이드아시아태평양특별자산1호투자회사': '098150',
-    '한국유니온제약': '080720',
-    '한국자산신탁': '123890',
-    '한국저축은행': '025610',
-    '한국전기초자': '009720',
-    '한국전력공사': '015760',
-    '한국전자인증': '041460',
-    '한국전자홀딩스': '006200',
-    '한국정밀기계': '101680',
-    '한국정보공학': '039740',
-    '한국정보인증': '053300',
-    '한국정보통신': '025770',
-    '한국제10호기업인수목적': '409570',
-    '한국제11호기업인수목적': '436610',
-    '한국제12호스팩': '458610',
-    '한국제13호스팩': '464440',
-    '한국제14호기업인수목적': '477530',
-    '한국제15호스팩': '479880',
-    '한국제4호기업인수목적': '240540',
-    '한국제5호기업인수목적': '271740',
-    '한국제6호기업인수목적': '281410',
-    '한국제7호기업인수목적': '291210',
-    '한국제지': '027970',
-    '한국종합기술': '023350',
-    '한국주강': '025890',
-    '한국주철관공업': '000970',
-    '한국지주': '009760',
-    '한국철강': '104700',
-    '한국첨단소재': '062970',
-    '한국카본': '017960',
-    '한국캐피탈': '023760',
-    '한국컴퓨터': '054040',
-    '한국콜마': '161890',
-    '한국큐빅': '021650',
-    '한국타이어앤테크놀로지': '161390',
-    '한국테크놀로지': '053590',
-    '한국토지신탁': '034830',
-    '한국통신데이타': '045760',
-    '한국투자신성장1호기업인수목적회사': '123290',
-    '한국투자파트너스': '019560',
-    '한국투자패러랠유전해외자원개발특별자산투자회사1호(지분증권)': '168490',
-    '한국특강': '007280',
-    '한국파마': '032300',
-    '한국팩키지': '037230',
-    '한국피아이엠': '448900',
-    '한국합섬': '025830',
-    '한국항공우주': '047810',
-    '한국화장품': '123690',
-    '한국화장품제조': '003350',
-    '한글과컴퓨터': '030520',
-    '한네트': '052600',
-    '한농화성': '011500',
-    '한도하이테크': '060660',
-    '한독': '002390',
-    '한독크린텍': '256150',
-    '한라IMS': '092460',
-    '한림창업투자': '021060',
-    '한마음상호저축은행': '025450',
-    '한메엔에스': '006150',
-    '한미글로벌': '053690',
-    '한미반도체': '042700',
-    '한미사이언스': '008930',
-    '한미약품': '128940',
-    '한빛네트': '036720',
-    '한빛레이저': '452190',
-    '한빛소프트': '047080',
-    '한샘': '009240',
-    '한서제약': '044070',
-    '한선엔지니어링': '452280',
-    '한섬': '020000',
-    '한성기업': '003680',
-    '한성크린텍': '066980',
-    '한세실업': '105630',
-    '한세엠케이': '069640',
-    '한세예스24홀딩스': '016450',
-    '한솔로지스틱스': '009180',
-    '한솔아이원스': '114810',
-    '한솔아트원제지': '007190',
-    '한솔인티큐브': '070590',
-    '한솔제지': '213500',
-    '한솔케미칼': '014680',
-    '한솔테크닉스': '004710',
-    '한솔피엔에스': '010420',
-    '한솔홀딩스': '004150',
-    '한솔홈데코': '025750',
-    '한송네오텍': '226440',
-    '한스바이오메드': '042520',
-    '한신공영': '004960',
-    '한신기계공업': '011700',
-    '한신코퍼레이션': '037120',
-    '한싹': '430690',
-    '한아시스템': '036020',
-    '한양디지텍': '078350',
-    '한양이엔지': '045100',
-    '한양증권': '001750',
-    '한온시스템': '018880',
-    '한올바이오파마': '009420',
-    '한와이어리스': '037020',
-    '한울반도체': '320000',
-    '한울비앤씨': '214870',
-    '한울소재과학': '091440',
-    '한울앤제주': '276730',
-    '한익스프레스': '014130',
-    '한일건설': '006440',
-    '한일네트웍스': '046110',
-    '한일단조': '024740',
-    '한일사료': '005860',
-    '한일시멘트': '300720',
-    '한일약품공업': '003040',
-    '한일철강': '002220',
-    '한일현대시멘트': '006390',
-    '한일홀딩스': '003300',
-    '한일화학': '007770',
-    '한전KPS': '051600',
-    '한전기술': '052690',
-    '한전산업': '130660',
-    '한주라이트메탈': '198940',
-    '한주에이알티': '058450',
-    '한중엔시에스': '107640',
-    '한진': '002320',
-    '한진중공업홀딩스': '003480',
-    '한진칼': '180640',
-    '한진피앤씨': '061460',
-    '한진해운': '117930',
-    '한창': '005110',
-    '한창산업': '079170',
-    '한창제지': '009460',
-    '한컴라이프케어': '372910',
-    '한컴위드': '054920',
-    '한컴지엠디': '077280',
-    '한켐': '457370',
-    '한탑': '002680',
-    '한텍': '098070',
-    '한텔': '041940',
-    '한프': '066110',
-    '한화': '000880',
-    '한화갤러리아': '452260',
-    '한화갤러리아타임월드': '027390',
-    '한화리츠': '451800',
-    '한화비전': '489790',
-    '한화생명': '088350',
-    '한화손해보험': '000370',
-    '한화솔루션': '009830',
-    '한화수성기업인수목적': '265920',
-    '한화시스템': '272210',
-    '한화에스브이명장제1호기업인수목적': '124050',
-    '한화에스비아이기업인수목적': '317320',
-    '한화에어로스페이스': '012450',
-    '한화에이스기업인수목적2호': '219860',
-    '한화에이스기업인수목적3호': '264290',
-    '한화에이스기업인수목적4호': '279410',
-    '한화엔진': '082740',
-    '한화오션': '042660',
-    '한화투자증권': '003530',
-    '한화플러스제2호기업인수목적': '386580',
-    '한화플러스제3호기업인수목적': '430460',
-    '한화플러스제4호스팩': '455310',
-    '한화플러스제5호스팩': '498390',
-    '한화화인케미칼': '025850',
-    '해성디에스': '195870',
-    '해성산업': '034810',
-    '해성에어로보틱스': '059270',
-    '해성옵틱스': '076610',
-    '해원에스티': '058480',
-    '해태제과식품': '101530',
-    '해피드림': '065180',
-    '핸디소프트': '220180',
-    '핸즈코퍼레이션': '143210',
-    '행남사': '008800',
-    '허메스홀딩스': '012400',
-    '헝셩그룹': '900270',
-    '헤쎄나': '036270',
-    '헤파호프코리아': '039350',
-    '헥토이노베이션': '214180',
-    '헥토파이낸셜': '234340',
-    '헬릭스미스': '084990',
-    '현대ADM': '187660',
-    '현대DSF': '016510',
-    '현대건설': '000720',
-    '현대경매부동산일호투자회사': '083160',
-    '현대공업': '170030',
-    '현대그린푸드': '453340',
-    '현대글로비스': '086280',
-    '현대금속': '018410',
-    '현대로템': '064350',
-    '현대리바트': '079430',
-    '현대멀티캡': '035910',
-    '현대모비스': '012330',
-    '현대무벡스': '319400',
-    '현대바이오': '048410',
-    '현대바이오랜드': '052260',
-    '현대백화점': '069960',
-    '현대비앤지스틸': '004560',
-    '현대사료': '016790',
-    '현대약품': '004310',
-    '현대에버다임': '041440',
-    '현대에이블기업인수목적1호': '204760',
-    '현대에이치씨엔동작방송': '034750',
-    '현대에이치티': '039010',
-    '현대엘리베이터': '017800',
-    '현대오토넷': '042100',
-    '현대오토에버': '307950',
-    '현대위아': '011210',
-    '현대이지웰': '090850',
-    '현대자동차': '005380',
-    '현대정보기술': '026180',
-    '현대제철': '004020',
-    '현대지에프홀딩스': '005440',
-    '현대차증권': '001500',
-    '현대코퍼레이션': '011760',
-    '현대코퍼레이션홀딩스': '227840',
-    '현대페인트': '011720',
-    '현대푸드시스템': '114410',
-    '현대퓨처넷': '126560',
-    '현대하이스코': '010520',
-    '현대해상': '001450',
-    '현대홈쇼핑': '057050',
-    '현대힘스': '460930',
-    '현우산업': '092300',
-    '현주컴퓨터': '038960',
-    '현진소재': '053660',
-    '협진': '138360',
-    '형지I&C': '011080',
-    '형지글로벌': '308100',
-    '형지엘리트': '093240',
-    '혜인': '003010',
-    '호반산업': '004320',
-    '호성': '035870',
-    '호전실업': '111110',
-    '호텔신라': '008770',
-    '홈캐스트': '064240',
-    '화림모드': '045920',
-    '화성밸브': '039610',
-    '화승알앤에이': '378850',
-    '화승엔터프라이즈': '241590',
-    '화승인더스트리': '006060',
-    '화승코퍼레이션': '013520',
-    '화신': '010690',
-    '화신정공': '126640',
-    '화신테크': '086250',
-    '화인베스틸': '133820',
-    '화인써키트': '127980',
-    '화인자산관리': '010460',
-    '화일약품': '061250',
-    '화천기계': '010660',
-    '화천기공': '000850',
-    '환인제약': '016580',
-    '황금에스티': '032560',
-    '효성': '004800',
-    '효성 ITX': '094280',
-    '효성오앤비': '097870',
-    '효성중공업': '298040',
-    '효성티앤씨': '298020',
-    '효성화학': '298000',
-    '후성': '093370',
-    '후야인포넷': '032050',
-    '훈영': '017170',
-    '휘튼': '066480',
-    '휴네시온': '290270',
-    '휴니드테크놀러지스': '005870',
-    '휴닉스': '009790',
-    '휴럼': '353190',
-    '휴리프': '006210',
-    '휴림로봇': '090710',
-    '휴림에이텍': '078590',
-    '휴마시스': '205470',
-    '휴맥스': '115160',
-    '휴맥스홀딩스': '028080',
-    '휴먼테크놀로지': '175140',
-    '휴먼텍코리아': '066060',
-    '휴메딕스': '200670',
-    '휴비스': '079980',
-    '휴비츠': '065510',
-    '휴스토리': '046400',
-    '휴스틸': '005010',
-    '휴엠앤씨': '263920',
-    '휴온스': '243070',
-    '휴온스글로벌': '084110',
-    '휴젤': '145020',
-    '휴코드홀딩스': '036840',
-    '흥구석유': '024060',
-    '흥국': '010240',
-    '흥국에프엔비': '189980',
-    '흥국화재': '000540',
-    '흥아해운': '003280',
-    '희림': '037440',
-    '희훈디앤지': '019640',
-    '히든챔피언제1호기업인수목적': '123160',
-    '힘스': '238490'
-}
+import os
+import threading
+from datetime import datetime
+
+from config import Config
+from fuzzy_match import LazyBKTree, to_jamo
+
+BUNDLED_STOCK_CODES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stock_codes.tsv')
+CACHED_STOCK_CODES_PATH = os.path.join(Config.CACHE_DIR, 'stock_codes.tsv')
 
 # 종목명 동의어 매핑
 STOCK_ALIASES = {
@@ -3874,12 +37,152 @@ STOCK_ALIASES = {
     '현대차': '현대자동차'
 }
 
-def get_stock_code(stock_name):
+FUZZY_MIN_CHARS = 3  # 이보다 짧은 이름(예: 토스)은 퍼지 매칭하지 않음 (오탐 방지)
+FUZZY_LONG_CHARS = 8  # 이 길이 이상이면 자모 편집 거리 2까지 허용 (그보다 짧으면 1)
+
+_mapping = None
+_mapping_lock = threading.Lock()
+
+def _normalize_name(name):
+    """종목명 정규화 ((주)/㈜/공백 제거)"""
+    return name.strip().replace("(주)", "").replace("㈜", "").replace(" ", "")
+
+class StockMapping:
+    """
+    한 시점의 종목 매핑 (생성 후 변경하지 않으며, 갱신 시 통째로 교체)
+    
+    - codes: 종목명 → 종목코드
+    - normalized_codes / normalized_aliases: 정규화된 이름 사전 (먼저 나온 항목 우선)
+    - fuzzy_index: 음성 인식 오타용 자모 편집 거리 색인 (첫 퍼지 검색 시 생성)
+    """
+    
+    def __init__(self, codes, source=None):
+        self.codes = codes
+        self.source = source
+        
+        self.normalized_codes = {}
+        for name, code in codes.items():
+            self.normalized_codes.setdefault(_normalize_name(name), code)
+        
+        self.normalized_aliases = {}
+        for alias, canonical in STOCK_ALIASES.items():
+            self.normalized_aliases.setdefault(_normalize_name(alias), canonical)
+        
+        self.fuzzy_index = LazyBKTree(
+            lambda: [(to_jamo(name), code) for name, code in self.normalized_codes.items()]
+        )
+
+def read_stock_codes(path):
+    """
+    종목 매핑 데이터 파일 읽기 (한 줄에 '종목명<TAB>종목코드', '#'로 시작하면 주석)
+    
+    Returns:
+        dict: {종목명: 종목코드} (파일 순서 유지)
+    """
+    codes = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            name, code = line.rstrip('\n').split('\t')
+            codes.setdefault(name, code)
+    return codes
+
+def write_stock_codes(rows, path=None):
+    """
+    종목 매핑 데이터 파일 저장 (종목명 순 정렬, 임시 파일 후 교체)
+    
+    Args:
+        rows: (종목명, 종목코드) 쌍들
+        path: 저장 경로 (없으면 CACHED_STOCK_CODES_PATH)
+        
+    Returns:
+        dict: 저장한 {종목명: 종목코드}
+    """
+    path = path or CACHED_STOCK_CODES_PATH
+    codes = {}
+    for name, code in sorted(rows):
+        if name and '\t' not in name and '\n' not in name:
+            codes.setdefault(name, code)
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(f"# 종목명 -> 종목코드 (DART corpCode.xml 상장 기업, 생성 시간: "
+                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n")
+        for name, code in codes.items():
+            f.write(f"{name}\t{code}\n")
+    os.replace(tmp_path, path)
+    return codes
+
+def get_mapping():
+    """현재 종목 매핑 (첫 호출 시 데이터 파일 로드, 캐시에 갱신본이 있으면 그것을 사용)"""
+    global _mapping
+    if _mapping is None:
+        with _mapping_lock:
+            if _mapping is None:
+                path = CACHED_STOCK_CODES_PATH
+                if not os.path.exists(path):
+                    path = BUNDLED_STOCK_CODES_PATH
+                try:
+                    _mapping = StockMapping(read_stock_codes(path), source=path)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ 종목 매핑 파일 로드 실패 ({path}): {e}")
+                    _mapping = StockMapping(read_stock_codes(BUNDLED_STOCK_CODES_PATH),
+                                            source=BUNDLED_STOCK_CODES_PATH)
+    return _mapping
+
+def refresh_from_corp_index(corp_index):
+    """
+    corpCode 색인으로 매핑 파일을 다시 만들고 메모리 매핑 교체
+    
+    Args:
+        corp_index: CorpCodeIndex (상장 기업만 색인됨)
+    """
+    global _mapping
+    try:
+        codes = write_stock_codes(zip(corp_index.names, corp_index.stock_codes))
+        if not codes:
+            return
+        mapping = StockMapping(codes, source=CACHED_STOCK_CODES_PATH)
+        with _mapping_lock:
+            _mapping = mapping
+        print(f"✅ 종목 매핑 갱신 완료: {len(codes)}개 종목")
+    except Exception as e:
+        print(f"⚠️ 종목 매핑 갱신 실패: {e}")
+
+def refresh_in_background(corp_index):
+    """refresh_from_corp_index를 백그라운드 스레드로 실행"""
+    thread = threading.Thread(target=refresh_from_corp_index, args=(corp_index,),
+                              name="stock-mapping-refresh", daemon=True)
+    thread.start()
+    return thread
+
+def _fuzzy_stock_code(mapping, normalized):
+    """
+    자모 편집 거리로 가장 가까운 종목코드 (최소 거리 후보가 한 종목일 때만)
+    
+    예: "삼송전자" → 삼성전자, "셀트리욘" → 셀트리온 ("토스"처럼 짧은 이름은 추정하지 않음)
+    """
+    if len(normalized) < FUZZY_MIN_CHARS:
+        return None
+    
+    max_distance = 1 if len(normalized) < FUZZY_LONG_CHARS else 2
+    matches = mapping.fuzzy_index.search(to_jamo(normalized), max_distance)
+    if not matches:
+        return None
+    
+    best_distance = matches[0][0]
+    codes = {code for distance, _, code in matches if distance == best_distance}
+    return codes.pop() if len(codes) == 1 else None
+
+def get_stock_code(stock_name, fuzzy=True):
     """
     종목명으로 종목코드 조회
     
     Args:
         stock_name (str): 종목명
+        fuzzy (bool): 정확히 일치하는 이름이 없을 때 자모 편집 거리로 추정할지 여부
         
     Returns:
         str: 6자리 종목코드 또는 None
@@ -3887,51 +190,63 @@ def get_stock_code(stock_name):
     if not stock_name:
         return None
     
+    mapping = get_mapping()
+    
     # 1단계: 직접 매핑 확인
-    stock_code = MAJOR_STOCK_CODES.get(stock_name)
+    stock_code = mapping.codes.get(stock_name)
     if stock_code:
         return stock_code
     
     # 2단계: 동의어 확인
     if stock_name in STOCK_ALIASES:
         canonical_name = STOCK_ALIASES[stock_name]
-        return MAJOR_STOCK_CODES.get(canonical_name)
+        return mapping.codes.get(canonical_name)
     
-    # 3단계: 정규화 후 재시도
-    normalized = stock_name.strip().replace("(주)", "").replace("㈜", "").replace(" ", "")
+    # 3단계: 정규화 후 재시도 (사전 조회)
+    normalized = _normalize_name(stock_name)
     
-    for mapped_name, code in MAJOR_STOCK_CODES.items():
-        if mapped_name.replace("(주)", "").replace("㈜", "").replace(" ", "") == normalized:
-            return code
+    stock_code = mapping.normalized_codes.get(normalized)
+    if stock_code:
+        return stock_code
     
     # 동의어도 정규화해서 확인
-    for alias, canonical in STOCK_ALIASES.items():
-        if alias.replace(" ", "") == normalized:
-            return MAJOR_STOCK_CODES.get(canonical)
+    if normalized in mapping.normalized_aliases:
+        return mapping.codes.get(mapping.normalized_aliases[normalized])
+    
+    # 4단계: 오타 허용 (자모 편집 거리)
+    if fuzzy:
+        return _fuzzy_stock_code(mapping, normalized)
     
     return None
 
 def get_all_stock_names():
     """등록된 모든 종목명 반환"""
-    all_names = set(MAJOR_STOCK_CODES.keys())
+    all_names = set(get_mapping().codes.keys())
     all_names.update(STOCK_ALIASES.keys())
     return sorted(list(all_names))
 
 def is_known_stock(stock_name):
-    """알려진 종목인지 확인"""
-    return get_stock_code(stock_name) is not None
+    """알려진 종목인지 확인 (오타 추정 제외)"""
+    return get_stock_code(stock_name, fuzzy=False) is not None
 
-# 통계 정보
-TOTAL_LISTED_COMPANIES = len(MAJOR_STOCK_CODES)
-TOTAL_ALIASES = len(STOCK_ALIASES)
+def __getattr__(name):
+    # 기존 상수 호환 (접근 시점에 데이터 파일 로드)
+    if name == 'MAJOR_STOCK_CODES':
+        return get_mapping().codes
+    if name == 'TOTAL_LISTED_COMPANIES':
+        return len(get_mapping().codes)
+    if name == 'TOTAL_ALIASES':
+        return len(STOCK_ALIASES)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # 간단한 테스트
     test_stocks = ['카카오', '삼성전자', '삼성', 'NAVER', '네이버', '존재하지않는종목']
     
-    print("=== 자동 생성된 종목 매핑 테스트 ===")
-    print(f"총 상장기업: {TOTAL_LISTED_COMPANIES}개")
-    print(f"총 동의어: {TOTAL_ALIASES}개")
+    print("=== 종목 매핑 테스트 ===")
+    print(f"데이터 파일: {get_mapping().source}")
+    print(f"총 상장기업: {len(get_mapping().codes)}개")
+    print(f"총 동의어: {len(STOCK_ALIASES)}개")
     print()
     
     for stock in test_stocks:
@@ -0,0 +1,136 @@
+# conftest.py - 저장소 루트의 평면 모듈을 테스트에서 import할 수 있도록 경로 추가
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import itertools
+
+import pytest
+
+_api_keys = itertools.count()
+
+
+class FakeResponse:
+    """requests.Response 대역 (JSON 본문 또는 다운로드 본문)"""
+
+    def __init__(self, data=None, content=b'', content_type='application/json', status_code=200):
+        self._data = data
+        self.content = content
+        self.text = content.decode('utf-8', 'replace')
+        self.headers = {'Content-Type': content_type}
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        import requests
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def json(self):
+        if self._data is None:
+            raise ValueError("JSON 아님")
+        return self._data
+
+    def iter_content(self, chunk_size=1):
+        yield self.content
+
+
+class FakeSession:
+    """엔드포인트 이름과 파라미터를 handler에 넘기는 세션 대역 (호출 기록 보관)"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        endpoint = url.rsplit('/', 1)[-1]
+        params = {k: v for k, v in (params or {}).items() if k != 'crtfc_key'}
+        self.calls.append((endpoint, params))
+        result = self.handler(endpoint, params)
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, FakeResponse):
+            return result
+        return FakeResponse(result)
+
+
+@pytest.fixture
+def make_dart_client(tmp_path):
+    """handler(endpoint, params) → dict / FakeResponse / 예외 로 응답하는 DARTClient 생성 (테스트마다 별도 차단기)"""
+    from cache_utils import DiskCache
+    from dart_client import DARTClient
+    from http_utils import TokenBucket
+
+    def factory(handler):
+        client = DARTClient(f"test-key-{next(_api_keys)}",
+                            cache=DiskCache(str(tmp_path / 'dart_cache.sqlite')),
+                            rate_limiter=TokenBucket(1000, 1000))
+        client.session = FakeSession(handler)
+        return client
+
+    return factory
+
+
+class FakeSearchSession:
+    """Serper POST 세션 대역 - handler(payload) → 응답 dict (또는 HTTP 상태 코드)"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.payloads = []
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        import json
+        payload = json.loads(data)
+        self.payloads.append(payload)
+        result = self.handler(payload)
+        if isinstance(result, int):
+            return FakeResponse(content=b'{}', status_code=result)
+        return FakeResponse(result, content=json.dumps(result, ensure_ascii=False).encode('utf-8'))
+
+
+@pytest.fixture
+def make_web_searcher(tmp_path, monkeypatch):
+    """임시 검색 캐시 + 가짜 Serper 세션을 쓰는 WebSearcher 생성"""
+    from config import Config
+    from http_utils import TokenBucket
+    from web_searcher import WebSearcher
+
+    monkeypatch.setattr(Config, 'SEARCH_CACHE_PATH', str(tmp_path / 'search_cache.sqlite'))
+
+    def factory(handler=lambda payload: {'organic': []}):
+        searcher = WebSearcher('test-key')
+        searcher.session = FakeSearchSession(handler)
+        searcher.rate_limiter = TokenBucket(1000, 1000)
+        return searcher
+
+    return factory
+
+
+def write_pdf(path, page_texts):
+    """페이지별 한 줄 텍스트로 최소 PDF 작성 (빈 문자열이면 텍스트 없는 페이지)"""
+    count = len(page_texts)
+    font_id = 3 + 2 * count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{3 + 2 * i} 0 R" for i in range(count)), count)).encode(),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode() if text else b""
+        objects.append((f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                        f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>").encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(data)
+    return str(path)
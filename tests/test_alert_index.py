@@ -0,0 +1,61 @@
+# test_alert_index.py - 투자주의/경고/위험 지정 구간 조회 (이분 탐색)
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from alert_index import AlertIndex, AlertTable
+
+
+@pytest.fixture
+def index():
+    caution = pd.DataFrame({
+        '종목명': ['에코프로', '에코프로', '(주)테스트'],
+        '종목코드': ['86520', '086520', '000001'],
+        '지정일': ['2024-01-10', '2024-03-05', '2024-02-01'],
+        '구분': ['투자경고 지정예고', None, '소수계좌 거래집중'],
+    })
+    warning = pd.DataFrame({
+        '종목명': ['에코프로', '에코프로'],
+        '종목코드': ['086520', '086520'],
+        '공시일': ['2024-04-01', '2024-01-15'],   # 정렬되지 않은 입력
+        '해제일': ['-', '2024-01-30'],
+    })
+    return AlertIndex(caution, warning, pd.DataFrame())
+
+
+def test_find_by_normalized_name(index):
+    assert index.find('에코프로') == ('086520', '에코프로')
+    assert index.find('테스트') == ('000001', '(주)테스트')
+    assert index.find('없는종목') is None
+
+
+def test_latest_interval_as_of(index):
+    table = index.caution
+    assert table.latest_as_of('086520', date(2024, 1, 9)) is None
+    assert table.latest_as_of('086520', date(2024, 1, 10))[0] == date(2024, 1, 10)
+    assert table.latest_as_of('086520', date(2024, 3, 4))[2] == '투자경고 지정예고'
+    assert table.latest_as_of('086520', date(2024, 12, 31)) == (date(2024, 3, 5), None, '투자주의')
+
+
+def test_warning_active_only_inside_interval(index):
+    assert index.warning.active_as_of('086520', date(2024, 1, 20)) is not None
+    assert index.warning.active_as_of('086520', date(2024, 2, 1)) is None   # 해제 후
+    assert index.warning.active_as_of('086520', date(2024, 5, 1)) == (date(2024, 4, 1), None, None)
+
+
+def test_status(index):
+    status = index.status('086520', date(2024, 1, 20))
+    assert status['any_alert']
+    assert status['caution'] == [{'type': '투자경고 지정예고', 'start_date': '2024-01-10', 'end_date': '현재'}]
+    assert status['warning'] == [{'start_date': '2024-01-15', 'end_date': '2024-01-30'}]
+    assert status['risk'] == []
+
+    clear = index.status('999999', date(2024, 1, 20))
+    assert not clear['any_alert']
+
+
+def test_table_without_required_columns_is_empty():
+    assert AlertTable(pd.DataFrame({'종목명': ['a']}), '지정일').codes == {}
+    assert AlertTable(None, '지정일').codes == {}
@@ -0,0 +1,57 @@
+# test_bm25_index.py - BM25 토큰화 / 검색 / RRF 결합
+
+import pytest
+
+from bm25_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+def test_tokenize_hangul_bigrams():
+    assert tokenize("삼성전자가") == ['삼성', '성전', '전자', '자가']
+
+
+def test_tokenize_keeps_short_runs_and_lowercases_alnum():
+    assert tokenize("주가 SK Hynix 2024") == ['주가', 'sk', 'hynix', '2024']
+
+
+def test_tokenize_empty():
+    assert tokenize("") == []
+    assert tokenize(None) == []
+
+
+def test_search_ranks_matching_document_first():
+    index = BM25Index()
+    index.build([
+        "현대차가 신형 전기차를 공개했다",
+        "삼성전자 반도체 실적이 개선됐다",
+        "금리 인상으로 채권 가격이 하락했다",
+    ])
+
+    results = index.search("삼성전자 반도체")
+    assert results[0][0] == 1
+    assert all(score > 0 for _, score in results)
+    assert index.search("비트코인") == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = BM25Index()
+    index.build(["삼성전자 반도체", "현대차 전기차", "LG에너지솔루션 배터리"])
+    path = str(tmp_path / "bm25.npz")
+    index.save(path)
+
+    loaded = BM25Index.load(path)
+    assert loaded.search("전기차") == index.search("전기차")
+
+
+def test_reciprocal_rank_fusion_order_and_score():
+    fused = reciprocal_rank_fusion([[1, 2, 3], [2, 1]], k=60)
+
+    assert [doc for doc, _ in fused] == [1, 2, 3]
+    scores = dict(fused)
+    assert scores[1] == pytest.approx(1 / 61 + 1 / 62)
+    assert scores[2] == pytest.approx(1 / 62 + 1 / 61)
+    assert scores[3] == pytest.approx(1 / 63)
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    fused = reciprocal_rank_fusion([[7, 8], [9, 8]])
+    assert fused[0][0] == 8
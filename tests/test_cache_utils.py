@@ -0,0 +1,92 @@
+# test_cache_utils.py - 메모리 LRU / 디스크 TTL 캐시
+
+import pytest
+
+import cache_utils
+from cache_utils import DiskCache, LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # a를 최근 사용으로 갱신
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_lru_stats_count_hits_and_misses():
+    cache = LRUCache(max_size=4)
+    cache.put('q', [0.1, 0.2])
+    cache.get('q')
+    cache.get('missing', default='x')
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_lru_zero_size_disables_cache():
+    cache = LRUCache(max_size=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_utils.time, 'time', clock)
+    return clock
+
+
+def test_disk_cache_expires_after_ttl(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / 'search.sqlite'))
+    cache.put('search|삼성전자', {'organic': [1, 2]}, ttl=60)
+
+    clock.now += 59
+    assert cache.get('search|삼성전자') == {'organic': [1, 2]}
+
+    clock.now += 2
+    assert cache.get('search|삼성전자') is None
+    assert len(cache) == 0  # 만료 항목은 조회 시 삭제
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_cache_persists_across_instances(tmp_path, clock):
+    path = str(tmp_path / 'search.sqlite')
+    DiskCache(path).put('k', '응답', ttl=3600)
+    assert DiskCache(path).get('k') == '응답'
+
+
+def test_disk_cache_evicts_expired_then_least_recently_used(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(DiskCache, 'EVICT_EVERY', 1)
+    cache = DiskCache(str(tmp_path / 'search.sqlite'), max_entries=2)
+
+    cache.put('short', 1, ttl=1)
+    clock.now += 1
+    cache.put('a', 2, ttl=100)
+    clock.now += 1
+    cache.put('b', 3, ttl=100)
+    clock.now += 1
+    cache.get('a')  # b보다 최근 사용
+    clock.now += 1
+    cache.put('c', 4, ttl=100)
+
+    assert len(cache) == 2
+    assert cache.get('short') is None
+    assert cache.get('b') is None
+    assert cache.get('a') == 2
+    assert cache.get('c') == 4
@@ -0,0 +1,123 @@
+# test_chunk_store.py - 메모리 매핑 청크 저장소 (UTF-8 blob + 오프셋 배열)와 RAG 캐시 로드
+
+import os
+
+import numpy as np
+import pytest
+
+from bm25_index import BM25Index
+from chunk_store import ChunkStore, ChunkStoreWriter
+from pdf_processor import ChunkMetadata, PDFProcessor
+
+TEXTS = ["삼성전자 반도체 실적이 개선됐다.", "", "ASCII only", "마지막 청크 😀"]
+
+
+def _write(tmp_path, texts, name='chunks'):
+    blob_path = str(tmp_path / f'{name}.bin')
+    offsets_path = str(tmp_path / f'{name}.offsets.npy')
+    with ChunkStoreWriter(blob_path, offsets_path) as writer:
+        for text in texts:
+            writer.append(text)
+    return blob_path, offsets_path
+
+
+def test_round_trip_multibyte_and_empty_chunks(tmp_path):
+    blob_path, offsets_path = _write(tmp_path, TEXTS)
+    store = ChunkStore.open(blob_path, offsets_path)
+    try:
+        assert len(store) == len(TEXTS)
+        assert list(store) == TEXTS
+        assert store[1] == ""
+        assert store[-1] == TEXTS[-1]                   # 마지막 오프셋 경계
+        assert store.nbytes() == os.path.getsize(blob_path) == sum(len(t.encode('utf-8')) for t in TEXTS)
+        with pytest.raises(IndexError):
+            store[len(TEXTS)]
+    finally:
+        store.close()
+
+
+def test_from_texts_matches_written_store(tmp_path):
+    memory = ChunkStore.from_texts(TEXTS)
+    blob_path, offsets_path = _write(tmp_path, TEXTS)
+
+    assert np.array_equal(memory._offsets, np.load(offsets_path))
+    assert list(memory) == TEXTS
+
+
+def test_empty_store(tmp_path):
+    store = ChunkStore.open(*_write(tmp_path, []))
+    assert len(store) == 0
+    assert list(store) == []
+    assert len(ChunkStore.from_texts([])) == 0
+
+
+def test_writer_truncate_rolls_back_failed_document(tmp_path):
+    blob_path = str(tmp_path / 'chunks.bin')
+    offsets_path = str(tmp_path / 'chunks.offsets.npy')
+    with ChunkStoreWriter(blob_path, offsets_path) as writer:
+        writer.append("첫 문서")
+        kept = len(writer)
+        writer.append("실패한 문서 1")
+        writer.append("실패한 문서 2")
+        writer.truncate(kept)
+        writer.append("다음 문서")
+
+    store = ChunkStore.open(blob_path, offsets_path)
+    assert list(store) == ["첫 문서", "다음 문서"]
+    store.close()
+
+
+def test_rewrite_keeps_existing_mapping_intact(tmp_path):
+    store = ChunkStore.open(*_write(tmp_path, ["이전 내용"]))
+    _write(tmp_path, ["새 내용", "추가"])
+
+    assert list(store) == ["이전 내용"]  # 교체 전 파일을 계속 매핑
+    store.close()
+
+
+@pytest.fixture
+def cached_processor(tmp_path, monkeypatch):
+    """임시 폴더에 완성된 RAG 캐시를 만든 PDFProcessor (folder_hash='abc')"""
+    monkeypatch.chdir(tmp_path)
+    processor = PDFProcessor(client=None)
+    paths = processor._cache_paths('abc')
+
+    with ChunkStoreWriter(paths['chunks'], paths['offsets']) as writer:
+        meta = ChunkMetadata()
+        for i, text in enumerate(TEXTS):
+            writer.append(text)
+            meta.append({'source': 'a.pdf', 'page_start': i + 1, 'page_end': i + 1,
+                         'char_start': i * 10, 'char_end': i * 10 + 5})
+
+    embeddings = np.random.default_rng(0).standard_normal((len(TEXTS), 8))
+    processor._save_cache('abc', embeddings, BM25Index().build(TEXTS), meta)
+    return processor, paths
+
+
+def test_load_cache_round_trip(cached_processor):
+    processor, _ = cached_processor
+
+    loaded, chunks, vector_index, bm25, meta = processor._load_cache('abc')
+
+    assert loaded
+    assert list(chunks) == TEXTS
+    assert len(vector_index) == len(TEXTS)
+    assert bm25.search("반도체")[0][0] == 0
+    assert meta.get(3) == {'source': 'a.pdf', 'page_start': 4, 'page_end': 4, 'char_start': 30, 'char_end': 35}
+    chunks.close()
+
+
+@pytest.mark.parametrize('missing', ['offsets', 'meta', 'chunks', 'embeddings'])
+def test_load_cache_rejects_incomplete_cache(cached_processor, missing):
+    processor, paths = cached_processor
+    os.remove(paths[missing])
+
+    assert processor._load_cache('abc') == (False, None, None, None, None)
+
+
+def test_load_cache_rejects_corrupt_offsets(cached_processor):
+    processor, paths = cached_processor
+    with open(paths['offsets'], 'wb') as f:
+        f.write(b'not an npy file')
+
+    assert processor._load_cache('abc')[0] is False
@@ -0,0 +1,32 @@
+# test_claim_clusters.py - 유사 주장 묶기 (같은 검색을 한 번만 수행)
+
+import pytest
+
+from historical_checker import cluster_claims
+
+
+def test_near_duplicate_claims_share_a_cluster():
+    claims = ['삼성전자가 급등했다', '삼성전자 주가 급등', '삼성전자 실적 발표',
+              'SK하이닉스 급등', '삼성전자가 급락했다', '삼성전자 급등']
+
+    assert cluster_claims(claims) == [[0, 1, 5], [2], [3], [4]]
+
+
+@pytest.mark.parametrize('claims', [
+    ['삼성전자가 급등했다', '삼성전자가 급락했다'],
+    ['목표주가 10만원 상향', '목표주가 7만원 하향'],
+    ['목표주가 10만원 상향', '목표주가 12만원 상향'],
+    ['영업이익 증가', '영업이익 감소'],
+    ['에코프로', '에코프로비엠'],
+    ['에코프로 급등', '에코프로비엠 급등'],
+])
+def test_contradicting_or_different_company_claims_stay_apart(claims):
+    assert cluster_claims(claims) == [[0], [1]]
+
+
+def test_particles_on_subject_do_not_split_cluster():
+    assert cluster_claims(['에코프로가 주가 급등했다', '에코프로 주가 급등']) == [[0, 1]]
+
+
+def test_empty_input():
+    assert cluster_claims([]) == []
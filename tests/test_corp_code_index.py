@@ -0,0 +1,67 @@
+# test_corp_code_index.py - corpCode.xml 색인 조회
+
+import pytest
+
+from corp_code_index import CorpCodeIndex
+
+ROWS = [
+    ('삼성전자', '005930', '00126380'),
+    ('삼성전자서비스', '000001', '00000001'),
+    ('SK하이닉스', '000660', '00164779'),
+    ('LG전자', '066570', '00401731'),
+    ('NAVER', '035420', '00266961'),
+    ('에코프로비엠', '247540', '01160363'),
+    ('에코프로', '086520', '00536541'),
+]
+
+XML = """<?xml version="1.0" encoding="UTF-8"?>
+<result>
+  <list><corp_code>00126380</corp_code><corp_name>삼성전자</corp_name><stock_code>005930</stock_code></list>
+  <list><corp_code>00999999</corp_code><corp_name>비상장회사</corp_name><stock_code> </stock_code></list>
+  <list><corp_code>00164779</corp_code><corp_name>SK하이닉스</corp_name><stock_code>000660</stock_code></list>
+</result>
+"""
+
+
+@pytest.fixture
+def index():
+    return CorpCodeIndex(ROWS)
+
+
+def test_exact_and_normalized_names(index):
+    assert index.find_stock_code('삼성전자') == '005930'
+    assert index.find_stock_code(' (주)SK 하이닉스 ') == '000660'
+
+
+def test_aliases(index):
+    assert index.find_stock_code('네이버') == '035420'
+    assert index.find_stock_code('LG') == '066570'
+
+
+def test_substring_prefers_xml_order(index):
+    assert index.find_stock_code('삼성전') == '005930'
+    assert index.find_stock_code('에코프') == '247540'  # XML에서 먼저 나온 기업
+    assert index.find_stock_code('하이닉') == '000660'
+    assert index.find_stock_code('카카오') is None
+
+
+def test_exact_name_beats_substring(index):
+    assert index.find_stock_code('에코프로') == '086520'
+
+
+def test_code_lookups(index):
+    assert index.get_corp_code('5930') == '00126380'
+    assert index.get_corp_code(660) == '00164779'
+    assert index.get_corp_name('01160363') == '에코프로비엠'
+    assert index.get_corp_code('123456') is None
+
+
+def test_from_xml_keeps_listed_companies_only(tmp_path):
+    path = tmp_path / 'corpCode.xml'
+    path.write_text(XML, encoding='utf-8')
+
+    index = CorpCodeIndex.from_xml(str(path))
+
+    assert len(index) == 2
+    assert index.find_stock_code('SK하이닉스') == '000660'
+    assert index.find_stock_code('비상장회사') is None
@@ -0,0 +1,223 @@
+# test_dart_client.py - DART 응답 캐시 / 후보 동시 조회 / 한도 차단기
+
+import threading
+import time
+from datetime import date
+
+import pytest
+import requests
+
+import dart_client
+from config import Config
+from conftest import FakeResponse
+from dart_client import (CircuitBreaker, DARTClient, DARTQuotaExceeded, is_closed_period, probe_first,
+                         recent_report_periods)
+from stock_checker import fetch_debt_ratio
+
+OK = {'status': '000', 'list': [{'value': 1}]}
+NO_DATA = {'status': '013', 'message': '조회된 데이타가 없습니다.'}
+
+
+def test_closed_period():
+    assert is_closed_period(2023, '11011', today=date(2024, 1, 1))
+    assert not is_closed_period(2024, '11013', today=date(2024, 3, 31))
+    assert is_closed_period(2024, '11013', today=date(2024, 4, 1))
+    assert not is_closed_period(None, '11011')
+    assert not is_closed_period(2023, '99999')
+
+
+def test_recent_report_periods_newest_first():
+    assert recent_report_periods(today=date(2024, 2, 15)) == [
+        (2023, '11011'), (2023, '11014'), (2023, '11012'), (2023, '11013'), (2022, '11011')]
+    assert recent_report_periods(2, today=date(2024, 7, 1)) == [(2024, '11012'), (2024, '11013')]
+
+
+def test_cache_key_ignores_api_key_and_param_order():
+    a = DARTClient.cache_key('list.json', {'crtfc_key': 'x', 'corp_code': '001', 'page_no': 1, 'bgn_de': '2024'})
+    b = DARTClient.cache_key('list.json', {'bgn_de': '2024', 'page_no': '1', 'corp_code': '001'})
+    assert a == b
+
+
+@pytest.mark.parametrize('endpoint, params, data, expected', [
+    ('hyslrSttus.json', {'bsns_year': '2000', 'reprt_code': '11011'}, OK, Config.DART_CACHE_CLOSED_TTL),
+    ('hyslrSttus.json', {'bsns_year': str(date.today().year + 1), 'reprt_code': '11011'}, OK,
+     Config.DART_CACHE_DAILY_TTL),
+    ('list.json', {'bsns_year': '2000', 'reprt_code': '11011'}, OK, Config.DART_CACHE_DAILY_TTL),
+    ('hyslrSttus.json', {'bsns_year': '2000', 'reprt_code': '11011'}, NO_DATA, Config.DART_CACHE_NO_DATA_TTL),
+    ('hyslrSttus.json', {'bsns_year': '2000', 'reprt_code': '11011'}, {'status': '100'}, None),
+])
+def test_cache_ttl(endpoint, params, data, expected):
+    assert DARTClient.cache_ttl(endpoint, params, data) == expected
+
+
+def test_get_json_serves_repeat_requests_from_cache(make_dart_client):
+    client = make_dart_client(lambda endpoint, params: OK)
+    params = {'corp_code': '00126380', 'bsns_year': '2000', 'reprt_code': '11011'}
+
+    assert client.get_json('hyslrSttus.json', params) == OK
+    assert client.get_json('hyslrSttus.json', params) == OK
+    assert client.api_calls == 1
+    assert client.stats()['endpoints']['hyslrSttus.json']['cache_hits'] == 1
+
+
+def test_get_json_does_not_cache_error_status(make_dart_client):
+    client = make_dart_client(lambda endpoint, params: {'status': '800', 'message': '점검 중'})
+
+    client.get_json('list.json', {'corp_code': '1'})
+    client.get_json('list.json', {'corp_code': '1'})
+    assert client.api_calls == 2
+
+
+def test_probe_first_prefers_priority_over_speed():
+    def fetch(candidate):
+        time.sleep(0.05 if candidate == 'slow-but-first' else 0)
+        return candidate.upper()
+
+    assert probe_first(['slow-but-first', 'fast'], fetch) == ('slow-but-first', 'SLOW-BUT-FIRST')
+
+
+def test_probe_first_skips_missing_and_failed_candidates():
+    def fetch(candidate):
+        if candidate == 'error':
+            raise RuntimeError("HTTP 500")
+        return None if candidate == 'missing' else candidate
+
+    assert probe_first(['error', 'missing', 'ok'], fetch) == ('ok', 'ok')
+    assert probe_first(['error', 'missing'], fetch) == (None, None)
+    assert probe_first([], fetch) == (None, None)
+
+
+def test_probe_first_cancels_queued_candidates(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(dart_client, '_probe_executor', executor)
+    started = []
+
+    def fetch(candidate):
+        started.append(candidate)
+        return candidate
+
+    assert probe_first(['a', 'b', 'c'], fetch) == ('a', 'a')
+    executor.shutdown(wait=True)
+    assert 'c' not in started  # 첫 후보가 성공하면 대기 중인 후보는 실행하지 않음
+
+
+def test_fetch_debt_ratio_uses_most_recent_report(make_dart_client):
+    def handler(endpoint, params):
+        if params['reprt_code'] == '11011':
+            return NO_DATA  # 사업보고서는 아직 미제출
+        return {'status': '000', 'list': [{'idx_nm': '부채비율', 'idx_val': f"1,{params['reprt_code'][-2:]}0"}]}
+
+    client = make_dart_client(handler)
+    result = fetch_debt_ratio(client, '00126380', bsns_year=2000)
+
+    assert result['status'] == 'success'
+    assert result['report_type'] == '11014'
+    assert result['debt_ratio'] == 1140.0
+    assert result['is_high_risk']
+
+
+def test_fetch_debt_ratio_not_found(make_dart_client):
+    client = make_dart_client(lambda endpoint, params: NO_DATA)
+    assert fetch_debt_ratio(client, '00126380', bsns_year=2000)['status'] == 'not_found'
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(dart_client.time, 'monotonic', clock)
+    return clock
+
+
+def test_breaker_half_open_allows_one_trial(clock):
+    breaker = CircuitBreaker(cooldown=60)
+    assert breaker.allow()
+
+    breaker.trip()
+    assert not breaker.allow()
+    clock.now += 60
+    assert breaker.allow()       # 시험 요청 하나
+    assert not breaker.allow()   # 시험 중에는 나머지 거절
+
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.stats() == {'state': 'closed', 'retry_in_seconds': 0.0, 'trips': 1, 'rejected': 2}
+
+
+def test_breaker_trial_quota_failure_reopens(clock):
+    breaker = CircuitBreaker(cooldown=60)
+    breaker.trip()
+    clock.now += 60
+    assert breaker.allow()
+
+    breaker.trip()
+    assert breaker.is_open()
+    assert not breaker.allow()
+    assert breaker.stats()['trips'] == 2
+
+
+def test_breaker_trial_other_failure_frees_trial_slot(clock):
+    breaker = CircuitBreaker(cooldown=60)
+    breaker.trip()
+    clock.now += 60
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.is_open()
+    assert breaker.allow()  # 다음 요청이 다시 시험
+
+
+def _open_breaker_for_trial(client, clock):
+    client.circuit.trip()
+    clock.now += client.circuit.cooldown
+
+
+@pytest.mark.parametrize('failure', [
+    requests.ConnectionError("연결 끊김"),
+    FakeResponse(status_code=503),
+    FakeResponse(None, content=b'<html>maintenance</html>', content_type='text/html'),  # JSON 아님
+])
+def test_get_json_trial_failure_does_not_leave_breaker_stuck(make_dart_client, clock, failure):
+    responses = [failure, OK]
+    client = make_dart_client(lambda endpoint, params: responses.pop(0))
+    _open_breaker_for_trial(client, clock)
+
+    with pytest.raises((requests.RequestException, ValueError)):
+        client.get_json('list.json', {'corp_code': '1'})
+    assert client.get_json('list.json', {'corp_code': '1'}) == OK
+    assert not client.quota_exceeded
+
+
+def test_get_json_quota_status_trips_breaker(make_dart_client):
+    client = make_dart_client(lambda endpoint, params: {'status': '020', 'message': '요청 제한 초과'})
+
+    with pytest.raises(DARTQuotaExceeded):
+        client.get_json('list.json', {'corp_code': '1'})
+    assert client.quota_exceeded
+    with pytest.raises(DARTQuotaExceeded):
+        client.get_json('list.json', {'corp_code': '2'})
+    assert client.api_calls == 1
+
+
+def test_download_error_body_trial_does_not_leave_breaker_stuck(make_dart_client, clock, tmp_path):
+    responses = [
+        FakeResponse(content=b'<result><status>010</status></result>', content_type='application/xml'),
+        FakeResponse(content=b'PK zip', content_type='application/x-msdownload'),
+    ]
+    client = make_dart_client(lambda endpoint, params: responses.pop(0))
+    _open_breaker_for_trial(client, clock)
+    path = str(tmp_path / 'corpCode.zip')
+
+    with pytest.raises(requests.HTTPError):
+        client.download('corpCode.xml', path)
+    assert client.download('corpCode.xml', path) == len(b'PK zip')
+    assert not client.quota_exceeded
@@ -0,0 +1,78 @@
+# test_dart_outlier_checker.py - 공시 제목 위험 신호 스캔 / 위험 신호 일괄 평가
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import dart_client
+from dart_outlier_checker import DARTOutlierChecker, scan_disclosures
+
+
+def test_scan_disclosures_groups_titles_by_signal():
+    disclosures = [
+        {'rcept_no': '1', 'report_nm': '주요사항보고서(유상증자결정)'},
+        {'rcept_no': '1', 'report_nm': '주요사항보고서(유상증자결정)'},   # 같은 공시 중복
+        {'rcept_no': '2', 'report_nm': '[기재정정]전환사채권발행결정'},
+        {'rcept_no': '3', 'report_nm': '최대주주변경'},
+        {'rcept_no': '4', 'report_nm': '횡령ㆍ배임혐의발생'},
+        {'rcept_no': '', 'report_nm': '유상증자결정'},                      # 공시번호 없음
+        {'rcept_no': '5', 'report_nm': '분기보고서 (2024.03)'},
+    ]
+
+    matches = scan_disclosures(disclosures)
+
+    assert matches['capital_raising'] == ['주요사항보고서(유상증자결정)', '[기재정정]전환사채권발행결정']
+    assert matches['control_change'] == ['최대주주변경']
+    assert matches['embezzlement'] == ['횡령ㆍ배임혐의발생']  # 횡령·배임 둘 다 있어도 공시 하나
+    assert matches['delisting_risk'] == []
+
+
+def _paged_handler(total_page=3, delay=0.0):
+    """공시 목록 total_page 페이지 (페이지마다 유상증자 공시 하나) + 최대주주 지분율 5%"""
+    def handler(endpoint, params):
+        time.sleep(delay)
+        if endpoint == 'list.json':
+            page_no = int(params['page_no'])
+            return {'status': '000', 'total_page': total_page, 'total_count': total_page,
+                    'list': [{'rcept_no': f"{params['corp_code']}-{page_no}",
+                              'report_nm': f'유상증자결정 ({page_no})'}]}
+        return {'status': '000', 'list': [{'hold_stock_rt': '3.0'}, {'hold_stock_rt': '5.0'}]}
+    return handler
+
+
+def test_evaluate_risk_signals(make_dart_client):
+    checker = DARTOutlierChecker('key', dart_client=make_dart_client(_paged_handler()))
+
+    result = checker.evaluate_risk_signals('00000001')
+
+    assert result['errors'] == []
+    assert result['details']['major_shareholder_ratio'] == 5.0
+    assert result['details']['disclosures_scanned'] == 3
+    assert result['details']['capital_raising_count'] == 3
+    assert result['signals']['governance_risk'] and result['signals']['capital_risk']
+    assert result['reasons'] == ['지배구조위험', '자본조달위험']
+    assert set(result['timings_ms']) == {'major_shareholder', 'disclosures', 'total'}
+
+
+def test_list_disclosures_no_data_and_error(make_dart_client):
+    responses = iter([{'status': '013'}, {'status': '800', 'message': '점검'}])
+    checker = DARTOutlierChecker('key', dart_client=make_dart_client(lambda e, p: next(responses)))
+
+    assert checker.list_disclosures('00000001') == []
+    assert checker.list_disclosures('00000002') is None
+
+
+def test_concurrent_evaluations_do_not_deadlock_small_pool(make_dart_client, monkeypatch):
+    # 풀 작업이 같은 풀의 페이지 조회를 기다리면 워커 2개가 모두 막혀 멈추던 문제
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dart-probe-test')
+    monkeypatch.setattr(dart_client, '_probe_executor', pool)
+    checker = DARTOutlierChecker('key', dart_client=make_dart_client(_paged_handler(delay=0.01)))
+
+    callers = ThreadPoolExecutor(max_workers=4)
+    futures = [callers.submit(checker.evaluate_risk_signals, f"0000000{i}") for i in range(4)]
+    done, not_done = wait(futures, timeout=10)
+
+    assert not not_done, "공유 DART 풀에서 교착 상태"
+    for future in done:
+        assert future.result()['details']['disclosures_scanned'] == 3
+    callers.shutdown()
+    pool.shutdown()
@@ -0,0 +1,103 @@
+# test_dart_prefetch.py - 사전 수집 진행 기록과 요청 한도 초과 시 집계
+
+import json
+import threading
+
+import pytest
+
+import dart_prefetch
+from config import Config
+from dart_client import DARTQuotaExceeded
+from financial_snapshot import FinancialSnapshot, write_snapshot
+
+
+def test_load_progress_skips_truncated_last_line(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    first = {'corp_code': '00126380', 'debt_ratio': 25.4, 'fetched_at': 1.0}
+    updated = {'corp_code': '00126380', 'debt_ratio': 30.1, 'fetched_at': 2.0}
+    other = {'corp_code': '00164779', 'debt_ratio': 80.0, 'fetched_at': 1.5}
+    lines = [json.dumps(record, ensure_ascii=False) for record in (first, other, updated)]
+    path.write_text('\n'.join(lines) + '\n{"corp_code": "00401731", "debt_ra', encoding='utf-8')
+
+    records = dart_prefetch.load_progress(str(path))
+
+    assert records == {'00126380': updated, '00164779': other}
+
+
+def test_load_progress_missing_file(tmp_path):
+    assert dart_prefetch.load_progress(str(tmp_path / 'missing.jsonl')) == {}
+
+
+class _FakeDARTClient:
+    def __init__(self, api_key, rate_limiter=None):
+        self.api_calls = 0
+        self.quota_exceeded = False
+
+
+@pytest.fixture
+def prefetch_env(tmp_path, monkeypatch):
+    """DART 없이 run_prefetch 실행 (수집 함수와 대상 목록 교체)"""
+    base_path = str(tmp_path / 'snapshot')
+    monkeypatch.setattr(dart_prefetch, 'PROGRESS_PATH', base_path + '.progress.jsonl')
+    monkeypatch.setattr(dart_prefetch, 'DARTClient', _FakeDARTClient)
+    monkeypatch.setattr(dart_prefetch, 'DARTOutlierChecker', lambda *args, **kwargs: None)
+    monkeypatch.setattr(dart_prefetch, 'write_snapshot',
+                        lambda records: write_snapshot(records, base_path=base_path))
+    monkeypatch.setattr(Config, 'DART_PREFETCH_WORKERS', 1)
+
+    def install(targets, collect):
+        monkeypatch.setattr(dart_prefetch, 'load_targets', lambda: targets)
+        monkeypatch.setattr(dart_prefetch, 'collect_company', collect)
+    return base_path, install
+
+
+def _collected(corp_code, stock_code, corp_name):
+    return {'corp_code': corp_code, 'stock_code': stock_code, 'corp_name': corp_name,
+            'debt_ratio': 50.0, 'capital_raising_count': 1, 'fetched_at': dart_prefetch.time.time()}
+
+
+def test_quota_exceeded_counts_rejected_and_cancelled_as_remaining(prefetch_env, monkeypatch):
+    base_path, install = prefetch_env
+    monkeypatch.setattr(Config, 'DART_PREFETCH_WORKERS', 2)
+    targets = [(f'0000000{i}', f'00000{i}', f'기업{i}') for i in range(6)]
+    release = threading.Event()
+
+    def collect(dart_client, outlier_checker, corp_code, stock_code, corp_name):
+        # 두 작업자가 모두 막혀 있는 동안 나머지 작업은 대기열에서 취소됨
+        if corp_code == '00000001':
+            dart_client.quota_exceeded = True
+            raise DARTQuotaExceeded("DART 요청 한도 초과")
+        release.wait(5)
+        if corp_code != '00000000' and dart_client.quota_exceeded:
+            raise DARTQuotaExceeded("DART 요청 한도 초과")
+        return _collected(corp_code, stock_code, corp_name)
+
+    install(targets, collect)
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    try:
+        stats = dart_prefetch.run_prefetch('test-key')
+    finally:
+        timer.cancel()
+
+    assert stats['quota_exceeded'] is True
+    assert stats['collected'] == 1
+    assert stats['failed'] == 0
+    assert stats['remaining'] == 5
+    assert FinancialSnapshot(base_path).get('00000000')['debt_ratio'] == 50.0
+
+
+def test_errors_are_failed_not_remaining(prefetch_env):
+    base_path, install = prefetch_env
+    targets = [('00000000', '000000', '기업0'), ('00000001', '000001', '기업1')]
+
+    def collect(dart_client, outlier_checker, corp_code, stock_code, corp_name):
+        if corp_code == '00000001':
+            raise RuntimeError("응답 형식 오류")
+        return _collected(corp_code, stock_code, corp_name)
+
+    install(targets, collect)
+    stats = dart_prefetch.run_prefetch('test-key')
+
+    assert stats == {**stats, 'collected': 1, 'failed': 1, 'remaining': 0, 'quota_exceeded': False}
+    assert dart_prefetch.load_progress(dart_prefetch.PROGRESS_PATH).keys() == {'00000000'}
@@ -0,0 +1,108 @@
+# test_excel_cache.py - 엑셀 바이너리 캐시 (메모리 → 상태 비교 → 내용 해시 → 재파싱)
+
+import os
+
+import pandas as pd
+import pytest
+
+import excel_cache
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    """엑셀 파싱과 내용 해시 호출 횟수를 센다 (openpyxl 없이 CSV 내용으로 파싱)"""
+    calls = {'parse': 0, 'hash': 0}
+    real_hash = excel_cache._content_hash
+
+    def fake_read_excel(path, **kwargs):
+        calls['parse'] += 1
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = [line.split(',') for line in f.read().splitlines()]
+        return pd.DataFrame(rows[1:], columns=rows[0])
+
+    def counting_hash(path):
+        calls['hash'] += 1
+        return real_hash(path)
+
+    monkeypatch.setattr(excel_cache.pd, 'read_excel', fake_read_excel)
+    monkeypatch.setattr(excel_cache, '_content_hash', counting_hash)
+    monkeypatch.setattr(excel_cache, '_memory', {})
+    return calls
+
+
+def _write_source(path, body):
+    path.write_text(body, encoding='utf-8')
+    return str(path)
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def test_first_load_parses_and_hashes_once(tmp_path, counters):
+    source = _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\n삼성전자,005930\n")
+
+    df = excel_cache.read_excel_cached(source, cache_dir=str(tmp_path / 'cache'))
+
+    assert df['종목코드'].tolist() == ['005930']
+    assert counters == {'parse': 1, 'hash': 1}
+
+
+def test_memory_hit_skips_parse_and_hash(tmp_path, counters):
+    source = _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\n삼성전자,005930\n")
+    cache_dir = str(tmp_path / 'cache')
+
+    first = excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+    second = excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    assert second is first
+    assert counters == {'parse': 1, 'hash': 1}
+
+
+def test_binary_cache_used_when_signature_matches(tmp_path, counters, monkeypatch):
+    source = _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\n삼성전자,005930\n")
+    cache_dir = str(tmp_path / 'cache')
+    excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    # 새 프로세스처럼 메모리 캐시 비우기
+    monkeypatch.setattr(excel_cache, '_memory', {})
+    df = excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    assert df['회사명'].tolist() == ['삼성전자']
+    assert counters == {'parse': 1, 'hash': 1}
+
+
+def test_signature_only_change_reuses_cache_without_parse(tmp_path, counters):
+    source = _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\n삼성전자,005930\n")
+    cache_dir = str(tmp_path / 'cache')
+    excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    _bump_mtime(source)
+    df = excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    assert df['종목코드'].tolist() == ['005930']
+    assert counters == {'parse': 1, 'hash': 2}
+
+    # 갱신된 상태가 매니페스트에 저장돼 다음 로드는 해시 없이 캐시 사용
+    manifest = excel_cache._load_manifest(cache_dir)
+    (entry,) = manifest.values()
+    assert entry['signature'] == excel_cache._signature(source)
+
+
+def test_content_change_reparses_and_hashes_once(tmp_path, counters):
+    source = _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\n삼성전자,005930\n")
+    cache_dir = str(tmp_path / 'cache')
+    excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    _write_source(tmp_path / 'codes.xlsx', "회사명,종목코드\nSK하이닉스,000660\n")
+    _bump_mtime(source)
+    df = excel_cache.read_excel_cached(source, cache_dir=cache_dir)
+
+    assert df['회사명'].tolist() == ['SK하이닉스']
+    # 변경 감지에 한 번, 매니페스트 기록에 같은 해시 재사용
+    assert counters == {'parse': 2, 'hash': 2}
+
+    manifest = excel_cache._load_manifest(cache_dir)
+    (entry,) = manifest.values()
+    assert entry['sha1'] == excel_cache.hashlib.sha1((tmp_path / 'codes.xlsx').read_bytes()).hexdigest()
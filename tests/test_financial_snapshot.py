@@ -0,0 +1,67 @@
+# test_financial_snapshot.py - 재무 지표 스냅샷 저장/조회 (NaN → None, 오래된 행 제외)
+
+import time
+
+import pytest
+
+from financial_snapshot import FinancialSnapshot, SNAPSHOT_COLUMNS, write_snapshot
+
+
+def _record(corp_code, **values):
+    record = {column: None for column in SNAPSHOT_COLUMNS}
+    record.update(corp_code=corp_code, stock_code='005930', corp_name='삼성전자',
+                  fetched_at=time.time())
+    record.update(values)
+    return record
+
+
+def test_round_trip_converts_missing_values_to_none(tmp_path):
+    base_path = str(tmp_path / 'snapshot')
+    write_snapshot([
+        _record('00126380', debt_ratio=25.4, debt_report_type='사업보고서', debt_year=2024,
+                shareholder_ratio=20.1, shareholder_year=2024, capital_raising_count=0),
+        _record('00164779', debt_ratio=float('nan'), capital_raising_count=None),
+    ], base_path=base_path)
+
+    snapshot = FinancialSnapshot(base_path, max_age_days=14)
+    full = snapshot.get('00126380')
+    assert full['debt_ratio'] == pytest.approx(25.4)
+    assert full['debt_report_type'] == '사업보고서'
+    assert full['capital_raising_count'] == 0
+
+    partial = snapshot.get('00164779')
+    assert partial['corp_code'] == '00164779'
+    assert partial['debt_ratio'] is None
+    assert partial['debt_report_type'] is None
+    assert partial['shareholder_ratio'] is None
+    assert partial['capital_raising_count'] is None
+
+    assert len(snapshot) == 2
+    assert snapshot.stats()['hits'] == 2
+
+
+def test_rows_older_than_max_age_are_misses(tmp_path):
+    base_path = str(tmp_path / 'snapshot')
+    write_snapshot([
+        _record('00126380', debt_ratio=25.4, fetched_at=time.time() - 3 * 86400),
+        _record('00164779', debt_ratio=80.0, fetched_at=time.time() - 20 * 86400),
+    ], base_path=base_path)
+
+    snapshot = FinancialSnapshot(base_path, max_age_days=14)
+
+    assert snapshot.get('00126380')['debt_ratio'] == pytest.approx(25.4)
+    assert snapshot.get('00164779') is None
+    assert snapshot.get('99999999') is None
+    assert snapshot.stats()['hits'] == 1
+    assert snapshot.stats()['misses'] == 2
+
+
+def test_reloads_when_file_is_rewritten(tmp_path):
+    base_path = str(tmp_path / 'snapshot')
+    snapshot = FinancialSnapshot(base_path, max_age_days=14)
+    assert snapshot.get('00126380') is None
+
+    path = write_snapshot([_record('00126380', debt_ratio=25.4)], base_path=base_path)
+
+    assert snapshot.get('00126380')['debt_ratio'] == pytest.approx(25.4)
+    assert snapshot.stats()['file'] == path
@@ -0,0 +1,72 @@
+# test_fuzzy_match.py - 자모 편집 거리 / BK-tree / 종목명 오타 추정
+
+import pytest
+
+import stock_mappings
+from fuzzy_match import BKTree, LazyBKTree, levenshtein, to_jamo
+from stock_mappings import StockMapping, get_stock_code
+
+
+def test_to_jamo_decomposes_syllables():
+    assert to_jamo('삼성') == 'ㅅㅏㅁㅅㅓㅇ'
+    assert to_jamo('LG전자') == 'LGㅈㅓㄴㅈㅏ'
+
+
+def test_levenshtein():
+    assert levenshtein('kitten', 'sitting') == 3
+    assert levenshtein('', 'abc') == 3
+    assert levenshtein(to_jamo('삼송전자'), to_jamo('삼성전자')) == 1
+
+
+def test_bktree_search_matches_brute_force():
+    words = ['삼성전자', '삼성SDI', '셀트리온', '카카오', '카카오뱅크', '테스', '토스']
+    tree = BKTree((to_jamo(word), word) for word in words)
+    query = to_jamo('삼송전자')
+
+    for max_distance in range(4):
+        expected = sorted((levenshtein(query, to_jamo(word)), to_jamo(word), word)
+                          for word in words
+                          if levenshtein(query, to_jamo(word)) <= max_distance)
+        assert tree.search(query, max_distance) == expected
+
+
+def test_lazy_bktree_builds_once():
+    calls = []
+
+    def items():
+        calls.append(1)
+        return [(to_jamo('카카오'), '035720')]
+
+    tree = LazyBKTree(items)
+    assert calls == []
+    assert tree.search(to_jamo('카카우'), 1)[0][2] == '035720'
+    tree.search(to_jamo('카카오'), 1)
+    assert calls == [1]
+
+
+@pytest.fixture
+def mapping():
+    return StockMapping({'삼성전자': '005930', '삼성전기': '009150', '테스': '095610',
+                         '카카오': '035720', '에코프로': '086520', '에코프로비엠': '247540'})
+
+
+def test_short_names_are_never_fuzzy_matched(mapping):
+    assert stock_mappings._fuzzy_stock_code(mapping, '토스') is None
+    assert stock_mappings._fuzzy_stock_code(mapping, '테수') is None
+
+
+def test_typo_resolves_to_unique_closest_name(mapping):
+    assert stock_mappings._fuzzy_stock_code(mapping, '삼송전자') == '005930'
+    assert stock_mappings._fuzzy_stock_code(mapping, '카카우') == '035720'
+
+
+def test_ambiguous_typo_is_rejected(mapping):
+    # 삼성전자 / 삼성전기 모두 거리 1 → 추정하지 않음
+    assert stock_mappings._fuzzy_stock_code(mapping, '삼성전지') is None
+
+
+def test_get_stock_code_on_bundled_data():
+    assert get_stock_code('토스') is None
+    assert get_stock_code('삼송전자') == '005930'
+    assert get_stock_code('삼송전자', fuzzy=False) is None
+    assert get_stock_code('삼성') == '005930'
@@ -0,0 +1,167 @@
+# test_http_utils.py - 공용 HTTP 세션 (속도 제한 / 연결 재사용 / 재시도)
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_utils
+from config import Config
+from http_utils import TokenBucket
+
+
+class _Clock:
+    """time.monotonic / time.sleep 대용 (sleep하면 시간이 흐름)"""
+
+    def __init__(self, monkeypatch):
+        self.now = 1000.0
+        self.sleeps = []
+        monkeypatch.setattr(http_utils.time, 'monotonic', lambda: self.now)
+        monkeypatch.setattr(http_utils.time, 'sleep', self.sleep)
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """공유 세션/제한기 목록을 테스트마다 비움"""
+    monkeypatch.setattr(http_utils, '_sessions', {})
+    monkeypatch.setattr(http_utils, '_rate_limiters', {})
+
+
+def test_token_bucket_allows_burst_then_waits(monkeypatch):
+    clock = _Clock(monkeypatch)
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
+
+    waited = bucket.acquire()
+    assert waited == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    stats = bucket.stats()
+    assert stats['acquired'] == 4
+    assert stats['waited_seconds'] == pytest.approx(0.5)
+    assert stats['available_tokens'] == 0
+
+
+def test_token_bucket_refills_up_to_capacity(monkeypatch):
+    clock = _Clock(monkeypatch)
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    assert bucket.stats()['available_tokens'] == 2
+    assert bucket.acquire() == 0.0
+
+
+def test_rate_limiter_is_shared_by_name(registry):
+    serper = http_utils.get_rate_limiter('serper', 5, 5)
+
+    assert http_utils.get_rate_limiter('serper', 100, 100) is serper
+    assert serper.rate == 5  # 처음 생성할 때 값 유지
+    assert http_utils.get_rate_limiter('dart', 5, 5) is not serper
+
+
+def test_default_timeout_uses_config(monkeypatch):
+    monkeypatch.setattr(Config, 'HTTP_CONNECT_TIMEOUT', 1.5)
+    monkeypatch.setattr(Config, 'HTTP_READ_TIMEOUT', 9.0)
+
+    assert http_utils.default_timeout() == (1.5, 9.0)
+
+
+def test_create_session_configures_pool_and_retries():
+    session = http_utils.create_session(pool_size=7, max_retries=2, backoff_factor=0.1)
+
+    adapter = session.get_adapter('https://google.serper.dev/search')
+    assert adapter is session.get_adapter('http://opendart.fss.or.kr/api')
+    assert adapter._pool_maxsize == 7
+    retry = adapter.max_retries
+    assert retry.total == 2
+    assert retry.backoff_factor == 0.1
+    assert set(retry.status_forcelist) == set(http_utils.RETRY_STATUS_CODES)
+    assert {'GET', 'POST'} <= set(retry.allowed_methods)
+
+
+def test_session_is_shared_by_name(registry):
+    session = http_utils.get_session('serper', pool_size=3)
+
+    assert http_utils.get_session('serper') is session
+    assert http_utils.get_session('dart') is not session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests.append(self.command)
+            status = server.statuses.pop(0) if server.statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.statuses = []
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/search"
+
+
+def test_requests_reuse_one_connection(server, registry):
+    session = http_utils.get_session('local', max_retries=0)
+    for _ in range(3):
+        assert session.get(_url(server), timeout=5).json() == {'ok': True}
+
+    (host,) = http_utils.pool_stats()['local']
+    assert host['connections_opened'] == 1
+    assert host['requests'] == 3
+    assert host['idle_connections'] == 1
+
+
+def test_post_is_retried_on_server_errors(server):
+    server.statuses = [503, 429]
+    session = http_utils.create_session(max_retries=3, backoff_factor=0)
+
+    response = session.post(_url(server), data='{"q": "삼성전자"}', timeout=5)
+
+    assert response.status_code == 200
+    assert server.requests == ['POST', 'POST', 'POST']
+
+
+def test_last_error_status_is_returned_when_retries_run_out(server):
+    server.statuses = [502, 502, 502]
+    session = http_utils.create_session(max_retries=1, backoff_factor=0)
+
+    response = session.get(_url(server), timeout=5)
+
+    assert response.status_code == 502
+    assert len(server.requests) == 2
@@ -0,0 +1,74 @@
+# test_pdf_chunks.py - 페이지 스트림 청크 분할 (겹침 / 전진 / 페이지 범위)
+
+import pytest
+
+from pdf_processor import PDFProcessor
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 생성자가 만드는 cache/ 폴더를 임시 경로에
+    return PDFProcessor(client=None)
+
+
+def _document(pages):
+    return "\n".join(text for _, text in pages if text)
+
+
+def test_chunks_match_document_offsets_and_overlap(processor):
+    pages = [(1, "가나다라마바사아자차" * 8), (2, "카타파하" * 20), (3, "ABCDEFGHIJ" * 6)]
+    document = _document(pages)
+
+    chunks = list(processor.iter_chunks(pages, source="a.pdf", chunk_size=50, overlap=10))
+
+    assert chunks[0]['char_start'] == 0
+    assert chunks[-1]['char_end'] == len(document)
+    for chunk in chunks:
+        assert chunk['text'] == document[chunk['char_start']:chunk['char_end']]
+        assert chunk['source'] == "a.pdf"
+        assert len(chunk['text']) <= 50 + 1  # 경계 문자(줄바꿈/마침표)까지 포함
+
+    for prev, cur in zip(chunks, chunks[1:]):
+        assert cur['char_start'] > prev['char_start']      # 항상 전진
+        assert prev['char_end'] - cur['char_start'] == 10  # overlap만큼 겹침
+
+
+def test_chunks_prefer_sentence_boundary(processor):
+    pages = [(1, "첫 문장입니다. " * 10)]
+    chunks = list(processor.iter_chunks(pages, chunk_size=40, overlap=0))
+
+    assert all(chunk['text'].rstrip().endswith('.') for chunk in chunks[:-1])
+    assert "".join(chunk['text'] for chunk in chunks) == _document(pages)
+
+
+def test_chunks_report_page_range(processor):
+    pages = [(1, "a" * 30), (2, ""), (3, "b" * 30)]
+    chunks = list(processor.iter_chunks(pages, chunk_size=40, overlap=10))
+
+    # 페이지 경계(줄바꿈)에서 잘리고, 겹침 구간 때문에 두 번째 청크는 1~3페이지에 걸침
+    assert (chunks[0]['page_start'], chunks[0]['page_end']) == (1, 1)
+    assert (chunks[1]['page_start'], chunks[1]['page_end']) == (1, 3)
+    assert chunks[-1]['page_end'] == 3
+
+
+def test_overlap_not_smaller_than_chunk_still_advances(processor):
+    pages = [(1, "x" * 30)]
+    chunks = list(processor.iter_chunks(pages, chunk_size=5, overlap=10))
+
+    starts = [chunk['char_start'] for chunk in chunks]
+    assert starts == sorted(set(starts))
+    assert chunks[-1]['char_end'] == 30
+
+
+def test_token_unit_counts_words(processor):
+    words = [f"w{i}" for i in range(20)]
+    pages = [(1, " ".join(words))]
+    chunks = list(processor.iter_chunks(pages, chunk_size=5, overlap=2, unit="token"))
+
+    assert chunks[0]['text'].split() == words[:5]
+    assert chunks[1]['text'].split()[:2] == words[3:5]
+    assert chunks[-1]['text'].split()[-1] == words[-1]
+
+
+def test_empty_pages_yield_nothing(processor):
+    assert list(processor.iter_chunks([(1, ""), (2, "   ")])) == []
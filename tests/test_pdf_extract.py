@@ -0,0 +1,103 @@
+# test_pdf_extract.py - PDF 페이지 병렬 추출 (페이지 범위 작업 / 파일 해시별 추출 텍스트 캐시)
+
+import os
+import shutil
+
+import pytest
+
+import pdf_processor
+from config import Config
+from conftest import write_pdf
+from pdf_processor import PDFProcessor
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 생성자가 만드는 cache/ 폴더를 임시 경로에
+    monkeypatch.setattr(Config, 'PDF_EXTRACT_WORKERS', 1)  # 스레드 실행기 (호출 횟수 확인용)
+    monkeypatch.setattr(Config, 'PDF_PAGES_PER_TASK', 2)
+    return PDFProcessor(client=None)
+
+
+@pytest.fixture
+def range_calls(monkeypatch):
+    calls = []
+    real_extract = pdf_processor._extract_page_range
+
+    def counting_extract(pdf_path, start, end):
+        calls.append((os.path.basename(pdf_path), start, end))
+        return real_extract(pdf_path, start, end)
+
+    monkeypatch.setattr(pdf_processor, '_extract_page_range', counting_extract)
+    return calls
+
+
+def test_extract_page_range_skips_empty_pages(tmp_path):
+    path = write_pdf(tmp_path / 'a.pdf', ["Page one", "", "Page three"])
+
+    pages = pdf_processor._extract_page_range(path, 0, 3)
+
+    assert pages == [(1, "Page one"), (3, "Page three")]
+    assert pdf_processor._extract_page_range(path, 1, 2) == []
+
+
+def test_pages_are_split_into_ranges_and_returned_in_order(tmp_path, processor, range_calls):
+    path = write_pdf(tmp_path / 'a.pdf', [f"Page {i}" for i in range(1, 6)])
+
+    pages = processor.extract_pages(path)
+
+    assert pages == [(i, f"Page {i}") for i in range(1, 6)]
+    assert range_calls == [('a.pdf', 0, 2), ('a.pdf', 2, 4), ('a.pdf', 4, 5)]
+
+
+def test_second_extraction_uses_file_hash_cache(tmp_path, processor, range_calls):
+    path = write_pdf(tmp_path / 'a.pdf', ["First page", "Second page"])
+    first = processor.extract_pages(path)
+    calls_after_first = len(range_calls)
+
+    # 이름이 달라도 내용이 같으면 같은 캐시
+    copy = shutil.copy(path, tmp_path / 'renamed.pdf')
+    second = processor.extract_pages(str(copy))
+
+    assert second == first
+    assert len(range_calls) == calls_after_first
+    assert os.listdir(processor.page_cache_dir) == [f"{processor._get_file_hash(path)}.json"]
+
+
+def test_changed_file_is_extracted_again(tmp_path, processor, range_calls):
+    path = tmp_path / 'a.pdf'
+    processor.extract_pages(write_pdf(path, ["Old text"]))
+
+    pages = processor.extract_pages(write_pdf(path, ["New text"]))
+
+    assert pages == [(1, "New text")]
+    assert [call[1:] for call in range_calls] == [(0, 1), (0, 1)]
+
+
+def test_folder_pages_keep_document_order_and_skip_unreadable(tmp_path, processor):
+    first = write_pdf(tmp_path / 'a.pdf', ["Alpha one", "Alpha two", "Alpha three"])
+    broken = tmp_path / 'b.pdf'
+    broken.write_bytes(b"not a pdf")
+    second = write_pdf(tmp_path / 'c.pdf', ["Gamma one"])
+
+    with processor._create_extract_executor() as executor:
+        results = [(os.path.basename(pdf_file), list(pages))
+                   for pdf_file, pages in processor.iter_folder_pages([first, str(broken), second], executor)]
+
+    assert results == [
+        ('a.pdf', [(1, "Alpha one"), (2, "Alpha two"), (3, "Alpha three")]),
+        ('c.pdf', [(1, "Gamma one")]),
+    ]
+
+
+def test_cache_is_written_only_after_all_pages_are_read(tmp_path, processor):
+    path = write_pdf(tmp_path / 'a.pdf', ["One", "Two", "Three"])
+    file_hash = processor._get_file_hash(path)
+
+    with processor._create_extract_executor() as executor:
+        _, pages = next(processor.iter_folder_pages([path], executor))
+        next(pages)
+        assert processor._load_page_cache(file_hash) is None
+        list(pages)
+
+    assert processor._load_page_cache(file_hash) == [(1, "One"), (2, "Two"), (3, "Three")]
@@ -0,0 +1,242 @@
+# test_rag_build.py - 백그라운드 색인 생성과 스냅샷 교체 (진행 중 검색은 이전 스냅샷 사용), 폴더 감시와 증분 색인
+
+import glob
+import hashlib
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from config import Config
+from conftest import write_pdf
+from pdf_processor import PDFProcessor, RAGIndex
+
+
+class _FakeEmbeddingClient:
+    """텍스트 해시로 정해지는 384차원 임베딩 (gate가 닫혀 있으면 대기)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def feature_extraction(self, text, model):
+        assert self.gate.wait(5), "gate가 열리지 않음"
+        self.calls += 1
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(384).tolist()
+
+
+@pytest.fixture
+def client():
+    return _FakeEmbeddingClient()
+
+
+@pytest.fixture
+def make_processor(tmp_path, monkeypatch, client):
+    monkeypatch.chdir(tmp_path)  # 생성자가 만드는 cache/ 폴더를 임시 경로에
+    monkeypatch.setattr(Config, 'PDF_EXTRACT_WORKERS', 1)
+    monkeypatch.setattr(Config, 'RAG_QUANTIZATION', 'none')
+    monkeypatch.setattr(Config, 'RAG_RERANKER_MODEL', '')
+    return lambda: PDFProcessor(client=client)
+
+
+@pytest.fixture
+def pdf_folder(tmp_path):
+    folder = tmp_path / 'pdfs'
+    folder.mkdir()
+    write_pdf(folder / 'a.pdf', ["Samsung memory revenue grew", "Foundry losses narrowed"])
+    return folder
+
+
+def test_background_build_reports_warming_then_ready(make_processor, client, pdf_folder):
+    processor = make_processor()
+    client.gate.clear()
+
+    assert processor.start_background_build(str(pdf_folder)) is True
+    assert processor.start_background_build(str(pdf_folder)) is False  # 이미 생성 중
+    assert processor.rag_status()['status'] == 'warming'
+    assert processor.search_similar_chunks("memory", show_preview=False) == []
+
+    client.gate.set()
+    assert processor.wait_for_build(5)
+
+    status = processor.rag_status()
+    assert status['status'] == 'ready'
+    assert status['building'] is False
+    assert status['chunks'] == len(processor.rag_index) > 0
+    assert status['version'] == processor._get_folder_hash(str(pdf_folder))
+    results = processor.search_similar_chunks("memory revenue", mode='lexical', show_preview=False)
+    assert 'memory' in results[0]['chunk']
+
+
+def test_rebuild_keeps_previous_snapshot_until_published(make_processor, client, pdf_folder):
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+    old_index = processor.rag_index
+    old_chunks = list(old_index.chunks)
+
+    write_pdf(pdf_folder / 'b.pdf', ["Hynix HBM shipments doubled"])
+    client.gate.clear()
+    processor.start_background_build(str(pdf_folder))
+
+    # 생성 중에는 이전 스냅샷으로 검색
+    assert processor.rag_index is old_index
+    assert processor.rag_status()['status'] == 'ready'
+    assert processor.rag_status()['building'] is True
+    results = processor.search_similar_chunks("Hynix HBM", mode='lexical', show_preview=False)
+    assert all(result['source'] == 'a.pdf' for result in results)
+
+    client.gate.set()
+    assert processor.wait_for_build(5)
+
+    assert processor.rag_index is not old_index
+    assert processor.index_version != old_index.version
+    assert list(old_index.chunks) == old_chunks  # 이전 스냅샷은 그대로
+    results = processor.search_similar_chunks("Hynix HBM", mode='lexical', show_preview=False)
+    assert results[0]['source'] == 'b.pdf'
+
+
+def test_publish_clears_query_caches_only_on_version_change(make_processor):
+    processor = make_processor()
+    processor._publish(RAGIndex([], version='v1'))
+    processor._search_result_cache.put('query', [])
+    processor._query_embedding_cache.put('query', np.zeros(384))
+
+    processor._publish(RAGIndex([], version='v1'))
+    assert len(processor._search_result_cache) == 1
+
+    processor._publish(RAGIndex([], version='v2'))
+    assert len(processor._search_result_cache) == 0
+    assert len(processor._query_embedding_cache) == 0
+
+
+def test_build_without_pdfs_reports_error(make_processor, tmp_path):
+    empty = tmp_path / 'empty'
+    empty.mkdir()
+    processor = make_processor()
+
+    processor.start_background_build(str(empty))
+    assert processor.wait_for_build(5)
+
+    status = processor.rag_status()
+    assert status['status'] == 'error'
+    assert status['error'] == "처리된 PDF가 없습니다."
+
+
+def test_new_processor_loads_snapshot_from_cache(make_processor, client, pdf_folder):
+    first = make_processor()
+    assert first.process_pdf_folder(str(pdf_folder))
+    calls = client.calls
+
+    second = make_processor()
+    assert second.process_pdf_folder(str(pdf_folder))
+
+    assert client.calls == calls  # 임베딩 재계산 없음
+    assert second.index_version == first.index_version
+    assert list(second.chunks) == list(first.chunks)
+    assert second.rag_status()['status'] == 'ready'
+
+
+def test_incremental_rebuild_embeds_only_changed_files(make_processor, client, pdf_folder):
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+    old_index = processor.rag_index
+    old_rows = len(old_index)
+    calls = client.calls
+
+    write_pdf(pdf_folder / 'b.pdf', ["Hynix HBM shipments doubled"])
+    assert processor.process_pdf_folder(str(pdf_folder))
+
+    index = processor.rag_index
+    new_rows = len(index) - old_rows
+    assert client.calls == calls + new_rows  # a.pdf는 이전 임베딩 재사용
+    assert list(index.chunks)[:old_rows] == list(old_index.chunks)
+    np.testing.assert_array_equal(index.embeddings[:old_rows], old_index.embeddings)
+    assert set(index.chunk_meta.signatures) == {'a.pdf', 'b.pdf'}
+
+
+def test_removed_file_drops_out_and_old_cache_is_deleted(make_processor, client, pdf_folder):
+    write_pdf(pdf_folder / 'b.pdf', ["Hynix HBM shipments doubled"])
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+    old_version = processor.index_version
+    calls = client.calls
+
+    os.remove(pdf_folder / 'b.pdf')
+    assert processor.process_pdf_folder(str(pdf_folder))
+
+    assert client.calls == calls
+    assert {processor.chunk_meta.get(i)['source'] for i in range(len(processor.rag_index))} == {'a.pdf'}
+    assert glob.glob(os.path.join(processor.cache_dir, f"*_{old_version}.*")) == []
+
+
+def test_removing_all_pdfs_publishes_empty_index(make_processor, pdf_folder):
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+
+    os.remove(pdf_folder / 'a.pdf')
+    assert processor.process_pdf_folder(str(pdf_folder)) is False
+
+    assert len(processor.rag_index) == 0
+    assert processor.index_version == processor._get_folder_hash(str(pdf_folder))
+
+
+class _ScanTicks:
+    """감시 루프의 stop 이벤트 대용 - wait()마다 다음 동작을 실행하고, 다 쓰면 종료"""
+
+    def __init__(self, actions):
+        self.actions = list(actions)
+
+    def wait(self, interval):
+        if not self.actions:
+            return True
+        self.actions.pop(0)()
+        return False
+
+
+def test_watch_loop_rebuilds_after_folder_is_stable(make_processor, pdf_folder, monkeypatch):
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+    builds = []
+    monkeypatch.setattr(processor, 'start_background_build', lambda folder: builds.append(folder))
+
+    def add_file():
+        write_pdf(pdf_folder / 'b.pdf', ["Hynix HBM shipments doubled"])
+
+    scans = []
+    processor._watch_stop = _ScanTicks([
+        lambda: None,                  # 변경 없음
+        add_file,                      # 처음 관측 - 복사 중일 수 있어 대기
+        lambda: scans.append(list(builds)),
+        lambda: None,                  # 같은 상태를 이미 시도함 - 다시 시작하지 않음
+    ])
+    processor._watch_loop(str(pdf_folder), 0)
+
+    assert scans == [[]]
+    assert builds == [str(pdf_folder)]
+
+
+def test_watcher_publishes_new_snapshot(make_processor, pdf_folder):
+    processor = make_processor()
+    assert processor.process_pdf_folder(str(pdf_folder))
+    old_version = processor.index_version
+
+    assert processor.start_watching(str(pdf_folder), interval=0) is False
+    assert processor.start_watching(str(pdf_folder), interval=0.02) is True
+    assert processor.start_watching(str(pdf_folder), interval=0.02) is False  # 이미 감시 중
+    try:
+        write_pdf(pdf_folder / 'b.pdf', ["Hynix HBM shipments doubled"])
+        expected = processor._get_folder_hash(str(pdf_folder))
+        deadline = time.monotonic() + 5
+        while processor.index_version != expected and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        processor.stop_watching()
+        processor._watch_thread.join(5)
+        processor.wait_for_build(5)
+
+    assert processor.index_version == expected != old_version
+    assert 'b.pdf' in processor.chunk_meta.signatures
@@ -0,0 +1,134 @@
+# test_rag_reranker.py - MMR 다양화 / 겹친 청크 병합 / cross-encoder 시간 예산
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import rag_reranker
+from rag_reranker import CrossEncoderReranker, candidate_similarity, merge_overlapping, mmr_select
+
+
+def test_mmr_prefers_diverse_candidates():
+    relevance = [1.0, 0.95, 0.5]
+    similarity = np.array([[1.0, 0.99, 0.0],
+                           [0.99, 1.0, 0.0],
+                           [0.0, 0.0, 1.0]], dtype=np.float32)
+
+    assert mmr_select(relevance, similarity, 2, lambda_mult=0.5) == [0, 2]
+    assert mmr_select(relevance, similarity, 2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select(relevance, similarity, 0) == []
+
+
+def test_mmr_past_deadline_fills_by_relevance():
+    relevance = [0.2, 1.0, 0.6, 0.8]
+    similarity = np.eye(4, dtype=np.float32)
+
+    assert mmr_select(relevance, similarity, 3, deadline=time.perf_counter() - 1) == [1, 3, 2]
+
+
+def test_candidate_similarity_falls_back_to_token_jaccard():
+    matrix = candidate_similarity(['삼성전자 실적', '삼성전자 실적', '금리 인상'])
+    assert matrix[0, 1] == pytest.approx(1.0)
+    assert matrix[0, 2] == 0.0
+
+
+def _result(index, start, end, text, source='a.pdf'):
+    return {'chunk_index': index, 'chunk': text, 'source': source, 'char_start': start, 'char_end': end,
+            'page_start': 1, 'page_end': 1}
+
+
+def test_merge_overlapping_joins_neighbor_chunks_once():
+    document = "0123456789ABCDEFGHIJ"
+    results = [
+        _result(1, 8, 16, document[8:16]),
+        _result(0, 0, 10, document[0:10]),
+        _result(5, 0, 5, "other", source='b.pdf'),
+    ]
+
+    merged = merge_overlapping(results)
+
+    assert len(merged) == 2
+    assert merged[0]['chunk'] == document[0:16]
+    assert (merged[0]['char_start'], merged[0]['char_end']) == (0, 16)
+    assert merged[0]['chunk_indices'] == [1, 0]
+    assert [evidence['rank'] for evidence in merged] == [1, 2]
+
+
+class _FakeCrossEncoder:
+    """로드 / 추론 시점을 테스트가 제어하는 CrossEncoder 대역"""
+
+    load_gate = None
+    predict_gate = None
+    predictions = 0
+
+    def __init__(self, model_name):
+        if model_name == 'broken':
+            raise OSError("모델 없음")
+        _FakeCrossEncoder.load_gate.wait(5)
+
+    def predict(self, pairs):
+        _FakeCrossEncoder.predictions += 1
+        _FakeCrossEncoder.predict_gate.wait(5)
+        return [float(len(text)) for _, text in pairs]
+
+
+@pytest.fixture
+def fake_cross_encoder(monkeypatch):
+    monkeypatch.setattr(rag_reranker, 'CrossEncoder', _FakeCrossEncoder, raising=False)
+    monkeypatch.setattr(rag_reranker, 'CROSS_ENCODER_AVAILABLE', True)
+    _FakeCrossEncoder.load_gate = threading.Event()
+    _FakeCrossEncoder.predict_gate = threading.Event()
+    _FakeCrossEncoder.predictions = 0
+    yield _FakeCrossEncoder
+    _FakeCrossEncoder.load_gate.set()
+    _FakeCrossEncoder.predict_gate.set()
+
+
+def _wait_idle(reranker):
+    reranker._pending.result(timeout=5)
+
+
+def test_model_loads_outside_the_query_budget(fake_cross_encoder):
+    reranker = CrossEncoderReranker('local-model')
+
+    started = time.perf_counter()
+    assert reranker.score('질의', ['a', 'bb'], timeout=1.0) is None  # 로드 중에는 기다리지 않음
+    assert time.perf_counter() - started < 0.5
+    assert reranker.skipped == 1
+
+    fake_cross_encoder.load_gate.set()
+    fake_cross_encoder.predict_gate.set()
+    _wait_idle(reranker)
+    assert reranker.score('질의', ['a', 'bb'], timeout=1.0).tolist() == [1.0, 2.0]
+
+
+def test_running_inference_is_not_queued_behind(fake_cross_encoder):
+    fake_cross_encoder.load_gate.set()
+    reranker = CrossEncoderReranker('local-model')
+    _wait_idle(reranker)
+
+    assert reranker.score('질의', ['a'], timeout=0.05) is None   # 예산 초과, 추론은 계속 실행 중
+    assert reranker.timeouts == 1
+    assert reranker.score('질의', ['a'], timeout=1.0) is None    # 뒤에 쌓지 않고 바로 생략
+    assert fake_cross_encoder.predictions == 1
+    assert reranker.skipped == 1
+
+    fake_cross_encoder.predict_gate.set()
+    _wait_idle(reranker)
+    assert reranker.score('질의', ['abc'], timeout=1.0).tolist() == [3.0]
+
+
+def test_failed_model_load_disables_reranker(fake_cross_encoder):
+    reranker = CrossEncoderReranker('broken')
+    _wait_idle(reranker)
+
+    assert not reranker.available
+    assert reranker.score('질의', ['a'], timeout=1.0) is None
+
+
+def test_no_model_configured():
+    reranker = CrossEncoderReranker('')
+    assert not reranker.available
+    assert reranker.score('질의', ['a'], timeout=1.0) is None
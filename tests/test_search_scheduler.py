@@ -0,0 +1,78 @@
+# test_search_scheduler.py - 공유 워커 검색 스케줄러 (동일 질의 공유 / 우선순위)
+
+import threading
+
+import pytest
+
+from search_scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, SearchScheduler
+
+
+def test_same_key_in_flight_shares_one_future():
+    scheduler = SearchScheduler(max_workers=2)
+    release = threading.Event()
+    calls = []
+
+    def search():
+        calls.append(1)
+        release.wait(5)
+        return ['결과']
+
+    first = scheduler.submit('search|삼성전자', search)
+    second = scheduler.submit('search|삼성전자', search)
+    release.set()
+
+    assert first is second
+    assert first.result(timeout=5) == ['결과']
+    assert len(calls) == 1
+    assert scheduler.stats()['shared_in_flight'] == 1
+
+
+def test_finished_key_runs_again():
+    scheduler = SearchScheduler(max_workers=1)
+    assert scheduler.submit('k', lambda: 1).result(timeout=5) == 1
+    assert scheduler.submit('k', lambda: 2).result(timeout=5) == 2
+    assert scheduler.stats()['submitted'] == 2
+
+
+def test_interactive_jobs_run_before_background():
+    scheduler = SearchScheduler(max_workers=1)
+    release = threading.Event()
+    order = []
+
+    blocker = scheduler.submit('blocker', lambda: release.wait(5))
+    background = scheduler.submit('bg', lambda: order.append('bg'), PRIORITY_BACKGROUND)
+    interactive = scheduler.submit('ui', lambda: order.append('ui'), PRIORITY_INTERACTIVE)
+    release.set()
+
+    for future in (blocker, background, interactive):
+        future.result(timeout=5)
+    assert order == ['ui', 'bg']
+
+
+def test_interactive_request_promotes_queued_background_job():
+    scheduler = SearchScheduler(max_workers=1)
+    release = threading.Event()
+    order = []
+
+    blocker = scheduler.submit('blocker', lambda: release.wait(5))
+    other = scheduler.submit('other', lambda: order.append('other'), PRIORITY_BACKGROUND)
+    promoted = scheduler.submit('same', lambda: order.append('same'), PRIORITY_BACKGROUND)
+    assert scheduler.submit('same', lambda: order.append('dup'), PRIORITY_INTERACTIVE) is promoted
+    release.set()
+
+    for future in (blocker, other, promoted):
+        future.result(timeout=5)
+    assert order == ['same', 'other']  # 한 번만 실행되고 앞당겨짐
+
+
+def test_map_keeps_exceptions_per_future():
+    scheduler = SearchScheduler(max_workers=2)
+
+    def fail():
+        raise RuntimeError("HTTP 500")
+
+    futures = scheduler.map({'ok': ('a', lambda: 'A'), 'bad': ('b', fail)})
+
+    assert futures['ok'].result() == 'A'
+    with pytest.raises(RuntimeError):
+        futures['bad'].result()
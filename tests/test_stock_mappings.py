@@ -0,0 +1,106 @@
+# test_stock_mappings.py - 종목 매핑 데이터 파일 (읽기/쓰기, 첫 사용 시 로드, corpCode 갱신)
+
+import pytest
+
+import stock_mappings
+from corp_code_index import CorpCodeIndex
+
+
+@pytest.fixture
+def cached_path(tmp_path, monkeypatch):
+    """캐시 매핑 파일을 임시 경로로 돌리고 메모리 매핑을 비움"""
+    path = str(tmp_path / 'cache' / 'stock_codes.tsv')
+    monkeypatch.setattr(stock_mappings, 'CACHED_STOCK_CODES_PATH', path)
+    monkeypatch.setattr(stock_mappings, '_mapping', None)
+    return path
+
+
+def test_write_and_read_round_trip(tmp_path):
+    path = str(tmp_path / 'codes' / 'stock_codes.tsv')
+    rows = [('카카오', '035720'), ('삼성전자', '005930'), ('삼성전자', '999999'),
+            ('', '000000'), ('탭\t이름', '111111'), ('줄\n바꿈', '222222')]
+
+    written = stock_mappings.write_stock_codes(rows, path)
+
+    assert list(written.items()) == [('삼성전자', '005930'), ('카카오', '035720')]
+    assert stock_mappings.read_stock_codes(path) == written
+    with open(path, 'r', encoding='utf-8') as f:
+        assert f.readline().startswith('# 종목명 -> 종목코드')
+
+
+def test_read_skips_comments_and_blank_lines(tmp_path):
+    path = tmp_path / 'stock_codes.tsv'
+    path.write_text("# 주석\n\n삼성전자\t005930\n카카오\t035720\n삼성전자\t999999\n", encoding='utf-8')
+
+    assert stock_mappings.read_stock_codes(str(path)) == {'삼성전자': '005930', '카카오': '035720'}
+
+
+def test_mapping_is_loaded_on_first_use_from_bundled_file(cached_path):
+    assert stock_mappings._mapping is None
+
+    mapping = stock_mappings.get_mapping()
+
+    assert mapping.source == stock_mappings.BUNDLED_STOCK_CODES_PATH
+    assert stock_mappings.get_mapping() is mapping
+    assert stock_mappings.get_stock_code('삼성전자') == '005930'
+
+
+def test_cached_file_takes_precedence(cached_path):
+    stock_mappings.write_stock_codes([('신규상장', '123450')], cached_path)
+
+    mapping = stock_mappings.get_mapping()
+
+    assert mapping.source == cached_path
+    assert stock_mappings.get_stock_code('신규상장') == '123450'
+    assert stock_mappings.get_stock_code('삼성전자', fuzzy=False) is None
+
+
+def test_malformed_cached_file_falls_back_to_bundled(cached_path):
+    stock_mappings.write_stock_codes([('삼성전자', '005930')], cached_path)
+    with open(cached_path, 'a', encoding='utf-8') as f:
+        f.write("탭 없는 줄\n")
+
+    mapping = stock_mappings.get_mapping()
+
+    assert mapping.source == stock_mappings.BUNDLED_STOCK_CODES_PATH
+    assert len(mapping.codes) > 1
+
+
+def test_refresh_from_corp_index_replaces_mapping(cached_path):
+    old = stock_mappings.get_mapping()
+    corp_index = CorpCodeIndex([('신규상장', '123450', '01234567'), ('삼성전자', '005930', '00126380')])
+
+    stock_mappings.refresh_from_corp_index(corp_index)
+
+    mapping = stock_mappings.get_mapping()
+    assert mapping is not old
+    assert mapping.source == cached_path
+    assert mapping.codes == {'삼성전자': '005930', '신규상장': '123450'}
+    assert stock_mappings.read_stock_codes(cached_path) == mapping.codes
+    assert stock_mappings.get_stock_code('신규 상장') == '123450'  # 정규화 사전도 새 매핑 기준
+
+
+def test_refresh_with_empty_index_keeps_mapping(cached_path):
+    old = stock_mappings.get_mapping()
+
+    stock_mappings.refresh_from_corp_index(CorpCodeIndex())
+
+    assert stock_mappings.get_mapping() is old
+
+
+def test_refresh_in_background(cached_path):
+    corp_index = CorpCodeIndex([('신규상장', '123450', '01234567')])
+
+    stock_mappings.refresh_in_background(corp_index).join(5)
+
+    assert stock_mappings.get_stock_code('신규상장') == '123450'
+
+
+def test_module_constants_follow_current_mapping(cached_path):
+    stock_mappings.write_stock_codes([('삼성전자', '005930'), ('카카오', '035720')], cached_path)
+
+    assert stock_mappings.MAJOR_STOCK_CODES == {'삼성전자': '005930', '카카오': '035720'}
+    assert stock_mappings.TOTAL_LISTED_COMPANIES == 2
+    assert stock_mappings.TOTAL_ALIASES == len(stock_mappings.STOCK_ALIASES)
+    with pytest.raises(AttributeError):
+        stock_mappings.NOT_A_CONSTANT
@@ -0,0 +1,98 @@
+# test_vector_index.py - float32 / int8 / PQ 임베딩 색인과 recall 측정
+
+import numpy as np
+import pytest
+
+from vector_index import (INDEX_TYPES, Int8VectorIndex, PQVectorIndex, VectorIndex, build_vector_index,
+                          measure_recall, normalize_rows)
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    """군집 구조가 있는 작은 합성 임베딩 (시드 고정)"""
+    rng = np.random.default_rng(7)
+    centers = rng.standard_normal((20, 32))
+    vectors = normalize_rows(centers[rng.integers(0, 20, size=600)] + 0.5 * rng.standard_normal((600, 32)))
+    queries = normalize_rows(vectors[rng.choice(600, 20, replace=False)] + 0.2 * rng.standard_normal((20, 32)))
+    return vectors, queries
+
+
+def test_normalize_rows():
+    rows = normalize_rows([[3.0, 4.0], [0.0, 0.0]])
+    assert rows.dtype == np.float32
+    assert np.allclose(rows, [[0.6, 0.8], [0.0, 0.0]])
+
+
+def test_exact_search_orders_by_cosine(corpus):
+    vectors, queries = corpus
+    ids, scores = VectorIndex(vectors).search(queries[0], top_k=5)
+
+    expected = np.argsort(vectors @ queries[0])[::-1][:5]
+    assert ids.tolist() == expected.tolist()
+    assert np.all(np.diff(scores) <= 0)
+
+
+def test_int8_round_trip_within_tolerance(corpus):
+    vectors, _ = corpus
+    index = Int8VectorIndex(vectors)
+
+    restored = index.codes.astype(np.float32) * index.scale
+    assert index.codes.dtype == np.int8
+    assert np.abs(restored - vectors).max() <= index.scale.max() / 2 + 1e-6  # 반올림 오차 이내
+    assert index.nbytes() < vectors.nbytes / 3
+
+
+def test_int8_approximate_scores_close_to_exact(corpus):
+    vectors, queries = corpus
+    index = Int8VectorIndex(vectors)
+    assert np.abs(index.approximate_scores(queries[0]) - vectors @ queries[0]).max() < 0.05
+
+
+def test_pq_with_exact_rerank_matches_exact_top_k(corpus):
+    pytest.importorskip('sklearn')
+    vectors, queries = corpus
+    exact = VectorIndex(vectors)
+    index = PQVectorIndex(vectors, num_subvectors=8, num_centroids=32)
+
+    assert index.codes.shape == (600, 8)
+    for query in queries:
+        expected, expected_scores = exact.search(query, top_k=5, rerank_candidates=5)
+        found, found_scores = index.search(query, top_k=5, rerank_candidates=100)
+        assert found.tolist() == expected.tolist()
+        assert np.allclose(found_scores, expected_scores)
+
+
+def test_pq_rejects_indivisible_dimension(corpus):
+    vectors, _ = corpus
+    with pytest.raises(ValueError):
+        PQVectorIndex(vectors, num_subvectors=5)
+
+
+@pytest.mark.parametrize('method', ['int8', 'pq'])
+def test_codes_save_and_load(corpus, tmp_path, method):
+    if method == 'pq':
+        pytest.importorskip('sklearn')
+    vectors, queries = corpus
+    index = build_vector_index(vectors, method, num_subvectors=8)
+    path = str(tmp_path / f'{method}.npz')
+    index.save_codes(path)
+
+    loaded = INDEX_TYPES[method].load_codes(path, vectors)
+    assert np.array_equal(loaded.approximate_scores(queries[0]), index.approximate_scores(queries[0]))
+
+
+def test_measure_recall_identity(corpus):
+    vectors, queries = corpus
+    report = measure_recall(VectorIndex(vectors), queries, k=10)
+
+    assert report['method'] == 'none'
+    assert report['recall'] == 1.0
+    assert report['compression'] == pytest.approx(1.0)
+
+
+def test_measure_recall_int8_is_high(corpus):
+    vectors, queries = corpus
+    report = measure_recall(Int8VectorIndex(vectors), queries, k=10, rerank_candidates=50)
+
+    assert report['recall'] >= 0.95
+    assert report['compression'] > 3
@@ -0,0 +1,204 @@
+# test_web_searcher.py - Serper 검색 캐시 TTL / 신뢰 도메인 등급 / 구조화된 검색 결과
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import Config
+from historical_checker import HistoricalChecker
+from web_searcher import (TIER_BROKER, TIER_CORPORATE, TIER_OFFICIAL, TIER_PRESS, SearchHit,
+                          SearchResults)
+
+ORGANIC = {'organic': [
+    {'title': '삼성전자 급등', 'link': 'https://www.yna.co.kr/view/1', 'snippet': '연합뉴스 기사'},
+    {'title': '거래소 공시', 'link': 'https://kind.krx.co.kr/a', 'snippet': '공시'},
+]}
+
+
+def _cache_ttls(searcher):
+    """캐시 키 → 남은 유효 기간(초)"""
+    now = time.time()
+    rows = searcher.cache._conn.execute("SELECT key, expires_at FROM cache").fetchall()
+    return {key: expires_at - now for key, expires_at in rows}
+
+
+def test_past_window_search_is_cached_with_historical_ttl(make_web_searcher):
+    searcher = make_web_searcher(lambda payload: ORGANIC)
+
+    searcher.search_with_date('삼성전자 급등', '2020-01-15')
+
+    ttls = _cache_ttls(searcher)
+    assert list(ttls) == ['date|삼성전자 급등|2020-01-08|2020-01-22']
+    assert ttls['date|삼성전자 급등|2020-01-08|2020-01-22'] == pytest.approx(Config.SEARCH_CACHE_HISTORICAL_TTL, abs=60)
+
+    searcher.search_with_date('삼성전자  급등', '2020-01-15')  # 정규화된 같은 질의
+    assert len(searcher.session.payloads) == 1
+
+
+def test_window_including_today_uses_current_ttl(make_web_searcher):
+    searcher = make_web_searcher(lambda payload: ORGANIC)
+
+    searcher.search_with_date('삼성전자', datetime.now().strftime('%Y-%m-%d'))
+    searcher.search('삼성전자')
+
+    ttls = _cache_ttls(searcher)
+    assert len(ttls) == 2
+    for ttl in ttls.values():
+        assert ttl == pytest.approx(Config.SEARCH_CACHE_CURRENT_TTL, abs=60)
+
+
+def test_failed_search_is_not_cached(make_web_searcher):
+    searcher = make_web_searcher(lambda payload: 500)
+
+    assert not searcher.search('삼성전자').ok
+    assert _cache_ttls(searcher) == {}
+
+
+@pytest.fixture
+def historical_checker(make_web_searcher, monkeypatch):
+    checker = HistoricalChecker(make_web_searcher(lambda payload: ORGANIC), llm_client=None)
+    monkeypatch.setattr(checker, '_extract_factual_claims_with_ai', lambda user_query: ['삼성전자 주가가 급등했다'])
+    monkeypatch.setattr(checker, '_analyze_upload_time_only_with_ai', lambda **kwargs: {})
+    monkeypatch.setattr(checker, '_analyze_historical_vs_current_with_ai', lambda **kwargs: {})
+    return checker
+
+
+def test_upload_time_search_uses_cached_date_window(historical_checker):
+    searcher = historical_checker.web_searcher
+
+    historical_checker.check_upload_time_only('스크립트', '2020-01-15')
+    historical_checker.check_upload_time_only('스크립트', '2020-01-15')
+
+    ttls = _cache_ttls(searcher)
+    assert len(ttls) == 1
+    key, ttl = ttls.popitem()
+    assert key.startswith('date|') and key.endswith('|2020-01-08|2020-01-22')
+    assert ttl == pytest.approx(Config.SEARCH_CACHE_HISTORICAL_TTL, abs=60)
+    assert len(searcher.session.payloads) == 1  # 두 번째 분석은 캐시 적중
+
+
+def test_historical_vs_current_searches_past_window_and_today(historical_checker):
+    upload_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
+
+    result = historical_checker.check_historical_vs_current('스크립트', upload_date)
+
+    keys = sorted(_cache_ttls(historical_checker.web_searcher))
+    assert [key.split('|')[0] for key in keys] == ['date', 'search']
+    claim = result['comparison_data']['claim_1']
+    assert claim['historical_search'].ok and not claim['search_skipped']
+
+
+@pytest.mark.parametrize('link, expected', [
+    ('https://www.fss.or.kr/fss/main.do', ('fss.or.kr', TIER_OFFICIAL)),
+    ('https://KIND.KRX.CO.KR./disclosure', ('kind.krx.co.kr', TIER_OFFICIAL)),  # 대소문자 / 끝 점 무시
+    ('https://data.krx.co.kr/stat', ('krx.co.kr', TIER_OFFICIAL)),
+    ('https://news.yna.co.kr:8443/view', ('yna.co.kr', TIER_PRESS)),
+    ('https://rc.kbsec.com/report', ('rc.kbsec.com', TIER_BROKER)),     # 가장 구체적인 도메인 우선
+    ('https://www.kbsec.com/', ('kbsec.com', TIER_BROKER)),
+    ('https://kt.com/ir', ('kt.com', TIER_CORPORATE)),
+    ('https://www.skt.com/ir', (None, 0.0)),                            # kt.com 접미사 아님 (라벨 경계)
+    ('https://fss.or.kr.evil.example/phish', (None, 0.0)),
+    ('https://notyna.co.kr/', (None, 0.0)),
+    ('http://[bad', (None, 0.0)),                                       # 잘못된 URL
+    ('not a url', (None, 0.0)),
+    ('', (None, 0.0)),
+])
+def test_domain_tier(make_web_searcher, link, expected):
+    assert make_web_searcher().domain_tier(link) == expected
+
+
+def test_fallback_keeps_results_with_malformed_links(make_web_searcher):
+    searcher = make_web_searcher()
+    data = {'organic': [
+        {'title': '블로그', 'link': 'http://[bad'},
+        {'title': '카페', 'link': 'https://cafe.example.com/1'},
+    ]}
+
+    organic = searcher.filter_reliable_organic(data)['organic']
+
+    assert [(item['domain'], item['domain_tier']) for item in organic] == [(None, 0.0), ('cafe.example.com', 0.0)]
+    assert 'domain' not in data['organic'][0]  # 원본은 변경하지 않음
+
+
+def test_added_domain_is_matched_on_label_boundary(make_web_searcher):
+    searcher = make_web_searcher()
+    searcher.add_reliable_domain('Example.com', TIER_PRESS)
+
+    assert searcher.domain_tier('https://news.example.com/a') == ('example.com', TIER_PRESS)
+    assert searcher.domain_tier('https://badexample.com/a') == (None, 0.0)
+    searcher.remove_reliable_domain('example.com')
+    assert searcher.domain_tier('https://news.example.com/a') == (None, 0.0)
+
+
+def test_search_hit_from_organic_defaults_missing_fields():
+    hit = SearchHit.from_organic({'title': '제목', 'link': 'https://x.example/1', 'domain': None})
+
+    assert hit == SearchHit(title='제목', snippet='', link='https://x.example/1')
+
+
+def test_search_hit_prompt_text_truncates_snippet():
+    hit = SearchHit(title='삼성전자 급등', snippet='가' * 30, link='https://www.yna.co.kr/view/1',
+                    date='2024-01-05', domain='yna.co.kr', tier=TIER_PRESS)
+
+    assert hit.to_prompt_text(max_chars=10) == f"- 삼성전자 급등 (2024-01-05 · yna.co.kr): {'가' * 10}..."
+    assert SearchHit(title='제목', snippet='짧음', link='').to_prompt_text() == "- 제목: 짧음"
+
+
+def test_search_results_prompt_text_orders_by_tier_and_limits_hits():
+    hits = [
+        SearchHit(title='블로그', snippet='b', link='', tier=0.0),
+        SearchHit(title='기사1', snippet='p1', link='', tier=TIER_PRESS),
+        SearchHit(title='공시', snippet='o', link='', tier=TIER_OFFICIAL),
+        SearchHit(title='기사2', snippet='p2', link='', tier=TIER_PRESS),
+    ]
+    results = SearchResults(query='q', hits=hits, answer='요약' * 5)
+
+    text = results.to_prompt_text(max_hits=3, max_chars=4)
+
+    assert text.splitlines() == [
+        "- 요약 답변: 요약요약",
+        "- 공시: o",
+        "- 기사1: p1",   # 같은 등급은 검색 순위 유지
+        "- 기사2: p2",
+    ]
+
+
+def test_search_results_error_and_empty():
+    failed = SearchResults(query='q', error="검색 실패: 500")
+    assert not failed.ok
+    assert failed.to_prompt_text() == "검색 실패: 500"
+
+    empty = SearchResults(query='q')
+    assert empty.ok and len(empty) == 0
+    assert empty.to_prompt_text() == "검색 결과 없음"
+
+
+def test_search_results_to_dict_is_json_serializable():
+    results = SearchResults(query='삼성전자', hits=[SearchHit(title='t', snippet='s', link='l', tier=1.0)])
+
+    data = json.loads(json.dumps(results.to_dict(), ensure_ascii=False))
+
+    assert data == {'query': '삼성전자', 'answer': '', 'error': '', 'hits': [
+        {'title': 't', 'snippet': 's', 'link': 'l', 'date': '', 'domain': '', 'tier': 1.0}]}
+
+
+def test_search_returns_structured_results(make_web_searcher):
+    searcher = make_web_searcher(lambda payload: dict(ORGANIC, answerBox={'snippet': '요약 답변'}))
+
+    results = searcher.search('삼성전자 주가')
+
+    assert results.ok
+    assert results.query == '삼성전자 주가'
+    assert results.answer == '요약 답변'
+    assert [(hit.domain, hit.tier) for hit in results.hits] == [
+        ('yna.co.kr', TIER_PRESS), ('kind.krx.co.kr', TIER_OFFICIAL)]
+
+
+def test_search_http_error_returns_error_result(make_web_searcher):
+    results = make_web_searcher(lambda payload: 500).search('삼성전자')
+
+    assert not results.ok
+    assert results.hits == []
+    assert results.error == "검색 실패: 500"
@@ -1,9 +1,268 @@
 ﻿# web_searcher.py
 
-import requests
 import json
+import unicodedata
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from config import Config
+from cache_utils import DiskCache
+from http_utils import default_timeout, get_rate_limiter, get_session
+from search_scheduler import PRIORITY_INTERACTIVE, get_search_scheduler
+
+# 신뢰 등급 점수 (높을수록 신뢰도 높음)
+TIER_OFFICIAL = 1.0    # 금융 당국·정부·공시 시스템
+TIER_RESEARCH = 0.9    # 연구기관·대학·기업분석 데이터
+TIER_PRESS = 0.8       # 주요 언론사·국제 신용평가/통신사
+TIER_BROKER = 0.7      # 증권사·자산운용사
+TIER_CORPORATE = 0.6   # 상장회사 공식 사이트
+TIER_GENERAL = 0.5     # 통합 도메인·금융 플랫폼 등 기타
+
+# 신뢰 도메인 → 등급. 호스트 이름을 라벨(.) 경계 기준 접미사로 매칭하며,
+# 가장 구체적인 도메인이 우선합니다 (예: rc.kbsec.com > kbsec.com, kt.com은 skt.com과 매칭되지 않음)
+RELIABLE_DOMAIN_TIERS = {
+    # 금융 공식 기관
+    'fss.or.kr': TIER_OFFICIAL,                  # 금융감독원
+    'krx.co.kr': TIER_OFFICIAL,                  # 한국거래소
+    'kofia.or.kr': TIER_OFFICIAL,                # 금융투자협회
+    'kdic.or.kr': TIER_OFFICIAL,                 # 예금보험공사
+    'bok.or.kr': TIER_OFFICIAL,                  # 한국은행
+    'koscom.co.kr': TIER_OFFICIAL,               # 코스콤
+    'kfb.or.kr': TIER_OFFICIAL,                  # 전국은행연합회
+    'ksds.or.kr': TIER_OFFICIAL,                 # 한국예탁결제원
+    'ksfc.co.kr': TIER_OFFICIAL,                 # 한국증권금융
+    'kreia.or.kr': TIER_OFFICIAL,                # 한국신용정보원
+    'crefia.or.kr': TIER_OFFICIAL,               # 여신금융협회
+    'kibo.or.kr': TIER_OFFICIAL,                 # 신용보증기금
+    'kdb.co.kr': TIER_OFFICIAL,                  # 한국산업은행
+    'finter.co.kr': TIER_OFFICIAL,               # 파인 금융감독원 금융소비자 포털
+
+    # 정부 기관 및 연구소
+    'moef.go.kr': TIER_OFFICIAL,                 # 기획재정부
+    'motie.go.kr': TIER_OFFICIAL,                # 산업통상자원부
+    'msit.go.kr': TIER_OFFICIAL,                 # 과학기술정보통신부
+    'gov.kr': TIER_OFFICIAL,                     # 정부 통합
+    'kostat.go.kr': TIER_OFFICIAL,               # 통계청
+    'kif.re.kr': TIER_RESEARCH,                  # 한국금융연구원
+    'kcmi.re.kr': TIER_RESEARCH,                 # 자본시장연구원
+    'kdi.re.kr': TIER_RESEARCH,                  # 한국개발연구원
+    'korcham.net': TIER_RESEARCH,                # 대한상공회의소
+    'kist.re.kr': TIER_RESEARCH,                 # 한국과학기술연구원
+    'krict.re.kr': TIER_RESEARCH,                # 한국화학연구원
+    'kiri.re.kr': TIER_RESEARCH,                 # 보험연구원
+
+    # 대학 및 연구기관 (종합대학)
+    'snu.ac.kr': TIER_RESEARCH,                  # 서울대학교
+    'yonsei.ac.kr': TIER_RESEARCH,               # 연세대학교
+    'korea.ac.kr': TIER_RESEARCH,                # 고려대학교
+    'skku.edu': TIER_RESEARCH,                   # 성균관대학교
+    'hanyang.ac.kr': TIER_RESEARCH,              # 한양대학교
+    'kaist.ac.kr': TIER_RESEARCH,                # KAIST
+    'postech.ac.kr': TIER_RESEARCH,              # 포항공과대학교
+    'unist.ac.kr': TIER_RESEARCH,                # 울산과기원
+    'gist.ac.kr': TIER_RESEARCH,                 # 광주과기원
+    'kau.ac.kr': TIER_RESEARCH,                  # 한국항공대학교
+    'cau.ac.kr': TIER_RESEARCH,                  # 중앙대학교
+
+    # 특화/산업중심 대학
+    'ajou.ac.kr': TIER_RESEARCH,                 # 아주대학교
+    'chungbuk.ac.kr': TIER_RESEARCH,             # 충북대학교
+    'knu.ac.kr': TIER_RESEARCH,                  # 경북대학교
+    'kentech.ac.kr': TIER_RESEARCH,              # 한국에너지공과대학교
+    'inha.ac.kr': TIER_RESEARCH,                 # 인하대학교
+    'pusan.ac.kr': TIER_RESEARCH,                # 부산대학교
+
+    # 대학 부설연구소 (금융/경제 특화)
+    'econ.snu.ac.kr': TIER_RESEARCH,             # 서울대 경제연구소
+    'ifc.yonsei.ac.kr': TIER_RESEARCH,           # 연세대 금융연구센터
+    'biz.korea.ac.kr': TIER_RESEARCH,            # 고려대 경영연구소
+    'dsl.korea.ac.kr': TIER_RESEARCH,            # 고려대 데이터사이언스 연구소
+    'fsc.kaist.ac.kr': TIER_RESEARCH,            # KAIST 금융공학센터
+    'datasci.skku.edu': TIER_RESEARCH,           # 성균관대 데이터사이언스
+
+    # 대학 통합 도메인
+    'ac.kr': TIER_GENERAL,                       # 대학 통합 도메인
+    're.kr': TIER_GENERAL,                       # 연구기관 통합 도메인
+
+    # 공식 투자정보 및 데이터포털
+    'dart.fss.or.kr': TIER_OFFICIAL,             # 전자공시시스템 DART
+    'kind.krx.co.kr': TIER_OFFICIAL,             # KRX 상장공시시스템
+    'seibro.or.kr': TIER_OFFICIAL,               # 증권정보포털 세이브로
+    'comp.fnguide.com': TIER_RESEARCH,           # 에프앤가이드 기업분석
+    'consensus.hankyung.com': TIER_RESEARCH,     # 한국경제 컨센서스
+    'bigfinance.co.kr': TIER_GENERAL,            # BigFinance
+
+    # 주요 언론사
+    'yna.co.kr': TIER_PRESS,                     # 연합뉴스
+    'chosun.com': TIER_PRESS,                    # 조선일보
+    'joongang.co.kr': TIER_PRESS,                # 중앙일보
+    'donga.com': TIER_PRESS,                     # 동아일보
+    'hankyung.com': TIER_PRESS,                  # 한국경제
+    'mk.co.kr': TIER_PRESS,                      # 매일경제
+    'edaily.co.kr': TIER_PRESS,                  # 이데일리
+    'etnews.com': TIER_PRESS,                    # 전자신문
+    'businesspost.co.kr': TIER_PRESS,            # 비즈니스포스트
+    'newsis.com': TIER_PRESS,                    # 뉴시스
+    'news1.kr': TIER_PRESS,                      # 뉴스1
+    'mt.co.kr': TIER_PRESS,                      # 머니투데이
+    'fnnews.com': TIER_PRESS,                    # 파이낸셜뉴스
+    'wowtv.co.kr': TIER_PRESS,                   # 한국경제TV
+    'sbscnbc.co.kr': TIER_PRESS,                 # SBS CNBC
+    'sedaily.com': TIER_PRESS,                   # 서울경제
+    'asiae.co.kr': TIER_PRESS,                   # 아시아경제
+    'economist.co.kr': TIER_PRESS,               # 이코노미스트(조선)
+    'ajunews.com': TIER_PRESS,                   # 아주경제
+    'heraldcorp.com': TIER_PRESS,                # 헤럴드경제
+    'dt.co.kr': TIER_PRESS,                      # 디지털타임스
+    'getnews.co.kr': TIER_PRESS,                 # 지디넷코리아
+    'newspim.com': TIER_PRESS,                   # 뉴스핌
+    'finance.naver.com': TIER_GENERAL,           # 네이버 금융
+
+    # 증권사 및 자산운용사
+    'nhqv.com': TIER_BROKER,                     # NH투자증권
+    'securities.koreainvestment.com': TIER_BROKER, # 한국투자증권
+    'kbsec.com': TIER_BROKER,                    # KB증권
+    'rc.kbsec.com': TIER_BROKER,                 # KB증권 리서치본부
+    'samsungpop.com': TIER_BROKER,               # 삼성증권
+    'samsungsecurities.com': TIER_BROKER,        # 삼성증권
+    'securities.miraeasset.com': TIER_BROKER,    # 미래에셋증권
+    'miraeasset.com': TIER_BROKER,               # 미래에셋증권
+    'iprovest.com': TIER_BROKER,                 # DB금융투자
+    'hmsec.com': TIER_BROKER,                    # 현대차증권
+    'sk-securities.co.kr': TIER_BROKER,          # SK증권
+    'daishin.com': TIER_BROKER,                  # 대신증권
+    'cape.co.kr': TIER_BROKER,                   # 카프투자증권
+    'shinhansec.com': TIER_BROKER,               # 신한투자증권
+    'hanwhawm.com': TIER_BROKER,                 # 한화투자증권
+    'kiwoom.com': TIER_BROKER,                   # 키움증권
+    'truefriend.com': TIER_BROKER,               # 유진투자증권
+
+    # 금융 서비스 플랫폼
+    'koreakbland.kr': TIER_GENERAL,              # KB부동산
+    'toss.im': TIER_GENERAL,                     # 토스 가이드
+
+    # 상장회사 공식 사이트 (주요 기업들)
+    'samsung.com': TIER_CORPORATE,               # 삼성
+    'sec.samsung.com': TIER_CORPORATE,           # 삼성전자
+    'lge.co.kr': TIER_CORPORATE,                 # LG
+    'hyundai.com': TIER_CORPORATE,               # 현대
+    'sk.com': TIER_CORPORATE,                    # SK
+    'skhynix.com': TIER_CORPORATE,               # SK하이닉스
+    'posco.com': TIER_CORPORATE,                 # POSCO
+    'hanwha.com': TIER_CORPORATE,                # 한화
+    'lgchem.com': TIER_CORPORATE,                # LG화학
+    'sktelecom.com': TIER_CORPORATE,             # SK텔레콤
+    'kt.com': TIER_CORPORATE,                    # KT
+    'lguplus.co.kr': TIER_CORPORATE,             # LG유플러스
+    'navercorp.com': TIER_CORPORATE,             # NAVER
+
+    # 국제 신뢰 기관
+    'reuters.com': TIER_PRESS,                   # 로이터
+    'bloomberg.com': TIER_PRESS,                 # 블룸버그
+    'wsj.com': TIER_PRESS,                       # 월스트리트저널
+    'ft.com': TIER_PRESS,                        # 파이낸셜타임스
+    'nikkei.com': TIER_PRESS,                    # 니혼게이자이신문
+    'moodys.com': TIER_PRESS,                    # 무디스
+    'standardandpoors.com': TIER_PRESS,          # S&P
+    'fitchratings.com': TIER_PRESS,              # 피치
+
+    # 기타 신뢰할 수 있는 금융 정보원
+    'investingkr.com': TIER_GENERAL,             # 인베스팅코리아
+    'fnguide.com': TIER_GENERAL,                 # FN가이드
+    'quantplus.co.kr': TIER_GENERAL,             # 퀀트플러스
+}
+
+# 프롬프트에 넣을 검색 결과 개수 / 스니펫 길이
+PROMPT_MAX_HITS = 5
+PROMPT_SNIPPET_CHARS = 200
+
+
+def _link_host(link):
+    """URL의 호스트 이름 (없거나 잘못된 URL이면 빈 문자열)"""
+    try:
+        return urlsplit(link).hostname or ""
+    except ValueError:  # 예: 'http://[bad' (잘못된 IPv6 표기)
+        return ""
+
+
+@dataclass
+class SearchHit:
+    """신뢰도 필터링을 거친 검색 결과 한 건"""
+    title: str
+    snippet: str
+    link: str
+    date: str = ""
+    domain: str = ""
+    tier: float = 0.0
+
+    @classmethod
+    def from_organic(cls, item):
+        """Serper organic 항목(domain / domain_tier 추가된 dict)에서 생성"""
+        return cls(
+            title=item.get('title', ''),
+            snippet=item.get('snippet', ''),
+            link=item.get('link', ''),
+            date=item.get('date', ''),
+            domain=item.get('domain') or '',
+            tier=item.get('domain_tier', 0.0)
+        )
+
+    def to_prompt_text(self, max_chars=PROMPT_SNIPPET_CHARS):
+        """프롬프트용 한 줄 요약 (제목 · 날짜 · 출처 + 스니펫)"""
+        snippet = self.snippet
+        if len(snippet) > max_chars:
+            snippet = snippet[:max_chars] + "..."
+        meta = " · ".join(part for part in (self.date, self.domain) if part)
+        header = f"{self.title} ({meta})" if meta else self.title
+        return f"- {header}: {snippet}"
+
+
+@dataclass
+class SearchResults:
+    """
+    검색 질의 하나의 결과 (모듈 간에는 객체로 전달, API 응답에서만 dict로 직렬화)
+
+    error가 있으면 검색 실패이며 hits는 비어 있습니다.
+    """
+    query: str
+    hits: list = field(default_factory=list)
+    answer: str = ""
+    error: str = ""
+
+    @property
+    def ok(self):
+        return not self.error
+
+    def __len__(self):
+        return len(self.hits)
+
+    def to_dict(self):
+        return asdict(self)
+
+    def to_prompt_text(self, max_hits=PROMPT_MAX_HITS, max_chars=PROMPT_SNIPPET_CHARS):
+        """
+        LLM 프롬프트용 압축 텍스트
+
+        Args:
+            max_hits: 포함할 최대 결과 수 (신뢰 등급 → 원래 순서)
+            max_chars: 결과 하나당 스니펫 최대 글자 수
+
+        Returns:
+            결과 목록 문자열 (실패 시 오류 메시지)
+        """
+        if self.error:
+            return self.error
+        if not self.hits and not self.answer:
+            return "검색 결과 없음"
+
+        lines = []
+        if self.answer:
+            lines.append(f"- 요약 답변: {self.answer[:max_chars]}")
+        ranked = sorted(self.hits, key=lambda hit: -hit.tier)  # 안정 정렬이라 같은 등급은 검색 순위 유지
+        lines.extend(hit.to_prompt_text(max_chars) for hit in ranked[:max_hits])
+        return "\n".join(lines)
+
 
 class WebSearcher:
     def __init__(self, api_key):
@@ -16,158 +275,105 @@ class WebSearcher:
         self.api_key = api_key
         self.base_url = "https://google.serper.dev/search"
         
-        # 신뢰도 높은 도메인 리스트
-        self.reliable_domains = [
-            # 금융 공식 기관
-            'fss.or.kr',           # 금융감독원
-            'krx.co.kr',           # 한국거래소
-            'kofia.or.kr',         # 금융투자협회
-            'kdic.or.kr',          # 예금보험공사
-            'bok.or.kr',           # 한국은행
-            'koscom.co.kr',        # 코스콤
-            'kfb.or.kr',           # 전국은행연합회
-            'ksds.or.kr',          # 한국예탁결제원
-            'ksfc.co.kr',          # 한국증권금융
-            'kreia.or.kr',         # 한국신용정보원
-            'crefia.or.kr',        # 여신금융협회
-            'kibo.or.kr',          # 신용보증기금
-            'kdb.co.kr',           # 한국산업은행
-            'finter.co.kr',        # 파인 금융감독원 금융소비자 포털
-            
-            # 정부 기관 및 연구소
-            'moef.go.kr',          # 기획재정부  
-            'motie.go.kr',         # 산업통상자원부
-            'msit.go.kr',          # 과학기술정보통신부
-            'gov.kr',              # 정부 통합
-            'kostat.go.kr',        # 통계청
-            'kif.re.kr',           # 한국금융연구원
-            'kcmi.re.kr',          # 자본시장연구원
-            'kdi.re.kr',           # 한국개발연구원
-            'korcham.net',         # 대한상공회의소
-            'kist.re.kr',          # 한국과학기술연구원
-            'krict.re.kr',         # 한국화학연구원
-            'kiri.re.kr',          # 보험연구원
-            
-            # 대학 및 연구기관 (종합대학)
-            'snu.ac.kr',           # 서울대학교
-            'yonsei.ac.kr',        # 연세대학교
-            'korea.ac.kr',         # 고려대학교
-            'skku.edu',            # 성균관대학교
-            'hanyang.ac.kr',       # 한양대학교
-            'kaist.ac.kr',         # KAIST
-            'postech.ac.kr',       # 포항공과대학교
-            'unist.ac.kr',         # 울산과기원
-            'gist.ac.kr',          # 광주과기원
-            'kau.ac.kr',           # 한국항공대학교
-            'cau.ac.kr',           # 중앙대학교
-            
-            # 특화/산업중심 대학
-            'ajou.ac.kr',          # 아주대학교
-            'chungbuk.ac.kr',      # 충북대학교
-            'knu.ac.kr',           # 경북대학교
-            'kentech.ac.kr',       # 한국에너지공과대학교
-            'inha.ac.kr',          # 인하대학교
-            'pusan.ac.kr',         # 부산대학교
-            
-            # 대학 부설연구소 (금융/경제 특화)
-            'econ.snu.ac.kr',      # 서울대 경제연구소
-            'ifc.yonsei.ac.kr',    # 연세대 금융연구센터
-            'biz.korea.ac.kr',     # 고려대 경영연구소
-            'dsl.korea.ac.kr',     # 고려대 데이터사이언스 연구소
-            'fsc.kaist.ac.kr',     # KAIST 금융공학센터
-            'datasci.skku.edu',    # 성균관대 데이터사이언스
-            
-            # 대학 통합 도메인
-            'ac.kr',               # 대학 통합 도메인
-            're.kr',               # 연구기관 통합 도메인
-            
-            # 공식 투자정보 및 데이터포털
-            'dart.fss.or.kr',      # 전자공시시스템 DART
-            'kind.krx.co.kr',      # KRX 상장공시시스템
-            'seibro.or.kr',        # 증권정보포털 세이브로
-            'comp.fnguide.com',    # 에프앤가이드 기업분석
-            'consensus.hankyung.com', # 한국경제 컨센서스
-            'bigfinance.co.kr',    # BigFinance
-            
-            # 주요 언론사
-            'yna.co.kr',           # 연합뉴스
-            'chosun.com',          # 조선일보
-            'joongang.co.kr',      # 중앙일보
-            'donga.com',           # 동아일보
-            'hankyung.com',        # 한국경제
-            'mk.co.kr',            # 매일경제
-            'edaily.co.kr',        # 이데일리
-            'etnews.com',          # 전자신문
-            'businesspost.co.kr',  # 비즈니스포스트
-            'newsis.com',          # 뉴시스
-            'news1.kr',            # 뉴스1
-            'mt.co.kr',            # 머니투데이
-            'fnnews.com',          # 파이낸셜뉴스
-            'wowtv.co.kr',         # 한국경제TV
-            'sbscnbc.co.kr',       # SBS CNBC
-            'sedaily.com',         # 서울경제
-            'asiae.co.kr',         # 아시아경제
-            'economist.co.kr',     # 이코노미스트(조선)
-            'ajunews.com',         # 아주경제
-            'heraldcorp.com',      # 헤럴드경제
-            'dt.co.kr',            # 디지털타임스
-            'getnews.co.kr',       # 지디넷코리아
-            'newspim.com',         # 뉴스핌
-            'finance.naver.com',   # 네이버 금융
-            
-            # 증권사 및 자산운용사
-            'nhqv.com',            # NH투자증권
-            'securities.koreainvestment.com', # 한국투자증권
-            'kbsec.com',           # KB증권
-            'rc.kbsec.com',        # KB증권 리서치본부
-            'samsungpop.com',      # 삼성증권
-            'samsungsecurities.com', # 삼성증권
-            'securities.miraeasset.com', # 미래에셋증권
-            'miraeasset.com',      # 미래에셋증권
-            'iprovest.com',        # DB금융투자
-            'hmsec.com',           # 현대차증권
-            'sk-securities.co.kr', # SK증권
-            'daishin.com',         # 대신증권
-            'cape.co.kr',          # 카프투자증권
-            'shinhansec.com',      # 신한투자증권
-            'hanwhawm.com',        # 한화투자증권
-            'kiwoom.com',          # 키움증권
-            'truefriend.com',      # 유진투자증권
-            
-            # 금융 서비스 플랫폼
-            'koreakbland.kr',      # KB부동산
-            'toss.im',             # 토스 가이드
+        # 공유 세션 (keep-alive 연결 재사용 + 타임아웃 + 429/5xx 재시도)
+        self.session = get_session('serper')
+        
+        # 프로세스 전체 Serper 요청 속도 제한 + 공유 검색 워커
+        self.rate_limiter = get_rate_limiter('serper', Config.SERPER_RATE_LIMIT, Config.SERPER_BURST)
+        self.scheduler = get_search_scheduler()
+        
+        # 검색 결과 디스크 캐시 (정규화된 질의 + 날짜 구간 → Serper 원본 응답)
+        self.cache = DiskCache(Config.SEARCH_CACHE_PATH, Config.SEARCH_CACHE_MAX_ENTRIES)
+        
+        # 신뢰도 높은 도메인 → 등급 (인스턴스별로 추가/제거 가능)
+        self.domain_tiers = dict(RELIABLE_DOMAIN_TIERS)
+    
+    @property
+    def reliable_domains(self):
+        """신뢰 도메인 목록 (기존 호환용)"""
+        return list(self.domain_tiers)
+    
+    def domain_tier(self, link):
+        """
+        링크의 신뢰 도메인과 등급 조회
+        
+        호스트를 한 번 파싱한 뒤 가장 구체적인 접미사부터 사전에서 찾습니다
+        (news.example.co.kr → news.example.co.kr, example.co.kr, co.kr, kr).
+        
+        Args:
+            link: 검색 결과 URL
+        
+        Returns:
+            (매칭된 도메인, 등급 점수) - 신뢰 도메인이 아니면 (None, 0.0)
+        """
+        host = _link_host(link)
+        if not host:
+            return None, 0.0
+        
+        labels = host.rstrip('.').split('.')
+        for i in range(len(labels)):
+            domain = '.'.join(labels[i:])
+            tier = self.domain_tiers.get(domain)
+            if tier is not None:
+                return domain, tier
+        return None, 0.0
+    
+    def filter_reliable_organic(self, results_data):
+        """
+        파싱된 Serper 응답에서 신뢰도 높은 소스만 남기기 (dict를 그대로 다룸)
+        
+        남긴 결과에는 domain / domain_tier가 추가됩니다.
+        
+        Args:
+            results_data: Serper 응답 dict
+        
+        Returns:
+            organic이 필터링된 dict (원본은 변경하지 않음)
+        """
+        if 'organic' not in results_data:
+            return results_data
+        
+        original_results = results_data['organic']
+        
+        # 신뢰도 높은 결과만 필터링
+        filtered_organic = []
+        for result in original_results:
+            link = result.get('link', '')
             
-            # 상장회사 공식 사이트 (주요 기업들)
-            'samsung.com',         # 삼성
-            'sec.samsung.com',     # 삼성전자
-            'lge.co.kr',           # LG
-            'hyundai.com',         # 현대
-            'sk.com',              # SK
-            'skhynix.com',         # SK하이닉스
-            'posco.com',           # POSCO
-            'hanwha.com',          # 한화
-            'lgchem.com',          # LG화학
-            'sktelecom.com',       # SK텔레콤
-            'kt.com',              # KT
-            'lguplus.co.kr',       # LG유플러스
-            'navercorp.com',       # NAVER
+            # 신뢰할 수 있는 도메인인지 확인 (라벨 경계 접미사 매칭)
+            domain, tier = self.domain_tier(link)
             
-            # 국제 신뢰 기관
-            'reuters.com',         # 로이터
-            'bloomberg.com',       # 블룸버그
-            'wsj.com',             # 월스트리트저널 
-            'ft.com',              # 파이낸셜타임스
-            'nikkei.com',          # 니혼게이자이신문
-            'moodys.com',          # 무디스
-            'standardandpoors.com', # S&P
-            'fitchratings.com',    # 피치
+            if domain is not None:
+                filtered_organic.append(dict(result, domain=domain, domain_tier=tier))
+                print(f"✅ 신뢰 소스 포함 ({tier:.1f}): {link}")
+            else:
+                print(f"❌ 신뢰도 낮은 소스 제외: {link}")
+        
+        print(f"📊 검색 결과 필터링: {len(filtered_organic)}개 소스만 사용")
+        
+        # 필터링된 결과가 너무 적으면 상위 3개 결과는 포함 (완화 정책)
+        if len(filtered_organic) < 2:
+            print("⚠️ 신뢰할 수 있는 검색 결과가 부족합니다. 상위 결과 일부 포함...")
+            
+            # 현재 filtered_organic에 있는 링크들 추출
+            existing_links = {result.get('link', '') for result in filtered_organic}
+            
+            # 원본 결과 상위 3개를 추가 (중복 제거)
+            added_count = 0
+            for result in original_results:
+                if added_count >= 3:
+                    break
+                    
+                link = result.get('link', '')
+                if link not in existing_links:
+                    filtered_organic.append(dict(result, domain=_link_host(link) or None, domain_tier=0.0))
+                    existing_links.add(link)
+                    print(f"🔄 예외 포함: {link}")
+                    added_count += 1
             
-            # 기타 신뢰할 수 있는 금융 정보원
-            'investingkr.com',     # 인베스팅코리아
-            'fnguide.com',         # FN가이드
-            'quantplus.co.kr',     # 퀀트플러스
-        ]
+            print(f"📊 최종 결과: {len(filtered_organic)}개 소스 사용")
+        
+        return dict(results_data, organic=filtered_organic)
     
     def filter_reliable_results(self, search_results):
         """
@@ -177,63 +383,78 @@ class WebSearcher:
             search_results: 원본 검색 결과 (JSON 문자열)
             
         Returns:
-            필터링된 검색 결과 (JSON 문자열)
+            필터링된 검색 결과 (압축 JSON 문자열)
         """
         try:
-            results_data = json.loads(search_results)
-            
-            if 'organic' not in results_data:
-                return search_results
-            
-            # 신뢰도 높은 결과만 필터링
-            filtered_organic = []
-            for result in results_data['organic']:
-                link = result.get('link', '')
-                
-                # 신뢰할 수 있는 도메인인지 확인
-                is_reliable = any(domain in link for domain in self.reliable_domains)
-                
-                if is_reliable:
-                    filtered_organic.append(result)
-                    print(f"✅ 신뢰 소스 포함: {link}")
-                else:
-                    print(f"❌ 신뢰도 낮은 소스 제외: {link}")
-            
-            # 필터링된 결과로 업데이트
-            results_data['organic'] = filtered_organic
-            
-            print(f"📊 검색 결과 필터링: {len(results_data.get('organic', []))}개 소스만 사용")
-            
-            # 필터링된 결과가 너무 적으면 상위 3개 결과는 포함 (완화 정책)
-            if len(filtered_organic) < 2:
-                print("⚠️ 신뢰할 수 있는 검색 결과가 부족합니다. 상위 결과 일부 포함...")
-                original_results = json.loads(search_results).get('organic', [])
-                
-                # 현재 filtered_organic에 있는 링크들 추출
-                existing_links = {result.get('link', '') for result in filtered_organic}
-                
-                # 원본 결과 상위 3개를 추가 (중복 제거)
-                added_count = 0
-                for result in original_results:
-                    if added_count >= 3:
-                        break
-                        
-                    link = result.get('link', '')
-                    if link not in existing_links:
-                        filtered_organic.append(result)
-                        existing_links.add(link)
-                        print(f"🔄 예외 포함: {link}")
-                        added_count += 1
-                
-                results_data['organic'] = filtered_organic
-                print(f"📊 최종 결과: {len(filtered_organic)}개 소스 사용")
-            
-            return json.dumps(results_data, ensure_ascii=False, indent=2)
+            results_data = self.filter_reliable_organic(json.loads(search_results))
+            return json.dumps(results_data, ensure_ascii=False, separators=(',', ':'))
             
         except Exception as e:
             print(f"검색 결과 필터링 오류: {e}")
             return search_results  # 오류 시 원본 반환
     
+    def _parse_results(self, query, response_text):
+        """
+        Serper 응답 텍스트를 한 번만 파싱해 신뢰도 필터링된 SearchResults로 변환
+        
+        Args:
+            query: 원래 검색 질의
+            response_text: Serper 원본 응답 (JSON 문자열)
+        
+        Returns:
+            SearchResults
+        """
+        results_data = self.filter_reliable_organic(json.loads(response_text))
+        answer_box = results_data.get('answerBox') or {}
+        return SearchResults(
+            query=query,
+            hits=[SearchHit.from_organic(item) for item in results_data.get('organic', [])],
+            answer=answer_box.get('answer') or answer_box.get('snippet') or ""
+        )
+    
+    def _normalize_query(self, query):
+        """캐시 키용 질의 정규화 (NFKC, 소문자, 공백 정리)"""
+        return " ".join(unicodedata.normalize("NFKC", query).lower().split())
+    
+    def _window_ttl(self, end_date):
+        """검색 기간이 이미 지났으면 결과가 거의 바뀌지 않으므로 긴 TTL, 오늘이 포함되면 짧은 TTL"""
+        if end_date.date() < datetime.now().date():
+            return Config.SEARCH_CACHE_HISTORICAL_TTL
+        return Config.SEARCH_CACHE_CURRENT_TTL
+    
+    def _post_search(self, search_query, cache_key, ttl):
+        """
+        Serper 검색 요청 (디스크 캐시 우선, 성공 응답만 저장)
+        
+        Args:
+            search_query: Serper에 보낼 최종 질의
+            cache_key: 캐시 키
+            ttl: 캐시 유효 기간(초)
+        
+        Returns:
+            (HTTP 상태 코드, 원본 응답 텍스트)
+        """
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print(f"⚡ 검색 캐시 적중: {cache_key}")
+            return 200, cached
+        
+        # 캐시에 없을 때만 요청 한도 토큰 사용
+        waited = self.rate_limiter.acquire()
+        if waited > 0:
+            print(f"⏳ Serper 요청 한도 대기: {waited:.2f}초")
+        
+        payload = json.dumps({"q": search_query, "num": 20})  # 더 많은 결과 요청
+        headers = {
+            'X-API-KEY': self.api_key,
+            'Content-Type': 'application/json'
+        }
+        
+        response = self.session.post(self.base_url, headers=headers, data=payload, timeout=default_timeout())
+        if response.status_code == 200:
+            self.cache.put(cache_key, response.text, ttl)
+        return response.status_code, response.text
+    
     def search(self, query):
         """
         웹 검색 수행 (신뢰도 필터링 적용)
@@ -242,42 +463,28 @@ class WebSearcher:
             query: 검색 질의
             
         Returns:
-            필터링된 검색 결과 (JSON 문자열)
+            SearchResults (실패 시 error 설정)
         """
         try:
             # 신뢰할 수 있는 사이트 우선 검색을 위한 쿼리 조정
             enhanced_query = f"{query} site:fss.or.kr OR site:krx.co.kr OR site:yna.co.kr OR site:hankyung.com OR site:mk.co.kr OR site:edaily.co.kr"
             
-            payload = json.dumps({"q": enhanced_query, "num": 20})  # 더 많은 결과 요청
-            headers = {
-                'X-API-KEY': self.api_key,
-                'Content-Type': 'application/json'
-            }
-            
             print(f"웹 검색 중: {query}")
-            response = requests.request("POST", self.base_url, headers=headers, data=payload)
+            cache_key = f"search|{self._normalize_query(query)}"
+            status_code, response_text = self._post_search(enhanced_query, cache_key, Config.SEARCH_CACHE_CURRENT_TTL)
             
-            if response.status_code == 200:
+            if status_code == 200:
                 # 신뢰도 필터링 적용
-                filtered_results = self.filter_reliable_results(response.text)
+                results = self._parse_results(query, response_text)
                 print("웹 검색 및 필터링 완료")
-                return filtered_results
+                return results
             else:
-                print(f"웹 검색 실패: HTTP {response.status_code}")
-                return f"검색 실패: {response.status_code}"
+                print(f"웹 검색 실패: HTTP {status_code}")
+                return SearchResults(query=query, error=f"검색 실패: {status_code}")
                 
         except Exception as e:
             print(f"웹 검색 오류: {e}")
-            return f"검색 오류: {str(e)}"
-        
-    def get_reliable_domains(self):
-        """
-        현재 설정된 신뢰할 수 있는 도메인 리스트 반환
-        
-        Returns:
-            신뢰 도메인 리스트
-        """
-        return self.reliable_domains.copy()
+            return SearchResults(query=query, error=f"검색 오류: {str(e)}")
     
     def search_with_date(self, query, upload_date, days_range=7):
         """
@@ -289,7 +496,7 @@ class WebSearcher:
             days_range: 검색 범위 (업로드일 ±N일, 기본값 7일)
             
         Returns:
-            필터링된 검색 결과 (JSON 문자열)
+            SearchResults (실패 시 현재 시점 검색 결과)
         """
         try:
             # 날짜 파싱
@@ -309,22 +516,17 @@ class WebSearcher:
             # 날짜 필터 + 신뢰 사이트 필터가 포함된 검색 쿼리
             date_filtered_query = f"{query} after:{start_str} before:{end_str} site:fss.or.kr OR site:krx.co.kr OR site:yna.co.kr OR site:hankyung.com"
             
-            payload = json.dumps({"q": date_filtered_query, "num": 20})
-            headers = {
-                'X-API-KEY': self.api_key,
-                'Content-Type': 'application/json'
-            }
-            
             print(f"과거 시점 웹 검색 중: {date_filtered_query}")
-            response = requests.request("POST", self.base_url, headers=headers, data=payload)
+            cache_key = f"date|{self._normalize_query(query)}|{start_str}|{end_str}"
+            status_code, response_text = self._post_search(date_filtered_query, cache_key, self._window_ttl(end_date))
             
-            if response.status_code == 200:
+            if status_code == 200:
                 # 신뢰도 필터링 적용
-                filtered_results = self.filter_reliable_results(response.text)
+                results = self._parse_results(query, response_text)
                 print("과거 시점 웹 검색 및 필터링 완료")
-                return filtered_results
+                return results
             else:
-                print(f"과거 시점 웹 검색 실패: HTTP {response.status_code}")
+                print(f"과거 시점 웹 검색 실패: HTTP {status_code}")
                 # 실패 시 현재 시점 검색으로 fallback
                 print("현재 시점 검색으로 대체...")
                 return self.search(query)
@@ -335,52 +537,64 @@ class WebSearcher:
             print("현재 시점 검색으로 대체...")
             return self.search(query)
     
-    def search_multiple(self, queries):
+    def _run_scheduled(self, jobs, priority):
         """
-        여러 검색어로 동시 검색 (신뢰도 필터링 적용)
+        공유 검색 스케줄러로 여러 검색 실행 (동일 질의는 진행 중인 검색 결과 공유)
         
         Args:
-            queries: 검색어 리스트
-            
+            jobs: {검색어: (작업 키, 검색 함수)}
+            priority: 스케줄러 우선순위
+        
         Returns:
-            필터링된 검색 결과들의 딕셔너리
+            검색어 → SearchResults 딕셔너리
         """
+        futures = self.scheduler.map(jobs, priority)
+        
         results = {}
-        for query in queries:
-            results[query] = self.search(query)
+        for query, future in futures.items():
+            try:
+                results[query] = future.result()
+                print(f"병렬 검색 완료: {query}")
+            except Exception as e:
+                print(f"병렬 검색 오류 ({query}): {e}")
+                results[query] = SearchResults(query=query, error=f"검색 오류: {str(e)}")
         return results
     
-    def search_multiple_parallel(self, queries, max_workers=3):
+    def search_multiple(self, queries, priority=PRIORITY_INTERACTIVE):
         """
-        여러 검색어로 병렬 검색 수행 (신뢰도 필터링 적용)
+        여러 검색어로 동시 검색 (신뢰도 필터링 적용)
         
         Args:
             queries: 검색어 리스트
-            max_workers: 최대 워커 수 (기본값 3)
+            priority: 스케줄러 우선순위 (배치 작업은 PRIORITY_BACKGROUND)
             
         Returns:
-            필터링된 검색 결과들의 딕셔너리
+            검색어 → SearchResults 딕셔너리
         """
-        results = {}
+        jobs = {
+            query: (f"search|{self._normalize_query(query)}", lambda query=query: self.search(query))
+            for query in queries
+        }
+        return self._run_scheduled(jobs, priority)
+    
+    def search_multiple_parallel(self, queries, max_workers=None, priority=PRIORITY_INTERACTIVE):
+        """
+        여러 검색어로 병렬 검색 수행 (신뢰도 필터링 적용)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 각 검색어에 대해 검색 작업 제출
-            future_to_query = {executor.submit(self.search, query): query for query in queries}
-            
-            # 완료된 작업들 처리
-            for future in as_completed(future_to_query):
-                query = future_to_query[future]
-                try:
-                    result = future.result()
-                    results[query] = result
-                    print(f"병렬 검색 완료: {query}")
-                except Exception as e:
-                    print(f"병렬 검색 오류 ({query}): {e}")
-                    results[query] = f"검색 오류: {str(e)}"
+        동시 실행 수는 프로세스 전체 검색 스케줄러(Config.SEARCH_MAX_WORKERS)가 정하므로
+        max_workers는 기존 호출 호환용으로만 남아 있습니다.
         
-        return results
+        Args:
+            queries: 검색어 리스트
+            max_workers: 사용하지 않음 (호환용)
+            priority: 스케줄러 우선순위
+            
+        Returns:
+            검색어 → SearchResults 딕셔너리
+        """
+        return self.search_multiple(queries, priority)
     
-    def search_multiple_with_date(self, queries, upload_date, days_range=7):
+    def search_multiple_with_date(self, queries, upload_date, days_range=7, priority=PRIORITY_INTERACTIVE):
         """
         여러 검색어로 과거 시점 동시 검색 (신뢰도 필터링 적용)
         
@@ -388,24 +602,29 @@ class WebSearcher:
             queries: 검색어 리스트
             upload_date: 영상 업로드 날짜
             days_range: 검색 범위 (기본값 7일)
+            priority: 스케줄러 우선순위
             
         Returns:
-            필터링된 검색 결과들의 딕셔너리
+            검색어 → SearchResults 딕셔너리
         """
-        results = {}
-        for query in queries:
-            results[query] = self.search_with_date(query, upload_date, days_range)
-        return results
+        jobs = {
+            query: (f"date|{self._normalize_query(query)}|{upload_date}|{days_range}",
+                    lambda query=query: self.search_with_date(query, upload_date, days_range))
+            for query in queries
+        }
+        return self._run_scheduled(jobs, priority)
     
-    def add_reliable_domain(self, domain):
+    def add_reliable_domain(self, domain, tier=TIER_GENERAL):
         """
         신뢰할 수 있는 도메인 추가
         
         Args:
             domain: 추가할 도메인
+            tier: 신뢰 등급 점수
         """
-        if domain not in self.reliable_domains:
-            self.reliable_domains.append(domain)
+        domain = domain.lower()
+        if domain not in self.domain_tiers:
+            self.domain_tiers[domain] = tier
             print(f"✅ 신뢰 도메인 추가: {domain}")
     
     def remove_reliable_domain(self, domain):
@@ -415,8 +634,9 @@ class WebSearcher:
         Args:
             domain: 제거할 도메인
         """
-        if domain in self.reliable_domains:
-            self.reliable_domains.remove(domain)
+        domain = domain.lower()
+        if domain in self.domain_tiers:
+            del self.domain_tiers[domain]
             print(f"❌ 신뢰 도메인 제거: {domain}")
     
     def get_reliable_domains(self):
@@ -426,3 +646,4 @@ class WebSearcher:
         Returns:
             신뢰 도메인 리스트
         """
+        return self.reliable_domains